@@ -0,0 +1,89 @@
+# app/api/endpoints/alerts.py
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import List, Any
+
+from app import crud, models, schemas
+from app.db.session import get_db
+from app.auth.dependencies import get_current_active_user
+from app.models.price_alert import AlertCondition
+from app.services import alert_engine, get_current_price
+
+router = APIRouter()
+
+
+@router.post(
+    "/", response_model=schemas.PriceAlert, status_code=status.HTTP_201_CREATED
+)
+def create_user_price_alert(
+    *,
+    db: Session = Depends(get_db),
+    alert_in: schemas.PriceAlertCreate,
+    current_user: models.User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Create a price alert for the current user.
+    - `above` / `below`: fires when the price crosses `threshold`.
+    - `percent_move`: fires when the price moves `threshold` percent away from
+      the price at creation time, in either direction.
+    - `sma_cross`: fires when the price crosses its `sma_window`-day SMA.
+    """
+    asset = crud.get_asset(db, asset_id=alert_in.asset_id)
+    if not asset:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Asset with ID {alert_in.asset_id} not found.",
+        )
+
+    reference_price = None
+    if alert_in.condition in (AlertCondition.PERCENT_MOVE, AlertCondition.SMA_CROSS):
+        reference_price = get_current_price(asset.symbol, asset.asset_type.value)
+        if reference_price is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Could not retrieve current price for {asset.symbol}.",
+            )
+
+    alert = crud.create_price_alert(
+        db, alert_in=alert_in, user_id=current_user.id, reference_price=reference_price
+    )
+    alert_engine.index_alert(
+        alert, asset.symbol, asset.asset_type.value, current_price=reference_price
+    )
+    return alert
+
+
+@router.get("/", response_model=List[schemas.PriceAlert])
+def read_user_price_alerts(
+    db: Session = Depends(get_db),
+    active_only: bool = False,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=200),
+    current_user: models.User = Depends(get_current_active_user),
+) -> Any:
+    return crud.get_price_alerts_by_user(
+        db, user_id=current_user.id, active_only=active_only, skip=skip, limit=limit
+    )
+
+
+@router.delete("/{alert_id}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_user_price_alert(
+    *,
+    db: Session = Depends(get_db),
+    alert_id: int,
+    current_user: models.User = Depends(get_current_active_user),
+) -> None:
+    """
+    Delete one of the current user's price alerts.
+    Returns 204 No Content on success.
+    """
+    deleted_alert = crud.remove_price_alert(
+        db, alert_id=alert_id, user_id=current_user.id
+    )
+    if not deleted_alert:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Price alert not found or not owned by user.",
+        )
+    if deleted_alert.asset:
+        alert_engine.unindex_alerts(deleted_alert.asset.symbol, [deleted_alert.id])
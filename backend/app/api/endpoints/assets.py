@@ -1,4 +1,5 @@
 # app/api/endpoints/assets.py
+import time
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Any, Optional
@@ -6,6 +7,8 @@ from typing import List, Any, Optional
 from app import crud, models, schemas
 from app.db.session import get_db
 from app.auth.dependencies import get_current_active_user  # For protected routes
+from app.services import corporate_actions, get_current_prices, instruments
+from app.services.data_providers import registry
 
 router = APIRouter()
 
@@ -27,9 +30,64 @@ def create_new_asset(
             detail=f"Asset with symbol '{asset_in.symbol}' already exists.",
         )
     asset = crud.create_asset(db=db, asset_in=asset_in)
+    instruments.forget(asset.symbol)
     return asset
 
 
+@router.post("/bulk", response_model=schemas.AssetBulkCreateResult)
+def create_assets_in_bulk(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: schemas.AssetBulkCreate,
+    current_user: models.User = Depends(get_current_active_user),  # Protected
+) -> Any:
+    """
+    Create many assets at once. (Requires authentication)
+    Duplicate symbols are collapsed and already registered symbols are skipped.
+    With `validate_symbols`, new symbols are first checked against the market
+    data providers in parallel and the ones without a price are rejected.
+    """
+    started_at = time.perf_counter()
+    unique_assets = {}
+    for asset_in in bulk_in.assets:
+        unique_assets.setdefault(asset_in.symbol.upper(), asset_in)
+
+    invalid_symbols: List[str] = []
+    if bulk_in.validate_symbols:
+        existing_symbols = {
+            asset.symbol
+            for asset in crud.get_assets_by_symbols(
+                db, symbols=list(unique_assets.keys())
+            )
+        }
+        prices = get_current_prices(
+            [
+                (symbol, asset_in.asset_type.value)
+                for symbol, asset_in in unique_assets.items()
+                if symbol not in existing_symbols
+            ]
+        )
+        invalid_symbols = sorted(s for s, price in prices.items() if price is None)
+        for symbol in invalid_symbols:
+            del unique_assets[symbol]
+
+    created_symbols = crud.bulk_create_assets(
+        db, assets_in=list(unique_assets.values())
+    )
+    for symbol in created_symbols:
+        instruments.forget(symbol)
+    return schemas.AssetBulkCreateResult(
+        requested_count=len(bulk_in.assets),
+        unique_count=len(unique_assets) + len(invalid_symbols),
+        created_count=len(created_symbols),
+        existing_count=len(unique_assets) - len(created_symbols),
+        invalid_count=len(invalid_symbols),
+        created_symbols=created_symbols,
+        invalid_symbols=invalid_symbols,
+        elapsed_seconds=round(time.perf_counter() - started_at, 4),
+    )
+
+
 @router.get("/", response_model=List[schemas.Asset])
 def read_assets_list(
     db: Session = Depends(get_db),
@@ -95,7 +153,10 @@ def update_existing_asset(
                 status_code=400, detail="Another asset with this symbol already exists."
             )
 
+    previous_symbol = db_asset.symbol
     asset = crud.update_asset(db=db, db_obj=db_asset, obj_in=asset_in)
+    instruments.forget(previous_symbol)
+    instruments.forget(asset.symbol)
     return asset
 
 
@@ -114,4 +175,154 @@ def delete_asset_by_id(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found"
         )
+    instruments.forget(asset.symbol)
     return asset  # Returns the deleted asset
+
+
+@router.get("/{asset_id}/provider-symbols", response_model=List[schemas.ProviderSymbol])
+def read_asset_provider_symbols(
+    *,
+    db: Session = Depends(get_db),
+    asset_id: int,
+) -> Any:
+    """
+    List the tickers stored for an asset per market data provider. Providers
+    without a row use their default mapping of the asset's symbol.
+    """
+    if not crud.get_asset(db, asset_id=asset_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found"
+        )
+    return crud.get_provider_symbols_by_asset(db, asset_id=asset_id)
+
+
+@router.put(
+    "/{asset_id}/provider-symbols/{provider}", response_model=schemas.ProviderSymbol
+)
+def set_asset_provider_symbol(
+    *,
+    db: Session = Depends(get_db),
+    asset_id: int,
+    provider: str,
+    symbol_in: schemas.ProviderSymbolSet,
+    current_user: models.User = Depends(get_current_active_user),  # Protected
+) -> Any:
+    """
+    Set the ticker a provider uses for an asset. (Requires authentication)
+    """
+    if registry.get_provider(provider) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown market data provider '{provider}'.",
+        )
+    if not crud.get_asset(db, asset_id=asset_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found"
+        )
+    provider_symbol = crud.set_provider_symbol(
+        db, asset_id=asset_id, provider=provider, ticker=symbol_in.ticker.strip()
+    )
+    instruments.provider_symbols_changed()
+    return provider_symbol
+
+
+@router.delete(
+    "/{asset_id}/provider-symbols/{provider}", response_model=schemas.ProviderSymbol
+)
+def delete_asset_provider_symbol(
+    *,
+    db: Session = Depends(get_db),
+    asset_id: int,
+    provider: str,
+    current_user: models.User = Depends(get_current_active_user),  # Protected
+) -> Any:
+    """
+    Remove a stored ticker, restoring the provider's default mapping.
+    (Requires authentication)
+    """
+    provider_symbol = crud.remove_provider_symbol(
+        db, asset_id=asset_id, provider=provider
+    )
+    if not provider_symbol:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No ticker stored for this provider",
+        )
+    instruments.provider_symbols_changed()
+    return provider_symbol
+
+
+@router.get(
+    "/{asset_id}/corporate-actions", response_model=List[schemas.CorporateAction]
+)
+def read_asset_corporate_actions(
+    *,
+    db: Session = Depends(get_db),
+    asset_id: int,
+) -> Any:
+    """
+    List the splits and dividends stored for an asset, oldest first. History
+    is adjusted for them where its provider has not already done so.
+    """
+    if not crud.get_asset(db, asset_id=asset_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found"
+        )
+    return crud.get_corporate_actions_by_asset(db, asset_id=asset_id)
+
+
+@router.post(
+    "/{asset_id}/corporate-actions",
+    response_model=schemas.CorporateAction,
+    status_code=status.HTTP_201_CREATED,
+)
+def add_asset_corporate_action(
+    *,
+    db: Session = Depends(get_db),
+    asset_id: int,
+    action_in: schemas.CorporateActionCreate,
+    current_user: models.User = Depends(get_current_active_user),  # Protected
+) -> Any:
+    """
+    Record a split or dividend the providers missed. (Requires authentication)
+    """
+    if not crud.get_asset(db, asset_id=asset_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Asset not found"
+        )
+    added = crud.add_corporate_actions(db, asset_id=asset_id, actions=[action_in])
+    if not added:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"A {action_in.action_type.value} on {action_in.ex_date} "
+                "is already recorded for this asset."
+            ),
+        )
+    corporate_actions.actions_changed()
+    return added[0]
+
+
+@router.delete(
+    "/{asset_id}/corporate-actions/{action_id}",
+    response_model=schemas.CorporateAction,
+)
+def delete_asset_corporate_action(
+    *,
+    db: Session = Depends(get_db),
+    asset_id: int,
+    action_id: int,
+    current_user: models.User = Depends(get_current_active_user),  # Protected
+) -> Any:
+    """
+    Remove a stored split or dividend, e.g. one entered by mistake.
+    (Requires authentication)
+    """
+    action = crud.remove_corporate_action(db, asset_id=asset_id, action_id=action_id)
+    if not action:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Corporate action not found",
+        )
+    corporate_actions.actions_changed()
+    return action
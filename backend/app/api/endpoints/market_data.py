@@ -1,42 +1,113 @@
 # app/api/endpoints/market_data.py
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime
 
-from app.services import get_current_price, get_historical_data
-from app import schemas
+from app.services import (
+    get_current_price_quote,
+    get_historical_data,
+    get_intraday_bars,
+    price_stream,
+    symbol_filter,
+)
+from app import crud, models, schemas
+from app.db.session import get_db
+from app.auth.dependencies import get_current_active_user
+from app.core.config import settings
+from app.core.deadline import Deadline, request_deadline
 
 router = APIRouter()
 
 
+def _reject_unknown_symbol(symbol: str) -> None:
+    """
+    Rejects malformed and known-invalid symbols before any cache or provider
+    lookup, so probing random tickers cannot spend provider quota. A
+    known-invalid symbol is still looked up now and then (see
+    symbol_filter.claim_invalid_symbol_probe), so one listed during an
+    outage is cleared once its lookups succeed again.
+    """
+    if not symbol_filter.is_plausible_symbol(symbol) or (
+        symbol_filter.is_known_invalid(symbol)
+        and not symbol_filter.claim_invalid_symbol_probe(symbol)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown symbol {symbol}",
+        )
+
+
+@router.get("/stream")
+def stream_tracked_asset_prices(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_active_user),
+):
+    """
+    Server-sent event stream of price updates for every asset in the current
+    user's watchlist and portfolio. Starts with the last known prices, then
+    pushes each price change as the refresh pipeline publishes it.
+    """
+    symbols = [
+        symbol
+        for symbol, _ in crud.get_user_tracked_assets(db, user_id=current_user.id)
+    ]
+    snapshot = price_stream.get_cached_price_snapshot(symbols)
+    return StreamingResponse(
+        price_stream.stream_price_updates(symbols, snapshot, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{symbol}/price", response_model=Optional[schemas.AssetCurrentPrice])
-async def get_asset_current_price(symbol: str):
+def get_asset_current_price(
+    symbol: str,
+    deadline: Deadline = Depends(
+        request_deadline(settings.MARKET_DATA_PRICE_DEADLINE_SECONDS)
+    ),
+):
     """
     Get the current market price for a given asset symbol.
+    Answers within the request deadline (`X-Request-Timeout`, capped by the
+    endpoint default); if providers cannot answer in time, the last known
+    price is returned with `is_stale` set.
     """
-    price = get_current_price(symbol)
-    if price is None:
+    _reject_unknown_symbol(symbol)
+    quote = get_current_price_quote(symbol, hedge=True, deadline=deadline)
+    if quote is None:
         # Decide if 404 is appropriate or if service layer should raise specific errors
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Could not retrieve current price for symbol {symbol}",
         )
-    return schemas.AssetCurrentPrice(
-        symbol=symbol, price=price, last_updated=datetime.now()
-    )
+    return schemas.AssetCurrentPrice(symbol=symbol, **quote)
 
 
 @router.get(
     "/{symbol}/history", response_model=Optional[List[schemas.HistoricalPricePoint]]
 )
-async def get_asset_historical_data(
-    symbol: str, outputsize: str = Query("compact", enum=["compact", "full"])
+def get_asset_historical_data(
+    symbol: str,
+    outputsize: str = Query("compact", enum=["compact", "full"]),
+    interval: str = Query("1d", enum=["1d", "1h", "15m", "5m", "1m"]),
+    deadline: Deadline = Depends(
+        request_deadline(settings.MARKET_DATA_HISTORY_DEADLINE_SECONDS)
+    ),
 ):
     """
-    Get historical daily price data for a given asset symbol.
+    Get historical price bars for a given asset symbol.
     - `outputsize`: "compact" (last 100 data points) or "full" (entire history).
+    - `interval`: "1d" for daily bars, or an intraday bar size. Intraday
+      requests return the most recent bars (INTRADAY_BUFFER_BARS of them at
+      most), each with its `timestamp`; `outputsize` does not apply.
     """
-    history = get_historical_data(symbol, outputsize=outputsize)
+    _reject_unknown_symbol(symbol)
+    if interval == "1d":
+        history = get_historical_data(symbol, outputsize=outputsize, deadline=deadline)
+    else:
+        history = get_intraday_bars(symbol, interval=interval, deadline=deadline)
     if history is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
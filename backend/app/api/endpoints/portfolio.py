@@ -1,15 +1,26 @@
 # app/api/endpoints/portfolio.py
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from sqlalchemy.orm import Session
-from typing import List, Any
+from typing import Any, Optional
 
 from app import crud, models, schemas
 from app.db.session import get_db
 from app.auth.dependencies import get_current_active_user
-from app.services import get_current_price
+from app.core.config import settings
+from app.core.deadline import Deadline, deadline_scope, request_deadline
+from app.services import get_current_price, portfolio_import, portfolio_valuation
 
 router = APIRouter()
 
+# Currency to report values in; defaults to settings.DEFAULT_BASE_CURRENCY.
+BaseCurrencyQuery = Query(None, pattern=r"^[A-Za-z]{3}$")
+# Price and FX lookups while valuing holdings share one request deadline
+# (`X-Request-Timeout`, capped by the default); past it, the orchestrator
+# answers from cache or with stale prices instead of calling providers.
+ValuationDeadline = Depends(
+    request_deadline(settings.PORTFOLIO_VALUATION_DEADLINE_SECONDS)
+)
+
 
 @router.post(
     "/holdings/",
@@ -20,6 +31,8 @@ def add_asset_to_portfolio(
     *,
     db: Session = Depends(get_db),
     holding_in: schemas.PortfolioHoldingCreate,
+    base_currency: Optional[str] = BaseCurrencyQuery,
+    deadline: Deadline = ValuationDeadline,
     current_user: models.User = Depends(get_current_active_user),
 ) -> Any:
     """
@@ -34,22 +47,37 @@ def add_asset_to_portfolio(
     holding_model = crud.create_portfolio_holding(
         db=db, holding_in=holding_in, user_id=current_user.id
     )
-    asset_schema = schemas.Asset.model_validate(holding_model.asset_info)
-    holding_response = schemas.PortfolioHolding.model_validate(holding_model)
-    holding_response.asset_info = asset_schema
+    with deadline_scope(deadline):
+        current_price = get_current_price(holding_model.asset_info.symbol)
+        return portfolio_valuation.value_holding(
+            holding_model, current_price, base_currency
+        )
 
-    current_price = get_current_price(holding_model.asset_info.symbol)
-    if current_price is not None:
-        holding_response.current_price = current_price
-        holding_response.current_value = holding_model.quantity * current_price
-        purchase_value = holding_model.quantity * holding_model.purchase_price
-        holding_response.gain_loss = holding_response.current_value - purchase_value
-        if purchase_value > 0:
-            holding_response.gain_loss_percent = (
-                holding_response.gain_loss / purchase_value
-            ) * 100
 
-    return holding_response
+@router.post("/holdings/import", response_model=schemas.PortfolioImportResult)
+def import_portfolio_holdings(
+    *,
+    db: Session = Depends(get_db),
+    file: UploadFile = File(...),
+    import_format: Optional[str] = Query(
+        None, alias="format", enum=portfolio_import.IMPORT_FORMATS
+    ),
+    current_user: models.User = Depends(get_current_active_user),
+) -> Any:
+    """
+    Bulk import holdings into the current user's portfolio from a CSV or
+    JSON-lines upload with `symbol`, `quantity`, `purchase_price` and
+    `purchase_date` fields. Rows are validated and inserted in chunks; the
+    response lists per-row errors and the overall throughput.
+    """
+    if import_format is None:
+        import_format = portfolio_import.detect_import_format(
+            file.filename, file.content_type
+        )
+    records = portfolio_import.iter_import_records(file.file, import_format)
+    return portfolio_import.import_holdings(
+        db, user_id=current_user.id, records=records
+    )
 
 
 @router.get("/holdings/", response_model=schemas.PortfolioSummary)
@@ -59,71 +87,29 @@ def view_user_portfolio_summary(
         0, ge=0
     ),  # Pagination might apply to holdings list within summary
     limit: int = Query(100, ge=1, le=200),
+    base_currency: Optional[str] = BaseCurrencyQuery,
+    deadline: Deadline = ValuationDeadline,
     current_user: models.User = Depends(get_current_active_user),
 ) -> Any:
     """
     Retrieve the current user's portfolio holdings with calculated current values and summary.
+    Values are converted into `base_currency`: current values at today's FX
+    rate, purchase values at the rate on each purchase date.
     """
     db_holdings = crud.get_portfolio_holdings_by_user(
         db=db, user_id=current_user.id, skip=skip, limit=limit
     )
 
-    processed_holdings: List[schemas.PortfolioHolding] = []
-    total_purchase_value = 0.0
-    total_current_value = 0.0
-
-    for db_holding in db_holdings:
-        holding_schema = schemas.PortfolioHolding.model_validate(db_holding)
-
-        if db_holding.asset_info:
-            holding_schema.asset_info = schemas.Asset.model_validate(
-                db_holding.asset_info
+    with deadline_scope(deadline):
+        prices = [
+            (
+                get_current_price(db_holding.asset_info.symbol)
+                if db_holding.asset_info
+                else None
             )
-
-            current_price = get_current_price(db_holding.asset_info.symbol)
-
-            purchase_value_of_holding = db_holding.quantity * db_holding.purchase_price
-            total_purchase_value += purchase_value_of_holding
-
-            if current_price is not None:
-                holding_schema.current_price = current_price
-                current_value_of_holding = db_holding.quantity * current_price
-                holding_schema.current_value = current_value_of_holding
-                holding_schema.gain_loss = (
-                    current_value_of_holding - purchase_value_of_holding
-                )
-                if purchase_value_of_holding > 0:
-                    holding_schema.gain_loss_percent = (
-                        holding_schema.gain_loss / purchase_value_of_holding
-                    ) * 100
-                else:
-                    holding_schema.gain_loss_percent = (
-                        0.0 if current_value_of_holding == 0 else None
-                    )  # Handle 0 purchase price
-                total_current_value += current_value_of_holding
-            else:
-                pass
-
-        processed_holdings.append(holding_schema)
-
-    total_gain_loss = total_current_value - total_purchase_value
-    total_gain_loss_percent = 0.0
-    if total_purchase_value > 0:
-        total_gain_loss_percent = (total_gain_loss / total_purchase_value) * 100
-    elif total_current_value > 0:
-        total_gain_loss_percent = float("inf")
-
-    return schemas.PortfolioSummary(
-        total_purchase_value=round(total_purchase_value, 2),
-        total_current_value=round(total_current_value, 2),
-        total_gain_loss=round(total_gain_loss, 2),
-        total_gain_loss_percent=(
-            round(total_gain_loss_percent, 2)
-            if total_gain_loss_percent != float("inf")
-            else None
-        ),
-        holdings=processed_holdings,
-    )
+            for db_holding in db_holdings
+        ]
+        return portfolio_valuation.value_holdings(db_holdings, prices, base_currency)
 
 
 @router.get("/holdings/{holding_id}", response_model=schemas.PortfolioHolding)
@@ -131,6 +117,8 @@ def view_single_portfolio_holding(
     *,
     db: Session = Depends(get_db),
     holding_id: int,
+    base_currency: Optional[str] = BaseCurrencyQuery,
+    deadline: Deadline = ValuationDeadline,
     current_user: models.User = Depends(get_current_active_user),
 ) -> Any:
     db_holding = crud.get_portfolio_holding(
@@ -142,22 +130,15 @@ def view_single_portfolio_holding(
             detail="Portfolio holding not found or not owned by user.",
         )
 
-    holding_response = schemas.PortfolioHolding.model_validate(db_holding)
-    if db_holding.asset_info:
-        holding_response.asset_info = schemas.Asset.model_validate(
-            db_holding.asset_info
+    with deadline_scope(deadline):
+        current_price = (
+            get_current_price(db_holding.asset_info.symbol)
+            if db_holding.asset_info
+            else None
+        )
+        return portfolio_valuation.value_holding(
+            db_holding, current_price, base_currency
         )
-        current_price = get_current_price(db_holding.asset_info.symbol)
-        if current_price is not None:
-            holding_response.current_price = current_price
-            holding_response.current_value = db_holding.quantity * current_price
-            purchase_value = db_holding.quantity * db_holding.purchase_price
-            holding_response.gain_loss = holding_response.current_value - purchase_value
-            if purchase_value > 0:
-                holding_response.gain_loss_percent = (
-                    holding_response.gain_loss / purchase_value
-                ) * 100
-    return holding_response
 
 
 @router.put("/holdings/{holding_id}", response_model=schemas.PortfolioHolding)
@@ -166,6 +147,8 @@ def update_user_portfolio_holding(
     db: Session = Depends(get_db),
     holding_id: int,
     holding_in: schemas.PortfolioHoldingUpdate,
+    base_currency: Optional[str] = BaseCurrencyQuery,
+    deadline: Deadline = ValuationDeadline,
     current_user: models.User = Depends(get_current_active_user),
 ) -> Any:
     """
@@ -184,27 +167,14 @@ def update_user_portfolio_holding(
         db=db, db_holding=db_holding, holding_in=holding_in
     )
 
-    asset_schema = schemas.Asset.model_validate(updated_holding_model.asset_info)
-    holding_response = schemas.PortfolioHolding.model_validate(updated_holding_model)
-    holding_response.asset_info = asset_schema
-
-    current_price = get_current_price(
-        symbol=updated_holding_model.asset_info.symbol,
-        asset_type=updated_holding_model.asset_info.asset_type.value,
-    )
-    if current_price is not None:
-        holding_response.current_price = current_price
-        holding_response.current_value = updated_holding_model.quantity * current_price
-        purchase_value = (
-            updated_holding_model.quantity * updated_holding_model.purchase_price
+    with deadline_scope(deadline):
+        current_price = get_current_price(
+            symbol=updated_holding_model.asset_info.symbol,
+            asset_type=updated_holding_model.asset_info.asset_type.value,
+        )
+        return portfolio_valuation.value_holding(
+            updated_holding_model, current_price, base_currency
         )
-        holding_response.gain_loss = holding_response.current_value - purchase_value
-        if purchase_value > 0:
-            holding_response.gain_loss_percent = (
-                holding_response.gain_loss / purchase_value
-            ) * 100
-
-    return holding_response
 
 
 @router.delete("/holdings/{holding_id}", status_code=status.HTTP_200_OK)
@@ -1,6 +1,14 @@
 # app/api/v1/api.py
 from fastapi import APIRouter
-from app.api.endpoints import users, auth, assets, portfolio, market_data, watchlist
+from app.api.endpoints import (
+    users,
+    auth,
+    assets,
+    portfolio,
+    market_data,
+    watchlist,
+    alerts,
+)
 
 api_router = APIRouter()
 api_router.include_router(users.router, prefix="/users", tags=["users"])
@@ -11,3 +19,4 @@ api_router.include_router(
     market_data.router, prefix="/market-data", tags=["market-data"]
 )
 api_router.include_router(watchlist.router, prefix="/watchlist", tags=["watchlist"])
+api_router.include_router(alerts.router, prefix="/alerts", tags=["alerts"])
@@ -1,4 +1,5 @@
 # app/auth/security.py
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import jwt, JWTError
@@ -6,6 +7,8 @@ from passlib.context import CryptContext
 from app.core.config import settings
 from app import schemas
 
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
@@ -28,9 +31,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         )
 
     to_encode.update({"exp": expire})
-    print(
-        f"DEBUG: Encoding JWT with algorithm: '{settings.ALGORITHM}' and key: '{settings.SECRET_KEY[:5]}...'"
-    )
+    logger.debug("Encoding JWT with algorithm %s.", settings.ALGORITHM)
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
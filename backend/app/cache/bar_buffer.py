@@ -0,0 +1,148 @@
+# app/cache/bar_buffer.py
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from app.core import tracing
+from app.core.config import settings
+from app.core.metrics import cache_key_family, observe_cache_lookup
+from .shared_cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Intraday bars are kept per (instrument, interval) in a Redis list used as a
+# ring buffer: new bars are RPUSHed and LTRIM keeps the newest
+# INTRADAY_BUFFER_BARS, so a buffer never grows past that many entries.
+# Each bar is stored as a compact JSON array,
+#   [epoch seconds, open, high, low, close, volume]
+# which stays under ~100 bytes, so `LLEN key` x 100 B bounds a buffer's size.
+BAR_KEY_PREFIX = "intraday:"
+# Present while a buffer counts as fresh; also stops two processes from
+# topping up the same buffer at once.
+REFRESH_KEY_PREFIX = "intraday_refresh:"
+
+Bar = Dict[str, Any]
+
+
+def buffer_key(cache_id: str, interval: str) -> str:
+    return f"{BAR_KEY_PREFIX}{cache_id}:{interval}"
+
+
+def encode_bar(bar: Bar) -> str:
+    return json.dumps(
+        [
+            int(bar["timestamp"].timestamp()),
+            bar["open"],
+            bar["high"],
+            bar["low"],
+            bar["close"],
+            bar["volume"],
+        ],
+        separators=(",", ":"),
+    )
+
+
+def decode_bar(raw: Any) -> Bar:
+    timestamp, open_, high, low, close, volume = json.loads(raw)
+    return {
+        "timestamp": datetime.fromtimestamp(timestamp, timezone.utc),
+        "open": open_,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+    }
+
+
+def merge_bars(stored: List[Bar], fresh: List[Bar]) -> List[Bar]:
+    """
+    `stored` topped up with `fresh`: fresh bars older than the last stored
+    one are ignored, one at the same time replaces it (it was still forming),
+    and newer ones are appended. Trimmed to INTRADAY_BUFFER_BARS.
+    """
+    if not stored:
+        return fresh[-settings.INTRADAY_BUFFER_BARS :]
+    last = stored[-1]["timestamp"]
+    newer = [bar for bar in fresh if bar["timestamp"] >= last]
+    if newer and newer[0]["timestamp"] == last:
+        stored = stored[:-1]
+    return (stored + newer)[-settings.INTRADAY_BUFFER_BARS :]
+
+
+def read_bars(key: str) -> Optional[List[Bar]]:
+    """The buffered bars, oldest first; None without Redis."""
+    client = get_redis_client()
+    if not client:
+        return None
+    try:
+        with tracing.span(
+            "cache.lrange",
+            kind="client",
+            attributes={"cache.key_family": cache_key_family(key)},
+        ):
+            raw_bars = client.lrange(key, 0, -1)
+        observe_cache_lookup(key, bool(raw_bars))
+        return [decode_bar(raw) for raw in raw_bars]
+    except Exception as e:
+        logger.error("Error reading bar buffer %s: %s", key, e)
+        return None
+
+
+def append_bars(key: str, bars: List[Bar]) -> None:
+    """
+    Tops up the buffer with `bars` (see merge_bars), trims it to
+    INTRADAY_BUFFER_BARS and renews its expiry, in one MULTI/EXEC.
+    """
+    client = get_redis_client()
+    if not client or not bars:
+        return
+    try:
+        last_raw = client.lindex(key, -1)
+        last = decode_bar(last_raw)["timestamp"] if last_raw else None
+        newer = [bar for bar in bars if last is None or bar["timestamp"] >= last]
+        pipe = client.pipeline(transaction=True)
+        if newer and newer[0]["timestamp"] == last:
+            pipe.lset(key, -1, encode_bar(newer[0]))
+            newer = newer[1:]
+        if newer:
+            pipe.rpush(key, *[encode_bar(bar) for bar in newer])
+        pipe.ltrim(key, -settings.INTRADAY_BUFFER_BARS, -1)
+        pipe.expire(key, settings.INTRADAY_BUFFER_TTL_SECONDS)
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error appending to bar buffer %s: %s", key, e)
+
+
+def replace_bars(key: str, bars: List[Bar]) -> None:
+    """Swaps the buffer's contents for the newest INTRADAY_BUFFER_BARS of `bars`."""
+    client = get_redis_client()
+    if not client:
+        return
+    try:
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(key)
+        if bars:
+            pipe.rpush(
+                key,
+                *[encode_bar(bar) for bar in bars[-settings.INTRADAY_BUFFER_BARS :]],
+            )
+            pipe.expire(key, settings.INTRADAY_BUFFER_TTL_SECONDS)
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error replacing bar buffer %s: %s", key, e)
+
+
+def claim_refresh(key: str, seconds: int) -> bool:
+    """
+    Marks the buffer fresh for `seconds`. False if it already was, i.e. it was
+    topped up (or is being topped up) recently. Always True without Redis.
+    """
+    client = get_redis_client()
+    if not client:
+        return True
+    try:
+        return bool(client.set(f"{REFRESH_KEY_PREFIX}{key}", "1", nx=True, ex=seconds))
+    except Exception as e:
+        logger.error("Error claiming refresh of bar buffer %s: %s", key, e)
+        return True
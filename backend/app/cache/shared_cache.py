@@ -1,36 +1,224 @@
 # app/cache/shared_cache.py
+import logging
+import threading
+import time
 import redis
 import json
-from typing import Any, Optional
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+from typing import Any, List, Optional, Union
 from app.core.config import settings
+from app.core import logs, metrics, tracing
+from app.core.metrics import cache_key_family, observe_cache_lookup
 from datetime import datetime, date
 
-try:
-    shared_redis_client = redis.Redis.from_url(
-        settings.SHARED_CACHE_REDIS_URL, decode_responses=True
+logger = logging.getLogger(__name__)
+
+# The Redis client is created on first use, not at import: a worker boots
+# without waiting on Redis, and a Redis that is down at boot no longer turns
+# the cache off for the life of the process. Connections come from a bounded
+# pool with socket timeouts. When a connect fails or a connection drops, or
+# after READ_TIMEOUTS_BEFORE_DOWN reads in a row time out, get_redis_client()
+# returns None - callers treat that as "no cache" - for a backoff that
+# doubles per consecutive failure up to REDIS_RECONNECT_BACKOFF_MAX_SECONDS;
+# the first call after it tries Redis again. A single slow command is just
+# a miss for its caller.
+RECONNECT_BACKOFF_BASE_SECONDS = 0.5
+READ_TIMEOUTS_BEFORE_DOWN = 3
+
+_client: Optional[redis.Redis] = None
+_NO_OVERRIDE = object()
+_client_override: Any = _NO_OVERRIDE
+_client_lock = threading.Lock()
+_availability = {"failures": 0, "down_until": 0.0}
+_read_timeouts = {"consecutive": 0}
+
+
+def _mark_down(error: Exception) -> None:
+    now = time.monotonic()
+    with _client_lock:
+        if now < _availability["down_until"]:
+            return  # already backing off; retries of the same call add nothing
+        _availability["failures"] += 1
+        backoff = min(
+            settings.REDIS_RECONNECT_BACKOFF_MAX_SECONDS,
+            RECONNECT_BACKOFF_BASE_SECONDS * 2 ** (_availability["failures"] - 1),
+        )
+        _availability["down_until"] = now + backoff
+    metrics.REDIS_AVAILABLE.set(0)
+    metrics.REDIS_CONNECTION_FAILURES.inc()
+    logger.error("Redis unreachable (%s); shared cache off for %.1fs.", error, backoff)
+
+
+def _mark_up() -> None:
+    if not _availability["failures"]:
+        return
+    with _client_lock:
+        _availability["failures"] = 0
+        _availability["down_until"] = 0.0
+    metrics.REDIS_AVAILABLE.set(1)
+    logger.info("Reconnected to Redis; shared cache back on.")
+
+
+def _note_read_timeout(error: Exception) -> None:
+    with _client_lock:
+        _read_timeouts["consecutive"] += 1
+        down = _read_timeouts["consecutive"] >= READ_TIMEOUTS_BEFORE_DOWN
+        if down:
+            _read_timeouts["consecutive"] = 0
+    if down:
+        _mark_down(error)
+
+
+class _TrackedConnection(redis.Connection):
+    """
+    Reports connect failures, dropped connections and runs of read timeouts,
+    which switch the cache to fast-fail.
+    """
+
+    def connect(self, *args, **kwargs):
+        try:
+            super().connect(*args, **kwargs)
+        except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
+            _mark_down(e)
+            raise
+        _mark_up()
+
+    def read_response(self, *args, **kwargs):
+        try:
+            response = super().read_response(*args, **kwargs)
+        except redis.exceptions.TimeoutError as e:
+            _note_read_timeout(e)
+            raise
+        except redis.exceptions.ConnectionError as e:
+            _mark_down(e)
+            raise
+        if _read_timeouts["consecutive"]:
+            _read_timeouts["consecutive"] = 0
+        return response
+
+
+class _InstrumentedPool(redis.BlockingConnectionPool):
+    """A blocking pool that keeps the pool utilisation gauges current."""
+
+    def __init__(self, *args, **kwargs):
+        self._checked_out_lock = threading.Lock()
+        self._checked_out = set()
+        super().__init__(*args, **kwargs)
+        metrics.REDIS_POOL_MAX_CONNECTIONS.set(self.max_connections)
+
+    def reset(self):
+        super().reset()
+        with self._checked_out_lock:
+            metrics.REDIS_POOL_CONNECTIONS_IN_USE.dec(len(self._checked_out))
+            self._checked_out = set()
+
+    def get_connection(self, *args, **kwargs):
+        connection = super().get_connection(*args, **kwargs)
+        with self._checked_out_lock:
+            self._checked_out.add(id(connection))
+        metrics.REDIS_POOL_CONNECTIONS_IN_USE.inc()
+        return connection
+
+    def release(self, connection):
+        with self._checked_out_lock:
+            checked_out = id(connection) in self._checked_out
+            self._checked_out.discard(id(connection))
+        super().release(connection)
+        if checked_out:
+            metrics.REDIS_POOL_CONNECTIONS_IN_USE.dec()
+
+
+def _create_client() -> redis.Redis:
+    pool = _InstrumentedPool.from_url(
+        settings.SHARED_CACHE_REDIS_URL,
+        connection_class=_TrackedConnection,
+        max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+        health_check_interval=30,
+        decode_responses=True,
+    )
+    # One immediate retry reconnects a pooled connection that went stale
+    # across a Redis restart; a Redis that is really down fails fast instead.
+    return redis.Redis(
+        connection_pool=pool, retry=Retry(NoBackoff(), 1), retry_on_error=[]
     )
-    shared_redis_client.ping()
-    print("SHARED_CACHE: Successfully connected to Redis for shared cache.")
-except redis.exceptions.ConnectionError as e:
-    print(f"SHARED_CACHE_ERROR: Could not connect to Redis for shared cache: {e}")
-    shared_redis_client = None
+
+
+def get_redis_client() -> Optional[redis.Redis]:
+    """
+    The shared-cache Redis client, or None while Redis is unreachable (and
+    backing off) or when another client was installed with use_redis_client.
+    """
+    global _client
+    if _client_override is not _NO_OVERRIDE:
+        return _client_override
+    if time.monotonic() < _availability["down_until"]:
+        return None
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _create_client()
+    return _client
+
+
+def use_redis_client(client: Any) -> Any:
+    """
+    Makes get_redis_client() return `client` (None: no Redis) until called
+    again with the returned value. For benchmarks and the load-test harness.
+    """
+    global _client_override
+    previous, _client_override = _client_override, client
+    return previous
+
 
 CACHE_DURATION_SECONDS = 15 * 60
 
 
 def get_shared_cache(key: str) -> Optional[Any]:
-    if not shared_redis_client:
+    client = get_redis_client()
+    if not client:
         return None
     try:
-        cached_value_json = shared_redis_client.get(key)
+        with tracing.span(
+            "cache.get",
+            kind="client",
+            attributes={"cache.key_family": cache_key_family(key)},
+        ) as cache_span:
+            cached_value_json = client.get(key)
+            if cache_span is not None:
+                cache_span.set_attribute("cache.hit", bool(cached_value_json))
+        observe_cache_lookup(key, bool(cached_value_json))
         if cached_value_json:
             return json.loads(cached_value_json)
         return None
     except Exception as e:
-        print(f"SHARED_CACHE_ERROR: Error getting from Redis key {key}: {e}")
+        logger.error("Error getting from Redis key %s: %s", key, e)
         return None
 
 
+def get_many_shared_cache(keys: List[str]) -> List[Optional[Any]]:
+    """Fetches several keys in one round trip; missing keys come back as None."""
+    client = get_redis_client()
+    if not client or not keys:
+        return [None] * len(keys)
+    try:
+        with tracing.span(
+            "cache.get_many", kind="client", attributes={"cache.keys": len(keys)}
+        ) as cache_span:
+            values = client.mget(keys)
+            if cache_span is not None:
+                cache_span.set_attribute("cache.hits", sum(1 for v in values if v))
+        for key, value in zip(keys, values):
+            observe_cache_lookup(key, bool(value))
+        return [json.loads(value) if value else None for value in values]
+    except Exception as e:
+        logger.error("Error getting %d keys from Redis: %s", len(keys), e)
+        return [None] * len(keys)
+
+
 def _datetime_converter(o):
     if isinstance(o, (datetime, date)):
         return o.isoformat()
@@ -38,11 +226,59 @@ def _datetime_converter(o):
 
 
 def set_shared_cache(key: str, value: Any, ex: int = CACHE_DURATION_SECONDS):
-    if not shared_redis_client or value is None:
+    client = get_redis_client()
+    if not client or value is None:
         return
     try:
         json_value = json.dumps(value, default=_datetime_converter)
-        shared_redis_client.set(key, json_value, ex=ex)
-        print(f"SHARED_CACHE_SET: Set key {key}")
+        with tracing.span(
+            "cache.set",
+            kind="client",
+            attributes={"cache.key_family": cache_key_family(key)},
+        ):
+            client.set(key, json_value, ex=ex)
+        if logger.isEnabledFor(logging.DEBUG) and logs.sampled("cache"):
+            logger.debug("Set key %s", key, extra={"family": "cache"})
+    except Exception as e:
+        logger.error("Error setting to Redis key %s: %s", key, e)
+
+
+def swap_shared_cache(
+    key: str, value: Any, ex: int = CACHE_DURATION_SECONDS
+) -> Optional[Any]:
+    """Atomically stores a new value and returns the one it replaced (SET ... GET)."""
+    client = get_redis_client()
+    if not client or value is None:
+        return None
+    try:
+        json_value = json.dumps(value, default=_datetime_converter)
+        with tracing.span(
+            "cache.swap",
+            kind="client",
+            attributes={"cache.key_family": cache_key_family(key)},
+        ):
+            previous_json = client.set(key, json_value, ex=ex, get=True)
+        return json.loads(previous_json) if previous_json else None
+    except Exception as e:
+        logger.error("Error swapping Redis key %s: %s", key, e)
+        return None
+
+
+def publish_shared_event(channels: Union[str, List[str]], message: Any):
+    """Publishes one JSON message to one or more channels in a single round trip."""
+    client = get_redis_client()
+    if not client:
+        return
+    if isinstance(channels, str):
+        channels = [channels]
+    try:
+        json_message = json.dumps(message, default=_datetime_converter)
+        with tracing.span(
+            "cache.publish", kind="client", attributes={"cache.channels": len(channels)}
+        ):
+            pipe = client.pipeline(transaction=False)
+            for channel in channels:
+                pipe.publish(channel, json_message)
+            pipe.execute()
     except Exception as e:
-        print(f"SHARED_CACHE_ERROR: Error setting to Redis key {key}: {e}")
+        logger.error("Error publishing to Redis channels %s: %s", channels, e)
@@ -1,12 +1,24 @@
 # app/core/celery_app.py
+import time
+
 from celery import Celery
+from celery.signals import (
+    before_task_publish,
+    setup_logging,
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_shutdown,
+)
+
+from app.core import logs, metrics, tracing
 from app.core.config import settings
 
 celery_app = Celery(
     "tasks",
     broker=settings.REDIS_URL,
     backend=settings.REDIS_URL,
-    include=["app.tasks.price_tasks"],
+    include=["app.tasks.price_tasks", "app.tasks.alert_tasks", "app.tasks.cache_tasks"],
 )
 
 celery_app.conf.update(
@@ -22,4 +34,76 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.price_tasks.refresh_all_asset_prices_task",
         "schedule": 3600.0,
     },
+    # Cheap when the cache is warm; re-warms it after Redis lost its data.
+    "warm-cache-if-cold-every-5-minutes": {
+        "task": "app.tasks.cache_tasks.warm_cache_task",
+        "schedule": 300.0,
+    },
+    "rebuild-alert-index-every-day": {
+        "task": "app.tasks.alert_tasks.rebuild_alert_index_task",
+        "schedule": 24 * 3600.0,
+    },
 }
+
+
+# task_id -> perf_counter at start, for the task duration histogram.
+_task_started_at = {}
+# task_id -> (span, context token) for tasks running under a trace.
+_task_spans = {}
+
+
+@before_task_publish.connect
+def _propagate_trace(headers=None, **_):
+    # Enqueued from a traced request (or task): the task continues its trace.
+    if headers is not None:
+        tracing.inject(headers)
+
+
+@task_prerun.connect
+def _start_task_timer(task_id=None, task=None, **_):
+    _task_started_at[task_id] = time.perf_counter()
+    if task is None or not tracing.tracing_enabled():
+        return
+    request = task.request
+    traceparent = getattr(request, "traceparent", None) or (
+        getattr(request, "headers", None) or {}
+    ).get(tracing.TRACEPARENT_HEADER)
+    task_span = tracing.start_span(
+        f"celery.task {task.name}",
+        parent=tracing.parse_traceparent(traceparent),
+        kind="consumer",
+        attributes={"celery.task_id": task_id},
+    )
+    if task_span is not None:
+        _task_spans[task_id] = (task_span, tracing.activate(task_span))
+
+
+@task_postrun.connect
+def _observe_task_duration(task_id=None, task=None, state=None, **_):
+    traced_task = _task_spans.pop(task_id, None)
+    if traced_task is not None:
+        task_span, token = traced_task
+        task_span.set_attribute("celery.state", state)
+        tracing.deactivate(token)
+        task_span.end()
+    started = _task_started_at.pop(task_id, None)
+    if started is not None and task is not None:
+        metrics.TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(
+            time.perf_counter() - started
+        )
+
+
+# Connecting a receiver stops Celery from installing its own root handlers.
+setup_logging.connect(logs.configure_logging)
+
+
+@worker_init.connect
+def _serve_worker_metrics(**_):
+    if settings.CELERY_METRICS_PORT:
+        metrics.start_metrics_server(settings.CELERY_METRICS_PORT)
+
+
+@worker_process_shutdown.connect
+def _release_worker_metrics(pid=None, **_):
+    metrics.mark_process_dead(pid)
+    tracing.flush()
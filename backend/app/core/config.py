@@ -1,7 +1,7 @@
 # backend/app/core/config.py
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -15,9 +15,81 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ALPHA_VANTAGE_API_KEY: Optional[str] = None
 
+    # Comma-separated provider names the orchestrator may use, e.g.
+    # "synthetic" for offline load tests.
+    MARKET_DATA_PROVIDERS: str = "yfinance,alpha_vantage"
+    MARKET_DATA_PROVIDER_TIMEOUT_SECONDS: float = 10.0
+    MARKET_DATA_PRICE_DEADLINE_SECONDS: float = 3.0
+    MARKET_DATA_HISTORY_DEADLINE_SECONDS: float = 8.0
+    # Budget for pricing and FX lookups while valuing portfolio holdings.
+    PORTFOLIO_VALUATION_DEADLINE_SECONDS: float = 5.0
+    MARKET_DATA_HEDGE_PERCENTILE: float = 95.0
+    MARKET_DATA_HEDGE_DEFAULT_DELAY_SECONDS: float = 1.0
+    MARKET_DATA_HEDGE_MAX_PER_MINUTE: int = 60
+
+    # "record" captures raw provider responses to MARKET_DATA_CASSETTE_PATH;
+    # "replay" serves them back offline with their recorded latencies.
+    MARKET_DATA_CASSETTE_MODE: Optional[str] = None
+    MARKET_DATA_CASSETTE_PATH: str = "market_data_cassette.jsonl.gz"
+    MARKET_DATA_CASSETTE_REPLAY_SPEED: float = 1.0
+
+    SYNTHETIC_PROVIDER_SEED: int = 0
+    SYNTHETIC_PROVIDER_LATENCY_MS: float = 0.0
+    SYNTHETIC_PROVIDER_LATENCY_JITTER_MS: float = 0.0
+    SYNTHETIC_PROVIDER_ERROR_RATE: float = 0.0
+    SYNTHETIC_PROVIDER_RATE_LIMIT_PER_MINUTE: Optional[int] = None
+
+    # Port on which each Celery worker serves Prometheus metrics (off if unset).
+    # Prefork pools also need PROMETHEUS_MULTIPROC_DIR in the environment.
+    CELERY_METRICS_PORT: Optional[int] = None
+
+    # Warm-up preloads prices and compact history for the most-tracked
+    # symbols, on the cache_warmup task and (unless disabled) before an API
+    # process starts serving.
+    CACHE_WARMUP_ON_STARTUP: bool = True
+    CACHE_WARMUP_STARTUP_SECONDS: float = 60.0
+    CACHE_WARMUP_MAX_SYMBOLS: int = 500
+    CACHE_WARMUP_MAX_WORKERS: int = 4
+
+    # Currency portfolio values are reported in unless a request names one.
+    DEFAULT_BASE_CURRENCY: str = "USD"
+
+    # Recent intraday bars live in one Redis list per (symbol, interval),
+    # capped at INTRADAY_BUFFER_BARS entries of at most ~100 bytes each:
+    # 500 bars is ~50 KiB per interval, ~200 KiB per symbol for all four.
+    # Buffers nobody reads expire after INTRADAY_BUFFER_TTL_SECONDS; a buffer
+    # is topped up from its provider at most once per INTRADAY_REFRESH_SECONDS.
+    INTRADAY_BUFFER_BARS: int = 500
+    INTRADAY_BUFFER_TTL_SECONDS: int = 24 * 60 * 60
+    INTRADAY_REFRESH_SECONDS: int = 60
+
+    # LOG_FORMAT is "text" or "json". LOG_SAMPLE_RATES keeps a fraction of the
+    # lines in each chatty message family (see logs.sampled), e.g.
+    # '{"price_refresh": 0.1}'.
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "text"
+    LOG_SAMPLE_RATES: Dict[str, float] = {"cache": 0.01, "price_refresh": 0.1}
+
+    # Tracing is off unless an exporter is chosen: "console", "file" (JSON
+    # lines at TRACING_FILE_PATH) or "zipkin" (POSTed to TRACING_COLLECTOR_URL).
+    # TRACING_SAMPLE_RATE applies to new traces; a caller's traceparent wins.
+    TRACING_EXPORTER: Optional[str] = None
+    TRACING_SAMPLE_RATE: float = 0.1
+    TRACING_FILE_PATH: str = "traces.jsonl"
+    TRACING_COLLECTOR_URL: str = "http://localhost:9411/api/v2/spans"
+    TRACING_SERVICE_NAME: Optional[str] = None
+
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
 
+    # Shared-cache connection pool. While Redis is unreachable, cache calls
+    # fail fast and reconnects back off up to the maximum below.
+    REDIS_POOL_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 1.0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 1.0
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 0.5
+    REDIS_RECONNECT_BACKOFF_MAX_SECONDS: float = 30.0
+
     @property
     def REDIS_URL(self) -> str:
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
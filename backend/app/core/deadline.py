@@ -0,0 +1,93 @@
+# app/core/deadline.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+
+DEADLINE_HEADER = "X-Request-Timeout"
+# Below this much remaining budget a provider call is not worth starting.
+MIN_PROVIDER_BUDGET_SECONDS = 0.2
+
+
+class Deadline:
+    """A point in (monotonic) time by which a unit of work must finish."""
+
+    def __init__(self, seconds: float):
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self, margin: float = 0.0) -> bool:
+        return self.remaining() <= margin
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """Seconds left, optionally capped, for use as a socket/wait timeout."""
+        remaining = self.remaining()
+        return remaining if cap is None else min(remaining, cap)
+
+    def __repr__(self) -> str:
+        return f"Deadline(remaining={self.remaining():.3f}s)"
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Makes `deadline` the ambient deadline for provider calls in this context.
+    A scope never extends an enclosing deadline; the earlier one wins.
+    """
+    enclosing = _current_deadline.get()
+    if deadline is None or (
+        enclosing is not None and enclosing.expires_at <= deadline.expires_at
+    ):
+        deadline = enclosing
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def provider_timeout() -> float:
+    """
+    Socket timeout for an upstream call: what is left of the ambient deadline,
+    or the global provider timeout when no deadline is set.
+    """
+    default = settings.MARKET_DATA_PROVIDER_TIMEOUT_SECONDS
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    return max(deadline.timeout(default), 0.001)
+
+
+def request_deadline(default_seconds: float) -> Callable[[Request], Deadline]:
+    """
+    FastAPI dependency factory: the request's deadline is the client's
+    X-Request-Timeout (seconds) if given, never more than the endpoint default.
+    """
+
+    def dependency(request: Request) -> Deadline:
+        budget = default_seconds
+        header_value = request.headers.get(DEADLINE_HEADER)
+        if header_value:
+            try:
+                budget = min(max(float(header_value), 0.0), default_seconds)
+            except ValueError:
+                pass
+        return Deadline(budget)
+
+    return dependency
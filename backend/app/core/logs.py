@@ -0,0 +1,152 @@
+# app/core/logs.py
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.core import tracing
+from app.core.config import settings
+
+# Application modules log through the standard library
+# (`logger = logging.getLogger(__name__)`); this module wires the output side
+# once per process. Callers only pay for building the record and a queue put:
+# formatting and the write to stdout happen on a listener thread, and a full
+# queue drops records instead of blocking. Chatty message families are
+# sampled with `sampled(family)` before the record is built, so a dropped
+# line costs a dict lookup and a random draw.
+LOG_QUEUE_SIZE = 10000
+TEXT_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+LOG_FORMAT_JSON = "json"
+
+# Attributes every LogRecord has; anything else came in through `extra=`.
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+def sampled(family: str) -> bool:
+    """
+    Whether to log this line of a message family rated in LOG_SAMPLE_RATES;
+    unknown families are always logged. Guard the logging call with it (and
+    pass `extra={"family": ...}` to label the record); warnings and worse
+    should not be sampled.
+    """
+    rate = settings.LOG_SAMPLE_RATES.get(family, 1.0)
+    return rate >= 1.0 or random.random() < rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with `extra=` fields as top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and value is not None:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread. Unlike QueueHandler it neither
+    formats nor copies the record on the caller's thread (a copy costs more
+    than the put), and it drops records once `max_size` are waiting.
+    """
+
+    def __init__(
+        self, log_queue: "queue.SimpleQueue[logging.LogRecord]", max_size: int
+    ):
+        super().__init__(log_queue)
+        self.max_size = max_size
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now, while its args still hold the values
+        # being logged, and note the trace the record belongs to.
+        record.msg = record.getMessage()
+        record.args = None
+        active = tracing.current_span()
+        if active is not None and active.sampled:
+            record.trace_id = active.trace_id
+            record.span_id = active.span_id
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.queue.qsize() >= self.max_size:
+            self.dropped += 1
+            return
+        self.queue.put_nowait(record)
+
+
+_listener: Optional[QueueListener] = None
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.LOG_FORMAT == LOG_FORMAT_JSON:
+        return JsonFormatter()
+    return logging.Formatter(TEXT_FORMAT)
+
+
+def configure_logging(**_) -> None:
+    """
+    Routes the root logger through a queue to stdout at LOG_LEVEL. Safe to
+    call more than once; also usable as Celery's `setup_logging` receiver.
+    """
+    global _listener, _configured
+    with _configure_lock:
+        if _listener is not None:
+            return
+        first_time = not _configured
+        _configured = True
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(_build_formatter())
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        queue_handler = NonBlockingQueueHandler(log_queue, LOG_QUEUE_SIZE)
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        root.setLevel(settings.LOG_LEVEL.upper())
+
+        _listener = QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.start()
+        if first_time:
+            atexit.register(shutdown_logging)
+            # A forked child (Celery prefork pool) has the handler but not the
+            # listener thread; give it a fresh queue and listener of its own.
+            os.register_at_fork(after_in_child=_reconfigure_in_child)
+
+
+def _reconfigure_in_child() -> None:
+    global _listener, _configure_lock
+    if _listener is None:
+        return
+    _listener = None
+    _configure_lock = threading.Lock()
+    configure_logging()
+
+
+def shutdown_logging() -> None:
+    """Writes out everything still queued and stops the listener thread."""
+    global _listener
+    with _configure_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _listener = None
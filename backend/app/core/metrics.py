@@ -0,0 +1,200 @@
+# app/core/metrics.py
+import logging
+import os
+import time
+from typing import Any, Optional
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    start_http_server,
+)
+from sqlalchemy import event
+
+# With PROMETHEUS_MULTIPROC_DIR set (a real environment variable, read by
+# prometheus_client itself), every process - uvicorn workers, Celery pool
+# children - writes its samples to files there, and scrapes aggregate them.
+# The directory must be emptied whenever the whole service restarts.
+logger = logging.getLogger(__name__)
+
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+NAMESPACE = "alphadash"
+UNMATCHED_ROUTE = "unmatched"
+HTTP_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+PROVIDER_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DB_QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+TASK_DURATION_BUCKETS = (0.1, 0.5, 1, 5, 15, 30, 60, 120, 300, 600, 1800)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    namespace=NAMESPACE,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ["method"],
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Shared-cache lookups by key family (the key prefix) and result.",
+    ["family", "result"],
+    namespace=NAMESPACE,
+)
+PROVIDER_REQUEST_DURATION = Histogram(
+    "provider_request_duration_seconds",
+    "Market-data provider call latency by operation and outcome.",
+    ["provider", "operation", "outcome"],
+    namespace=NAMESPACE,
+    buckets=PROVIDER_LATENCY_BUCKETS,
+)
+DB_SESSIONS = Counter(
+    "db_sessions_total",
+    "Database sessions that began a transaction.",
+    namespace=NAMESPACE,
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database statement latency.",
+    namespace=NAMESPACE,
+    buckets=DB_QUERY_BUCKETS,
+)
+TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time by task and final state.",
+    ["task", "state"],
+    namespace=NAMESPACE,
+    buckets=TASK_DURATION_BUCKETS,
+)
+PRICE_REFRESH_ASSETS = Counter(
+    "price_refresh_assets_total",
+    "Assets handled by the price refresh sweep, by outcome.",
+    ["outcome"],
+    namespace=NAMESPACE,
+)
+
+REDIS_POOL_CONNECTIONS_IN_USE = Gauge(
+    "redis_pool_connections_in_use",
+    "Shared-cache Redis connections currently checked out of the pool.",
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+REDIS_POOL_MAX_CONNECTIONS = Gauge(
+    "redis_pool_max_connections",
+    "Size limit of the shared-cache Redis connection pool.",
+    namespace=NAMESPACE,
+    multiprocess_mode="livesum",
+)
+REDIS_AVAILABLE = Gauge(
+    "redis_available",
+    "1 while the shared cache can reach Redis, 0 while its calls fail fast.",
+    namespace=NAMESPACE,
+    multiprocess_mode="livemin",
+)
+REDIS_CONNECTION_FAILURES = Counter(
+    "redis_connection_failures_total",
+    "Redis connect or read failures that started a reconnect backoff.",
+    namespace=NAMESPACE,
+)
+REDIS_AVAILABLE.set(1)
+
+
+def cache_key_family(key: str) -> str:
+    """'price:AAPL' -> 'price'. Key prefixes are code constants, so bounded."""
+    family, sep, _ = key.partition(":")
+    return family if sep and family else "other"
+
+
+def observe_cache_lookup(key: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache_key_family(key), "hit" if hit else "miss").inc()
+
+
+def collector_registry() -> CollectorRegistry:
+    """The registry to expose: aggregated across processes when multiprocess."""
+    if not MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_latest() -> bytes:
+    return generate_latest(collector_registry())
+
+
+def mark_process_dead(pid: Optional[int] = None) -> None:
+    """Drops a finished process's live gauges from multiprocess aggregation."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def start_metrics_server(port: int) -> None:
+    """Serves /metrics on its own port, e.g. from the Celery worker's parent."""
+    start_http_server(port, registry=collector_registry())
+    logger.info("Serving Prometheus metrics on port %d.", port)
+
+
+def instrument_database(engine, session_factory) -> None:
+    """Counts sessions begun and times every statement on `engine`."""
+
+    @event.listens_for(session_factory, "after_begin")
+    def _count_session(session, transaction, connection) -> None:
+        DB_SESSIONS.inc()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query_timer(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _observe_query(conn, cursor, statement, parameters, context, many):
+        started = conn.info.get("query_started_at")
+        if started:
+            DB_QUERY_DURATION.observe(time.perf_counter() - started.pop())
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency per route template (not raw
+    path, which would explode label cardinality). Requests that match no
+    route are grouped under "unmatched".
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in HTTP_METHODS else "OTHER"
+        status = {"code": 500}
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            HTTP_REQUEST_DURATION.labels(
+                method, route_path, str(status["code"])
+            ).observe(time.perf_counter() - started)
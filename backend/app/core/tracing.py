@@ -0,0 +1,420 @@
+# app/core/tracing.py
+import atexit
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+import requests
+from sqlalchemy import event
+
+from app.core.config import settings
+
+# Lightweight tracing: spans live in a context variable, are head-sampled at
+# the root (TRACING_SAMPLE_RATE, or the caller's W3C traceparent decision),
+# and finished spans are batched to an exporter on a background thread.
+# Everything under an unsampled root reuses the root's non-recording span, so
+# unsampled requests pay about one context-variable lookup per instrumented call.
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_HEADER = "traceparent"
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+EXPORT_QUEUE_SIZE = 4096
+EXPORT_BATCH_SIZE = 512
+EXPORT_INTERVAL_SECONDS = 2.0
+MAX_STATEMENT_LENGTH = 200
+
+EXPORTER_CONSOLE = "console"
+EXPORTER_FILE = "file"
+EXPORTER_ZIPKIN = "zipkin"
+
+
+class Span:
+    """One timed operation in a trace. Attributes are flat key/value pairs."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+        "sampled",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str],
+        sampled: bool,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.kind = kind
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        if self.sampled:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.sampled:
+            _export(self)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "duration_us": ((self.end_ns or self.start_ns) - self.start_ns) // 1000,
+            "attributes": self.attributes,
+            "error": self.error,
+            "service": settings.TRACING_SERVICE_NAME or settings.PROJECT_NAME,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def tracing_enabled() -> bool:
+    return bool(settings.TRACING_EXPORTER) and settings.TRACING_SAMPLE_RATE > 0
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def _new_trace_id() -> str:
+    return f"{random.getrandbits(128):032x}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Span]:
+    """A stand-in parent span for a W3C traceparent header, or None if invalid."""
+    match = TRACEPARENT_PATTERN.match((value or "").strip().lower())
+    if not match:
+        return None
+    trace_id, span_id, flags = match.groups()
+    parent = Span("remote", trace_id, None, sampled=bool(int(flags, 16) & 1))
+    parent.span_id = span_id
+    return parent
+
+
+def start_span(
+    name: str,
+    parent: Optional[Span] = None,
+    kind: str = "internal",
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Optional[Span]:
+    """
+    Starts a span under `parent` (default: the current span) without making
+    it current; the caller must end() it. Returns None when tracing is off,
+    so callers can skip attribute work entirely.
+    """
+    if not tracing_enabled():
+        return None
+    parent = parent or _current_span.get()
+    if parent is None:
+        sampled = random.random() < settings.TRACING_SAMPLE_RATE
+        return Span(
+            name, _new_trace_id(), None, sampled, kind, attributes if sampled else None
+        )
+    if not parent.sampled:
+        return parent
+    return Span(name, parent.trace_id, parent.span_id, True, kind, attributes)
+
+
+def activate(active: Span) -> Token:
+    """Makes `active` the current span until `deactivate(token)`."""
+    return _current_span.set(active)
+
+
+def deactivate(token: Token) -> None:
+    _current_span.reset(token)
+
+
+@contextmanager
+def span(
+    name: str,
+    parent: Optional[Span] = None,
+    kind: str = "internal",
+    attributes: Optional[Dict[str, Any]] = None,
+) -> Iterator[Optional[Span]]:
+    """Runs the block in a new current span; exceptions are recorded on it."""
+    new_span = start_span(name, parent=parent, kind=kind, attributes=attributes)
+    if new_span is None:
+        yield None
+        return
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as e:
+        new_span.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        new_span.end()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator form of `span`, named after the function by default."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracing_enabled():
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def inject(headers: Dict[str, Any]) -> None:
+    """Adds the current span's traceparent to outgoing headers."""
+    active = _current_span.get()
+    if active is not None:
+        headers[TRACEPARENT_HEADER] = active.traceparent
+
+
+def extract(headers: Optional[Mapping[str, Any]]) -> Optional[Span]:
+    if not headers:
+        return None
+    return parse_traceparent(headers.get(TRACEPARENT_HEADER))
+
+
+def trace_database(engine) -> None:
+    """Records a client span per statement executed on `engine`."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_query_span(conn, cursor, statement, parameters, context, many):
+        # Only inside a trace: lone statements (startup, migrations) are noise.
+        query_span = None
+        if _current_span.get() is not None:
+            query_span = start_span(
+                "db.query",
+                kind="client",
+                attributes={"db.statement": statement[:MAX_STATEMENT_LENGTH]},
+            )
+        conn.info.setdefault("query_spans", []).append(query_span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end_query_span(conn, cursor, statement, parameters, context, many):
+        spans = conn.info.get("query_spans")
+        if spans:
+            query_span = spans.pop()
+            if query_span is not None:
+                query_span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _fail_query_span(exception_context):
+        conn = exception_context.connection
+        spans = conn.info.get("query_spans") if conn is not None else None
+        if spans:
+            query_span = spans.pop()
+            if query_span is not None:
+                query_span.record_error(exception_context.original_exception)
+                query_span.end()
+
+
+# --- Export -----------------------------------------------------------------
+
+
+class _SpanExporter:
+    """Batches finished spans to the configured exporter off the request path."""
+
+    def __init__(self):
+        self._queue: "queue.Queue[Span]" = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def submit(self, finished: Span) -> None:
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(finished)
+        except queue.Full:
+            self.dropped += 1
+
+    def _ensure_thread(self) -> None:
+        # Forked workers (Celery prefork, uvicorn workers) need their own thread.
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="span-exporter", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(timeout=EXPORT_INTERVAL_SECONDS)
+            if batch:
+                self.export(batch)
+
+    def _drain(self, timeout: float) -> List[Span]:
+        """Up to a batch of spans, waiting at most `timeout` for the first."""
+        batch: List[Span] = []
+        try:
+            batch.append(
+                self._queue.get(timeout=timeout)
+                if timeout
+                else self._queue.get_nowait()
+            )
+            while len(batch) < EXPORT_BATCH_SIZE:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def flush(self) -> None:
+        while True:
+            batch = self._drain(timeout=0)
+            if not batch:
+                return
+            self.export(batch)
+
+    def export(self, batch: List[Span]) -> None:
+        exporter = settings.TRACING_EXPORTER
+        try:
+            if exporter == EXPORTER_CONSOLE:
+                for finished in batch:
+                    logger.info(json.dumps(finished.to_dict(), default=str))
+            elif exporter == EXPORTER_FILE:
+                lines = "".join(
+                    json.dumps(finished.to_dict(), default=str) + "\n"
+                    for finished in batch
+                )
+                with open(settings.TRACING_FILE_PATH, "a", encoding="utf-8") as f:
+                    f.write(lines)
+            elif exporter == EXPORTER_ZIPKIN:
+                requests.post(
+                    settings.TRACING_COLLECTOR_URL,
+                    json=[to_zipkin(finished) for finished in batch],
+                    timeout=5,
+                )
+        except Exception as e:
+            logger.warning("Could not export %d spans: %s", len(batch), e)
+
+
+def to_zipkin(finished: Span) -> Dict[str, Any]:
+    """Zipkin v2 JSON, accepted by Zipkin, Jaeger and OpenTelemetry collectors."""
+    record: Dict[str, Any] = {
+        "traceId": finished.trace_id,
+        "id": finished.span_id,
+        "name": finished.name,
+        "timestamp": finished.start_ns // 1000,
+        "duration": max(
+            1, ((finished.end_ns or finished.start_ns) - finished.start_ns) // 1000
+        ),
+        "localEndpoint": {
+            "serviceName": settings.TRACING_SERVICE_NAME or settings.PROJECT_NAME
+        },
+        "tags": {key: str(value) for key, value in finished.attributes.items()},
+    }
+    if finished.parent_id:
+        record["parentId"] = finished.parent_id
+    if finished.kind in ("server", "client", "producer", "consumer"):
+        record["kind"] = finished.kind.upper()
+    if finished.error:
+        record["tags"]["error"] = finished.error
+    return record
+
+
+_exporter = _SpanExporter()
+atexit.register(_exporter.flush)
+
+
+def _export(finished: Span) -> None:
+    _exporter.submit(finished)
+
+
+def flush() -> None:
+    """Exports everything queued so far (e.g. before a worker process exits)."""
+    _exporter.flush()
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware opening a server span per request, continuing the
+    caller's trace when a traceparent header is sent, and echoing the
+    traceparent in the response so a slow page can be looked up.
+    """
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+        with span(
+            f"HTTP {scope['method']}",
+            parent=extract(headers),
+            kind="server",
+            attributes={"http.method": scope["method"], "http.target": scope["path"]},
+        ) as request_span:
+
+            async def send_wrapper(message) -> None:
+                if message["type"] == "http.response.start":
+                    request_span.set_attribute("http.status_code", message["status"])
+                    if request_span.sampled:
+                        message.setdefault("headers", [])
+                        message["headers"] = list(message["headers"]) + [
+                            (b"traceparent", request_span.traceparent.encode())
+                        ]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    request_span.name = f"HTTP {scope['method']} {route}"
+                    request_span.set_attribute("http.route", route)
@@ -2,15 +2,18 @@
 from .crud_user import create_user, get_user_by_email
 from .crud_asset import (
     create_asset,
+    bulk_create_assets,
     get_asset,
     get_asset_by_symbol,
     get_assets,
+    get_assets_by_symbols,
     update_asset,
     remove_asset,
     update_asset_last_price_timestamp,
 )
 from .crud_portfolio_holding import (
     create_portfolio_holding,
+    bulk_create_portfolio_holdings,
     get_portfolio_holdings_by_user,
     get_portfolio_holding,
     update_portfolio_holding,
@@ -22,18 +25,43 @@ from .crud_watchlist import (
     add_asset_to_watchlist,
     get_watchlist_items_by_user,
     remove_asset_from_watchlist,
+    get_user_tracked_assets,
+    get_tracked_assets_by_popularity,
+)
+from .crud_price_alert import (
+    create_price_alert,
+    get_price_alert,
+    get_price_alerts_by_user,
+    get_active_price_alerts,
+    mark_price_alerts_triggered,
+    remove_price_alert,
+)
+from .crud_provider_symbol import (
+    get_provider_symbols_by_asset,
+    get_provider_symbol_map,
+    set_provider_symbol,
+    remove_provider_symbol,
+)
+from .crud_corporate_action import (
+    get_corporate_actions_by_asset,
+    get_corporate_action_map,
+    add_corporate_actions,
+    remove_corporate_action,
 )
 
 __all__ = [
     "create_user",
     "get_user_by_email",
     "create_asset",
+    "bulk_create_assets",
     "get_asset",
     "get_asset_by_symbol",
     "get_assets",
+    "get_assets_by_symbols",
     "update_asset",
     "remove_asset",
     "create_portfolio_holding",
+    "bulk_create_portfolio_holdings",
     "get_portfolio_holdings_by_user",
     "get_portfolio_holding",
     "update_portfolio_holding",
@@ -44,4 +72,20 @@ __all__ = [
     "add_asset_to_watchlist",
     "get_watchlist_items_by_user",
     "remove_asset_from_watchlist",
+    "get_user_tracked_assets",
+    "get_tracked_assets_by_popularity",
+    "create_price_alert",
+    "get_price_alert",
+    "get_price_alerts_by_user",
+    "get_active_price_alerts",
+    "mark_price_alerts_triggered",
+    "remove_price_alert",
+    "get_provider_symbols_by_asset",
+    "get_provider_symbol_map",
+    "set_provider_symbol",
+    "remove_provider_symbol",
+    "get_corporate_actions_by_asset",
+    "get_corporate_action_map",
+    "add_corporate_actions",
+    "remove_corporate_action",
 ]
@@ -1,5 +1,6 @@
 # app/crud/crud_asset.py
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional, Union, Dict, Any
 from app import models, schemas
 from datetime import datetime
@@ -17,11 +18,22 @@ def get_assets(db: Session, skip: int = 0, limit: int = 100) -> List[models.Asse
     return db.query(models.Asset).offset(skip).limit(limit).all()
 
 
+def get_assets_by_symbols(db: Session, *, symbols: List[str]) -> List[models.Asset]:
+    """
+    Fetches all assets matching any of the given symbols in a single query.
+    """
+    upper_symbols = {symbol.upper() for symbol in symbols}
+    if not upper_symbols:
+        return []
+    return db.query(models.Asset).filter(models.Asset.symbol.in_(upper_symbols)).all()
+
+
 def create_asset(db: Session, *, asset_in: schemas.AssetCreate) -> models.Asset:
     db_asset = models.Asset(
         symbol=asset_in.symbol.upper(),
         name=asset_in.name,
         asset_type=asset_in.asset_type,
+        currency=asset_in.currency,
     )
     db.add(db_asset)
     db.commit()
@@ -29,6 +41,35 @@ def create_asset(db: Session, *, asset_in: schemas.AssetCreate) -> models.Asset:
     return db_asset
 
 
+def bulk_create_assets(
+    db: Session, *, assets_in: List[schemas.AssetCreate], chunk_size: int = 5000
+) -> List[str]:
+    """
+    Inserts many assets with INSERT ... ON CONFLICT (symbol) DO NOTHING, in a
+    single transaction. Returns the symbols that were actually created.
+    """
+    rows = [
+        {
+            "symbol": asset_in.symbol.upper(),
+            "name": asset_in.name,
+            "asset_type": asset_in.asset_type,
+            "currency": asset_in.currency,
+        }
+        for asset_in in assets_in
+    ]
+    created_symbols: List[str] = []
+    for start in range(0, len(rows), chunk_size):
+        stmt = (
+            pg_insert(models.Asset)
+            .values(rows[start : start + chunk_size])
+            .on_conflict_do_nothing(index_elements=["symbol"])
+            .returning(models.Asset.symbol)
+        )
+        created_symbols.extend(db.execute(stmt).scalars().all())
+    db.commit()
+    return created_symbols
+
+
 def update_asset(
     db: Session,
     *,
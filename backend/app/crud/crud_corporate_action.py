@@ -0,0 +1,97 @@
+# app/crud/crud_corporate_action.py
+from datetime import date
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Dict, List, Optional, Sequence, Tuple
+from app import models, schemas
+
+
+def get_corporate_actions_by_asset(
+    db: Session, *, asset_id: int
+) -> List[models.CorporateAction]:
+    return (
+        db.query(models.CorporateAction)
+        .filter(models.CorporateAction.asset_id == asset_id)
+        .order_by(models.CorporateAction.ex_date, models.CorporateAction.id)
+        .all()
+    )
+
+
+def get_corporate_action_map(
+    db: Session,
+) -> Dict[str, List[Tuple[str, date, float]]]:
+    """
+    Every stored action as {asset symbol: [(action type, ex-date, value)]},
+    oldest first, in a single query.
+    """
+    rows = (
+        db.query(
+            models.Asset.symbol,
+            models.CorporateAction.action_type,
+            models.CorporateAction.ex_date,
+            models.CorporateAction.value,
+        )
+        .join(
+            models.CorporateAction, models.CorporateAction.asset_id == models.Asset.id
+        )
+        .order_by(models.CorporateAction.ex_date)
+        .all()
+    )
+    mapping: Dict[str, List[Tuple[str, date, float]]] = {}
+    for symbol, action_type, ex_date, value in rows:
+        mapping.setdefault(symbol.upper(), []).append(
+            (action_type.value, ex_date, value)
+        )
+    return mapping
+
+
+def add_corporate_actions(
+    db: Session,
+    *,
+    asset_id: int,
+    actions: Sequence[schemas.CorporateActionCreate],
+    source: Optional[str] = None,
+) -> List[models.CorporateAction]:
+    """
+    Inserts the actions the asset does not have yet (same type and ex-date)
+    and returns those rows; existing ones are left as they are.
+    """
+    if not actions:
+        return []
+    stmt = (
+        pg_insert(models.CorporateAction)
+        .values(
+            [
+                {
+                    "asset_id": asset_id,
+                    "action_type": action.action_type,
+                    "ex_date": action.ex_date,
+                    "value": action.value,
+                    "source": source,
+                }
+                for action in actions
+            ]
+        )
+        .on_conflict_do_nothing(constraint="_asset_action_ex_date_uc")
+        .returning(models.CorporateAction)
+    )
+    db_objs = list(db.execute(stmt).scalars().all())
+    db.commit()
+    return db_objs
+
+
+def remove_corporate_action(
+    db: Session, *, asset_id: int, action_id: int
+) -> Optional[models.CorporateAction]:
+    db_obj = (
+        db.query(models.CorporateAction)
+        .filter(
+            models.CorporateAction.asset_id == asset_id,
+            models.CorporateAction.id == action_id,
+        )
+        .first()
+    )
+    if db_obj:
+        db.delete(db_obj)
+        db.commit()
+    return db_obj
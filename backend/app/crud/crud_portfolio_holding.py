@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional, Union, Dict, Any
 from app import models, schemas
 from app.crud import get_asset
-from sqlalchemy import func, cast, Float
+from sqlalchemy import func, cast, Float, insert
 
 
 def create_portfolio_holding(
@@ -16,6 +16,21 @@ def create_portfolio_holding(
     return db_holding
 
 
+def bulk_create_portfolio_holdings(
+    db: Session, *, holdings_in: List[Dict[str, Any]], user_id: int
+) -> int:
+    """
+    Inserts many holdings for a user with a single multi-row INSERT and commits.
+    Each item must provide asset_id, quantity, purchase_price and purchase_date.
+    """
+    if not holdings_in:
+        return 0
+    rows = [{**holding, "user_id": user_id} for holding in holdings_in]
+    db.execute(insert(models.PortfolioHolding), rows)
+    db.commit()
+    return len(rows)
+
+
 def get_portfolio_holdings_by_user(
     db: Session, *, user_id: int, skip: int = 0, limit: int = 100
 ) -> List[models.PortfolioHolding]:
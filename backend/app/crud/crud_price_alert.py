@@ -0,0 +1,103 @@
+# app/crud/crud_price_alert.py
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import update
+from typing import List, Optional, Tuple
+from datetime import datetime
+from app import models, schemas
+
+
+def create_price_alert(
+    db: Session,
+    *,
+    alert_in: schemas.PriceAlertCreate,
+    user_id: int,
+    reference_price: Optional[float] = None,
+) -> models.PriceAlert:
+    db_alert = models.PriceAlert(
+        **alert_in.model_dump(),
+        user_id=user_id,
+        reference_price=reference_price,
+        is_active=True,
+    )
+    db.add(db_alert)
+    db.commit()
+    db.refresh(db_alert)
+    return db_alert
+
+
+def get_price_alert(
+    db: Session, *, alert_id: int, user_id: int
+) -> Optional[models.PriceAlert]:
+    return (
+        db.query(models.PriceAlert)
+        .filter(
+            models.PriceAlert.id == alert_id,
+            models.PriceAlert.user_id == user_id,
+        )
+        .options(joinedload(models.PriceAlert.asset))
+        .first()
+    )
+
+
+def get_price_alerts_by_user(
+    db: Session,
+    *,
+    user_id: int,
+    active_only: bool = False,
+    skip: int = 0,
+    limit: int = 100,
+) -> List[models.PriceAlert]:
+    query = db.query(models.PriceAlert).filter(models.PriceAlert.user_id == user_id)
+    if active_only:
+        query = query.filter(models.PriceAlert.is_active.is_(True))
+    return (
+        query.options(joinedload(models.PriceAlert.asset))
+        .order_by(models.PriceAlert.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_active_price_alerts(db: Session) -> List[models.PriceAlert]:
+    return (
+        db.query(models.PriceAlert)
+        .filter(models.PriceAlert.is_active.is_(True))
+        .options(joinedload(models.PriceAlert.asset))
+        .all()
+    )
+
+
+def mark_price_alerts_triggered(
+    db: Session, *, alert_ids: List[int], price: float, triggered_at: datetime
+) -> List[Tuple[int, int]]:
+    """
+    Deactivates the given alerts if they are still active and returns the
+    (alert_id, user_id) pairs that this call actually triggered. The guarded
+    UPDATE makes concurrent evaluators fire each alert at most once.
+    """
+    if not alert_ids:
+        return []
+    stmt = (
+        update(models.PriceAlert)
+        .where(
+            models.PriceAlert.id.in_(alert_ids),
+            models.PriceAlert.is_active.is_(True),
+        )
+        .values(is_active=False, triggered_at=triggered_at, triggered_price=price)
+        .returning(models.PriceAlert.id, models.PriceAlert.user_id)
+    )
+    triggered = [(row.id, row.user_id) for row in db.execute(stmt).all()]
+    db.commit()
+    return triggered
+
+
+def remove_price_alert(
+    db: Session, *, alert_id: int, user_id: int
+) -> Optional[models.PriceAlert]:
+    db_alert = get_price_alert(db=db, alert_id=alert_id, user_id=user_id)
+    if db_alert:
+        db.delete(db_alert)
+        db.commit()
+        return db_alert
+    return None
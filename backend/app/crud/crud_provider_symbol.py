@@ -0,0 +1,73 @@
+# app/crud/crud_provider_symbol.py
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Dict, List, Optional
+from app import models
+
+
+def get_provider_symbols_by_asset(
+    db: Session, *, asset_id: int
+) -> List[models.ProviderSymbol]:
+    return (
+        db.query(models.ProviderSymbol)
+        .filter(models.ProviderSymbol.asset_id == asset_id)
+        .order_by(models.ProviderSymbol.provider)
+        .all()
+    )
+
+
+def get_provider_symbol_map(db: Session) -> Dict[str, Dict[str, str]]:
+    """
+    Every stored mapping as {asset symbol: {provider name: ticker}}, in a
+    single query.
+    """
+    rows = (
+        db.query(
+            models.Asset.symbol,
+            models.ProviderSymbol.provider,
+            models.ProviderSymbol.ticker,
+        )
+        .join(models.ProviderSymbol, models.ProviderSymbol.asset_id == models.Asset.id)
+        .all()
+    )
+    mapping: Dict[str, Dict[str, str]] = {}
+    for symbol, provider, ticker in rows:
+        mapping.setdefault(symbol.upper(), {})[provider] = ticker
+    return mapping
+
+
+def set_provider_symbol(
+    db: Session, *, asset_id: int, provider: str, ticker: str
+) -> models.ProviderSymbol:
+    """Creates or replaces the asset's ticker for `provider`."""
+    stmt = (
+        pg_insert(models.ProviderSymbol)
+        .values(asset_id=asset_id, provider=provider, ticker=ticker)
+        .on_conflict_do_update(
+            constraint="_asset_provider_uc",
+            set_={"ticker": ticker, "updated_at": func.now()},
+        )
+        .returning(models.ProviderSymbol)
+        .execution_options(populate_existing=True)
+    )
+    db_obj = db.execute(stmt).scalars().one()
+    db.commit()
+    return db_obj
+
+
+def remove_provider_symbol(
+    db: Session, *, asset_id: int, provider: str
+) -> Optional[models.ProviderSymbol]:
+    db_obj = (
+        db.query(models.ProviderSymbol)
+        .filter(
+            models.ProviderSymbol.asset_id == asset_id,
+            models.ProviderSymbol.provider == provider,
+        )
+        .first()
+    )
+    if db_obj:
+        db.delete(db_obj)
+        db.commit()
+    return db_obj
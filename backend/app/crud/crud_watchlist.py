@@ -1,6 +1,7 @@
 # app/crud/crud_watchlist.py
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from sqlalchemy import func, select, union, union_all
+from typing import List, Optional, Tuple
 from app import models
 
 
@@ -62,3 +63,52 @@ def remove_asset_from_watchlist(
         db.commit()
         return db_watchlist_item
     return None
+
+
+def get_user_tracked_assets(db: Session, *, user_id: int) -> List[Tuple[str, str]]:
+    """
+    Returns distinct (symbol, asset_type) pairs for every asset the user either
+    watches or holds, in a single query.
+    """
+    watched_ids = select(models.WatchlistItem.asset_id).where(
+        models.WatchlistItem.user_id == user_id
+    )
+    held_ids = select(models.PortfolioHolding.asset_id).where(
+        models.PortfolioHolding.user_id == user_id
+    )
+    rows = (
+        db.query(models.Asset.symbol, models.Asset.asset_type)
+        .filter(models.Asset.id.in_(union(watched_ids, held_ids)))
+        .order_by(models.Asset.symbol)
+        .all()
+    )
+    return [(row.symbol, row.asset_type.value) for row in rows]
+
+
+def get_tracked_assets_by_popularity(
+    db: Session, *, limit: Optional[int] = None
+) -> List[Tuple[str, str]]:
+    """
+    Returns (symbol, asset_type) for every asset any user watches or holds,
+    most-tracked first (distinct users), in a single query.
+    """
+    trackers = union_all(
+        select(
+            models.WatchlistItem.asset_id.label("asset_id"),
+            models.WatchlistItem.user_id.label("user_id"),
+        ),
+        select(
+            models.PortfolioHolding.asset_id.label("asset_id"),
+            models.PortfolioHolding.user_id.label("user_id"),
+        ),
+    ).subquery()
+    user_count = func.count(func.distinct(trackers.c.user_id))
+    query = (
+        db.query(models.Asset.symbol, models.Asset.asset_type)
+        .join(trackers, trackers.c.asset_id == models.Asset.id)
+        .group_by(models.Asset.id, models.Asset.symbol, models.Asset.asset_type)
+        .order_by(user_count.desc(), models.Asset.symbol)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    return [(row.symbol, row.asset_type.value) for row in query.all()]
@@ -6,5 +6,17 @@ from app.models.user import User
 from app.models.asset import Asset
 from app.models.portfolio_holding import PortfolioHolding
 from app.models.watchlist_item import WatchlistItem
+from app.models.price_alert import PriceAlert
+from app.models.provider_symbol import ProviderSymbol
+from app.models.corporate_action import CorporateAction
 
-__all__ = ["Base", "User", "Asset", "PortfolioHolding", "WatchlistItem"]
+__all__ = [
+    "Base",
+    "User",
+    "Asset",
+    "PortfolioHolding",
+    "WatchlistItem",
+    "PriceAlert",
+    "ProviderSymbol",
+    "CorporateAction",
+]
@@ -2,15 +2,23 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core import tracing
+from app.core.metrics import instrument_database
 
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_database(engine, SessionLocal)
+tracing.trace_database(engine)
 
 
 # Dependency to get DB session
 def get_db():
+    # Not made current: FastAPI may finish this generator in another context.
+    session_span = tracing.start_span("db.session")
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+        if session_span is not None:
+            session_span.end()
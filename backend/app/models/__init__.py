@@ -3,5 +3,19 @@ from .user import User
 from .asset import Asset, AssetType
 from .portfolio_holding import PortfolioHolding
 from .watchlist_item import WatchlistItem
+from .price_alert import PriceAlert, AlertCondition
+from .provider_symbol import ProviderSymbol
+from .corporate_action import CorporateAction, CorporateActionType
 
-__all__ = ["User", "Asset", "AssetType", "PortfolioHolding", "WatchlistItem"]
+__all__ = [
+    "User",
+    "Asset",
+    "AssetType",
+    "PortfolioHolding",
+    "WatchlistItem",
+    "PriceAlert",
+    "AlertCondition",
+    "ProviderSymbol",
+    "CorporateAction",
+    "CorporateActionType",
+]
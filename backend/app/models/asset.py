@@ -6,6 +6,10 @@ from app.db.base_class import Base
 import enum
 
 
+# Prices from providers are quoted in the asset's listing currency.
+DEFAULT_CURRENCY = "USD"
+
+
 class AssetType(enum.Enum):
     STOCK = "stock"
     CRYPTO = "crypto"
@@ -18,6 +22,12 @@ class Asset(Base):
     symbol = Column(String, unique=True, index=True, nullable=False)
     name = Column(String, index=True)
     asset_type = Column(SAEnum(AssetType), nullable=False, index=True)
+    currency = Column(
+        String(3),
+        nullable=False,
+        default=DEFAULT_CURRENCY,
+        server_default=DEFAULT_CURRENCY,
+    )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -25,3 +35,15 @@ class Asset(Base):
 
     holdings = relationship("PortfolioHolding", back_populates="asset_info")
     watched_by_users_items = relationship("WatchlistItem", back_populates="asset")
+    provider_symbols = relationship(
+        "ProviderSymbol",
+        back_populates="asset",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    corporate_actions = relationship(
+        "CorporateAction",
+        back_populates="asset",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
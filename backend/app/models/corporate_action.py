@@ -0,0 +1,50 @@
+# app/models/corporate_action.py
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    Date,
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+import enum
+
+
+class CorporateActionType(enum.Enum):
+    SPLIT = "split"
+    DIVIDEND = "dividend"
+
+
+class CorporateAction(Base):
+    """
+    A split or cash dividend, by ex-date. `value` is the split ratio (shares
+    after / before, 4.0 for a 4-for-1) or the dividend per share as paid, in
+    the asset's currency.
+    """
+
+    __tablename__ = "corporate_actions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    asset_id = Column(
+        Integer, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False
+    )
+    action_type = Column(SAEnum(CorporateActionType), nullable=False)
+    ex_date = Column(Date, nullable=False)
+    value = Column(Float, nullable=False)
+    # Provider the action was read from; None when entered by hand.
+    source = Column(String(50), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    asset = relationship("Asset", back_populates="corporate_actions")
+
+    __table_args__ = (
+        UniqueConstraint(
+            "asset_id", "action_type", "ex_date", name="_asset_action_ex_date_uc"
+        ),
+    )
@@ -0,0 +1,40 @@
+# app/models/price_alert.py
+from sqlalchemy import (
+    Column,
+    Integer,
+    Float,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Enum as SAEnum,
+)
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+import enum
+
+
+class AlertCondition(enum.Enum):
+    ABOVE = "above"
+    BELOW = "below"
+    PERCENT_MOVE = "percent_move"
+    SMA_CROSS = "sma_cross"
+
+
+class PriceAlert(Base):
+    __tablename__ = "price_alerts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    asset_id = Column(Integer, ForeignKey("assets.id"), nullable=False, index=True)
+    condition = Column(SAEnum(AlertCondition), nullable=False)
+    threshold = Column(Float, nullable=True)
+    sma_window = Column(Integer, nullable=True)
+    reference_price = Column(Float, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False, index=True)
+    triggered_at = Column(DateTime(timezone=True), nullable=True)
+    triggered_price = Column(Float, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    owner = relationship("User", back_populates="price_alerts")
+    asset = relationship("Asset")
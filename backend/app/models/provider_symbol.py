@@ -0,0 +1,27 @@
+# app/models/provider_symbol.py
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+
+class ProviderSymbol(Base):
+    """The ticker one market data provider uses for an asset."""
+
+    __tablename__ = "provider_symbols"
+
+    id = Column(Integer, primary_key=True, index=True)
+    asset_id = Column(
+        Integer, ForeignKey("assets.id", ondelete="CASCADE"), nullable=False
+    )
+    provider = Column(String(50), nullable=False)
+    ticker = Column(String(50), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    asset = relationship("Asset", back_populates="provider_symbols")
+
+    __table_args__ = (
+        UniqueConstraint("asset_id", "provider", name="_asset_provider_uc"),
+    )
@@ -19,3 +19,6 @@ class User(Base):
     watchlist_items = relationship(
         "WatchlistItem", back_populates="owner", cascade="all, delete-orphan"
     )
+    price_alerts = relationship(
+        "PriceAlert", back_populates="owner", cascade="all, delete-orphan"
+    )
@@ -1,16 +1,31 @@
 # app/schemas/__init__.py
 from .user import User, UserCreate
 from .token import Token, TokenData
-from .asset import Asset, AssetCreate, AssetUpdate
+from .asset import (
+    Asset,
+    AssetCreate,
+    AssetUpdate,
+    AssetBulkCreate,
+    AssetBulkCreateResult,
+)
 from .portfolio_holding import (
     PortfolioHolding,
     PortfolioHoldingCreate,
     PortfolioHoldingUpdate,
 )
 from .financial_data import AssetCurrentPrice, HistoricalPricePoint
+from .price_event import PriceChangeEvent
+from .price_alert import PriceAlert, PriceAlertCreate
+from .provider_symbol import ProviderSymbol, ProviderSymbolSet
+from .corporate_action import CorporateAction, CorporateActionCreate
 from .portfolio_summary import PortfolioSummary
 from .user_asset_summary import UserAssetSummaryItem
 from .watchlist import WatchlistItemCreate, WatchlistItemResponse
+from .portfolio_import import (
+    PortfolioHoldingImportRow,
+    PortfolioImportRowError,
+    PortfolioImportResult,
+)
 
 __all__ = [
     "User",
@@ -20,13 +35,25 @@ __all__ = [
     "Asset",
     "AssetCreate",
     "AssetUpdate",
+    "AssetBulkCreate",
+    "AssetBulkCreateResult",
     "PortfolioHolding",
     "PortfolioHoldingCreate",
     "PortfolioHoldingUpdate",
     "AssetCurrentPrice",
     "HistoricalPricePoint",
+    "PriceChangeEvent",
+    "PriceAlert",
+    "PriceAlertCreate",
+    "ProviderSymbol",
+    "ProviderSymbolSet",
+    "CorporateAction",
+    "CorporateActionCreate",
     "PortfolioSummary",
     "UserAssetSummaryItem",
     "WatchlistItemCreate",
     "WatchlistItemResponse",
+    "PortfolioHoldingImportRow",
+    "PortfolioImportRowError",
+    "PortfolioImportResult",
 ]
@@ -1,8 +1,14 @@
 # app/schemas/asset.py
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
 from datetime import datetime
-from app.models.asset import AssetType
+from app.models.asset import DEFAULT_CURRENCY, AssetType
+
+CURRENCY_PATTERN = r"^[A-Z]{3}$"
+
+
+def _normalize_currency(value: Optional[str]) -> Optional[str]:
+    return value.strip().upper() if isinstance(value, str) else value
 
 
 # Shared properties
@@ -10,6 +16,13 @@ class AssetBase(BaseModel):
     symbol: str = Field(..., min_length=1, max_length=50)
     name: Optional[str] = Field(None, max_length=100)
     asset_type: AssetType
+    # ISO 4217 code the asset's prices are quoted in.
+    currency: str = Field(DEFAULT_CURRENCY, pattern=CURRENCY_PATTERN)
+
+    @field_validator("currency", mode="before")
+    @classmethod
+    def normalize_currency(cls, value: Optional[str]) -> str:
+        return _normalize_currency(value) or DEFAULT_CURRENCY
 
 
 # Properties to receive via API on creation
@@ -17,11 +30,35 @@ class AssetCreate(AssetBase):
     pass
 
 
+# Properties to receive via API on bulk creation
+class AssetBulkCreate(BaseModel):
+    assets: List[AssetCreate] = Field(..., min_length=1, max_length=20000)
+    validate_symbols: bool = False
+
+
+# Outcome of a bulk creation request
+class AssetBulkCreateResult(BaseModel):
+    requested_count: int = 0
+    unique_count: int = 0
+    created_count: int = 0
+    existing_count: int = 0
+    invalid_count: int = 0
+    created_symbols: List[str] = []
+    invalid_symbols: List[str] = []
+    elapsed_seconds: float = 0.0
+
+
 # Properties to receive via API on update
 class AssetUpdate(BaseModel):  # Or inherit AssetBase and make fields optional
     symbol: Optional[str] = Field(None, min_length=1, max_length=50)
     name: Optional[str] = Field(None, max_length=100)
     asset_type: Optional[AssetType] = None
+    currency: Optional[str] = Field(None, pattern=CURRENCY_PATTERN)
+
+    @field_validator("currency", mode="before")
+    @classmethod
+    def normalize_currency(cls, value: Optional[str]) -> Optional[str]:
+        return _normalize_currency(value)
 
 
 # Properties shared by models stored in DB
@@ -0,0 +1,27 @@
+# app/schemas/corporate_action.py
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+from typing import Optional
+from app.models.corporate_action import CorporateActionType
+
+
+class CorporateActionBase(BaseModel):
+    action_type: CorporateActionType
+    ex_date: date
+    # Split ratio (shares after / before) or dividend per share as paid.
+    value: float = Field(..., gt=0)
+
+
+# Properties to receive via API when recording an action
+class CorporateActionCreate(CorporateActionBase):
+    pass
+
+
+# Properties to return to client
+class CorporateAction(CorporateActionBase):
+    id: int
+    asset_id: int
+    source: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
@@ -8,6 +8,7 @@ class AssetCurrentPrice(BaseModel):
     symbol: str
     price: float
     last_updated: datetime
+    is_stale: bool = False
 
 
 class HistoricalPricePoint(BaseModel):
@@ -19,3 +20,5 @@ class HistoricalPricePoint(BaseModel):
     volume: int
     sma20: Optional[float] = None  # Add SMA fields
     sma50: Optional[float] = None
+    # Bar start (UTC) for intraday intervals; daily bars have only a date.
+    timestamp: Optional[datetime] = None
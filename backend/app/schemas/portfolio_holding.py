@@ -22,6 +22,11 @@ class PortfolioHolding(PortfolioHoldingBase):
     created_at: datetime
     asset_info: Optional[Asset] = None
 
+    # Valuation, in `currency` (the requested base currency). purchase_value
+    # converts at the rate on the purchase date, current values at fx_rate.
+    currency: Optional[str] = None
+    fx_rate: Optional[float] = None
+    purchase_value: Optional[float] = None
     current_price: Optional[float] = None
     current_value: Optional[float] = None
     gain_loss: Optional[float] = None
@@ -0,0 +1,27 @@
+# app/schemas/portfolio_import.py
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
+
+
+class PortfolioHoldingImportRow(BaseModel):
+    symbol: str = Field(..., min_length=1, max_length=50)
+    quantity: float = Field(..., gt=0)
+    purchase_price: float = Field(..., ge=0)
+    purchase_date: datetime
+
+
+class PortfolioImportRowError(BaseModel):
+    row: int
+    symbol: Optional[str] = None
+    error: str
+
+
+class PortfolioImportResult(BaseModel):
+    total_rows: int = 0
+    imported_count: int = 0
+    failed_count: int = 0
+    errors: List[PortfolioImportRowError] = []
+    errors_truncated: bool = False
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
@@ -1,12 +1,15 @@
 # app/schemas/portfolio_summary.py
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 from .portfolio_holding import PortfolioHolding
 
 
 class PortfolioSummary(BaseModel):
+    base_currency: str = "USD"
+    # Set when a holding was converted at a last-known, not current, rate.
+    fx_is_stale: bool = False
     total_purchase_value: float = 0.0
     total_current_value: float = 0.0
     total_gain_loss: float = 0.0
-    total_gain_loss_percent: float = 0.0
+    total_gain_loss_percent: Optional[float] = 0.0
     holdings: List[PortfolioHolding] = []
@@ -0,0 +1,38 @@
+# app/schemas/price_alert.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
+from typing import Literal, Optional
+from app.models.price_alert import AlertCondition
+from .asset import Asset
+
+
+class PriceAlertBase(BaseModel):
+    asset_id: int
+    condition: AlertCondition
+    # Price level for above/below, percent for percent_move.
+    threshold: Optional[float] = Field(None, gt=0)
+    sma_window: Optional[Literal[20, 50]] = None
+
+
+class PriceAlertCreate(PriceAlertBase):
+    @model_validator(mode="after")
+    def check_condition_parameters(self) -> "PriceAlertCreate":
+        if self.condition == AlertCondition.SMA_CROSS:
+            if self.sma_window is None:
+                raise ValueError("sma_window is required for sma_cross alerts")
+        elif self.threshold is None:
+            raise ValueError(f"threshold is required for {self.condition.value} alerts")
+        return self
+
+
+class PriceAlert(PriceAlertBase):
+    id: int
+    user_id: int
+    reference_price: Optional[float] = None
+    is_active: bool
+    triggered_at: Optional[datetime] = None
+    triggered_price: Optional[float] = None
+    created_at: datetime
+    asset: Optional[Asset] = None
+
+    model_config = {"from_attributes": True}
@@ -0,0 +1,13 @@
+# app/schemas/price_event.py
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class PriceChangeEvent(BaseModel):
+    symbol: str
+    asset_type: Optional[str] = None
+    price: float
+    previous_price: Optional[float] = None
+    timestamp: datetime
+    source: str
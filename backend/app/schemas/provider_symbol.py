@@ -0,0 +1,20 @@
+# app/schemas/provider_symbol.py
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional
+
+
+# Properties to receive via API when setting a provider's ticker
+class ProviderSymbolSet(BaseModel):
+    ticker: str = Field(..., min_length=1, max_length=50)
+
+
+# Properties to return to client
+class ProviderSymbol(BaseModel):
+    id: int
+    asset_id: int
+    provider: str
+    ticker: str
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
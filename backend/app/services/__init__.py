@@ -1 +1,9 @@
-from .financial_data_orchestrator import get_current_price, get_historical_data  # noqa
+from .financial_data_orchestrator import (  # noqa
+    get_current_price,
+    get_current_price_quote,
+    get_current_prices,
+    get_fx_rates,
+    get_historical_data,
+    get_intraday_bars,
+)
+from . import alert_engine  # noqa: F401  (registers the price-change handler)
@@ -0,0 +1,259 @@
+# app/services/alert_engine.py
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.cache import shared_cache
+from app.db.session import SessionLocal
+from app.models.price_alert import AlertCondition
+from . import financial_data_orchestrator as orchestrator
+from . import price_events
+
+logger = logging.getLogger(__name__)
+
+ALERTS_ABOVE_KEY_PREFIX = "alerts:above:"
+ALERTS_BELOW_KEY_PREFIX = "alerts:below:"
+ALERT_NOTIFICATIONS_CHANNEL_PREFIX = "alert_notifications:"
+ALERTS_REBUILD_KEY_PREFIX = "alerts_rebuild:"
+ALERTS_REBUILD_TTL_SECONDS = 10 * 60
+TRIGGER_MAX_WORKERS = 2
+
+# Alerts live in two Redis sorted sets per symbol, scored by the price level at
+# which they fire: "above" members fire once price >= score, "below" members
+# once price <= score. A price update is then two range queries that return
+# exactly the triggered alerts, independent of how many alerts exist.
+# Marking them triggered (a database write) and notifying their owners runs
+# on _trigger_executor, off the thread whose price fetch published the change.
+_trigger_executor = ThreadPoolExecutor(
+    max_workers=TRIGGER_MAX_WORKERS, thread_name_prefix="alert-trigger"
+)
+
+
+def _above_key(symbol: str) -> str:
+    return f"{ALERTS_ABOVE_KEY_PREFIX}{symbol.upper()}"
+
+
+def _below_key(symbol: str) -> str:
+    return f"{ALERTS_BELOW_KEY_PREFIX}{symbol.upper()}"
+
+
+def compute_trigger_levels(
+    alert: models.PriceAlert,
+    current_price: Optional[float] = None,
+    sma_value: Optional[float] = None,
+) -> Tuple[Optional[float], Optional[float]]:
+    """Returns the (above, below) price levels at which the alert fires."""
+    if alert.condition == AlertCondition.ABOVE:
+        return alert.threshold, None
+    if alert.condition == AlertCondition.BELOW:
+        return None, alert.threshold
+    if alert.condition == AlertCondition.PERCENT_MOVE:
+        if alert.reference_price is None:
+            return None, None
+        move = alert.reference_price * alert.threshold / 100
+        return alert.reference_price + move, alert.reference_price - move
+    if alert.condition == AlertCondition.SMA_CROSS:
+        if sma_value is None or current_price is None:
+            return None, None
+        if current_price < sma_value:
+            return sma_value, None
+        return None, sma_value
+    return None, None
+
+
+def _latest_sma(symbol: str, asset_type: str, window: int) -> Optional[float]:
+    history = orchestrator.get_historical_data(symbol, asset_type)
+    for point in reversed(history or []):
+        value = point.get(f"sma{window}")
+        if value is not None:
+            return float(value)
+    return None
+
+
+def _alert_levels(
+    alert: models.PriceAlert,
+    symbol: str,
+    asset_type: str,
+    current_price: Optional[float] = None,
+) -> Tuple[Optional[float], Optional[float]]:
+    """compute_trigger_levels, fetching what an SMA-cross alert needs."""
+    sma_value = None
+    if alert.condition == AlertCondition.SMA_CROSS:
+        sma_value = _latest_sma(symbol, asset_type, alert.sma_window)
+        if current_price is None:
+            current_price = alert.reference_price or orchestrator.get_current_price(
+                symbol, asset_type
+            )
+
+    above, below = compute_trigger_levels(alert, current_price, sma_value)
+    if above is None and below is None:
+        logger.warning(
+            "Could not determine trigger level for alert %s on %s; not indexed.",
+            alert.id,
+            symbol,
+        )
+    return above, below
+
+
+def index_alert(
+    alert: models.PriceAlert,
+    symbol: str,
+    asset_type: str,
+    current_price: Optional[float] = None,
+) -> bool:
+    """
+    Adds an active alert to its symbol's trigger index. Returns True if
+    indexed; an alert left out on a Redis error is picked up by the next
+    rebuild_alert_index.
+    """
+    client = shared_cache.get_redis_client()
+    if not client or not alert.is_active:
+        return False
+
+    above, below = _alert_levels(alert, symbol, asset_type, current_price)
+    if above is None and below is None:
+        return False
+
+    try:
+        pipe = client.pipeline(transaction=False)
+        if above is not None:
+            pipe.zadd(_above_key(symbol), {str(alert.id): above})
+        if below is not None:
+            pipe.zadd(_below_key(symbol), {str(alert.id): below})
+        pipe.execute()
+    except Exception as e:
+        logger.error("Could not index alert %s on %s: %s", alert.id, symbol, e)
+        return False
+    return True
+
+
+def unindex_alerts(symbol: str, alert_ids: List[int]) -> None:
+    client = shared_cache.get_redis_client()
+    if not client or not alert_ids:
+        return
+    members = [str(alert_id) for alert_id in alert_ids]
+    pipe = client.pipeline(transaction=False)
+    pipe.zrem(_above_key(symbol), *members)
+    pipe.zrem(_below_key(symbol), *members)
+    pipe.execute()
+
+
+def evaluate_price_change(event: schemas.PriceChangeEvent) -> List[int]:
+    """
+    Price-change handler: looks up only the alerts whose level was crossed
+    and hands them to trigger_alerts on a background thread. Returns the
+    candidate alert ids.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return []
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.zrangebyscore(_above_key(event.symbol), "-inf", event.price)
+        pipe.zrangebyscore(_below_key(event.symbol), event.price, "+inf")
+        above_ids, below_ids = pipe.execute()
+    except Exception as e:
+        logger.error("Could not read alert index for %s: %s", event.symbol, e)
+        return []
+
+    candidate_ids = sorted({int(member) for member in above_ids + below_ids})
+    if candidate_ids:
+        _trigger_executor.submit(trigger_alerts, event, candidate_ids)
+    return candidate_ids
+
+
+def trigger_alerts(
+    event: schemas.PriceChangeEvent, candidate_ids: List[int]
+) -> List[int]:
+    """
+    Marks the candidate alerts triggered, takes them out of the index and
+    notifies their owners. Returns the ids actually triggered.
+    """
+    try:
+        db = SessionLocal()
+        try:
+            triggered = crud.mark_price_alerts_triggered(
+                db,
+                alert_ids=candidate_ids,
+                price=event.price,
+                triggered_at=event.timestamp,
+            )
+        finally:
+            db.close()
+        unindex_alerts(event.symbol, candidate_ids)
+    except Exception as e:
+        logger.error("Could not trigger alerts for %s: %s", event.symbol, e)
+        return []
+
+    for alert_id, user_id in triggered:
+        shared_cache.publish_shared_event(
+            f"{ALERT_NOTIFICATIONS_CHANNEL_PREFIX}{user_id}",
+            {
+                "alert_id": alert_id,
+                "symbol": event.symbol,
+                "price": event.price,
+                "triggered_at": event.timestamp,
+            },
+        )
+    logger.info(
+        "%s at %s triggered %s alert(s).", event.symbol, event.price, len(triggered)
+    )
+    return [alert_id for alert_id, _ in triggered]
+
+
+def rebuild_alert_index(db: Session) -> int:
+    """
+    Rebuilds the trigger index from the database, e.g. after Redis data loss
+    or to move SMA-cross levels to the latest moving average. The new sets
+    are written under temporary keys and renamed over the live ones in one
+    transaction, so price changes keep finding alerts throughout.
+    Returns the number of alerts indexed.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return 0
+
+    levels: Dict[str, Dict[str, float]] = {}
+    indexed = 0
+    for alert in crud.get_active_price_alerts(db):
+        if not alert.asset:
+            continue
+        symbol = alert.asset.symbol
+        above, below = _alert_levels(alert, symbol, alert.asset.asset_type.value)
+        if above is not None:
+            levels.setdefault(_above_key(symbol), {})[str(alert.id)] = above
+        if below is not None:
+            levels.setdefault(_below_key(symbol), {})[str(alert.id)] = below
+        if above is not None or below is not None:
+            indexed += 1
+
+    rebuild_id = uuid.uuid4().hex
+    staged = {key: f"{ALERTS_REBUILD_KEY_PREFIX}{rebuild_id}:{key}" for key in levels}
+    pipe = client.pipeline(transaction=False)
+    for key, members in levels.items():
+        pipe.zadd(staged[key], members)
+        # Left behind only if the swap below never runs.
+        pipe.expire(staged[key], ALERTS_REBUILD_TTL_SECONDS)
+    pipe.execute()
+
+    stale_keys = [
+        key
+        for prefix in (ALERTS_ABOVE_KEY_PREFIX, ALERTS_BELOW_KEY_PREFIX)
+        for key in client.scan_iter(match=f"{prefix}*", count=500)
+        if key not in staged
+    ]
+    pipe = client.pipeline(transaction=True)
+    for key, staged_key in staged.items():
+        pipe.rename(staged_key, key)
+        pipe.persist(key)
+    if stale_keys:
+        pipe.delete(*stale_keys)
+    pipe.execute()
+    return indexed
+
+
+price_events.register_price_change_handler(evaluate_price_change)
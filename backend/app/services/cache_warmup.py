@@ -0,0 +1,271 @@
+# app/services/cache_warmup.py
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
+from app import crud
+from app.cache import shared_cache
+from app.core.config import settings
+from app.core.deadline import Deadline, deadline_scope
+from app.db.session import SessionLocal
+from . import financial_data_orchestrator as orchestrator
+from . import instruments
+from . import provider_health
+from .data_providers import registry
+from .data_providers.base import OPERATION_CURRENT_PRICE
+
+logger = logging.getLogger(__name__)
+
+# A fresh deploy or an emptied Redis sends every first request upstream at
+# once. Warming walks the tracked symbols most-popular first, in chunks:
+# prices the cache already holds are skipped, batch-quote providers fill what
+# they can in one call, and the rest go through the orchestrator with at most
+# CACHE_WARMUP_MAX_WORKERS lookups in flight.
+WARMUP_CHUNK_SIZE = 50
+# Set (without expiry) once a warm-up completes; gone after Redis loses its data.
+WARMED_AT_KEY = "cache_warmup:warmed_at"
+# Held while one process warms, so concurrently starting workers wait for it.
+LOCK_KEY = "cache_warmup:lock"
+LOCK_SECONDS = 10 * 60
+LOCK_POLL_SECONDS = 0.5
+
+
+class WarmupProgress(BaseModel):
+    total: int = 0
+    processed: int = 0
+    prices_cached: int = 0
+    prices_warmed: int = 0
+    prices_failed: int = 0
+    histories_cached: int = 0
+    histories_warmed: int = 0
+    histories_failed: int = 0
+    elapsed_seconds: float = 0.0
+
+
+ProgressCallback = Callable[[WarmupProgress], None]
+
+
+def is_cache_warm() -> bool:
+    client = shared_cache.get_redis_client()
+    if client is None:
+        return False
+    try:
+        return bool(client.exists(WARMED_AT_KEY))
+    except Exception as e:
+        logger.error("Error checking cache warm-up marker: %s", e)
+        return False
+
+
+def _mark_warm() -> None:
+    client = shared_cache.get_redis_client()
+    if client is None:
+        return
+    try:
+        client.set(WARMED_AT_KEY, datetime.now(timezone.utc).isoformat())
+    except Exception as e:
+        logger.error("Error setting cache warm-up marker: %s", e)
+
+
+def _batch_quote(
+    batch: List[instruments.Instrument], asset_type: Optional[str]
+) -> Set[str]:
+    """
+    Prices `batch` with one call to the first batch-quote provider in the
+    plan, caching every price it returns. Returns the cache ids priced.
+    """
+    provider = next(
+        (
+            p
+            for p in registry.plan(OPERATION_CURRENT_PRICE, asset_type)
+            if p.capabilities.batch_quotes
+        ),
+        None,
+    )
+    if provider is None or not provider_health.allow_request(provider.name, asset_type):
+        return set()
+    by_ticker = {i.provider_symbol(provider.name).upper(): i for i in batch}
+    try:
+        prices = registry.counted_call(
+            provider, provider.fetch_current_prices, list(by_ticker), asset_type
+        )()
+    except Exception as e:
+        logger.warning("Batch quote from %s failed: %s", provider.name, e)
+        return set()
+    priced = set()
+    for ticker, price in (prices or {}).items():
+        instrument = by_ticker.get(ticker.upper())
+        if instrument is not None and price is not None:
+            orchestrator.cache_current_price(instrument, price, provider.name)
+            priced.add(instrument.cache_id)
+    return priced
+
+
+def _warm_prices(
+    chunk: List[instruments.Instrument], progress: WarmupProgress, max_workers: int
+) -> None:
+    cached = shared_cache.get_many_shared_cache(
+        [orchestrator.current_price_cache_key(i) for i in chunk]
+    )
+    cold = [i for i, value in zip(chunk, cached) if value is None]
+    progress.prices_cached += len(chunk) - len(cold)
+
+    by_type: Dict[Optional[str], List[instruments.Instrument]] = {}
+    for instrument in cold:
+        by_type.setdefault(instrument.asset_type, []).append(instrument)
+    priced: Set[str] = set()
+    for asset_type, batch in by_type.items():
+        priced |= _batch_quote(batch, asset_type)
+    progress.prices_warmed += len(priced)
+
+    # Whatever the batch providers missed, one lookup each.
+    remaining = [i for i in cold if i.cache_id not in priced]
+    prices = orchestrator.get_current_prices(
+        [(i.symbol, i.asset_type) for i in remaining], max_workers=max_workers
+    )
+    for instrument in remaining:
+        if prices.get(instrument.symbol) is None:
+            progress.prices_failed += 1
+        else:
+            progress.prices_warmed += 1
+
+
+def _warm_histories(
+    chunk: List[instruments.Instrument], progress: WarmupProgress, max_workers: int
+) -> None:
+    cached = shared_cache.get_many_shared_cache(
+        [orchestrator.historical_data_cache_key(i, "compact") for i in chunk]
+    )
+    cold = [i for i, value in zip(chunk, cached) if value is None]
+    progress.histories_cached += len(chunk) - len(cold)
+    if not cold:
+        return
+
+    def fetch(instrument: instruments.Instrument) -> bool:
+        history = orchestrator.get_historical_data(
+            instrument.symbol, instrument.asset_type, "compact"
+        )
+        return history is not None
+
+    # As in get_current_prices: each worker runs in a copy of this context,
+    # so the ambient deadline and trace carry over.
+    contexts = [contextvars.copy_context() for _ in cold]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(cold))) as executor:
+        for ok in executor.map(lambda ctx, i: ctx.run(fetch, i), contexts, cold):
+            if ok:
+                progress.histories_warmed += 1
+            else:
+                progress.histories_failed += 1
+
+
+def warm_cache(
+    items: List[Tuple[str, Optional[str]]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = WARMUP_CHUNK_SIZE,
+    on_progress: Optional[ProgressCallback] = None,
+    deadline: Optional[Deadline] = None,
+) -> WarmupProgress:
+    """
+    Loads current prices and compact history for (symbol, asset_type) pairs
+    into the shared cache, in the order given. Stops early, with a partial
+    report, if `deadline` (or the ambient one) runs out.
+    """
+    started = time.perf_counter()
+    max_workers = max_workers or settings.CACHE_WARMUP_MAX_WORKERS
+    progress = WarmupProgress(total=len(items))
+    with deadline_scope(deadline) as deadline:
+        for start in range(0, len(items), chunk_size):
+            if deadline is not None and deadline.expired():
+                logger.warning(
+                    "Cache warm-up out of time after %d/%d symbols.",
+                    progress.processed,
+                    progress.total,
+                )
+                break
+            chunk_items = items[start : start + chunk_size]
+            instruments.resolve_many(chunk_items)
+            chunk = [instruments.resolve(*item) for item in chunk_items]
+            _warm_prices(chunk, progress, max_workers)
+            _warm_histories(chunk, progress, max_workers)
+
+            progress.processed += len(chunk)
+            progress.elapsed_seconds = round(time.perf_counter() - started, 3)
+            logger.info(
+                "Cache warm-up: %d/%d symbols (%d prices, %d histories fetched).",
+                progress.processed,
+                progress.total,
+                progress.prices_warmed,
+                progress.histories_warmed,
+            )
+            if on_progress is not None:
+                on_progress(progress)
+    progress.elapsed_seconds = round(time.perf_counter() - started, 3)
+    return progress
+
+
+def warm_tracked_assets(
+    on_progress: Optional[ProgressCallback] = None,
+    deadline: Optional[Deadline] = None,
+) -> WarmupProgress:
+    """Warms the CACHE_WARMUP_MAX_SYMBOLS symbols users track most."""
+    db = SessionLocal()
+    try:
+        items = crud.get_tracked_assets_by_popularity(
+            db, limit=settings.CACHE_WARMUP_MAX_SYMBOLS
+        )
+    finally:
+        db.close()
+    logger.info("Warming the cache for %d tracked symbol(s).", len(items))
+    progress = warm_cache(items, on_progress=on_progress, deadline=deadline)
+    if progress.processed == progress.total:
+        _mark_warm()
+    return progress
+
+
+def _acquire_lock() -> bool:
+    client = shared_cache.get_redis_client()
+    if client is None:
+        return True
+    try:
+        return bool(client.set(LOCK_KEY, "1", nx=True, ex=LOCK_SECONDS))
+    except Exception as e:
+        logger.error("Error taking the cache warm-up lock: %s", e)
+        return True
+
+
+def _release_lock() -> None:
+    client = shared_cache.get_redis_client()
+    if client is None:
+        return
+    try:
+        client.delete(LOCK_KEY)
+    except Exception as e:
+        logger.error("Error releasing the cache warm-up lock: %s", e)
+
+
+def warm_on_startup() -> None:
+    """
+    Startup hook: unless the shared cache is already warm, warms it before
+    the process starts serving, within CACHE_WARMUP_STARTUP_SECONDS. When
+    several workers start together one warms and the others wait for it.
+    """
+    if not settings.CACHE_WARMUP_ON_STARTUP:
+        return
+    if shared_cache.get_redis_client() is None or is_cache_warm():
+        return
+    deadline = Deadline(settings.CACHE_WARMUP_STARTUP_SECONDS)
+    if not _acquire_lock():
+        logger.info("Another process is warming the cache; waiting for it.")
+        while not deadline.expired() and not is_cache_warm():
+            time.sleep(LOCK_POLL_SECONDS)
+        return
+    try:
+        warm_tracked_assets(deadline=deadline)
+    except Exception as e:
+        logger.exception("Cache warm-up on startup failed: %s", e)
+    finally:
+        _release_lock()
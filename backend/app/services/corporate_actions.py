@@ -0,0 +1,266 @@
+# app/services/corporate_actions.py
+import hashlib
+import logging
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from app import crud, schemas
+from app.cache import shared_cache
+from app.db.session import SessionLocal
+from app.models.corporate_action import CorporateActionType
+from .data_providers.base import ACTION_DIVIDEND, ACTION_SPLIT
+from . import instruments
+
+logger = logging.getLogger(__name__)
+
+# Splits and dividends from the corporate_actions table are held in memory
+# whole, like provider symbols: writers bump this Redis counter and every
+# process reloads the table when it moved (checked at most once per
+# VERSION_CHECK_SECONDS), or when its copy is older than RELOAD_SECONDS.
+CORPORATE_ACTIONS_VERSION_KEY = "corporate_actions:version"
+VERSION_CHECK_SECONDS = 10
+RELOAD_SECONDS = 5 * 60
+LOAD_ERROR_BACKOFF_SECONDS = 30
+PRICE_FIELDS = ("open", "high", "low", "close")
+SMA_WINDOWS = ((20, "sma20"), (50, "sma50"))
+
+# (action type, ex-date, value), as in crud.get_corporate_action_map.
+Action = Tuple[str, date, float]
+HistoryPoint = Dict[str, Any]
+
+# symbol -> actions, oldest first.
+_actions: Dict[str, Tuple[Action, ...]] = {}
+_state = {"version": None, "loaded_at": None, "next_check": 0.0}
+_lock = threading.Lock()
+
+
+def _stored_version() -> Optional[int]:
+    client = shared_cache.get_redis_client()
+    if client is None:
+        return None
+    try:
+        version = client.get(CORPORATE_ACTIONS_VERSION_KEY)
+    except Exception as e:
+        logger.error("Error reading corporate actions version: %s", e)
+        return None
+    return int(version) if version else 0
+
+
+def _sync() -> None:
+    """Reloads the corporate_actions table if it changed or the copy is old."""
+    global _actions
+    now = time.monotonic()
+    if now < _state["next_check"]:
+        return
+    with _lock:
+        if now < _state["next_check"]:
+            return
+        _state["next_check"] = now + VERSION_CHECK_SECONDS
+    version = _stored_version()
+    loaded_at = _state["loaded_at"]
+    if (
+        loaded_at is not None
+        and version == _state["version"]
+        and now - loaded_at < RELOAD_SECONDS
+    ):
+        return
+    try:
+        db = SessionLocal()
+        try:
+            mapping = crud.get_corporate_action_map(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error("Error loading corporate actions: %s", e)
+        with _lock:
+            _state["next_check"] = now + LOAD_ERROR_BACKOFF_SECONDS
+        return
+    with _lock:
+        _actions = {symbol: tuple(actions) for symbol, actions in mapping.items()}
+        _state.update(version=version, loaded_at=now)
+    logger.info("Loaded corporate actions for %d asset(s).", len(mapping))
+
+
+def actions_changed() -> None:
+    """Call after writing corporate_actions: reloads here, and everywhere else."""
+    client = shared_cache.get_redis_client()
+    if client is not None:
+        try:
+            client.incr(CORPORATE_ACTIONS_VERSION_KEY)
+        except Exception as e:
+            logger.error("Error bumping corporate actions version: %s", e)
+    with _lock:
+        _state.update(loaded_at=None, next_check=0.0)
+
+
+def forget() -> None:
+    """Drops the in-memory copy; the next lookup reloads it."""
+    with _lock:
+        _actions.clear()
+        _state.update(version=None, loaded_at=None, next_check=0.0)
+
+
+def actions_for(symbol: str) -> Tuple[Action, ...]:
+    """The stored splits and dividends of `symbol`, oldest first."""
+    _sync()
+    return _actions.get(symbol.strip().upper(), ())
+
+
+def pending_actions(actions: Iterable[Action], applied: FrozenSet[str]) -> List[Action]:
+    """The actions whose type a series adjusted for `applied` still lacks."""
+    return [action for action in actions if action[0] not in applied]
+
+
+def fingerprint(
+    actions: Sequence[Action], applied: FrozenSet[str], fetched_at: Any
+) -> str:
+    """
+    Names one adjusted series: changes when an action is added or corrected,
+    or when the raw series (fetched at `fetched_at`) is replaced.
+    """
+    digest = hashlib.blake2b(
+        repr((tuple(actions), sorted(applied), fetched_at)).encode(), digest_size=8
+    )
+    return digest.hexdigest()
+
+
+def actions_from_history(
+    points: Sequence[HistoryPoint], applied: FrozenSet[str]
+) -> List[Action]:
+    """
+    The actions a provider reported on the points of its series ("split" and
+    "dividend" fields), oldest first. Dividends in split-adjusted series are
+    restated per share as paid, using the splits later in the series.
+    """
+    found: List[Action] = []
+    later_splits = 1.0
+    for point in reversed(points):
+        dividend, split = point.get("dividend"), point.get("split")
+        if dividend:
+            if ACTION_SPLIT in applied:
+                dividend *= later_splits
+            found.append((ACTION_DIVIDEND, point["date"], round(dividend, 6)))
+        if split:
+            found.append((ACTION_SPLIT, point["date"], split))
+            later_splits *= split
+    found.reverse()
+    return found
+
+
+def record_from_history(
+    instrument: instruments.Instrument,
+    points: Sequence[HistoryPoint],
+    source: Optional[str],
+    applied: FrozenSet[str],
+) -> None:
+    """
+    Stores actions reported in a freshly fetched series that the asset does
+    not have yet. Instruments that are not assets are skipped.
+    """
+    if instrument.asset_id is None:
+        return
+    found = actions_from_history(points, applied)
+    if not found:
+        return
+    known = {(action[0], action[1]) for action in actions_for(instrument.symbol)}
+    new = [action for action in found if (action[0], action[1]) not in known]
+    if not new:
+        return
+    try:
+        db = SessionLocal()
+        try:
+            added = crud.add_corporate_actions(
+                db,
+                asset_id=instrument.asset_id,
+                actions=[
+                    schemas.CorporateActionCreate(
+                        action_type=CorporateActionType(action_type),
+                        ex_date=ex_date,
+                        value=value,
+                    )
+                    for action_type, ex_date, value in new
+                ],
+                source=source,
+            )
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(
+            "Error recording corporate actions for %s: %s", instrument.symbol, e
+        )
+        return
+    if added:
+        logger.info(
+            "Recorded %d corporate action(s) for %s from %s.",
+            len(added),
+            instrument.symbol,
+            source,
+        )
+        actions_changed()
+
+
+def _recompute_moving_averages(points: List[HistoryPoint]) -> None:
+    """Rewrites sma20/sma50 in place from the points' closes (running sums)."""
+    sums = {window: 0.0 for window, _ in SMA_WINDOWS}
+    for i, point in enumerate(points):
+        for window, field in SMA_WINDOWS:
+            sums[window] += point["close"]
+            if i >= window:
+                sums[window] -= points[i - window]["close"]
+            point[field] = sums[window] / window if i + 1 >= window else None
+
+
+def adjust_history(
+    points: List[HistoryPoint], actions: Sequence[Action], applied: FrozenSet[str]
+) -> List[HistoryPoint]:
+    """
+    `points` (oldest first, adjusted by their provider for `applied`) with
+    the remaining actions applied, in one backward pass: walking from the
+    newest point, each action's factor joins the cumulative price and volume
+    factors once the walk passes its ex-date, so every point is scaled by
+    the product of the actions after it. A split of r divides prices by r and
+    multiplies volume by r; a dividend d multiplies prices by 1 - d / close,
+    the close being the last one before the ex-date, as traded. Moving
+    averages are recomputed from the adjusted closes. Returns `points`
+    unchanged when no action applies.
+    """
+    if not points or not pending_actions(actions, applied):
+        return points
+    newest_first = sorted(actions, key=lambda action: action[1], reverse=True)
+    splits_pending = ACTION_SPLIT not in applied
+    dividends_pending = ACTION_DIVIDEND not in applied
+
+    later_splits = 1.0  # every split after the point, applied or not
+    price_factor = 1.0
+    volume_factor = 1.0
+    next_action = 0
+    adjusted: List[HistoryPoint] = [{}] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        point = points[i]
+        while (
+            next_action < len(newest_first)
+            and newest_first[next_action][1] > point["date"]
+        ):
+            action_type, _, value = newest_first[next_action]
+            next_action += 1
+            if action_type == ACTION_SPLIT:
+                later_splits *= value
+                if splits_pending:
+                    price_factor /= value
+                    volume_factor *= value
+            elif dividends_pending:
+                close = point["close"] * (1.0 if splits_pending else later_splits)
+                if 0 < value < close:
+                    price_factor *= 1 - value / close
+        point = dict(point)
+        if price_factor != 1.0:
+            for field in PRICE_FIELDS:
+                if point.get(field) is not None:
+                    point[field] *= price_factor
+        if volume_factor != 1.0 and point.get("volume") is not None:
+            point["volume"] = int(round(point["volume"] * volume_factor))
+        adjusted[i] = point
+    _recompute_moving_averages(adjusted)
+    return adjusted
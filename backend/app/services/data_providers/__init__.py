@@ -0,0 +1,14 @@
+from . import registry
+
+# Imported on first use; see registry._lazy_providers.
+registry.register_lazy_provider(
+    "yfinance",
+    "app.services.data_providers.yahoo_finance_provider:YahooFinanceProvider",
+)
+registry.register_lazy_provider(
+    "alpha_vantage",
+    "app.services.data_providers.alpha_vantage_provider:AlphaVantageProvider",
+)
+registry.register_lazy_provider(
+    "synthetic", "app.services.data_providers.synthetic_provider:SyntheticProvider"
+)
@@ -1,9 +1,16 @@
 # app/services/data_providers/alpha_vantage_provider.py
+import json
+import logging
 import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, FrozenSet, Optional
 from datetime import datetime
 
 from app.core.config import settings  # For API Key
+from app.core.deadline import provider_timeout
+from . import cassette
+from .base import MarketDataProvider, ProviderCapabilities, crypto_base_symbol
+
+logger = logging.getLogger(__name__)
 
 ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
 
@@ -11,24 +18,35 @@ ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
 def _make_av_request(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Helper function to make Alpha Vantage request and basic error handling."""
     if not settings.ALPHA_VANTAGE_API_KEY:
-        print("AV_PROVIDER Warning: ALPHA_VANTAGE_API_KEY not configured.")
+        logger.warning("ALPHA_VANTAGE_API_KEY not configured.")
         return None
 
     all_params = {"apikey": settings.ALPHA_VANTAGE_API_KEY, **params}
-    try:
-        response = requests.get(ALPHA_VANTAGE_BASE_URL, params=all_params)
+
+    def get_json() -> Dict[str, Any]:
+        response = requests.get(
+            ALPHA_VANTAGE_BASE_URL, params=all_params, timeout=provider_timeout()
+        )
         response.raise_for_status()
-        data = response.json()
+        return response.json()
+
+    try:
+        data = cassette.intercept(
+            "av_request",
+            json.dumps(params, sort_keys=True),
+            get_json,
+            error_type=requests.exceptions.RequestException,
+        )
         if "Note" in data or "Information" in data:  # Handle API limit/info messages
             note_or_info = data.get("Note", data.get("Information"))
-            print(f"AV_PROVIDER API Note/Info for params {params}: {note_or_info}")
+            logger.warning("API Note/Info for params %s: %s", params, note_or_info)
             return None  # Indicate an issue, not valid data
         return data
     except requests.exceptions.RequestException as e:
-        print(f"AV_PROVIDER Error fetching data for params {params}: {e}")
+        logger.error("Error fetching data for params %s: %s", params, e)
         return None
     except ValueError as e:  # JSON decoding error
-        print(f"AV_PROVIDER Error decoding JSON for params {params}: {e}")
+        logger.error("Error decoding JSON for params %s: %s", params, e)
         return None
 
 
@@ -41,20 +59,19 @@ def fetch_av_stock_current_price(symbol: str) -> Optional[float]:
             try:
                 return float(global_quote["05. price"])
             except (ValueError, TypeError):
-                print(
-                    f"AV_PROVIDER Error parsing stock price for {symbol} from: {global_quote}"
+                logger.error(
+                    "Error parsing stock price for %s from: %s", symbol, global_quote
                 )
-    print(f"AV_PROVIDER Could not parse stock price for {symbol} from: {data}")
+    logger.warning("Could not parse stock price for %s from: %s", symbol, data)
     return None
 
 
-def fetch_av_crypto_current_price(
-    crypto_symbol: str, market_currency: str = "USD"
-) -> Optional[float]:
+def fetch_av_exchange_rate(from_currency: str, to_currency: str) -> Optional[float]:
+    """Realtime rate between two currencies, physical or digital."""
     params = {
         "function": "CURRENCY_EXCHANGE_RATE",
-        "from_currency": crypto_symbol.upper(),
-        "to_currency": market_currency.upper(),
+        "from_currency": from_currency.upper(),
+        "to_currency": to_currency.upper(),
     }
     data = _make_av_request(params)
     if data:
@@ -63,15 +80,66 @@ def fetch_av_crypto_current_price(
             try:
                 return float(rate_data["5. Exchange Rate"])
             except (ValueError, TypeError):
-                print(
-                    f"AV_PROVIDER Error parsing crypto price for {crypto_symbol}/{market_currency} from: {rate_data}"
+                logger.error(
+                    "Error parsing exchange rate for %s/%s from: %s",
+                    from_currency,
+                    to_currency,
+                    rate_data,
                 )
-    print(
-        f"AV_PROVIDER Could not parse crypto price for {crypto_symbol}/{market_currency} from: {data}"
+    logger.warning(
+        "Could not parse exchange rate for %s/%s from: %s",
+        from_currency,
+        to_currency,
+        data,
     )
     return None
 
 
+def fetch_av_crypto_current_price(
+    crypto_symbol: str, market_currency: str = "USD"
+) -> Optional[float]:
+    return fetch_av_exchange_rate(crypto_symbol, market_currency)
+
+
+def fetch_av_fx_history(
+    from_currency: str, to_currency: str
+) -> Optional[List[Dict[str, Any]]]:
+    params = {
+        "function": "FX_DAILY",
+        "from_symbol": from_currency.upper(),
+        "to_symbol": to_currency.upper(),
+        "outputsize": "full",
+    }
+    data = _make_av_request(params)
+    time_series = data.get("Time Series FX (Daily)") if data else None
+    if not time_series:
+        logger.warning(
+            "Could not parse FX history for %s/%s from: %s",
+            from_currency,
+            to_currency,
+            data,
+        )
+        return None
+    points = []
+    for date_str, daily_data in time_series.items():
+        try:
+            points.append(
+                {
+                    "date": datetime.strptime(date_str, "%Y-%m-%d").date(),
+                    "rate": float(daily_data["4. close"]),
+                }
+            )
+        except (ValueError, KeyError) as parse_err:
+            logger.warning(
+                "Skipping malformed FX data for %s/%s on %s: %s",
+                from_currency,
+                to_currency,
+                date_str,
+                parse_err,
+            )
+    return sorted(points, key=lambda x: x["date"]) or None
+
+
 def fetch_av_stock_historical_data(
     symbol: str, outputsize: str = "compact"
 ) -> Optional[List[Dict[str, Any]]]:
@@ -98,8 +166,11 @@ def fetch_av_stock_historical_data(
                         }
                     )
                 except (ValueError, KeyError) as parse_err:
-                    print(
-                        f"AV_PROVIDER Skipping malformed stock data for {symbol} on {date_str}: {parse_err}"
+                    logger.warning(
+                        "Skipping malformed stock data for %s on %s: %s",
+                        symbol,
+                        date_str,
+                        parse_err,
                     )
                     continue
             return (
@@ -107,7 +178,7 @@ def fetch_av_stock_historical_data(
                 if processed_data
                 else None
             )
-    print(f"AV_PROVIDER Could not parse stock historical for {symbol} from: {data}")
+    logger.warning("Could not parse stock historical for %s from: %s", symbol, data)
     return None
 
 
@@ -145,8 +216,11 @@ def fetch_av_crypto_historical_data(
                         }
                     )
                 except (ValueError, KeyError) as parse_err:
-                    print(
-                        f"AV_PROVIDER Skipping malformed crypto data for {crypto_symbol} on {date_str}: {parse_err}"
+                    logger.warning(
+                        "Skipping malformed crypto data for %s on %s: %s",
+                        crypto_symbol,
+                        date_str,
+                        parse_err,
                     )
                     continue
 
@@ -160,7 +234,52 @@ def fetch_av_crypto_historical_data(
             return (
                 sorted_data if sorted_data else None
             )  # Return None if list is empty after processing
-    print(
-        f"AV_PROVIDER Could not parse crypto historical for {crypto_symbol} from: {data}"
+    logger.warning(
+        "Could not parse crypto historical for %s from: %s", crypto_symbol, data
     )
     return None
+
+
+class AlphaVantageProvider(MarketDataProvider):
+    """Adapter over the module-level Alpha Vantage functions."""
+
+    name = "alpha_vantage"
+    capabilities = ProviderCapabilities(fx=True)
+    priority = 20
+    cost_per_call = 1.0
+    # Free-tier quota.
+    rate_limit_per_minute = 5
+    rate_limit_per_day = 25
+    # TIME_SERIES_DAILY prices are as traded: nothing is adjusted.
+    history_adjustments: FrozenSet[str] = frozenset()
+
+    def is_enabled(self) -> bool:
+        return bool(settings.ALPHA_VANTAGE_API_KEY)
+
+    # Fetch methods take this ticker (or a stored one) and use it as is.
+    def provider_symbol(self, symbol: str, asset_type: Optional[str]) -> str:
+        if asset_type and asset_type.lower() == "crypto":
+            return crypto_base_symbol(symbol)
+        return symbol.upper()
+
+    def fetch_current_price(
+        self, symbol: str, asset_type: Optional[str]
+    ) -> Optional[float]:
+        if asset_type and asset_type.lower() == "crypto":
+            return fetch_av_crypto_current_price(symbol)
+        return fetch_av_stock_current_price(symbol)
+
+    def fetch_historical_data(
+        self, symbol: str, asset_type: Optional[str], outputsize: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        if asset_type and asset_type.lower() == "crypto":
+            return fetch_av_crypto_historical_data(symbol, outputsize=outputsize)
+        return fetch_av_stock_historical_data(symbol, outputsize=outputsize)
+
+    def fetch_fx_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        return fetch_av_exchange_rate(from_currency, to_currency)
+
+    def fetch_fx_history(
+        self, from_currency: str, to_currency: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        return fetch_av_fx_history(from_currency, to_currency)
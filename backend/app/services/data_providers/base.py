@@ -0,0 +1,143 @@
+# app/services/data_providers/base.py
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+OPERATION_CURRENT_PRICE = "current_price"
+OPERATION_HISTORICAL_DATA = "historical_data"
+# Served by providers whose capabilities set `intraday`.
+OPERATION_INTRADAY_BARS = "intraday_bars"
+# Currency conversion, served by providers whose capabilities set `fx`.
+OPERATION_FX_RATE = "fx_rate"
+OPERATION_FX_HISTORY = "fx_history"
+
+# Intraday bar sizes the API offers, in seconds.
+INTRADAY_INTERVAL_SECONDS = {"1m": 60, "5m": 5 * 60, "15m": 15 * 60, "1h": 60 * 60}
+
+# Corporate actions a daily history series can be adjusted for.
+ACTION_SPLIT = "split"
+ACTION_DIVIDEND = "dividend"
+ACTION_TYPES = frozenset({ACTION_SPLIT, ACTION_DIVIDEND})
+
+# Quote-currency suffixes users attach to crypto symbols ("BTCUSD", "ETH-USDT").
+CRYPTO_QUOTE_SUFFIXES = ("-USDT", "-USD", "USDT", "USD")
+
+
+def crypto_base_symbol(symbol: str) -> str:
+    """The coin in a crypto symbol, without any USD quote suffix."""
+    symbol_upper = symbol.upper()
+    for suffix in CRYPTO_QUOTE_SUFFIXES:
+        # Keep at least two characters so coins like "TUSD" stay intact.
+        if symbol_upper.endswith(suffix) and len(symbol_upper) - len(suffix) >= 2:
+            return symbol_upper[: -len(suffix)]
+    return symbol_upper
+
+
+class ProviderCapabilities(BaseModel):
+    """What a provider adapter can serve. Used to build execution plans."""
+
+    model_config = ConfigDict(frozen=True)
+
+    operations: FrozenSet[str] = frozenset(
+        {OPERATION_CURRENT_PRICE, OPERATION_HISTORICAL_DATA}
+    )
+    asset_types: FrozenSet[str] = frozenset({"stock", "crypto"})
+    batch_quotes: bool = False
+    intraday: bool = False
+    fx: bool = False
+    # Deepest daily history available; None means the full listing history.
+    max_history_days: Optional[int] = None
+
+
+class MarketDataProvider:
+    """
+    Interface every market-data source implements. Subclasses set the class
+    attributes and override the fetch methods they declare in `capabilities`.
+    Fetch methods return None when the provider has no usable answer.
+    """
+
+    name: str = ""
+    capabilities: ProviderCapabilities = ProviderCapabilities()
+    # Lower runs earlier when health data does not say otherwise.
+    priority: int = 100
+    # Relative cost of one call (0 = free); breaks priority ties.
+    cost_per_call: float = 0.0
+    rate_limit_per_minute: Optional[int] = None
+    rate_limit_per_day: Optional[int] = None
+    # Corporate actions already applied to fetch_historical_data's prices;
+    # the rest are applied from the corporate actions store.
+    history_adjustments: FrozenSet[str] = frozenset()
+
+    def is_enabled(self) -> bool:
+        """Whether the provider is configured (e.g. has credentials) right now."""
+        return True
+
+    def provider_symbol(self, symbol: str, asset_type: Optional[str]) -> str:
+        """
+        This provider's default ticker for a canonical (symbol, asset_type);
+        rows in the provider_symbols table take precedence over it.
+        """
+        return symbol.upper()
+
+    def supports(self, operation: str, asset_type: Optional[str]) -> bool:
+        if operation == OPERATION_INTRADAY_BARS:
+            if not self.capabilities.intraday:
+                return False
+        elif operation in (OPERATION_FX_RATE, OPERATION_FX_HISTORY):
+            if not self.capabilities.fx:
+                return False
+        elif operation not in self.capabilities.operations:
+            return False
+        return asset_type is None or asset_type.lower() in self.capabilities.asset_types
+
+    def fetch_current_price(
+        self, symbol: str, asset_type: Optional[str]
+    ) -> Optional[float]:
+        raise NotImplementedError
+
+    def fetch_current_prices(
+        self, symbols: List[str], asset_type: Optional[str]
+    ) -> Dict[str, Optional[float]]:
+        """Batch quotes; providers with `batch_quotes` override this."""
+        return {
+            symbol.upper(): self.fetch_current_price(symbol, asset_type)
+            for symbol in symbols
+        }
+
+    def fetch_historical_data(
+        self, symbol: str, asset_type: Optional[str], outputsize: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Daily {"date", "open", "high", "low", "close", "volume"} points,
+        oldest first. Points may also carry "split" (shares after / before)
+        and "dividend" (cash per share) on the ex-date of an action.
+        """
+        raise NotImplementedError
+
+    def fetch_intraday_bars(
+        self,
+        symbol: str,
+        asset_type: Optional[str],
+        interval: str,
+        since: Optional[datetime] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Bars of `interval` ({"timestamp" (UTC), "open", "high", "low",
+        "close", "volume"}, oldest first). With `since`, only bars starting
+        at or after it; otherwise a backfill of recent bars.
+        """
+        raise NotImplementedError
+
+    def fetch_fx_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        """Units of `to_currency` per unit of `from_currency`, right now."""
+        raise NotImplementedError
+
+    def fetch_fx_history(
+        self, from_currency: str, to_currency: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Daily {"date", "rate"} points for the pair, oldest first."""
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
@@ -0,0 +1,202 @@
+# app/services/data_providers/cassette.py
+import atexit
+import gzip
+import io
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Optional, Type
+
+from app.core import tracing
+from app.core.config import settings
+from app.core.deadline import provider_timeout
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Provider raw-response layers route through `intercept`. In "record" mode
+# every upstream response (or error) is appended, with its latency, to a
+# gzip'd JSON-lines cassette; in "replay" mode responses are served from the
+# cassette instead of the network, after the recorded latency. The providers'
+# parsing code and the orchestrator run unchanged either way.
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+
+class CassetteMiss(Exception):
+    """Replay found no recorded response for a request."""
+
+
+def encode_frame(frame: "pd.DataFrame") -> Dict[str, Any]:
+    tz = getattr(frame.index, "tz", None)
+    return {
+        "frame": frame.to_json(orient="split", date_format="iso", date_unit="ns"),
+        "tz": str(tz) if tz is not None else None,
+    }
+
+
+def decode_frame(payload: Dict[str, Any]) -> "pd.DataFrame":
+    import pandas as pd  # only yfinance responses are frames; keep it off import
+
+    frame = pd.read_json(io.StringIO(payload["frame"]), orient="split")
+    if payload.get("tz") and isinstance(frame.index, pd.DatetimeIndex):
+        frame.index = frame.index.tz_convert(payload["tz"])
+    return frame
+
+
+class CassetteRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def record(
+        self,
+        kind: str,
+        key: str,
+        latency: float,
+        response: Any = None,
+        error: Optional[str] = None,
+    ) -> None:
+        entry = {"kind": kind, "key": key, "latency": round(latency, 6)}
+        if error is not None:
+            entry["error"] = error
+        else:
+            entry["response"] = response
+        line = json.dumps(entry, default=str, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = gzip.open(self.path, "at", encoding="utf-8")
+            self._file.write(line)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CassettePlayer:
+    """
+    Serves recorded responses. Repeated requests for the same key get the
+    recordings in their original order, then the last one again.
+    """
+
+    def __init__(self, path: str, speed: float = 1.0):
+        self.path = path
+        self.speed = speed
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        with gzip.open(path, "rt", encoding="utf-8") as cassette_file:
+            for line in cassette_file:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[f"{entry['kind']}|{entry['key']}"].append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def next_entry(self, kind: str, key: str) -> Dict[str, Any]:
+        with self._lock:
+            entries = self._entries.get(f"{kind}|{key}")
+            if not entries:
+                self.misses += 1
+                raise CassetteMiss(f"No recording for {kind} {key}")
+            return entries.popleft() if len(entries) > 1 else entries[0]
+
+    def play(
+        self,
+        kind: str,
+        key: str,
+        decode: Optional[Callable[[Any], Any]] = None,
+        error_type: Type[Exception] = RuntimeError,
+    ) -> Any:
+        entry = self.next_entry(kind, key)
+        delay = entry["latency"] * self.speed
+        if delay > 0:
+            timeout = provider_timeout()
+            time.sleep(min(delay, timeout))
+            if delay > timeout:
+                raise error_type(f"Replayed {kind} {key} timed out after {timeout}s")
+        if "error" in entry:
+            raise error_type(entry["error"])
+        response = entry.get("response")
+        return decode(response) if decode and response is not None else response
+
+
+_recorder: Optional[CassetteRecorder] = None
+_player: Optional[CassettePlayer] = None
+_state_lock = threading.Lock()
+
+
+def get_recorder() -> CassetteRecorder:
+    global _recorder
+    with _state_lock:
+        if _recorder is None or _recorder.path != settings.MARKET_DATA_CASSETTE_PATH:
+            if _recorder is not None:
+                _recorder.close()
+            _recorder = CassetteRecorder(settings.MARKET_DATA_CASSETTE_PATH)
+            atexit.register(_recorder.close)
+        return _recorder
+
+
+def get_player() -> CassettePlayer:
+    global _player
+    with _state_lock:
+        if _player is None or _player.path != settings.MARKET_DATA_CASSETTE_PATH:
+            _player = CassettePlayer(
+                settings.MARKET_DATA_CASSETTE_PATH,
+                speed=settings.MARKET_DATA_CASSETTE_REPLAY_SPEED,
+            )
+            logger.info(
+                "Loaded %s recordings from %s for replay.", len(_player), _player.path
+            )
+        return _player
+
+
+def intercept(
+    kind: str,
+    key: str,
+    live: Callable[[], Any],
+    encode: Optional[Callable[[Any], Any]] = None,
+    decode: Optional[Callable[[Any], Any]] = None,
+    error_type: Type[Exception] = RuntimeError,
+) -> Any:
+    """
+    Runs one raw upstream call through the cassette layer. Without a cassette
+    mode this is just `live()`. Replayed failures are raised as `error_type`
+    so the provider's own error handling runs as it did when recorded.
+    """
+    mode = settings.MARKET_DATA_CASSETTE_MODE
+    if mode == MODE_REPLAY:
+        try:
+            return get_player().play(kind, key, decode=decode, error_type=error_type)
+        except CassetteMiss as e:
+            raise error_type(str(e)) from e
+
+    started = time.perf_counter()
+    try:
+        with tracing.span(f"upstream {kind}", kind="client"):
+            result = live()
+    except Exception as e:
+        if mode == MODE_RECORD:
+            get_recorder().record(
+                kind,
+                key,
+                time.perf_counter() - started,
+                error=f"{type(e).__name__}: {e}",
+            )
+        raise
+    if mode == MODE_RECORD:
+        get_recorder().record(
+            kind,
+            key,
+            time.perf_counter() - started,
+            response=encode(result) if encode and result is not None else result,
+        )
+    return result
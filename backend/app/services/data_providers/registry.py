@@ -0,0 +1,184 @@
+# app/services/data_providers/registry.py
+import importlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.cache import shared_cache
+from app.core import metrics, tracing
+from app.core.config import settings
+from .base import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_CALLS_KEY_PREFIX = "provider_calls:"
+
+_providers: Dict[str, MarketDataProvider] = {}
+# name -> "module:Class" of providers whose module has not been imported yet.
+# Provider modules pull in heavy client libraries (yfinance, pandas, numpy);
+# they load on the first lookup that needs them, so processes that never
+# fetch market data never pay for them.
+_lazy_providers: Dict[str, str] = {}
+_load_lock = threading.Lock()
+
+
+def register_provider(provider: MarketDataProvider) -> None:
+    """Adds (or replaces) a provider under its name."""
+    if not provider.name:
+        raise ValueError(f"Provider {provider!r} has no name.")
+    _lazy_providers.pop(provider.name, None)
+    _providers[provider.name] = provider
+
+
+def register_lazy_provider(name: str, target: str) -> None:
+    """
+    Registers the provider class at `target` ("package.module:Class") under
+    `name`, to be imported and instantiated on first use.
+    """
+    if name not in _providers:
+        _lazy_providers[name] = target
+
+
+def unregister_provider(name: str) -> None:
+    _lazy_providers.pop(name, None)
+    _providers.pop(name, None)
+
+
+def _load(name: str) -> None:
+    with _load_lock:
+        target = _lazy_providers.get(name)
+        if target is None:
+            return
+        module_name, _, class_name = target.partition(":")
+        started = time.perf_counter()
+        provider = getattr(importlib.import_module(module_name), class_name)()
+        register_provider(provider)
+    logger.debug(
+        "Loaded provider %s in %.0f ms.", name, (time.perf_counter() - started) * 1000
+    )
+
+
+def get_provider(name: str) -> Optional[MarketDataProvider]:
+    if name in _lazy_providers:
+        _load(name)
+    return _providers.get(name)
+
+
+def get_providers() -> List[MarketDataProvider]:
+    """Every registered provider, importing any not loaded yet."""
+    for name in list(_lazy_providers):
+        _load(name)
+    return list(_providers.values())
+
+
+def enabled_provider_names() -> List[str]:
+    """Providers selected by MARKET_DATA_PROVIDERS, in configured order."""
+    return [
+        name.strip()
+        for name in settings.MARKET_DATA_PROVIDERS.split(",")
+        if name.strip()
+    ]
+
+
+def selected_providers() -> List[MarketDataProvider]:
+    """Registered providers named in MARKET_DATA_PROVIDERS; loads only those."""
+    selected = [get_provider(name) for name in enabled_provider_names()]
+    return [provider for provider in selected if provider is not None]
+
+
+def _usage_keys(name: str) -> Dict[str, str]:
+    now = int(time.time())
+    return {
+        "minute": f"{PROVIDER_CALLS_KEY_PREFIX}{name}:m:{now // 60}",
+        "day": f"{PROVIDER_CALLS_KEY_PREFIX}{name}:d:{now // 86400}",
+    }
+
+
+def _over_rate_limit(providers: List[MarketDataProvider]) -> set:
+    """Names of providers that have used up their per-minute or per-day quota."""
+    limited = [p for p in providers if p.rate_limit_per_minute or p.rate_limit_per_day]
+    if not limited:
+        return set()
+    keys = []
+    for provider in limited:
+        usage_keys = _usage_keys(provider.name)
+        keys.extend([usage_keys["minute"], usage_keys["day"]])
+    counts = shared_cache.get_many_shared_cache(keys)
+    exhausted = set()
+    for i, provider in enumerate(limited):
+        minute_count, day_count = counts[2 * i] or 0, counts[2 * i + 1] or 0
+        if (
+            provider.rate_limit_per_minute
+            and minute_count >= provider.rate_limit_per_minute
+        ) or (provider.rate_limit_per_day and day_count >= provider.rate_limit_per_day):
+            exhausted.add(provider.name)
+    return exhausted
+
+
+def plan(operation: str, asset_type: Optional[str]) -> List[MarketDataProvider]:
+    """
+    Execution plan for one request: selected, enabled providers that support
+    the operation and asset type and still have quota, cheapest-priority first.
+    """
+    candidates = [
+        provider
+        for provider in selected_providers()
+        if provider.is_enabled() and provider.supports(operation, asset_type)
+    ]
+    exhausted = _over_rate_limit(candidates)
+    for name in exhausted:
+        logger.info("%s is over its rate limit; leaving it out.", name)
+    return sorted(
+        (p for p in candidates if p.name not in exhausted),
+        key=lambda p: (p.priority, p.cost_per_call),
+    )
+
+
+def note_provider_call(provider: MarketDataProvider) -> None:
+    """Counts one call against the provider's rate limits."""
+    if not (provider.rate_limit_per_minute or provider.rate_limit_per_day):
+        return
+    client = shared_cache.get_redis_client()
+    if not client:
+        return
+    usage_keys = _usage_keys(provider.name)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(usage_keys["minute"])
+        pipe.expire(usage_keys["minute"], 120)
+        pipe.incr(usage_keys["day"])
+        pipe.expire(usage_keys["day"], 2 * 86400)
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error counting call for %s: %s", provider.name, e)
+
+
+def counted_call(
+    provider: MarketDataProvider, method: Callable[..., Any], *args: Any
+) -> Callable[[], Any]:
+    """
+    Zero-argument fetcher that counts the call, then invokes `method(*args)`,
+    recording its latency and outcome (data, empty or error).
+    """
+    operation = getattr(method, "__name__", "unknown").removeprefix("fetch_")
+
+    def call() -> Any:
+        note_provider_call(provider)
+        started = time.perf_counter()
+        outcome = "error"
+        with tracing.span(
+            f"provider.{operation}", attributes={"provider": provider.name}
+        ) as provider_span:
+            try:
+                result = method(*args)
+                outcome = "empty" if result is None else "success"
+                return result
+            finally:
+                metrics.PROVIDER_REQUEST_DURATION.labels(
+                    provider.name, operation, outcome
+                ).observe(time.perf_counter() - started)
+                if provider_span is not None:
+                    provider_span.set_attribute("provider.outcome", outcome)
+
+    return call
@@ -0,0 +1,216 @@
+# app/services/data_providers/synthetic_provider.py
+import hashlib
+import logging
+import math
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.deadline import provider_timeout
+from .base import ACTION_TYPES, MarketDataProvider, ProviderCapabilities
+
+logger = logging.getLogger(__name__)
+
+# Trading days generated per outputsize, mirroring yfinance's 3mo / max.
+OUTPUTSIZE_DAYS = {"compact": 63, "full": 5 * 252}
+QUOTE_BUCKET_SECONDS = 60
+WALK_BLOCK_DAYS = 64
+
+
+def _seed(*parts: Any) -> int:
+    key = ":".join(str(part) for part in (settings.SYNTHETIC_PROVIDER_SEED, *parts))
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def _volatility(asset_type: Optional[str]) -> float:
+    return 0.04 if asset_type and asset_type.lower() == "crypto" else 0.015
+
+
+def _trading_days(end: date, count: int, asset_type: Optional[str]) -> List[date]:
+    """The last `count` trading days up to `end`; crypto trades every day."""
+    every_day = bool(asset_type and asset_type.lower() == "crypto")
+    days: List[date] = []
+    day = end
+    while len(days) < count:
+        if every_day or day.weekday() < 5:
+            days.append(day)
+        day -= timedelta(days=1)
+    return days[::-1]
+
+
+def _block_anchor(symbol: str, block: int, volatility: float) -> float:
+    """Log-price at the start of a block: the symbol's base level plus noise."""
+    base = math.log(random.Random(_seed(symbol, "base")).uniform(5, 500))
+    shock = random.Random(_seed(symbol, "anchor", block)).gauss(0, 1)
+    return base + shock * volatility * math.sqrt(WALK_BLOCK_DAYS)
+
+
+def _block_bars(symbol: str, block: int, volatility: float) -> np.ndarray:
+    """
+    Daily (log-close, open, high, low, volume) noise for one block of days.
+    Closes follow a random walk pinned to the block's start and end anchors
+    (a Brownian bridge), so any day can be generated without replaying the
+    walk from an epoch, and blocks join up without jumps.
+    """
+    rng = np.random.default_rng(_seed(symbol, "block", block))
+    steps = rng.standard_normal(WALK_BLOCK_DAYS) * volatility
+    walk = np.cumsum(steps)
+    t = np.arange(1, WALK_BLOCK_DAYS + 1) / WALK_BLOCK_DAYS
+    start = _block_anchor(symbol, block, volatility)
+    end = _block_anchor(symbol, block + 1, volatility)
+    log_close = start + (end - start) * t + (walk - t * walk[-1])
+    bars = np.empty((WALK_BLOCK_DAYS, 5))
+    bars[:, 0] = log_close
+    bars[:, 1] = rng.standard_normal(WALK_BLOCK_DAYS) * volatility / 2
+    bars[:, 2:4] = np.abs(rng.standard_normal((WALK_BLOCK_DAYS, 2))) * volatility / 2
+    bars[:, 4] = rng.uniform(1e5, 5e7, WALK_BLOCK_DAYS)
+    return bars
+
+
+def generate_history(
+    symbol: str, asset_type: Optional[str], days: int, end: Optional[date] = None
+) -> List[Dict[str, Any]]:
+    """
+    Seeded random-walk daily OHLCV for `symbol`, in the same shape as the real
+    providers (sma20/sma50 over the returned window, like yfinance). A given
+    day's bar is the same whatever window it is requested in.
+    """
+    symbol_upper = symbol.upper()
+    end = end or datetime.now(timezone.utc).date()
+    volatility = _volatility(asset_type)
+    blocks: Dict[int, np.ndarray] = {}
+
+    points: List[Dict[str, Any]] = []
+    closes: List[float] = []
+    for session in _trading_days(end, days, asset_type):
+        block, offset = divmod(session.toordinal(), WALK_BLOCK_DAYS)
+        if block not in blocks:
+            blocks[block] = _block_bars(symbol_upper, block, volatility)
+        log_close, open_gap, high_ext, low_ext, volume = blocks[block][offset]
+        close = math.exp(log_close)
+        open_ = close * math.exp(open_gap)
+        closes.append(close)
+        points.append(
+            {
+                "date": session,
+                "open": round(open_, 4),
+                "high": round(max(open_, close) * (1 + high_ext), 4),
+                "low": round(min(open_, close) * (1 - low_ext), 4),
+                "close": round(close, 4),
+                "volume": int(volume),
+                "sma20": (
+                    round(sum(closes[-20:]) / 20, 4) if len(closes) >= 20 else None
+                ),
+                "sma50": (
+                    round(sum(closes[-50:]) / 50, 4) if len(closes) >= 50 else None
+                ),
+            }
+        )
+    return points
+
+
+def generate_quote(
+    symbol: str, asset_type: Optional[str], at: Optional[float] = None
+) -> float:
+    """
+    Deterministic quote for `symbol` at time `at`: the latest synthetic close
+    nudged by a shock that changes every QUOTE_BUCKET_SECONDS.
+    """
+    symbol_upper = symbol.upper()
+    at = time.time() if at is None else at
+    today = datetime.fromtimestamp(at, timezone.utc).date()
+    last_close = generate_history(symbol_upper, asset_type, 1, end=today)[0]["close"]
+    bucket = int(at // QUOTE_BUCKET_SECONDS)
+    shock = random.Random(_seed(symbol_upper, "quote", bucket)).gauss(0, 1)
+    return round(last_close * math.exp(shock * _volatility(asset_type) / 4), 4)
+
+
+class SyntheticProvider(MarketDataProvider):
+    """
+    Offline provider for load tests and benchmarks: answers for any symbol
+    from seeded random walks, with configurable latency, error rate and an
+    upstream-style rate limit (SYNTHETIC_PROVIDER_* settings).
+    """
+
+    name = "synthetic"
+    capabilities = ProviderCapabilities(batch_quotes=True)
+    priority = 0
+    cost_per_call = 0.0
+    # The walks have no corporate actions to adjust for.
+    history_adjustments = ACTION_TYPES
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rng = random.Random(_seed("faults"))
+        self._window_minute = 0
+        self._window_calls = 0
+
+    @property
+    def rate_limit_per_minute(self) -> Optional[int]:
+        return settings.SYNTHETIC_PROVIDER_RATE_LIMIT_PER_MINUTE
+
+    def _simulate_call(self) -> bool:
+        """Applies latency, rate limiting and injected errors. True if the call may answer."""
+        with self._lock:
+            minute = int(time.time() // 60)
+            if minute != self._window_minute:
+                self._window_minute, self._window_calls = minute, 0
+            self._window_calls += 1
+            limit = settings.SYNTHETIC_PROVIDER_RATE_LIMIT_PER_MINUTE
+            if limit and self._window_calls > limit:
+                logger.info("Rate limit exceeded.")
+                return False
+            latency = max(
+                0.0,
+                self._rng.gauss(
+                    settings.SYNTHETIC_PROVIDER_LATENCY_MS,
+                    settings.SYNTHETIC_PROVIDER_LATENCY_JITTER_MS,
+                )
+                / 1000,
+            )
+            failed = self._rng.random() < settings.SYNTHETIC_PROVIDER_ERROR_RATE
+
+        timeout = provider_timeout()
+        if latency:
+            time.sleep(min(latency, timeout))
+        if latency > timeout:
+            logger.info("Simulated timeout after %.3fs.", timeout)
+            return False
+        if failed:
+            logger.info("Simulated upstream error.")
+            return False
+        return True
+
+    def fetch_current_price(
+        self, symbol: str, asset_type: Optional[str]
+    ) -> Optional[float]:
+        if not self._simulate_call():
+            return None
+        return generate_quote(symbol, asset_type)
+
+    def fetch_current_prices(
+        self, symbols: List[str], asset_type: Optional[str]
+    ) -> Dict[str, Optional[float]]:
+        if not self._simulate_call():
+            return {symbol.upper(): None for symbol in symbols}
+        now = time.time()
+        return {
+            symbol.upper(): generate_quote(symbol, asset_type, at=now)
+            for symbol in symbols
+        }
+
+    def fetch_historical_data(
+        self, symbol: str, asset_type: Optional[str], outputsize: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        if not self._simulate_call():
+            return None
+        return generate_history(
+            symbol,
+            asset_type,
+            OUTPUTSIZE_DAYS.get(outputsize, OUTPUTSIZE_DAYS["compact"]),
+        )
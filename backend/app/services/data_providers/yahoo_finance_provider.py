@@ -1,56 +1,98 @@
 # app/services/data_providers/yahoo_finance_provider.py
+import logging
 import yfinance as yf
 import pandas as pd
 from typing import List, Dict, Any, Optional
-from datetime import date
+from datetime import date, datetime, timezone
+
+from app.core.deadline import (
+    MIN_PROVIDER_BUDGET_SECONDS,
+    current_deadline,
+    provider_timeout,
+)
+from . import cassette
+from .base import (
+    ACTION_TYPES,
+    MarketDataProvider,
+    ProviderCapabilities,
+    crypto_base_symbol,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def _map_symbol_for_yfinance(symbol: str, asset_type: Optional[str] = None) -> str:
-    """Maps internal symbol to yfinance-compatible ticker."""
-    symbol_upper = symbol.upper()
+    """
+    Maps internal symbol to yfinance-compatible ticker: crypto trades as
+    "<coin>-USD". Coins listed differently get a provider_symbols row.
+    The fetch functions below take the resulting ticker (or the stored
+    one) and use it as is.
+    """
     if asset_type and asset_type.lower() == "crypto":
-        known_crypto_bases = [
-            "BTC",
-            "ETH",
-            "SOL",
-            "XRP",
-            "ADA",
-            "DOGE",
-            "LTC",
-            "BCH",
-            "DOT",
-            "LINK",
-        ]
-        if symbol_upper in known_crypto_bases:
-            return f"{symbol_upper}-USD"
-        base_symbol = symbol_upper.replace("-USD", "").replace("USD", "")
-        if base_symbol in known_crypto_bases:
-            return f"{base_symbol}-USD"
-    return symbol_upper
+        return f"{crypto_base_symbol(symbol)}-USD"
+    return symbol.upper()
+
+
+def _yf_history(
+    ticker: yf.Ticker,
+    yf_symbol: str,
+    period: str,
+    interval: str,
+    start: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """
+    Raw yfinance history frame; the layer the cassette records and replays.
+    With `start`, the bars from then on instead of the last `period`.
+    """
+    if start is not None:
+        key = f"{yf_symbol}|since {start.isoformat()}|{interval}"
+        window: Dict[str, Any] = {"start": start}
+    else:
+        key = f"{yf_symbol}|{period}|{interval}"
+        window = {"period": period}
+    return cassette.intercept(
+        "yf_history",
+        key,
+        lambda: ticker.history(**window, interval=interval, timeout=provider_timeout()),
+        encode=cassette.encode_frame,
+        decode=cassette.decode_frame,
+    )
+
+
+def _yf_info(ticker: yf.Ticker, yf_symbol: str) -> Dict[str, Any]:
+    return cassette.intercept("yf_info", yf_symbol, lambda: ticker.info)
 
 
 def fetch_yf_current_price(
     symbol: str, asset_type: Optional[str] = None
 ) -> Optional[float]:
-    yf_symbol = _map_symbol_for_yfinance(symbol, asset_type)
-    print(
-        f"YF_PROVIDER: Attempting to fetch current price for yf_symbol '{yf_symbol}' (original: '{symbol}')"
+    yf_symbol = symbol
+    logger.debug(
+        "Attempting to fetch current price for yf_symbol '%s' (type: %s)",
+        yf_symbol,
+        asset_type,
     )
     try:
         ticker = yf.Ticker(yf_symbol)
-        data = ticker.history(period="5d", interval="1d")
+        data = _yf_history(ticker, yf_symbol, period="5d", interval="1d")
         if not data.empty and "Close" in data and len(data["Close"]) > 0:
             for price_val in reversed(data["Close"].values):
                 if price_val == price_val:
                     return float(price_val)
-            print(
-                f"YF_PROVIDER: Found history for {yf_symbol} but all recent closes were NaN."
+            logger.info(
+                "Found history for %s but all recent closes were NaN.", yf_symbol
             )
 
-        print(
-            f"YF_PROVIDER: history call failed for {yf_symbol}, trying ticker.info..."
-        )
-        info = ticker.info
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired(MIN_PROVIDER_BUDGET_SECONDS):
+            # ticker.info takes no timeout, so only call it with budget left.
+            logger.warning(
+                "History call failed for %s and no time left for ticker.info.",
+                yf_symbol,
+            )
+            return None
+        logger.info("History call failed for %s, trying ticker.info...", yf_symbol)
+        info = _yf_info(ticker, yf_symbol)
         price_keys = [
             "regularMarketPrice",
             "currentPrice",
@@ -63,13 +105,15 @@ def fetch_yf_current_price(
             if info.get(key) is not None:
                 return float(info[key])
 
-        print(
-            f"YF_PROVIDER: Could not determine current price for {yf_symbol} from history or info. Info: {info}"
+        logger.warning(
+            "Could not determine current price for %s from history or info. Info: %s",
+            yf_symbol,
+            info,
         )
         return None
     except Exception as e:
-        print(
-            f"YF_PROVIDER: Error fetching current price for yf_symbol '{yf_symbol}': {e}"
+        logger.error(
+            "Error fetching current price for yf_symbol '%s': %s", yf_symbol, e
         )
         return None
 
@@ -80,17 +124,20 @@ def fetch_yf_historical_data(
     period: str = "1mo",
     interval: str = "1d",
 ) -> Optional[List[Dict[str, Any]]]:
-    yf_symbol = _map_symbol_for_yfinance(symbol, asset_type)
-    print(
-        f"YF_PROVIDER: Attempting to fetch historical for yf_symbol '{yf_symbol}' (original: '{symbol}') period: {period}"
+    yf_symbol = symbol
+    logger.debug(
+        "Attempting to fetch historical for yf_symbol '%s' (type: %s) period: %s",
+        yf_symbol,
+        asset_type,
+        period,
     )
     try:
         ticker = yf.Ticker(yf_symbol)
-        hist_df = ticker.history(period=period, interval=interval)
+        hist_df = _yf_history(ticker, yf_symbol, period=period, interval=interval)
 
         if hist_df.empty:
-            print(
-                f"YF_PROVIDER: No historical data found for {yf_symbol} with period {period}."
+            logger.warning(
+                "No historical data found for %s with period %s.", yf_symbol, period
             )
             return None
 
@@ -119,26 +166,186 @@ def fetch_yf_historical_data(
                 pd.isna(row.get(col))
                 for col in ["Open", "High", "Low", "Close", "Volume"]
             ):
-                print(
-                    f"YF_PROVIDER: Skipping data point for {yf_symbol} on {dt_date} due to NaN in OHLCV."
+                logger.debug(
+                    "Skipping data point for %s on %s due to NaN in OHLCV.",
+                    yf_symbol,
+                    dt_date,
                 )
                 continue
 
-            processed_data.append(
+            point = {
+                "date": dt_date,
+                "open": float(row["Open"]),
+                "high": float(row["High"]),
+                "low": float(row["Low"]),
+                "close": float(row["Close"]),
+                "volume": int(row["Volume"]),
+                "sma20": sma20_val,
+                "sma50": sma50_val,
+            }
+            # Ex-dates of corporate actions; yfinance reports them as zero
+            # on every other day.
+            for column, field in (("Dividends", "dividend"), ("Stock Splits", "split")):
+                value = row.get(column)
+                if value is not None and pd.notna(value) and value > 0:
+                    point[field] = float(value)
+            processed_data.append(point)
+        return processed_data if processed_data else None
+    except Exception as e:
+        logger.error(
+            "Error fetching/processing historical data for yf_symbol '%s': %s",
+            yf_symbol,
+            e,
+        )
+        return None
+
+
+def _yf_fx_symbol(from_currency: str, to_currency: str) -> str:
+    """Yahoo lists currency pairs as "<FROM><TO>=X", e.g. "EURUSD=X"."""
+    return f"{from_currency.upper()}{to_currency.upper()}=X"
+
+
+def fetch_yf_fx_rate(from_currency: str, to_currency: str) -> Optional[float]:
+    yf_symbol = _yf_fx_symbol(from_currency, to_currency)
+    try:
+        ticker = yf.Ticker(yf_symbol)
+        data = _yf_history(ticker, yf_symbol, period="5d", interval="1d")
+        if not data.empty and "Close" in data:
+            for rate in reversed(data["Close"].values):
+                if rate == rate:
+                    return float(rate)
+        logger.warning("No recent FX rate found for %s.", yf_symbol)
+        return None
+    except Exception as e:
+        logger.error("Error fetching FX rate for '%s': %s", yf_symbol, e)
+        return None
+
+
+def fetch_yf_fx_history(
+    from_currency: str, to_currency: str
+) -> Optional[List[Dict[str, Any]]]:
+    yf_symbol = _yf_fx_symbol(from_currency, to_currency)
+    try:
+        ticker = yf.Ticker(yf_symbol)
+        hist_df = _yf_history(ticker, yf_symbol, period="max", interval="1d")
+        if hist_df.empty:
+            logger.warning("No FX history found for %s.", yf_symbol)
+            return None
+        points = [
+            {
+                "date": (
+                    day.date()
+                    if hasattr(day, "date")
+                    else date.fromisoformat(str(day).split(" ")[0])
+                ),
+                "rate": float(close),
+            }
+            for day, close in hist_df["Close"].items()
+            if pd.notna(close)
+        ]
+        return points or None
+    except Exception as e:
+        logger.error("Error fetching FX history for '%s': %s", yf_symbol, e)
+        return None
+
+
+# Backfill window per intraday interval: enough bars to fill a buffer of
+# INTRADAY_BUFFER_BARS, within what Yahoo serves (1m bars: the last 7 days).
+INTRADAY_BACKFILL_PERIODS = {"1m": "5d", "5m": "1mo", "15m": "1mo", "1h": "6mo"}
+
+
+def fetch_yf_intraday_bars(
+    symbol: str,
+    asset_type: Optional[str] = None,
+    interval: str = "5m",
+    since: Optional[datetime] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Intraday OHLCV bars with UTC timestamps, oldest first: from `since` on
+    when given, else the interval's backfill period.
+    """
+    yf_symbol = symbol
+    period = INTRADAY_BACKFILL_PERIODS.get(interval, "5d")
+    try:
+        ticker = yf.Ticker(yf_symbol)
+        hist_df = _yf_history(
+            ticker, yf_symbol, period=period, interval=interval, start=since
+        )
+        if hist_df.empty:
+            logger.warning(
+                "No %s bars found for %s (since %s).", interval, yf_symbol, since
+            )
+            return None
+
+        bars = []
+        for timestamp, row in hist_df.iterrows():
+            if any(
+                pd.isna(row.get(col))
+                for col in ["Open", "High", "Low", "Close", "Volume"]
+            ):
+                continue
+            bar_time = pd.Timestamp(timestamp)
+            if bar_time.tzinfo is None:
+                bar_time = bar_time.tz_localize(timezone.utc)
+            bars.append(
                 {
-                    "date": dt_date,
+                    "timestamp": bar_time.tz_convert(timezone.utc).to_pydatetime(),
                     "open": float(row["Open"]),
                     "high": float(row["High"]),
                     "low": float(row["Low"]),
                     "close": float(row["Close"]),
                     "volume": int(row["Volume"]),
-                    "sma20": sma20_val,
-                    "sma50": sma50_val,
                 }
             )
-        return processed_data if processed_data else None
+        return bars or None
     except Exception as e:
-        print(
-            f"YF_PROVIDER: Error fetching/processing historical data for yf_symbol '{yf_symbol}': {e}"
+        logger.error(
+            "Error fetching %s bars for yf_symbol '%s': %s", interval, yf_symbol, e
         )
         return None
+
+
+OUTPUTSIZE_PERIODS = {"compact": "3mo", "full": "max"}
+
+
+class YahooFinanceProvider(MarketDataProvider):
+    """Adapter over the module-level yfinance functions."""
+
+    name = "yfinance"
+    capabilities = ProviderCapabilities(intraday=True, fx=True)
+    priority = 10
+    cost_per_call = 0.0
+    # yfinance auto-adjusts history for splits and dividends.
+    history_adjustments = ACTION_TYPES
+
+    def provider_symbol(self, symbol: str, asset_type: Optional[str]) -> str:
+        return _map_symbol_for_yfinance(symbol, asset_type)
+
+    def fetch_current_price(
+        self, symbol: str, asset_type: Optional[str]
+    ) -> Optional[float]:
+        return fetch_yf_current_price(symbol, asset_type)
+
+    def fetch_historical_data(
+        self, symbol: str, asset_type: Optional[str], outputsize: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        return fetch_yf_historical_data(
+            symbol, asset_type, period=OUTPUTSIZE_PERIODS.get(outputsize, "3mo")
+        )
+
+    def fetch_intraday_bars(
+        self,
+        symbol: str,
+        asset_type: Optional[str],
+        interval: str,
+        since: Optional[datetime] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        return fetch_yf_intraday_bars(symbol, asset_type, interval, since)
+
+    def fetch_fx_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
+        return fetch_yf_fx_rate(from_currency, to_currency)
+
+    def fetch_fx_history(
+        self, from_currency: str, to_currency: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        return fetch_yf_fx_history(from_currency, to_currency)
@@ -1,53 +1,456 @@
 # app/services/financial_data_orchestrator.py
-from typing import List, Dict, Any, Optional
+import bisect
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
+from app.core import logs, tracing
 from app.core.config import settings
-from .data_providers import yahoo_finance_provider as yf_provider
-from .data_providers import alpha_vantage_provider as av_provider
-from app.cache import shared_cache
-from datetime import date
+from app.core.deadline import (
+    MIN_PROVIDER_BUDGET_SECONDS,
+    Deadline,
+    current_deadline,
+    deadline_scope,
+)
+from .data_providers import registry
+from .data_providers.base import (
+    INTRADAY_INTERVAL_SECONDS,
+    OPERATION_CURRENT_PRICE,
+    OPERATION_FX_HISTORY,
+    OPERATION_FX_RATE,
+    OPERATION_HISTORICAL_DATA,
+    OPERATION_INTRADAY_BARS,
+)
+from app.cache import bar_buffer, shared_cache
+from . import corporate_actions
+from . import instruments
+from . import price_events
+from . import provider_health
+from . import symbol_filter
+from datetime import date, datetime, timedelta, timezone
+
+logger = logging.getLogger(__name__)
 
 
 _cache = {"price_cache": {}, "history_cache": {}}
 CACHE_DURATION_SECONDS = 15 * 60
+PRICE_BATCH_MAX_WORKERS = 8
+HEDGE_MAX_WORKERS = 16
+# outputsize -> yfinance period; also part of the history cache key.
+HISTORY_PERIODS = {"compact": "3mo", "full": "max"}
+# Daily history is cached as the provider returned it, with the provider's
+# name: {"source", "fetched_at", "points"}. Corporate actions the provider
+# did not apply are applied on read (see corporate_actions.adjust_history)
+# and the result cached under a key naming the symbol's actions and the raw
+# fetch, so a new action only recomputes that symbol's adjusted series from
+# the cached raw one, without refetching it.
+ADJUSTED_HISTORY_KEY_PREFIX = "history_adjusted:"
+# FX rates are cached like prices (CACHE_DURATION_SECONDS in the shared
+# cache, last known rate kept for stale serving). Daily FX history is cached
+# as parallel date/rate columns, so converting any date is one bisect.
+LAST_FX_RATE_KEY_PREFIX = "fx_last:"
+LAST_FX_RATE_TTL_SECONDS = 7 * 24 * 60 * 60
+FX_HISTORY_CACHE_SECONDS = 12 * 60 * 60
+
+# Runs provider calls for hedged lookups; a losing call finishes in the
+# background so its outcome still feeds provider health.
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="provider-hedge"
+)
+
+
+def _log_cache(msg: str, *args) -> None:
+    """A per-lookup DEBUG line, sampled as the "cache" family."""
+    if logger.isEnabledFor(logging.DEBUG) and logs.sampled("cache"):
+        logger.debug(msg, *args, extra={"family": "cache"})
+
+
+def current_price_cache_key(instrument: instruments.Instrument) -> str:
+    return f"price:{instrument.cache_id}"
+
+
+def historical_data_cache_key(
+    instrument: instruments.Instrument, outputsize: str
+) -> str:
+    yf_period = HISTORY_PERIODS.get(outputsize, HISTORY_PERIODS["compact"])
+    return f"history:{instrument.cache_id}_{yf_period}"
 
 
-def get_current_price(symbol: str, asset_type: Optional[str] = None) -> Optional[float]:
-    symbol_upper = symbol.upper()
-    cache_key = f"price:{symbol_upper}_{asset_type or 'unknown'}"
+def adjusted_history_cache_key(
+    instrument: instruments.Instrument, outputsize: str, fingerprint: str
+) -> str:
+    yf_period = HISTORY_PERIODS.get(outputsize, HISTORY_PERIODS["compact"])
+    return (
+        f"{ADJUSTED_HISTORY_KEY_PREFIX}{instrument.cache_id}_{yf_period}:{fingerprint}"
+    )
+
+
+def intraday_bars_cache_key(instrument: instruments.Instrument, interval: str) -> str:
+    return bar_buffer.buffer_key(instrument.cache_id, interval)
+
 
-    cached_price = shared_cache.get_shared_cache(cache_key)
-    if cached_price is not None:
-        print(f"ORCHESTRATOR CACHE HIT (Redis): Using cached price for {symbol_upper}")
-        return float(cached_price)
+def fx_rate_cache_key(from_currency: str, to_currency: str) -> str:
+    return f"fx:{from_currency.upper()}{to_currency.upper()}"
 
-    print(
-        f"ORCHESTRATOR: Cache miss for current price of {symbol_upper} (type: {asset_type}). Trying yfinance."
+
+def fx_history_cache_key(from_currency: str, to_currency: str) -> str:
+    return f"fx_history:{from_currency.upper()}{to_currency.upper()}"
+
+
+def cache_current_price(
+    instrument: instruments.Instrument, price: float, source: Optional[str]
+) -> None:
+    """Stores a freshly fetched price and announces it to price-change listeners."""
+    cache_key = current_price_cache_key(instrument)
+    shared_cache.set_shared_cache(cache_key, price)
+    symbol_filter.record_lookup_success(cache_key, instrument.symbol)
+    price_events.publish_price_change(
+        instrument.symbol, instrument.asset_type, price, source
     )
-    price = yf_provider.fetch_yf_current_price(symbol, asset_type)
 
-    if price is None and settings.ALPHA_VANTAGE_API_KEY:
-        print(
-            f"ORCHESTRATOR: yfinance failed for current price of {symbol_upper}. Trying AlphaVantage as fallback."
+
+def _current_price_fetchers(
+    instrument: instruments.Instrument,
+) -> List[Tuple[str, Callable[[], Optional[float]]]]:
+    """The registry's execution plan for a current-price lookup."""
+    return [
+        (
+            provider.name,
+            registry.counted_call(
+                provider,
+                provider.fetch_current_price,
+                instrument.provider_symbol(provider.name),
+                instrument.asset_type,
+            ),
         )
-        if asset_type and asset_type.lower() == "crypto":
-            base_crypto_symbol = symbol_upper.replace("USDT", "").replace("USD", "")
-            if base_crypto_symbol:
-                price = av_provider.fetch_av_crypto_current_price(base_crypto_symbol)
-        else:
-            price = av_provider.fetch_av_stock_current_price(symbol_upper)
+        for provider in registry.plan(OPERATION_CURRENT_PRICE, instrument.asset_type)
+    ]
+
 
-    if price is not None:
-        shared_cache.set_shared_cache(cache_key, price)
-        print(
-            f"ORCHESTRATOR: Successfully fetched current price for {symbol_upper}: {price}. Stored in Redis."
+def _historical_data_fetchers(
+    instrument: instruments.Instrument, outputsize: str
+) -> List[Tuple[str, Callable[[], Optional[List[Dict[str, Any]]]]]]:
+    """The registry's execution plan for a historical-data lookup."""
+    return [
+        (
+            provider.name,
+            registry.counted_call(
+                provider,
+                provider.fetch_historical_data,
+                instrument.provider_symbol(provider.name),
+                instrument.asset_type,
+                outputsize,
+            ),
         )
-    else:
-        print(
-            f"ORCHESTRATOR: Failed to fetch current price for {symbol_upper} from all providers."
+        for provider in registry.plan(OPERATION_HISTORICAL_DATA, instrument.asset_type)
+    ]
+
+
+def _intraday_bar_fetchers(
+    instrument: instruments.Instrument, interval: str, since: Optional[datetime]
+) -> List[Tuple[str, Callable[[], Optional[List[Dict[str, Any]]]]]]:
+    """The registry's execution plan for an intraday-bars lookup."""
+    return [
+        (
+            provider.name,
+            registry.counted_call(
+                provider,
+                provider.fetch_intraday_bars,
+                instrument.provider_symbol(provider.name),
+                instrument.asset_type,
+                interval,
+                since,
+            ),
+        )
+        for provider in registry.plan(OPERATION_INTRADAY_BARS, instrument.asset_type)
+    ]
+
+
+def _fetch_from_providers(
+    fetchers: List[Tuple[str, Callable[[], Any]]],
+    asset_type: Optional[str],
+    description: str,
+) -> Tuple[Any, Optional[str], bool]:
+    """
+    Tries providers in health-adjusted order, skipping any whose circuit is
+    open, until one returns data. Returns (result, provider name, whether any
+    provider was actually asked).
+    """
+    fetcher_by_name = dict(fetchers)
+    ordered = provider_health.order_providers(
+        [name for name, _ in fetchers], asset_type
+    )
+    attempts: List[provider_health.ProviderAttempt] = []
+    errors: List[str] = []
+    result, source = None, None
+    deadline = current_deadline()
+    for name in ordered:
+        if deadline is not None and deadline.expired(MIN_PROVIDER_BUDGET_SECONDS):
+            logger.info("Deadline reached; not trying %s for %s.", name, description)
+            break
+        if not provider_health.allow_request(name, asset_type):
+            logger.info("Circuit open for %s; skipping for %s.", name, description)
+            continue
+        logger.debug("Trying %s for %s.", name, description)
+        name, latency, result, raised = _timed_fetch(name, fetcher_by_name[name])
+        attempts.append((name, latency, result is not None))
+        if raised:
+            errors.append(name)
+        if result is not None:
+            source = name
+            break
+        logger.warning("%s failed for %s.", name, description)
+    provider_health.record_attempts(attempts, asset_type, errors)
+    return result, source, bool(attempts)
+
+
+def _timed_fetch(name: str, fetcher: Callable[[], Any]) -> Tuple[str, float, Any, bool]:
+    """Runs one provider call: (name, latency, result, whether it raised)."""
+    started = time.perf_counter()
+    raised = False
+    try:
+        result = fetcher()
+    except Exception as e:
+        logger.warning("%s raised: %s", name, e)
+        result, raised = None, True
+    return name, time.perf_counter() - started, result, raised
+
+
+def _record_when_done(futures: List[Future], asset_type: Optional[str]) -> None:
+    """Records provider outcomes once every launched call has finished."""
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def on_done(_: Future) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        attempts, errors = [], []
+        for future in futures:
+            name, latency, result, raised = future.result()
+            attempts.append((name, latency, result is not None))
+            if raised:
+                errors.append(name)
+        provider_health.record_attempts(attempts, asset_type, errors)
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+
+def _fetch_hedged(
+    fetchers: List[Tuple[str, Callable[[], Any]]],
+    asset_type: Optional[str],
+    description: str,
+) -> Tuple[Any, Optional[str], bool]:
+    """
+    Like _fetch_from_providers, but if the first provider has not answered
+    within its hedge delay (a latency percentile), the next provider is fired
+    in parallel and the first usable answer wins. Hedges draw on a global
+    per-minute budget; without budget this degrades to plain fallback.
+    """
+    fetcher_by_name = dict(fetchers)
+    candidates = iter(
+        provider_health.order_providers([name for name, _ in fetchers], asset_type)
+    )
+    launched: List[Future] = []
+    launched_names: List[str] = []
+    deadline = current_deadline()
+
+    def launch_next() -> Optional[Future]:
+        if deadline is not None and deadline.expired(MIN_PROVIDER_BUDGET_SECONDS):
+            return None
+        for name in candidates:
+            if not provider_health.allow_request(name, asset_type):
+                logger.info("Circuit open for %s; skipping for %s.", name, description)
+                continue
+            logger.debug("Trying %s for %s.", name, description)
+            # Copy the context so the worker thread sees the ambient deadline.
+            future = _hedge_executor.submit(
+                contextvars.copy_context().run,
+                _timed_fetch,
+                name,
+                fetcher_by_name[name],
+            )
+            launched.append(future)
+            launched_names.append(name)
+            return future
+        return None
+
+    primary = launch_next()
+    if primary is None:
+        return None, None, False
+
+    pending = {primary}
+    timeout: Optional[float] = provider_health.hedge_delay(
+        launched_names[0], asset_type
+    )
+    result, source = None, None
+    while pending and result is None:
+        wait_timeout = timeout
+        if deadline is not None:
+            wait_timeout = deadline.timeout(timeout)
+        done, pending = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            name, _, value, _ = future.result()
+            if value is not None and result is None:
+                result, source = value, name
+            elif value is None:
+                logger.warning("%s failed for %s.", name, description)
+        if result is not None:
+            break
+        if deadline is not None and deadline.expired():
+            logger.info("Deadline reached waiting for %s.", description)
+            break
+        if not done:
+            # Primary is slower than its usual tail: hedge once, if budget allows.
+            timeout = None
+            if provider_health.try_acquire_hedge_slot():
+                hedge = launch_next()
+                if hedge is not None:
+                    logger.info("Hedging %s after slow primary.", description)
+                    pending.add(hedge)
+        elif not pending:
+            fallback = launch_next()
+            if fallback is not None:
+                pending.add(fallback)
+
+    _record_when_done(launched, asset_type)
+    return result, source, True
+
+
+def _stale_price_quote(symbol_upper: str) -> Optional[Dict[str, Any]]:
+    """Last price ever seen for the symbol, flagged stale; None if never seen."""
+    events = price_events.get_last_price_events([symbol_upper])
+    if not events:
+        return None
+    logger.info(
+        "Serving stale price for %s from %s.", symbol_upper, events[0].timestamp
+    )
+    return {
+        "price": events[0].price,
+        "is_stale": True,
+        "last_updated": events[0].timestamp,
+    }
+
+
+@tracing.traced("orchestrator.current_price")
+def get_current_price_quote(
+    symbol: str,
+    asset_type: Optional[str] = None,
+    hedge: bool = False,
+    deadline: Optional[Deadline] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Current price for `symbol` as {"price", "is_stale", "last_updated"}, from
+    cache or the first provider that answers. `asset_type` may be omitted for
+    assets in the assets table. With `hedge=True` (interactive
+    callers), a slow primary provider is raced against the next one instead
+    of waited out. Provider calls share `deadline`; if it runs out, or no
+    provider may be called, the last known price is returned flagged stale.
+    """
+    with deadline_scope(deadline) as deadline:
+        instrument = instruments.resolve(symbol, asset_type)
+        symbol_upper, asset_type = instrument.symbol, instrument.asset_type
+        cache_key = current_price_cache_key(instrument)
+
+        cached_price = shared_cache.get_shared_cache(cache_key)
+        if cached_price is not None:
+            _log_cache(
+                "Cache hit for current price of %s",
+                symbol_upper,
+            )
+            return {
+                "price": float(cached_price),
+                "is_stale": False,
+                "last_updated": datetime.now(timezone.utc),
+            }
+
+        if symbol_filter.is_negatively_cached(cache_key):
+            _log_cache(
+                "Negative cache hit: Recent lookups for %s failed; skipping providers.",
+                symbol_upper,
+            )
+            return None
+
+        _log_cache(
+            "Cache miss for current price of %s (type: %s).",
+            symbol_upper,
+            asset_type,
         )
+        fetch = _fetch_hedged if hedge else _fetch_from_providers
+        price, source, attempted = fetch(
+            _current_price_fetchers(instrument),
+            asset_type,
+            f"current price of {symbol_upper}",
+        )
+
+        if price is not None:
+            cache_current_price(instrument, price, source)
+            logger.info(
+                "Successfully fetched current price for %s: %s. Stored in Redis.",
+                symbol_upper,
+                price,
+            )
+            return {
+                "price": price,
+                "is_stale": False,
+                "last_updated": datetime.now(timezone.utc),
+            }
+
+        logger.warning(
+            "Failed to fetch current price for %s from all providers.", symbol_upper
+        )
+        out_of_time = deadline is not None and deadline.expired(
+            MIN_PROVIDER_BUDGET_SECONDS
+        )
+        if attempted and not out_of_time:
+            symbol_filter.record_lookup_failure(cache_key, symbol_upper)
+            return None
+        return _stale_price_quote(symbol_upper)
+
+
+def get_current_price(
+    symbol: str,
+    asset_type: Optional[str] = None,
+    hedge: bool = False,
+    deadline: Optional[Deadline] = None,
+) -> Optional[float]:
+    """Price-only form of get_current_price_quote."""
+    quote = get_current_price_quote(symbol, asset_type, hedge=hedge, deadline=deadline)
+    return quote["price"] if quote else None
+
+
+def get_current_prices(
+    items: List[Tuple[str, Optional[str]]],
+    max_workers: int = PRICE_BATCH_MAX_WORKERS,
+    deadline: Optional[Deadline] = None,
+) -> Dict[str, Optional[float]]:
+    """
+    Fetches current prices for many (symbol, asset_type) pairs concurrently,
+    with at most `max_workers` provider lookups in flight. Each lookup goes
+    through get_current_price, so cached prices are reused and new ones cached.
+    All lookups share `deadline` (or the ambient one).
+    """
+    if not items:
+        return {}
+    deadline = deadline or current_deadline()
+    # Resolve every bare symbol in one assets query rather than one per lookup.
+    instruments.resolve_many(items)
+
+    def fetch(item: Tuple[str, Optional[str]]) -> Optional[float]:
+        with deadline_scope(deadline):
+            return get_current_price(*item)
 
-    return price
+    # Worker threads do not inherit context variables: run each lookup in a
+    # copy of this thread's context so its spans join the caller's trace.
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        prices = executor.map(lambda ctx, item: ctx.run(fetch, item), contexts, items)
+        return {symbol.upper(): price for (symbol, _), price in zip(items, prices)}
 
 
 def _deserialize_history_from_cache(
@@ -56,9 +459,7 @@ def _deserialize_history_from_cache(
     """Converts date strings in cached history data back to date objects."""
     processed_cached_data = []
     if not isinstance(cached_data_raw, list):
-        print(
-            f"ORCHESTRATOR CACHE WARNING: Expected list from cache, got {type(cached_data_raw)}"
-        )
+        logger.warning("Expected list from cache, got %s", type(cached_data_raw))
         return []
 
     for point_dict in cached_data_raw:
@@ -71,61 +472,411 @@ def _deserialize_history_from_cache(
                 point_dict_copy["date"] = date.fromisoformat(date_val)
             processed_cached_data.append(point_dict_copy)
         except (ValueError, TypeError) as e:
-            print(
-                f"ORCHESTRATOR CACHE WARNING: Malformed date string '{point_dict.get('date')}' in cached data. Point: {point_dict} Error: {e}"
+            logger.warning(
+                "Malformed date string '%s' in cached data. Point: %s Error: %s",
+                point_dict.get("date"),
+                point_dict,
+                e,
             )
             processed_cached_data.append(point_dict.copy())
     return processed_cached_data
 
 
+@tracing.traced("orchestrator.historical_data")
 def get_historical_data(
-    symbol: str, asset_type: Optional[str] = None, outputsize: str = "compact"
+    symbol: str,
+    asset_type: Optional[str] = None,
+    outputsize: str = "compact",
+    deadline: Optional[Deadline] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    with deadline_scope(deadline):
+        return _get_historical_data(symbol, asset_type, outputsize)
+
+
+def _get_historical_data(
+    symbol: str, asset_type: Optional[str], outputsize: str
 ) -> Optional[List[Dict[str, Any]]]:
-    symbol_upper = symbol.upper()
-    period_map = {"compact": "3mo", "full": "max"}
-    yf_period = period_map.get(outputsize, "3mo")
-    cache_key = f"history:{symbol_upper}_{asset_type or 'unknown'}_{yf_period}"
+    instrument = instruments.resolve(symbol, asset_type)
+    history = _get_raw_history(instrument, outputsize)
+    if history is None:
+        return None
+    if not history["points"] or history["source"] is None:
+        return history["points"]
+    return _adjusted_history(instrument, outputsize, history)
+
+
+def _unpack_cached_history(cached: Any) -> Dict[str, Any]:
+    """A cached raw series; bare lists predate recording the source."""
+    if isinstance(cached, dict):
+        return {
+            "source": cached.get("source"),
+            "fetched_at": cached.get("fetched_at"),
+            "points": _deserialize_history_from_cache(cached.get("points")),
+        }
+    return {
+        "source": None,
+        "fetched_at": None,
+        "points": _deserialize_history_from_cache(cached),
+    }
+
+
+def _get_raw_history(
+    instrument: instruments.Instrument, outputsize: str
+) -> Optional[Dict[str, Any]]:
+    """The provider's series as {"source", "fetched_at", "points"}, cached."""
+    symbol_upper, asset_type = instrument.symbol, instrument.asset_type
+    yf_period = HISTORY_PERIODS.get(outputsize, HISTORY_PERIODS["compact"])
+    cache_key = historical_data_cache_key(instrument, outputsize)
 
     cached_data_raw = shared_cache.get_shared_cache(cache_key)
     if cached_data_raw is not None:
-        print(
-            f"ORCHESTRATOR CACHE HIT (Redis): Using cached history for {symbol.upper()}"
+        _log_cache("Cache hit for history of %s", symbol_upper)
+        return _unpack_cached_history(cached_data_raw)
+
+    if symbol_filter.is_negatively_cached(cache_key):
+        _log_cache(
+            "Negative cache hit: Recent history lookups for %s failed; skipping providers.",
+            symbol_upper,
         )
-        return _deserialize_history_from_cache(cached_data_raw)
+        return None
 
-    print(
-        f"ORCHESTRATOR: Cache miss for historical data of {symbol_upper} (type: {asset_type}, period: {yf_period}). Trying yfinance."
+    _log_cache(
+        "Cache miss for historical data of %s (type: %s, period: %s).",
+        symbol_upper,
+        asset_type,
+        yf_period,
+    )
+    history, source, attempted = _fetch_from_providers(
+        _historical_data_fetchers(instrument, outputsize),
+        asset_type,
+        f"historical data of {symbol_upper}",
     )
-    history = yf_provider.fetch_yf_historical_data(symbol, asset_type, period=yf_period)
 
-    if history is None and settings.ALPHA_VANTAGE_API_KEY:
-        print(
-            f"ORCHESTRATOR: yfinance failed for historical {symbol_upper}. Trying AlphaVantage as fallback."
-        )
-        if asset_type and asset_type.lower() == "crypto":
-            base_crypto_symbol = symbol_upper.replace("USDT", "").replace("USD", "")
-            if base_crypto_symbol:
-                history = av_provider.fetch_av_crypto_historical_data(
-                    base_crypto_symbol, outputsize=outputsize
-                )
+    if history is not None:
+        symbol_filter.record_lookup_success(cache_key, symbol_upper)
+        entry = {"source": source, "fetched_at": time.time(), "points": history}
+        shared_cache.set_shared_cache(cache_key, entry)
+        if history:
+            logger.info(
+                "Successfully fetched %s historical points for %s. Stored in Redis.",
+                len(history),
+                symbol_upper,
+            )
+            corporate_actions.record_from_history(
+                instrument, history, source, _applied_adjustments(source)
+            )
         else:
-            history = av_provider.fetch_av_stock_historical_data(
-                symbol_upper, outputsize=outputsize
+            logger.info(
+                "Fetched empty historical data for %s. Caching empty list.",
+                symbol_upper,
             )
+        return entry
+
+    logger.warning(
+        "Failed to fetch historical data for %s from all providers.", symbol_upper
+    )
+    deadline = current_deadline()
+    if attempted and not (
+        deadline is not None and deadline.expired(MIN_PROVIDER_BUDGET_SECONDS)
+    ):
+        symbol_filter.record_lookup_failure(cache_key)
+    return None
+
 
-    if history is not None and len(history) > 0:
-        shared_cache.set_shared_cache(cache_key, history)
-        print(
-            f"ORCHESTRATOR: Successfully fetched {len(history)} historical points for {symbol.upper()}. Stored in Redis."
+def _applied_adjustments(source: Optional[str]) -> FrozenSet[str]:
+    """The corporate actions `source` already applies to its history."""
+    provider = registry.get_provider(source) if source else None
+    return provider.history_adjustments if provider is not None else frozenset()
+
+
+def _adjusted_history(
+    instrument: instruments.Instrument, outputsize: str, history: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """The raw series with the symbol's outstanding corporate actions applied."""
+    points = history["points"]
+    applied = _applied_adjustments(history["source"])
+    actions = corporate_actions.actions_for(instrument.symbol)
+    if not corporate_actions.pending_actions(actions, applied):
+        return points
+
+    cache_key = adjusted_history_cache_key(
+        instrument,
+        outputsize,
+        corporate_actions.fingerprint(actions, applied, history["fetched_at"]),
+    )
+    cached = shared_cache.get_shared_cache(cache_key)
+    if cached is not None:
+        return _deserialize_history_from_cache(cached)
+
+    adjusted = corporate_actions.adjust_history(points, actions, applied)
+    shared_cache.set_shared_cache(cache_key, adjusted)
+    logger.debug(
+        "Adjusted history of %s for %d corporate action(s).",
+        instrument.symbol,
+        len(actions),
+    )
+    return adjusted
+
+
+def _with_moving_averages(bars: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Intraday bars as history points: a date, plus sma20/sma50 over the window."""
+    closes = [bar["close"] for bar in bars]
+    points = []
+    for i, bar in enumerate(bars):
+        point = dict(bar, date=bar["timestamp"].date(), sma20=None, sma50=None)
+        for window, field in ((20, "sma20"), (50, "sma50")):
+            if i + 1 >= window:
+                point[field] = sum(closes[i + 1 - window : i + 1]) / window
+        points.append(point)
+    return points
+
+
+@tracing.traced("orchestrator.intraday_bars")
+def get_intraday_bars(
+    symbol: str,
+    asset_type: Optional[str] = None,
+    interval: str = "5m",
+    deadline: Optional[Deadline] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    The most recent INTRADAY_BUFFER_BARS bars of `interval` for `symbol`,
+    oldest first, shaped like get_historical_data points plus a `timestamp`.
+    Served from the symbol's Redis ring buffer, which is topped up with only
+    the bars since its last one at most once per INTRADAY_REFRESH_SECONDS.
+    """
+    if interval not in INTRADAY_INTERVAL_SECONDS:
+        raise ValueError(f"Unsupported intraday interval {interval!r}")
+    with deadline_scope(deadline):
+        return _get_intraday_bars(symbol, asset_type, interval)
+
+
+def _get_intraday_bars(
+    symbol: str, asset_type: Optional[str], interval: str
+) -> Optional[List[Dict[str, Any]]]:
+    instrument = instruments.resolve(symbol, asset_type)
+    symbol_upper, asset_type = instrument.symbol, instrument.asset_type
+    interval_seconds = INTRADAY_INTERVAL_SECONDS[interval]
+    cache_key = intraday_bars_cache_key(instrument, interval)
+
+    stored = bar_buffer.read_bars(cache_key)
+    refresh_seconds = min(interval_seconds, settings.INTRADAY_REFRESH_SECONDS)
+    if not bar_buffer.claim_refresh(cache_key, refresh_seconds) and stored:
+        _log_cache(
+            "Fresh %s bars for %s in buffer.",
+            interval,
+            symbol_upper,
+        )
+        return _with_moving_averages(stored)
+
+    if not stored and symbol_filter.is_negatively_cached(cache_key):
+        _log_cache(
+            "Negative cache hit: Recent %s bar lookups for %s failed; skipping providers.",
+            interval,
+            symbol_upper,
         )
-    elif history == []:
-        shared_cache.set_shared_cache(cache_key, [])
-        print(
-            f"ORCHESTRATOR: Fetched empty historical data for {symbol.upper()}. Caching empty list."
+        return None
+
+    # Only the bars since the newest buffered one, unless the buffer is so
+    # old that none of it would survive the trim anyway.
+    since = stored[-1]["timestamp"] if stored else None
+    window = timedelta(seconds=interval_seconds * settings.INTRADAY_BUFFER_BARS)
+    if since is not None and since < datetime.now(timezone.utc) - window:
+        since = None
+    bars, _, attempted = _fetch_from_providers(
+        _intraday_bar_fetchers(instrument, interval, since),
+        asset_type,
+        f"{interval} bars of {symbol_upper}",
+    )
+
+    if bars is None:
+        logger.warning(
+            "Failed to fetch %s bars for %s from all providers.", interval, symbol_upper
         )
+        deadline = current_deadline()
+        if (
+            not stored
+            and attempted
+            and not (
+                deadline is not None and deadline.expired(MIN_PROVIDER_BUDGET_SECONDS)
+            )
+        ):
+            symbol_filter.record_lookup_failure(cache_key)
+        return _with_moving_averages(stored) if stored else None
+
+    symbol_filter.record_lookup_success(cache_key, symbol_upper)
+    if since is None:
+        bar_buffer.replace_bars(cache_key, bars)
+        merged = bar_buffer.merge_bars([], bars)
     else:
-        print(
-            f"ORCHESTRATOR: Failed to fetch historical data for {symbol_upper} from all providers."
+        bar_buffer.append_bars(cache_key, bars)
+        merged = bar_buffer.merge_bars(stored, bars)
+    logger.info(
+        "Fetched %d %s bars for %s (since %s).",
+        len(bars),
+        interval,
+        symbol_upper,
+        since,
+    )
+    return _with_moving_averages(merged)
+
+
+def _fx_fetchers(
+    operation: str, from_currency: str, to_currency: str
+) -> List[Tuple[str, Callable[[], Any]]]:
+    """The registry's execution plan for an FX rate or FX history lookup."""
+    return [
+        (
+            provider.name,
+            registry.counted_call(
+                provider,
+                (
+                    provider.fetch_fx_rate
+                    if operation == OPERATION_FX_RATE
+                    else provider.fetch_fx_history
+                ),
+                from_currency,
+                to_currency,
+            ),
+        )
+        for provider in registry.plan(operation, None)
+    ]
+
+
+def _stale_fx_quote(pair: str) -> Optional[Dict[str, Any]]:
+    """Last rate ever seen for the pair, flagged stale; None if never seen."""
+    last = shared_cache.get_shared_cache(f"{LAST_FX_RATE_KEY_PREFIX}{pair}")
+    if not isinstance(last, dict) or last.get("rate") is None:
+        return None
+    logger.info("Serving stale FX rate for %s from %s.", pair, last.get("timestamp"))
+    return {
+        "rate": float(last["rate"]),
+        "is_stale": True,
+        "last_updated": datetime.fromisoformat(last["timestamp"]),
+    }
+
+
+def _fetch_fx_rate_quote(
+    from_currency: str, to_currency: str
+) -> Optional[Dict[str, Any]]:
+    """FX rate from the providers, on a cache miss; same fallbacks as prices."""
+    pair = f"{from_currency}{to_currency}"
+    cache_key = fx_rate_cache_key(from_currency, to_currency)
+    if symbol_filter.is_negatively_cached(cache_key):
+        _log_cache(
+            "Negative cache hit: Recent FX lookups for %s failed; skipping providers.",
+            pair,
+        )
+        return None
+
+    rate, _, attempted = _fetch_from_providers(
+        _fx_fetchers(OPERATION_FX_RATE, from_currency, to_currency),
+        None,
+        f"FX rate {pair}",
+    )
+    now = datetime.now(timezone.utc)
+    if rate is not None:
+        shared_cache.set_shared_cache(cache_key, rate)
+        shared_cache.set_shared_cache(
+            f"{LAST_FX_RATE_KEY_PREFIX}{pair}",
+            {"rate": rate, "timestamp": now},
+            ex=LAST_FX_RATE_TTL_SECONDS,
         )
+        symbol_filter.record_lookup_success(cache_key)
+        return {"rate": rate, "is_stale": False, "last_updated": now}
+
+    logger.warning("Failed to fetch FX rate %s from all providers.", pair)
+    deadline = current_deadline()
+    out_of_time = deadline is not None and deadline.expired(MIN_PROVIDER_BUDGET_SECONDS)
+    if attempted and not out_of_time:
+        symbol_filter.record_lookup_failure(cache_key)
+        return None
+    return _stale_fx_quote(pair)
+
+
+@tracing.traced("orchestrator.fx_rates")
+def get_fx_rates(
+    currencies: List[str], base_currency: str, deadline: Optional[Deadline] = None
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Rates converting each of `currencies` into `base_currency`, as
+    {"rate", "is_stale", "last_updated"} keyed by upper-cased currency (None
+    where no rate is known). Cached rates are read in one round trip; misses
+    go to the providers one pair at a time, sharing `deadline`.
+    """
+    base = base_currency.upper()
+    now = datetime.now(timezone.utc)
+    wanted = sorted({currency.upper() for currency in currencies})
+    quotes: Dict[str, Optional[Dict[str, Any]]] = {
+        currency: {"rate": 1.0, "is_stale": False, "last_updated": now}
+        for currency in wanted
+        if currency == base
+    }
+    others = [currency for currency in wanted if currency != base]
+    cached = shared_cache.get_many_shared_cache(
+        [fx_rate_cache_key(currency, base) for currency in others]
+    )
+    with deadline_scope(deadline):
+        for currency, rate in zip(others, cached):
+            if rate is not None:
+                quotes[currency] = {
+                    "rate": float(rate),
+                    "is_stale": False,
+                    "last_updated": now,
+                }
+            else:
+                quotes[currency] = _fetch_fx_rate_quote(currency, base)
+    return quotes
 
+
+def get_fx_history(
+    from_currency: str, to_currency: str
+) -> Optional[Dict[str, List[Any]]]:
+    """
+    Daily closing rates for the pair as {"dates": [ISO date, ...], "rates":
+    [...]}, oldest first; see fx_rate_on. None if no provider has them; a
+    failed fetch backs off like other lookups, as each one is a full-history
+    call against the providers' quotas.
+    """
+    from_currency, to_currency = from_currency.upper(), to_currency.upper()
+    if from_currency == to_currency:
+        return {"dates": [], "rates": []}
+    pair = f"{from_currency}{to_currency}"
+    cache_key = fx_history_cache_key(from_currency, to_currency)
+    cached = shared_cache.get_shared_cache(cache_key)
+    if isinstance(cached, dict):
+        return cached
+    if symbol_filter.is_negatively_cached(cache_key):
+        _log_cache(
+            "Negative cache hit: Recent FX history lookups for %s failed; skipping providers.",
+            pair,
+        )
+        return None
+
+    points, _, attempted = _fetch_from_providers(
+        _fx_fetchers(OPERATION_FX_HISTORY, from_currency, to_currency),
+        None,
+        f"FX history {pair}",
+    )
+    if not points:
+        deadline = current_deadline()
+        out_of_time = deadline is not None and deadline.expired(
+            MIN_PROVIDER_BUDGET_SECONDS
+        )
+        if attempted and not out_of_time:
+            symbol_filter.record_lookup_failure(cache_key)
+        return None
+    history = {
+        "dates": [point["date"].isoformat() for point in points],
+        "rates": [point["rate"] for point in points],
+    }
+    shared_cache.set_shared_cache(cache_key, history, ex=FX_HISTORY_CACHE_SECONDS)
+    symbol_filter.record_lookup_success(cache_key)
     return history
+
+
+def fx_rate_on(history: Optional[Dict[str, List[Any]]], day: date) -> Optional[float]:
+    """The pair's closing rate on `day`, or the last one before it."""
+    if not history or not history["dates"]:
+        return None
+    index = bisect.bisect_right(history["dates"], day.isoformat()) - 1
+    return history["rates"][index] if index >= 0 else None
@@ -0,0 +1,243 @@
+# app/services/instruments.py
+import logging
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from app import crud
+from app.cache import shared_cache
+from app.db.session import SessionLocal
+from .data_providers import registry
+
+logger = logging.getLogger(__name__)
+
+# Callers name instruments loosely: the portfolio page passes a bare symbol,
+# the refresh task passes (symbol, type), users type lower case. Everything
+# that builds a cache key or calls a provider resolves through here first,
+# so one instrument maps to one set of cache entries however it was named.
+INSTRUMENT_CACHE_SECONDS = 5 * 60
+# After a failed assets lookup, how long to resolve without the DB.
+LOOKUP_ERROR_BACKOFF_SECONDS = 30
+# Provider tickers stored in the provider_symbols table are held in memory
+# whole. Writers bump this Redis counter; every process compares it at most
+# once per VERSION_CHECK_SECONDS and reloads the table when it moved.
+PROVIDER_SYMBOLS_VERSION_KEY = "provider_symbols:version"
+VERSION_CHECK_SECONDS = 10
+
+
+class Instrument(BaseModel):
+    """An instrument under its canonical name, with each provider's ticker."""
+
+    model_config = ConfigDict(frozen=True)
+
+    symbol: str
+    asset_type: Optional[str] = None
+    asset_id: Optional[int] = None
+    provider_symbols: Dict[str, str] = {}
+
+    @property
+    def cache_id(self) -> str:
+        """Key fragment shared by every cache entry for this instrument."""
+        return f"{self.symbol}_{self.asset_type or 'unknown'}"
+
+    def provider_symbol(self, provider_name: str) -> str:
+        return self.provider_symbols.get(provider_name, self.symbol)
+
+
+# (symbol, type hint) -> (expires_at, instrument)
+_resolved: Dict[Tuple[str, Optional[str]], Tuple[float, Instrument]] = {}
+# symbol -> (expires_at, asset_type, asset_id) from the assets table; a None
+# type records that the symbol is not an asset.
+_assets: Dict[str, Tuple[float, Optional[str], Optional[int]]] = {}
+_lock = threading.Lock()
+
+# symbol -> {provider name: ticker}, as stored in provider_symbols.
+_provider_symbols: Dict[str, Dict[str, str]] = {}
+_provider_symbols_state = {"version": None, "loaded_at": None, "next_check": 0.0}
+
+
+def _normalize(symbol: str, asset_type: Optional[str]) -> Tuple[str, Optional[str]]:
+    return symbol.strip().upper(), (asset_type.lower() if asset_type else None)
+
+
+def _load_assets(symbols: List[str]) -> None:
+    """Reads the assets rows for `symbols` in one query."""
+    now = time.monotonic()
+    try:
+        db = SessionLocal()
+        try:
+            found = {
+                asset.symbol.upper(): asset
+                for asset in crud.get_assets_by_symbols(db, symbols=symbols)
+            }
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error("Error loading assets for %d symbol(s): %s", len(symbols), e)
+        expires_at = now + LOOKUP_ERROR_BACKOFF_SECONDS
+        with _lock:
+            for symbol in symbols:
+                _assets[symbol] = (expires_at, None, None)
+        return
+    expires_at = now + INSTRUMENT_CACHE_SECONDS
+    with _lock:
+        for symbol in symbols:
+            asset = found.get(symbol)
+            _assets[symbol] = (
+                expires_at,
+                asset.asset_type.value if asset is not None else None,
+                asset.id if asset is not None else None,
+            )
+
+
+def _known_asset(symbol: str) -> Optional[Tuple[float, Optional[str], Optional[int]]]:
+    entry = _assets.get(symbol)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry
+
+
+def _stored_version() -> Optional[int]:
+    client = shared_cache.get_redis_client()
+    if client is None:
+        return None
+    try:
+        version = client.get(PROVIDER_SYMBOLS_VERSION_KEY)
+    except Exception as e:
+        logger.error("Error reading provider symbol version: %s", e)
+        return None
+    return int(version) if version else 0
+
+
+def _sync_provider_symbols() -> None:
+    """
+    Reloads the provider_symbols table if another process changed it, or if
+    the copy is older than INSTRUMENT_CACHE_SECONDS (the fallback without
+    Redis). A reload drops memoized resolutions, since their tickers may be
+    out of date.
+    """
+    global _provider_symbols
+    state = _provider_symbols_state
+    now = time.monotonic()
+    if now < state["next_check"]:
+        return
+    with _lock:
+        if now < state["next_check"]:
+            return
+        state["next_check"] = now + VERSION_CHECK_SECONDS
+    version = _stored_version()
+    loaded_at = state["loaded_at"]
+    if (
+        loaded_at is not None
+        and version == state["version"]
+        and now - loaded_at < INSTRUMENT_CACHE_SECONDS
+    ):
+        return
+    try:
+        db = SessionLocal()
+        try:
+            mapping = crud.get_provider_symbol_map(db)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error("Error loading provider symbols: %s", e)
+        with _lock:
+            state["next_check"] = now + LOOKUP_ERROR_BACKOFF_SECONDS
+        return
+    with _lock:
+        _provider_symbols = mapping
+        state.update(version=version, loaded_at=now)
+        _resolved.clear()
+    logger.info("Loaded provider symbols for %d asset(s).", len(mapping))
+
+
+def provider_symbols_changed() -> None:
+    """Call after writing provider_symbols: reloads here, and everywhere else."""
+    client = shared_cache.get_redis_client()
+    if client is not None:
+        try:
+            client.incr(PROVIDER_SYMBOLS_VERSION_KEY)
+        except Exception as e:
+            logger.error("Error bumping provider symbol version: %s", e)
+    with _lock:
+        _provider_symbols_state.update(loaded_at=None, next_check=0.0)
+
+
+def _build(symbol: str, hint: Optional[str]) -> Instrument:
+    asset = _known_asset(symbol)
+    asset_type = (asset[1] if asset else None) or hint
+    stored = _provider_symbols.get(symbol, {})
+    return Instrument(
+        symbol=symbol,
+        asset_type=asset_type,
+        asset_id=asset[2] if asset else None,
+        provider_symbols={
+            provider.name: stored.get(provider.name)
+            or provider.provider_symbol(symbol, asset_type)
+            for provider in registry.selected_providers()
+        },
+    )
+
+
+def _cached(key: Tuple[str, Optional[str]]) -> Optional[Instrument]:
+    entry = _resolved.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
+
+
+def resolve_many(
+    items: Iterable[Tuple[str, Optional[str]]],
+) -> Dict[Tuple[str, Optional[str]], Instrument]:
+    """
+    Resolves (symbol, optional asset type) pairs, reading any unknown bare
+    symbols from the assets table in one query. Keyed by the normalized pair.
+    """
+    _sync_provider_symbols()
+    keys = {_normalize(symbol, asset_type) for symbol, asset_type in items}
+    resolved = {key: _cached(key) for key in keys}
+    missing = [key for key, instrument in resolved.items() if instrument is None]
+    if not missing:
+        return resolved
+
+    # A type hint is enough to name the instrument; bare symbols need the DB.
+    unknown = sorted(
+        {
+            symbol
+            for symbol, hint in missing
+            if hint is None and not _known_asset(symbol)
+        }
+    )
+    if unknown:
+        _load_assets(unknown)
+    expires_at = time.monotonic() + INSTRUMENT_CACHE_SECONDS
+    for key in missing:
+        instrument = _build(*key)
+        with _lock:
+            _resolved[key] = (expires_at, instrument)
+        resolved[key] = instrument
+    return resolved
+
+
+def resolve(symbol: str, asset_type: Optional[str] = None) -> Instrument:
+    """The canonical instrument for `symbol`, typed from the assets table if known."""
+    _sync_provider_symbols()
+    key = _normalize(symbol, asset_type)
+    return _cached(key) or resolve_many([key])[key]
+
+
+def forget(symbol: Optional[str] = None) -> None:
+    """Drops resolutions of `symbol` (or all), e.g. after its asset row changes."""
+    with _lock:
+        if symbol is None:
+            _resolved.clear()
+            _assets.clear()
+            _provider_symbols.clear()
+            _provider_symbols_state.update(version=None, loaded_at=None, next_check=0.0)
+            return
+        symbol_upper = symbol.strip().upper()
+        _assets.pop(symbol_upper, None)
+        for key in [key for key in _resolved if key[0] == symbol_upper]:
+            del _resolved[key]
@@ -0,0 +1,205 @@
+# app/services/portfolio_import.py
+import csv
+import io
+import json
+import logging
+import time
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+
+logger = logging.getLogger(__name__)
+
+IMPORT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+IMPORT_FORMATS = ["csv", "jsonl"]
+
+# (row number, parsed record or None, parse error or None)
+ImportRecord = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str]) -> str:
+    """Guesses the upload format from its filename or content type, defaulting to CSV."""
+    name = (filename or "").lower()
+    ctype = (content_type or "").lower()
+    if name.endswith((".jsonl", ".ndjson")) or "ndjson" in ctype or "jsonl" in ctype:
+        return "jsonl"
+    return "csv"
+
+
+def _normalize_record(record: Dict[Any, Any]) -> Dict[str, Any]:
+    normalized = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip() or None
+        normalized[str(key).strip().lower()] = value
+    return normalized
+
+
+def iter_import_records(
+    stream: IO[bytes], import_format: str
+) -> Iterator[ImportRecord]:
+    """
+    Lazily yields records from a binary CSV or JSON-lines stream, one row at a
+    time, so large uploads are never held in memory as a whole.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        if import_format == "jsonl":
+            for line_number, line in enumerate(text_stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield line_number, None, f"Invalid JSON: {e}"
+                    continue
+                if not isinstance(record, dict):
+                    yield line_number, None, "Expected a JSON object per line."
+                    continue
+                yield line_number, _normalize_record(record), None
+        else:
+            reader = csv.DictReader(text_stream)
+            last_line = 1  # the header
+            try:
+                for record in reader:
+                    last_line = reader.line_num
+                    yield last_line, _normalize_record(record), None
+            except csv.Error as e:
+                # The reader cannot resync after e.g. an oversized field or
+                # unterminated quoting, so the rest of the upload is unread;
+                # the bad record starts on the line after the last good one.
+                yield last_line + 1, None, f"Invalid CSV, import stopped: {e}"
+    except UnicodeDecodeError as e:
+        yield 0, None, f"Could not decode upload as UTF-8: {e}"
+    finally:
+        text_stream.detach()
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+def _record_error(
+    result: schemas.PortfolioImportResult,
+    row: int,
+    error: str,
+    symbol: Optional[str] = None,
+) -> None:
+    result.failed_count += 1
+    if len(result.errors) < MAX_REPORTED_ERRORS:
+        result.errors.append(
+            schemas.PortfolioImportRowError(row=row, symbol=symbol, error=error)
+        )
+    else:
+        result.errors_truncated = True
+
+
+def _flush_chunk(
+    db: Session,
+    user_id: int,
+    chunk: List[Tuple[int, schemas.PortfolioHoldingImportRow]],
+    asset_ids: Dict[str, Optional[int]],
+    result: schemas.PortfolioImportResult,
+) -> None:
+    unresolved = {row.symbol.upper() for _, row in chunk} - asset_ids.keys()
+    if unresolved:
+        for asset in crud.get_assets_by_symbols(db, symbols=list(unresolved)):
+            asset_ids[asset.symbol] = asset.id
+        for symbol in unresolved:
+            asset_ids.setdefault(symbol, None)
+
+    holdings_in = []
+    for row_number, row in chunk:
+        asset_id = asset_ids[row.symbol.upper()]
+        if asset_id is None:
+            _record_error(
+                result, row_number, f"Unknown asset symbol '{row.symbol}'.", row.symbol
+            )
+            continue
+        holdings_in.append(
+            {
+                "asset_id": asset_id,
+                "quantity": row.quantity,
+                "purchase_price": row.purchase_price,
+                "purchase_date": row.purchase_date,
+            }
+        )
+
+    try:
+        result.imported_count += crud.bulk_create_portfolio_holdings(
+            db, holdings_in=holdings_in, user_id=user_id
+        )
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("Chunk insert failed for user %s: %s", user_id, e)
+        for row_number, row in chunk:
+            if asset_ids[row.symbol.upper()] is not None:
+                _record_error(
+                    result, row_number, "Database error while inserting.", row.symbol
+                )
+
+
+def import_holdings(
+    db: Session,
+    *,
+    user_id: int,
+    records: Iterable[ImportRecord],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> schemas.PortfolioImportResult:
+    """
+    Validates records as they stream in and inserts them in chunked transactions.
+    Symbols are resolved to assets once per chunk and memoised for the whole import.
+    """
+    started_at = time.perf_counter()
+    result = schemas.PortfolioImportResult()
+    asset_ids: Dict[str, Optional[int]] = {}
+    chunk: List[Tuple[int, schemas.PortfolioHoldingImportRow]] = []
+
+    for row_number, record, parse_error in records:
+        result.total_rows += 1
+        if parse_error is not None:
+            _record_error(result, row_number, parse_error)
+            continue
+        try:
+            row = schemas.PortfolioHoldingImportRow.model_validate(record)
+        except ValidationError as e:
+            # JSON rows may carry a non-string symbol (e.g. a number).
+            symbol = record.get("symbol")
+            _record_error(
+                result,
+                row_number,
+                _format_validation_error(e),
+                str(symbol) if symbol is not None else None,
+            )
+            continue
+
+        chunk.append((row_number, row))
+        if len(chunk) >= chunk_size:
+            _flush_chunk(db, user_id, chunk, asset_ids, result)
+            chunk = []
+
+    if chunk:
+        _flush_chunk(db, user_id, chunk, asset_ids, result)
+
+    result.elapsed_seconds = round(time.perf_counter() - started_at, 4)
+    if result.elapsed_seconds > 0:
+        result.rows_per_second = round(result.total_rows / result.elapsed_seconds, 2)
+    logger.info(
+        "User %s imported %s/%s rows (%s failed) in %ss.",
+        user_id,
+        result.imported_count,
+        result.total_rows,
+        result.failed_count,
+        result.elapsed_seconds,
+    )
+    return result
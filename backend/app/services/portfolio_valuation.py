@@ -0,0 +1,132 @@
+# app/services/portfolio_valuation.py
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from app import models, schemas
+from app.core.config import settings
+from app.models.asset import DEFAULT_CURRENCY
+from . import financial_data_orchestrator as orchestrator
+
+logger = logging.getLogger(__name__)
+
+# Holdings are valued in one pass: the FX inputs (current rate and rate on
+# the purchase date) are looked up once per distinct currency, lined up
+# with the holdings as columns, and every value is computed from them.
+# Current values convert at today's rate, purchase values at the rate on
+# the purchase date, so gain/loss includes the currency move.
+
+
+def _currency(db_holding: models.PortfolioHolding) -> str:
+    asset = db_holding.asset_info
+    return ((asset.currency if asset else None) or DEFAULT_CURRENCY).upper()
+
+
+def value_holdings(
+    db_holdings: Sequence[models.PortfolioHolding],
+    prices: Sequence[Optional[float]],
+    base_currency: Optional[str] = None,
+) -> schemas.PortfolioSummary:
+    """
+    Values holdings in `base_currency` (DEFAULT_BASE_CURRENCY if None), given
+    each holding's current price in its asset's currency (None if unknown).
+    Holdings whose price or FX rate is unknown are returned without values
+    and left out of the current total.
+    """
+    base = (base_currency or settings.DEFAULT_BASE_CURRENCY).upper()
+    currencies = [_currency(db_holding) for db_holding in db_holdings]
+    foreign = sorted(set(currencies) - {base})
+
+    quotes = orchestrator.get_fx_rates(foreign, base) if foreign else {}
+    # History (a full-series provider call on a miss) only for currencies
+    # with a holding bought before today; today's rate covers the rest.
+    today = datetime.now(timezone.utc).date()
+    bought_before_today = {
+        currency
+        for db_holding, currency in zip(db_holdings, currencies)
+        if currency != base and db_holding.purchase_date.date() < today
+    }
+    histories = {
+        currency: orchestrator.get_fx_history(currency, base)
+        for currency in sorted(bought_before_today)
+    }
+    rates_now: Dict[str, Optional[float]] = {base: 1.0}
+    for currency in foreign:
+        quote = quotes.get(currency)
+        rates_now[currency] = quote["rate"] if quote else None
+        if quote is None:
+            logger.warning(
+                "No %s/%s rate; holdings in %s unvalued.", currency, base, currency
+            )
+
+    now_column = [rates_now[currency] for currency in currencies]
+    paid_column = []
+    for db_holding, currency, rate_now in zip(db_holdings, currencies, now_column):
+        rate_paid = None
+        if currency in histories:
+            rate_paid = orchestrator.fx_rate_on(
+                histories[currency], db_holding.purchase_date.date()
+            )
+        if rate_paid is None:
+            # Without history back to the purchase date, today's rate stands in.
+            rate_paid = rate_now
+        paid_column.append(rate_paid)
+
+    holdings: List[schemas.PortfolioHolding] = []
+    total_purchase_value = 0.0
+    total_current_value = 0.0
+    for db_holding, price, rate_now, rate_paid in zip(
+        db_holdings, prices, now_column, paid_column
+    ):
+        holding = schemas.PortfolioHolding.model_validate(db_holding)
+        holdings.append(holding)
+        if db_holding.asset_info is None:
+            continue
+        holding.asset_info = schemas.Asset.model_validate(db_holding.asset_info)
+        if rate_paid is None:
+            continue
+
+        purchase_value = db_holding.quantity * db_holding.purchase_price * rate_paid
+        holding.currency = base
+        holding.purchase_value = purchase_value
+        total_purchase_value += purchase_value
+        if price is None or rate_now is None:
+            continue
+
+        holding.fx_rate = rate_now
+        holding.current_price = price * rate_now
+        holding.current_value = db_holding.quantity * holding.current_price
+        holding.gain_loss = holding.current_value - purchase_value
+        if purchase_value > 0:
+            holding.gain_loss_percent = (holding.gain_loss / purchase_value) * 100
+        else:
+            holding.gain_loss_percent = 0.0 if holding.current_value == 0 else None
+        total_current_value += holding.current_value
+
+    total_gain_loss = total_current_value - total_purchase_value
+    total_gain_loss_percent: Optional[float] = 0.0
+    if total_purchase_value > 0:
+        total_gain_loss_percent = round(
+            (total_gain_loss / total_purchase_value) * 100, 2
+        )
+    elif total_current_value > 0:
+        total_gain_loss_percent = None
+
+    return schemas.PortfolioSummary(
+        base_currency=base,
+        fx_is_stale=any(quote and quote["is_stale"] for quote in quotes.values()),
+        total_purchase_value=round(total_purchase_value, 2),
+        total_current_value=round(total_current_value, 2),
+        total_gain_loss=round(total_gain_loss, 2),
+        total_gain_loss_percent=total_gain_loss_percent,
+        holdings=holdings,
+    )
+
+
+def value_holding(
+    db_holding: models.PortfolioHolding,
+    price: Optional[float],
+    base_currency: Optional[str] = None,
+) -> schemas.PortfolioHolding:
+    """value_holdings for a single holding."""
+    return value_holdings([db_holding], [price], base_currency).holdings[0]
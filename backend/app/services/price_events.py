@@ -0,0 +1,156 @@
+# app/services/price_events.py
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Iterator, List, Optional
+
+import redis
+import redis.asyncio as aioredis
+
+from app import schemas
+from app.cache import shared_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PRICE_EVENTS_CHANNEL = "price_events"
+PRICE_EVENTS_SYMBOL_CHANNEL_PREFIX = "price_events:"
+LAST_PRICE_KEY_PREFIX = "last_price:"
+LAST_PRICE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+PriceChangeHandler = Callable[[schemas.PriceChangeEvent], None]
+
+_handlers: List[PriceChangeHandler] = []
+
+
+def register_price_change_handler(handler: PriceChangeHandler) -> None:
+    """Registers an in-process consumer called synchronously for every published change."""
+    if handler not in _handlers:
+        _handlers.append(handler)
+
+
+def unregister_price_change_handler(handler: PriceChangeHandler) -> None:
+    if handler in _handlers:
+        _handlers.remove(handler)
+
+
+def symbol_channel(symbol: str) -> str:
+    return f"{PRICE_EVENTS_SYMBOL_CHANNEL_PREFIX}{symbol.upper()}"
+
+
+def get_last_price_events(symbols: List[str]) -> List[schemas.PriceChangeEvent]:
+    """Returns the most recent event recorded for each symbol that has one."""
+    keys = [f"{LAST_PRICE_KEY_PREFIX}{symbol.upper()}" for symbol in symbols]
+    return [
+        schemas.PriceChangeEvent.model_validate(payload)
+        for payload in shared_cache.get_many_shared_cache(keys)
+        if isinstance(payload, dict)
+    ]
+
+
+def publish_price_change(
+    symbol: str, asset_type: Optional[str], price: float, source: str
+) -> Optional[schemas.PriceChangeEvent]:
+    """
+    Records a freshly fetched price and, if it differs from the last one seen
+    for the symbol, publishes a compact change event on the global and
+    per-symbol channels and hands it to in-process handlers.
+    Returns the event, or None when the price did not change.
+    """
+    symbol_upper = symbol.upper()
+    event = schemas.PriceChangeEvent(
+        symbol=symbol_upper,
+        asset_type=asset_type,
+        price=price,
+        timestamp=datetime.now(timezone.utc),
+        source=source,
+    )
+    payload = event.model_dump(mode="json")
+    previous = shared_cache.swap_shared_cache(
+        f"{LAST_PRICE_KEY_PREFIX}{symbol_upper}", payload, ex=LAST_PRICE_TTL_SECONDS
+    )
+    if isinstance(previous, dict) and previous.get("price") is not None:
+        if float(previous["price"]) == price:
+            return None
+        event.previous_price = float(previous["price"])
+        payload["previous_price"] = event.previous_price
+
+    shared_cache.publish_shared_event(
+        [PRICE_EVENTS_CHANNEL, symbol_channel(symbol_upper)], payload
+    )
+    for handler in list(_handlers):
+        try:
+            handler(event)
+        except Exception as e:
+            logger.error(
+                "Handler %s failed for %s: %s",
+                getattr(handler, "__name__", handler),
+                symbol_upper,
+                e,
+            )
+    return event
+
+
+def _channels_for(symbols: Optional[List[str]]) -> List[str]:
+    if symbols is None:
+        return [PRICE_EVENTS_CHANNEL]
+    return [symbol_channel(symbol) for symbol in symbols]
+
+
+def iter_price_changes(
+    symbols: Optional[List[str]] = None, poll_timeout: float = 1.0
+) -> Iterator[Optional[schemas.PriceChangeEvent]]:
+    """
+    Blocking subscriber for worker processes. Yields change events for the
+    given symbols (or for every symbol when None), and None after each idle
+    `poll_timeout` so the consumer can do housekeeping or stop.
+    """
+    client = redis.Redis.from_url(
+        settings.SHARED_CACHE_REDIS_URL, decode_responses=True
+    )
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    try:
+        channels = _channels_for(symbols)
+        if channels:
+            pubsub.subscribe(*channels)
+        while True:
+            message = None
+            if channels:
+                message = pubsub.get_message(timeout=poll_timeout)
+            if message and message.get("type") == "message":
+                yield schemas.PriceChangeEvent.model_validate_json(message["data"])
+            else:
+                if not channels:
+                    time.sleep(poll_timeout)
+                yield None
+    finally:
+        pubsub.close()
+        client.close()
+
+
+async def aiter_price_changes(
+    symbols: Optional[List[str]] = None, poll_timeout: float = 1.0
+) -> AsyncIterator[Optional[schemas.PriceChangeEvent]]:
+    """Async counterpart of iter_price_changes for consumers on the event loop."""
+    client = aioredis.Redis.from_url(
+        settings.SHARED_CACHE_REDIS_URL, decode_responses=True
+    )
+    pubsub = client.pubsub(ignore_subscribe_messages=True)
+    try:
+        channels = _channels_for(symbols)
+        if channels:
+            await pubsub.subscribe(*channels)
+        while True:
+            message = None
+            if channels:
+                message = await pubsub.get_message(timeout=poll_timeout)
+            if message and message.get("type") == "message":
+                yield schemas.PriceChangeEvent.model_validate_json(message["data"])
+            else:
+                if not channels:
+                    await asyncio.sleep(poll_timeout)
+                yield None
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
@@ -0,0 +1,62 @@
+# app/services/price_stream.py
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+import redis
+
+from . import price_events
+
+logger = logging.getLogger(__name__)
+
+SSE_HEARTBEAT_SECONDS = 15.0
+SSE_POLL_TIMEOUT_SECONDS = 1.0
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """Formats a payload as a single server-sent event frame."""
+    frame = f"event: {event}\n" if event else ""
+    return f"{frame}data: {json.dumps(data, default=str)}\n\n"
+
+
+def get_cached_price_snapshot(symbols: List[str]) -> List[Dict[str, Any]]:
+    """Reads the last recorded price event of every symbol in one round trip."""
+    return [
+        event.model_dump(mode="json")
+        for event in price_events.get_last_price_events(symbols)
+    ]
+
+
+async def stream_price_updates(
+    symbols: List[str],
+    snapshot: List[Dict[str, Any]],
+    is_disconnected: Callable[[], Awaitable[bool]],
+) -> AsyncIterator[str]:
+    """
+    Yields SSE frames: first the cached snapshot, then every price change
+    published for the given symbols, with periodic heartbeats so proxies keep
+    the connection open. A single Redis subscription serves the whole stream.
+    """
+    for price_update in snapshot:
+        yield format_sse(price_update, event="price")
+
+    changes = price_events.aiter_price_changes(
+        [symbol.upper() for symbol in symbols], poll_timeout=SSE_POLL_TIMEOUT_SECONDS
+    )
+    try:
+        last_frame_at = time.monotonic()
+        async for event in changes:
+            if await is_disconnected():
+                break
+            if event is not None:
+                yield format_sse(event.model_dump(mode="json"), event="price")
+                last_frame_at = time.monotonic()
+            elif time.monotonic() - last_frame_at >= SSE_HEARTBEAT_SECONDS:
+                yield ": keep-alive\n\n"
+                last_frame_at = time.monotonic()
+    except redis.exceptions.RedisError as e:
+        logger.error("Redis subscription failed: %s", e)
+        yield format_sse({"detail": "Price stream unavailable."}, event="error")
+    finally:
+        await changes.aclose()
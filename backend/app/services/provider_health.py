@@ -0,0 +1,295 @@
+# app/services/provider_health.py
+import logging
+import threading
+import time
+from typing import Any, Collection, Dict, List, Optional, Tuple
+
+from app.cache import shared_cache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_OUTCOMES_KEY_PREFIX = "provider_outcomes:"
+PROVIDER_CIRCUIT_OPEN_KEY_PREFIX = "provider_circuit_open:"
+PROVIDER_CIRCUIT_TRIPPED_KEY_PREFIX = "provider_circuit_tripped:"
+PROVIDER_PROBE_KEY_PREFIX = "provider_probe:"
+HEDGE_BUDGET_KEY_PREFIX = "hedge_budget:"
+
+HEALTH_WINDOW_SIZE = 100
+HEALTH_WINDOW_TTL_SECONDS = 60 * 60
+HEALTH_STATS_LOCAL_TTL_SECONDS = 5.0
+MIN_SAMPLES = 10
+ERROR_RATE_THRESHOLD = 0.5
+CIRCUIT_OPEN_SECONDS = 30
+CIRCUIT_TRIPPED_TTL_SECONDS = 24 * 60 * 60
+PROBE_LOCK_SECONDS = 30
+# A provider that returns nothing after this long is treated as failing even
+# when no other provider answered (it timed out rather than saying "no data").
+SLOW_FAILURE_SECONDS = 5.0
+
+# Per-process copy of recent stats so routing decisions do not cost a Redis
+# round trip on every lookup.
+_local_stats: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+# Fallback hedge budget when Redis is unavailable: {minute: hedges issued}.
+_local_hedge_budget: Dict[int, int] = {}
+_local_hedge_budget_lock = threading.Lock()
+
+# Attempt tuple recorded by the orchestrator: (provider, latency_seconds, success).
+ProviderAttempt = Tuple[str, float, bool]
+
+
+def _scope(provider: str, asset_type: Optional[str]) -> str:
+    return f"{provider}:{(asset_type or 'unknown').lower()}"
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    rank = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+def _summarize(raw_outcomes: List[str]) -> Dict[str, Any]:
+    successes: List[float] = []
+    failures = 0
+    for entry in raw_outcomes:
+        status, _, latency = entry.partition(":")
+        if status == "1":
+            try:
+                successes.append(float(latency))
+            except ValueError:
+                continue
+        else:
+            failures += 1
+    samples = len(successes) + failures
+    successes.sort()
+    return {
+        "samples": samples,
+        "error_rate": failures / samples if samples else 0.0,
+        "p50": _percentile(successes, 50),
+        "p95": _percentile(successes, 95),
+        "latencies": successes,
+    }
+
+
+def get_provider_stats(
+    provider: str, asset_type: Optional[str], refresh: bool = False
+) -> Dict[str, Any]:
+    """
+    Rolling health of one provider for one asset type over its last
+    HEALTH_WINDOW_SIZE calls: sample count, error rate, and p50/p95 latency
+    (seconds) of successful calls, plus the sorted successful latencies.
+    """
+    cache_key = (provider, (asset_type or "unknown").lower())
+    now = time.monotonic()
+    cached = _local_stats.get(cache_key)
+    if cached and not refresh and now - cached[0] < HEALTH_STATS_LOCAL_TTL_SECONDS:
+        return cached[1]
+
+    client = shared_cache.get_redis_client()
+    raw_outcomes: List[str] = []
+    if client:
+        try:
+            raw_outcomes = client.lrange(
+                f"{PROVIDER_OUTCOMES_KEY_PREFIX}{_scope(provider, asset_type)}", 0, -1
+            )
+        except Exception as e:
+            logger.error("Error reading stats for %s: %s", provider, e)
+    stats = _summarize(raw_outcomes)
+    _local_stats[cache_key] = (now, stats)
+    return stats
+
+
+def _push_outcome(pipe, scope: str, success: bool, latency: float) -> None:
+    key = f"{PROVIDER_OUTCOMES_KEY_PREFIX}{scope}"
+    pipe.lpush(key, f"{1 if success else 0}:{latency:.4f}")
+    pipe.ltrim(key, 0, HEALTH_WINDOW_SIZE - 1)
+    pipe.expire(key, HEALTH_WINDOW_TTL_SECONDS)
+
+
+def _open_circuit(provider: str, asset_type: Optional[str]) -> None:
+    client = shared_cache.get_redis_client()
+    if not client:
+        return
+    scope = _scope(provider, asset_type)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.set(
+            f"{PROVIDER_CIRCUIT_OPEN_KEY_PREFIX}{scope}", 1, ex=CIRCUIT_OPEN_SECONDS
+        )
+        pipe.set(
+            f"{PROVIDER_CIRCUIT_TRIPPED_KEY_PREFIX}{scope}",
+            1,
+            ex=CIRCUIT_TRIPPED_TTL_SECONDS,
+        )
+        pipe.delete(f"{PROVIDER_PROBE_KEY_PREFIX}{scope}")
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error opening circuit for %s: %s", scope, e)
+        return
+    logger.info("Circuit opened for %s for %ss.", scope, CIRCUIT_OPEN_SECONDS)
+
+
+def _close_circuit(provider: str, asset_type: Optional[str]) -> None:
+    client = shared_cache.get_redis_client()
+    if not client:
+        return
+    scope = _scope(provider, asset_type)
+    try:
+        client.delete(
+            f"{PROVIDER_CIRCUIT_OPEN_KEY_PREFIX}{scope}",
+            f"{PROVIDER_CIRCUIT_TRIPPED_KEY_PREFIX}{scope}",
+            f"{PROVIDER_PROBE_KEY_PREFIX}{scope}",
+            # Start the window afresh so pre-outage failures cannot re-trip it.
+            f"{PROVIDER_OUTCOMES_KEY_PREFIX}{scope}",
+        )
+    except Exception as e:
+        logger.error("Error closing circuit for %s: %s", scope, e)
+        return
+    _local_stats.pop((provider, (asset_type or "unknown").lower()), None)
+    logger.info("Circuit closed for %s; probe succeeded.", scope)
+
+
+def allow_request(provider: str, asset_type: Optional[str]) -> bool:
+    """
+    Circuit breaker check. Closed: allowed. Open: skipped until the open
+    period expires. Half-open (tripped but no longer open): exactly one caller
+    across all processes wins the probe lock and is allowed through.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return True
+    scope = _scope(provider, asset_type)
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.exists(f"{PROVIDER_CIRCUIT_OPEN_KEY_PREFIX}{scope}")
+        pipe.exists(f"{PROVIDER_CIRCUIT_TRIPPED_KEY_PREFIX}{scope}")
+        is_open, is_tripped = pipe.execute()
+        if is_open:
+            return False
+        if not is_tripped:
+            return True
+        return bool(
+            client.set(
+                f"{PROVIDER_PROBE_KEY_PREFIX}{scope}", 1, nx=True, ex=PROBE_LOCK_SECONDS
+            )
+        )
+    except Exception as e:
+        logger.error("Error checking circuit for %s: %s", scope, e)
+        return True
+
+
+def record_attempts(
+    attempts: List[ProviderAttempt],
+    asset_type: Optional[str],
+    errors: Collection[str] = (),
+) -> None:
+    """
+    Records the providers tried for one lookup. A provider that raised (named
+    in `errors`) always counts as a failure. One that returned nothing counts
+    as a failure only if another provider did answer or the call was slow;
+    otherwise the symbol itself is the likely problem, and bad symbols must
+    not trip the breaker.
+    """
+    client = shared_cache.get_redis_client()
+    if not client or not attempts:
+        return
+    answered = any(success for _, _, success in attempts)
+    try:
+        pipe = client.pipeline(transaction=False)
+        verdicts = []
+        queued = 0
+        for provider, latency, success in attempts:
+            scope = _scope(provider, asset_type)
+            if (
+                success
+                or answered
+                or provider in errors
+                or latency >= SLOW_FAILURE_SECONDS
+            ):
+                _push_outcome(pipe, scope, success, latency)
+                pipe.exists(f"{PROVIDER_CIRCUIT_TRIPPED_KEY_PREFIX}{scope}")
+                queued += 4
+                verdicts.append((provider, success, queued - 1))
+            else:
+                # Inconclusive: let the next caller probe instead.
+                pipe.delete(f"{PROVIDER_PROBE_KEY_PREFIX}{scope}")
+                queued += 1
+        results = pipe.execute()
+    except Exception as e:
+        logger.error("Error recording provider outcomes: %s", e)
+        return
+
+    for provider, success, tripped_index in verdicts:
+        if results[tripped_index]:
+            if success:
+                _close_circuit(provider, asset_type)
+            else:
+                _open_circuit(provider, asset_type)
+            continue
+        if not success:
+            stats = get_provider_stats(provider, asset_type, refresh=True)
+            if (
+                stats["samples"] >= MIN_SAMPLES
+                and stats["error_rate"] >= ERROR_RATE_THRESHOLD
+            ):
+                _open_circuit(provider, asset_type)
+
+
+def order_providers(providers: List[str], asset_type: Optional[str]) -> List[str]:
+    """
+    Orders providers by expected time to a usable answer for this asset type:
+    median successful latency divided by success rate. The configured order
+    is kept until every provider has enough samples to compare.
+    """
+    if len(providers) < 2 or not shared_cache.get_redis_client():
+        return list(providers)
+    scores = {}
+    for provider in providers:
+        stats = get_provider_stats(provider, asset_type)
+        if stats["samples"] < MIN_SAMPLES or stats["p50"] is None:
+            return list(providers)
+        scores[provider] = stats["p50"] / max(1.0 - stats["error_rate"], 0.1)
+    return sorted(providers, key=lambda provider: scores[provider])
+
+
+def hedge_delay(provider: str, asset_type: Optional[str]) -> float:
+    """
+    How long to wait on `provider` before hedging: its configured latency
+    percentile for this asset type, or a fixed default until it has samples.
+    """
+    stats = get_provider_stats(provider, asset_type)
+    if stats["samples"] < MIN_SAMPLES or not stats["latencies"]:
+        return settings.MARKET_DATA_HEDGE_DEFAULT_DELAY_SECONDS
+    return _percentile(stats["latencies"], settings.MARKET_DATA_HEDGE_PERCENTILE)
+
+
+def try_acquire_hedge_slot() -> bool:
+    """
+    Takes one slot from the global per-minute hedge budget, so hedging cannot
+    multiply provider quota use by more than MARKET_DATA_HEDGE_MAX_PER_MINUTE.
+    """
+    limit = settings.MARKET_DATA_HEDGE_MAX_PER_MINUTE
+    if limit <= 0:
+        return False
+    minute = int(time.time() // 60)
+    client = shared_cache.get_redis_client()
+    if client:
+        key = f"{HEDGE_BUDGET_KEY_PREFIX}{minute}"
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.incr(key)
+            pipe.expire(key, 120)
+            return int(pipe.execute()[0]) <= limit
+        except Exception as e:
+            logger.error("Error reading hedge budget: %s", e)
+    with _local_hedge_budget_lock:
+        for stale_minute in [m for m in _local_hedge_budget if m != minute]:
+            del _local_hedge_budget[stale_minute]
+        used = _local_hedge_budget.get(minute, 0)
+        if used >= limit:
+            return False
+        _local_hedge_budget[minute] = used + 1
+        return True
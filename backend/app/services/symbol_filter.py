@@ -0,0 +1,194 @@
+# app/services/symbol_filter.py
+import logging
+import re
+import threading
+import time
+from typing import Optional
+
+from app.cache import shared_cache
+from app.cache.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_CACHE_KEY_PREFIX = "negative:"
+NEGATIVE_FAILURES_KEY_PREFIX = "negative_failures:"
+INVALID_SYMBOLS_KEY = "invalid_symbols"
+INVALID_PROBE_KEY_PREFIX = "invalid_probe:"
+
+NEGATIVE_CACHE_BASE_SECONDS = 60
+NEGATIVE_CACHE_MAX_SECONDS = 24 * 60 * 60
+NEGATIVE_FAILURES_TTL_SECONDS = 7 * 24 * 60 * 60
+INVALID_AFTER_FAILURES = 3
+INVALID_SYMBOL_TTL_SECONDS = 30 * 24 * 60 * 60
+INVALID_SYMBOLS_MAX = 100_000
+# Failures that put a symbol in the invalid set may have been an outage or an
+# exhausted quota rather than an unknown ticker, so one lookup per window is
+# let through; its success clears the entry (record_lookup_success).
+INVALID_SYMBOL_PROBE_SECONDS = 15 * 60
+BLOOM_REFRESH_SECONDS = 5 * 60
+BLOOM_ERROR_RATE = 0.01
+
+# Tickers as the providers spell them: BRK.B, BTC-USD, EURUSD=X, ^GSPC.
+SYMBOL_PATTERN = re.compile(r"^\^?[A-Z0-9][A-Z0-9.\-=]{0,19}$")
+
+_bloom: Optional[BloomFilter] = None
+_bloom_built_at = 0.0
+_bloom_lock = threading.Lock()
+
+
+def is_plausible_symbol(symbol: str) -> bool:
+    return bool(SYMBOL_PATTERN.match(symbol.upper()))
+
+
+def negative_cache_ttl(failures: int) -> int:
+    """Backoff for the n-th consecutive failure: base, 2x base, 4x base ... capped."""
+    exponent = min(max(failures, 1) - 1, 20)
+    return min(NEGATIVE_CACHE_BASE_SECONDS * 2**exponent, NEGATIVE_CACHE_MAX_SECONDS)
+
+
+def is_negatively_cached(cache_key: str) -> bool:
+    """True while a recent failed lookup for `cache_key` is still backing off."""
+    client = shared_cache.get_redis_client()
+    if not client:
+        return False
+    try:
+        return bool(client.exists(f"{NEGATIVE_CACHE_KEY_PREFIX}{cache_key}"))
+    except Exception as e:
+        logger.error("Error reading negative cache for %s: %s", cache_key, e)
+        return False
+
+
+def record_lookup_failure(cache_key: str, symbol: Optional[str] = None) -> None:
+    """
+    Negatively caches `cache_key` for a TTL that doubles with each consecutive
+    failure; failures are counted per cache key, so per operation. Pass
+    `symbol` only for current-price lookups: a symbol whose price keeps
+    failing is added to the known-invalid set. History, intraday and FX
+    failures only back off their own key.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return
+    failures_key = f"{NEGATIVE_FAILURES_KEY_PREFIX}{cache_key}"
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(failures_key)
+        pipe.expire(failures_key, NEGATIVE_FAILURES_TTL_SECONDS)
+        failures = int(pipe.execute()[0])
+
+        ttl = negative_cache_ttl(failures)
+        invalid = symbol is not None and failures >= INVALID_AFTER_FAILURES
+        pipe = client.pipeline(transaction=False)
+        pipe.set(f"{NEGATIVE_CACHE_KEY_PREFIX}{cache_key}", failures, ex=ttl)
+        if invalid:
+            pipe.zadd(INVALID_SYMBOLS_KEY, {symbol.upper(): time.time()})
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error recording failure for %s: %s", cache_key, e)
+        return
+
+    logger.warning(
+        "Lookup for %s failed %s time(s); backing off %ss.", cache_key, failures, ttl
+    )
+    if invalid:
+        with _bloom_lock:
+            if _bloom is not None:
+                _bloom.add(symbol.upper())
+
+
+def record_lookup_success(cache_key: str, symbol: Optional[str] = None) -> None:
+    """
+    Clears backoff state once a lookup succeeds again, and takes `symbol`
+    (if given) out of the known-invalid set.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(
+            f"{NEGATIVE_CACHE_KEY_PREFIX}{cache_key}",
+            f"{NEGATIVE_FAILURES_KEY_PREFIX}{cache_key}",
+        )
+        if symbol is not None:
+            pipe.zrem(INVALID_SYMBOLS_KEY, symbol.upper())
+        pipe.execute()
+    except Exception as e:
+        logger.error("Error clearing failures for %s: %s", cache_key, e)
+
+
+def refresh_invalid_symbol_filter() -> Optional[BloomFilter]:
+    """
+    Trims expired entries from the known-invalid set and rebuilds the
+    in-process Bloom filter from what remains.
+    """
+    global _bloom, _bloom_built_at
+    client = shared_cache.get_redis_client()
+    if not client:
+        return None
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.zremrangebyscore(
+            INVALID_SYMBOLS_KEY, "-inf", time.time() - INVALID_SYMBOL_TTL_SECONDS
+        )
+        pipe.zremrangebyrank(INVALID_SYMBOLS_KEY, 0, -INVALID_SYMBOLS_MAX - 1)
+        pipe.zrange(INVALID_SYMBOLS_KEY, 0, -1)
+        symbols = pipe.execute()[-1]
+    except Exception as e:
+        logger.error("Error loading invalid symbols: %s", e)
+        # Keep serving the previous filter rather than retrying on every lookup.
+        _bloom_built_at = time.monotonic()
+        return _bloom
+
+    bloom = BloomFilter(
+        capacity=max(len(symbols) * 2, 1000), error_rate=BLOOM_ERROR_RATE
+    )
+    bloom.update(symbols)
+    with _bloom_lock:
+        _bloom = bloom
+        _bloom_built_at = time.monotonic()
+    return bloom
+
+
+def is_known_invalid(symbol: str) -> bool:
+    """
+    True if the symbol is in the known-invalid set. The local Bloom filter
+    answers most lookups without a network call; only its (rare) positives
+    are confirmed against Redis.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return False
+    bloom = _bloom
+    if bloom is None or time.monotonic() - _bloom_built_at > BLOOM_REFRESH_SECONDS:
+        bloom = refresh_invalid_symbol_filter()
+    symbol_upper = symbol.upper()
+    if bloom is None or not bloom.might_contain(symbol_upper):
+        return False
+    try:
+        return client.zscore(INVALID_SYMBOLS_KEY, symbol_upper) is not None
+    except Exception as e:
+        logger.error("Error confirming %s: %s", symbol_upper, e)
+        return False
+
+
+def claim_invalid_symbol_probe(symbol: str) -> bool:
+    """
+    True for one caller per INVALID_SYMBOL_PROBE_SECONDS: that lookup of a
+    known-invalid symbol goes ahead instead of being rejected.
+    """
+    client = shared_cache.get_redis_client()
+    if not client:
+        return False
+    try:
+        return bool(
+            client.set(
+                f"{INVALID_PROBE_KEY_PREFIX}{symbol.upper()}",
+                "1",
+                nx=True,
+                ex=INVALID_SYMBOL_PROBE_SECONDS,
+            )
+        )
+    except Exception as e:
+        logger.error("Error claiming probe of %s: %s", symbol.upper(), e)
+        return False
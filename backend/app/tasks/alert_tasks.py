@@ -0,0 +1,26 @@
+# app/tasks/alert_tasks.py
+import logging
+
+from celery import shared_task
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.services import alert_engine
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="app.tasks.alert_tasks.rebuild_alert_index_task")
+def rebuild_alert_index_task():
+    logger.info("Starting rebuild_alert_index_task.")
+    db: Session = SessionLocal()
+    try:
+        indexed = alert_engine.rebuild_alert_index(db)
+        result_message = f"CELERY_TASK: Alert index rebuilt. Indexed: {indexed}."
+        logger.info(result_message)
+        return result_message
+    except Exception as e:
+        logger.exception("Critical error in rebuild_alert_index_task: %s", e)
+        return f"Task failed with critical error: {e}"
+    finally:
+        db.close()
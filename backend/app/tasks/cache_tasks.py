@@ -0,0 +1,45 @@
+# app/tasks/cache_tasks.py
+import logging
+
+from celery import shared_task
+
+from app.cache import shared_cache
+from app.services import cache_warmup
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="app.tasks.cache_tasks.warm_cache_task")
+def warm_cache_task(self, force: bool = False):
+    """
+    Warms the shared cache for the most-tracked symbols, unless a previous
+    warm-up already did (pass force=True to warm anyway). Progress is
+    reported as the task's PROGRESS state. Skipped without Redis: nothing
+    fetched could be cached, and provider rate limits are not enforced.
+    """
+    if shared_cache.get_redis_client() is None:
+        logger.warning("Redis unavailable; skipping warm_cache_task.")
+        return "Cache unavailable; warm-up skipped."
+    if not force and cache_warmup.is_cache_warm():
+        logger.debug("Cache already warm; skipping warm_cache_task.")
+        return "Cache already warm."
+    logger.info("Starting warm_cache_task.")
+    try:
+        progress = cache_warmup.warm_tracked_assets(
+            on_progress=lambda p: self.update_state(
+                state="PROGRESS", meta=p.model_dump()
+            )
+        )
+        result_message = (
+            f"Cache warm-up complete. "
+            f"Symbols: {progress.processed}/{progress.total}, "
+            f"Prices fetched: {progress.prices_warmed} "
+            f"(already cached: {progress.prices_cached}, failed: {progress.prices_failed}), "
+            f"Histories fetched: {progress.histories_warmed} "
+            f"(already cached: {progress.histories_cached}, failed: {progress.histories_failed})."
+        )
+        logger.info(result_message)
+        return result_message
+    except Exception as e:
+        logger.exception("Critical error in warm_cache_task: %s", e)
+        return f"Task failed with critical error: {e}"
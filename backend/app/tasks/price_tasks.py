@@ -1,25 +1,36 @@
 # app/tasks/price_tasks.py
+import logging
+
 from celery import shared_task
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
 
+from app.core import logs, metrics
 from app.db.session import SessionLocal
 from app import crud
 from app.services import financial_data_orchestrator as fds_orchestrator
 from app.models import Asset as AssetModel
 
+logger = logging.getLogger(__name__)
+
 PRICE_STALENESS_THRESHOLD_MINUTES = 30
 
 
+def _log_refresh(msg: str, *args) -> None:
+    """A per-asset INFO line, sampled as the "price_refresh" family."""
+    if logger.isEnabledFor(logging.INFO) and logs.sampled("price_refresh"):
+        logger.info(msg, *args, extra={"family": "price_refresh"})
+
+
 @shared_task(name="app.tasks.price_tasks.refresh_all_asset_prices_task")
 def refresh_all_asset_prices_task():
-    print("CELERY_TASK: Starting refresh_all_asset_prices_task (enhanced)...")
+    logger.info("Starting refresh_all_asset_prices_task.")
     db: Session = SessionLocal()
     try:
         assets_to_check: list[AssetModel] = crud.get_assets(db, limit=10000)
 
         if not assets_to_check:
-            print("CELERY_TASK: No assets found in DB to refresh.")
+            logger.info("No assets found in DB to refresh.")
             return "No assets to refresh."
 
         refreshed_count = 0
@@ -28,33 +39,39 @@ def refresh_all_asset_prices_task():
         now_utc = datetime.now(timezone.utc)
         staleness_delta = timedelta(minutes=PRICE_STALENESS_THRESHOLD_MINUTES)
 
-        print(
-            f"CELERY_TASK: Checking {len(assets_to_check)} assets for price refresh..."
-        )
+        logger.info("Checking %d assets for price refresh.", len(assets_to_check))
 
         for asset_model in assets_to_check:
             should_refresh = False
             if asset_model.last_price_updated_at is None:
                 should_refresh = True
-                print(
-                    f"CELERY_TASK: Asset {asset_model.symbol} - Refreshing (never updated)."
+                _log_refresh(
+                    "Asset %s - Refreshing (never updated).",
+                    asset_model.symbol,
                 )
             else:
                 if now_utc - asset_model.last_price_updated_at > staleness_delta:
                     should_refresh = True
-                    print(
-                        f"CELERY_TASK: Asset {asset_model.symbol} - Refreshing (stale: last updated {asset_model.last_price_updated_at})."
+                    _log_refresh(
+                        "Asset %s - Refreshing (stale: last updated %s).",
+                        asset_model.symbol,
+                        asset_model.last_price_updated_at,
                     )
                 else:
-                    print(
-                        f"CELERY_TASK: Asset {asset_model.symbol} - Skipping (fresh: last updated {asset_model.last_price_updated_at})."
+                    _log_refresh(
+                        "Asset %s - Skipping (fresh: last updated %s).",
+                        asset_model.symbol,
+                        asset_model.last_price_updated_at,
                     )
                     skipped_count += 1
+                    metrics.PRICE_REFRESH_ASSETS.labels("skipped").inc()
 
             if should_refresh:
                 try:
-                    print(
-                        f"CELERY_TASK: Fetching price for {asset_model.symbol} (Type: {asset_model.asset_type.value})"
+                    logger.debug(
+                        "Fetching price for %s (Type: %s).",
+                        asset_model.symbol,
+                        asset_model.asset_type.value,
                     )
                     price = fds_orchestrator.get_current_price(
                         symbol=asset_model.symbol,
@@ -64,29 +81,33 @@ def refresh_all_asset_prices_task():
                         crud.update_asset_last_price_timestamp(
                             db=db, asset_model=asset_model, timestamp=now_utc
                         )
-                        print(
-                            f"CELERY_TASK: Price for {asset_model.symbol} updated/cached: {price}. DB timestamp updated."
+                        _log_refresh(
+                            "Price for %s updated/cached: %s. DB timestamp updated.",
+                            asset_model.symbol,
+                            price,
                         )
                         refreshed_count += 1
+                        metrics.PRICE_REFRESH_ASSETS.labels("refreshed").inc()
                     else:
-                        print(
-                            f"CELERY_TASK: Failed to get price for {asset_model.symbol} (orchestrator returned None)."
+                        logger.warning(
+                            "Failed to get price for %s (orchestrator returned None).",
+                            asset_model.symbol,
                         )
                         failed_count += 1
+                        metrics.PRICE_REFRESH_ASSETS.labels("failed").inc()
                 except Exception as e:
-                    print(
-                        f"CELERY_TASK: ERROR processing asset {asset_model.symbol}: {e}"
-                    )
+                    logger.error("Error processing asset %s: %s", asset_model.symbol, e)
                     failed_count += 1
+                    metrics.PRICE_REFRESH_ASSETS.labels("failed").inc()
 
         result_message = (
             f"CELERY_TASK: Price refresh complete. "
             f"Refreshed: {refreshed_count}, Skipped (fresh): {skipped_count}, Failed: {failed_count}."
         )
-        print(result_message)
+        logger.info(result_message)
         return result_message
     except Exception as e:
-        print(f"CELERY_TASK: CRITICAL ERROR in refresh_all_asset_prices_task: {e}")
+        logger.exception("Critical error in refresh_all_asset_prices_task: %s", e)
         return f"Task failed with critical error: {e}"
     finally:
         db.close()
@@ -0,0 +1,66 @@
+# backend/benchmarks/bench_api.py
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from app import models
+from app.api.endpoints import portfolio
+from app.auth import security
+from app.models.asset import AssetType
+from .harness import benchmark
+
+
+def _holdings(size: int):
+    rng = random.Random(size)
+    created = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    holdings, prices = [], {}
+    for index in range(size):
+        symbol = f"SYM{index}"
+        asset = models.Asset(
+            id=index + 1,
+            symbol=symbol,
+            name=f"Asset {index}",
+            asset_type=AssetType.STOCK,
+            created_at=created,
+        )
+        holdings.append(
+            models.PortfolioHolding(
+                id=index + 1,
+                user_id=1,
+                asset_id=asset.id,
+                quantity=rng.uniform(1, 100),
+                purchase_price=rng.uniform(5, 500),
+                purchase_date=created - timedelta(days=rng.randint(1, 1000)),
+                created_at=created,
+                asset_info=asset,
+            )
+        )
+        prices[symbol] = rng.uniform(5, 500)
+    return holdings, prices
+
+
+@benchmark("portfolio.summary_assembly", sizes=(10, 100, 500))
+def bench_portfolio_summary(size: int):
+    """The holdings endpoint with DB and price lookups answered from memory."""
+    holdings, prices = _holdings(size)
+    user = models.User(id=1, email="bench@example.com", is_active=True)
+    with (
+        patch.object(
+            portfolio.crud, "get_portfolio_holdings_by_user", return_value=holdings
+        ),
+        patch.object(portfolio, "get_current_price", side_effect=prices.get),
+    ):
+        yield lambda: portfolio.view_user_portfolio_summary(
+            db=MagicMock(), skip=0, limit=size, base_currency=None, current_user=user
+        )
+
+
+@benchmark("auth.jwt_encode")
+def bench_jwt_encode(size: int):
+    return lambda: security.create_access_token(data={"sub": "bench@example.com"})
+
+
+@benchmark("auth.jwt_decode")
+def bench_jwt_decode(size: int):
+    token = security.create_access_token(data={"sub": "bench@example.com"})
+    return lambda: security.decode_access_token(token)
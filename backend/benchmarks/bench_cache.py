@@ -0,0 +1,54 @@
+# backend/benchmarks/bench_cache.py
+from typing import Any, Dict, Optional
+
+from app.cache import shared_cache
+from .bench_market_data import HISTORY_SIZES, history_points
+from .harness import benchmark
+
+
+class InMemoryRedis:
+    """Just enough of a Redis client to time shared_cache's (de)serialisation."""
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        return self._data.get(key)
+
+    def set(self, key: str, value: str, ex: Optional[int] = None, **_: Any):
+        self._data[key] = value
+        return True
+
+
+def _with_client():
+    return shared_cache.use_redis_client(InMemoryRedis())
+
+
+@benchmark("shared_cache.set_history", sizes=HISTORY_SIZES)
+def bench_set_history(size: int):
+    points = history_points(size)
+    original = _with_client()
+    try:
+        yield lambda: shared_cache.set_shared_cache("history:AAPL:compact", points)
+    finally:
+        shared_cache.use_redis_client(original)
+
+
+@benchmark("shared_cache.get_history", sizes=HISTORY_SIZES)
+def bench_get_history(size: int):
+    original = _with_client()
+    try:
+        shared_cache.set_shared_cache("history:AAPL:compact", history_points(size))
+        yield lambda: shared_cache.get_shared_cache("history:AAPL:compact")
+    finally:
+        shared_cache.use_redis_client(original)
+
+
+@benchmark("shared_cache.get_price")
+def bench_get_price(size: int):
+    original = _with_client()
+    try:
+        shared_cache.set_shared_cache("price:AAPL", 187.42)
+        yield lambda: shared_cache.get_shared_cache("price:AAPL")
+    finally:
+        shared_cache.use_redis_client(original)
@@ -0,0 +1,81 @@
+# backend/benchmarks/bench_logging.py
+import contextlib
+import logging
+import os
+import queue
+from logging.handlers import QueueListener
+from unittest.mock import patch
+
+from app.core import logs
+from app.core.config import settings
+from app.core.logs import LOG_QUEUE_SIZE, TEXT_FORMAT, NonBlockingQueueHandler
+from .harness import benchmark
+
+SYMBOL = "AAPL"
+
+
+def _devnull_output(stream) -> logging.Handler:
+    output = logging.StreamHandler(stream)
+    output.setFormatter(logging.Formatter(TEXT_FORMAT))
+    return output
+
+
+@contextlib.contextmanager
+def _queued_logger(name: str, level: int):
+    """A logger wired like configure_logging's, writing to /dev/null."""
+    with open(os.devnull, "w") as devnull:
+        log_queue = queue.SimpleQueue()
+        handler = NonBlockingQueueHandler(log_queue, LOG_QUEUE_SIZE)
+        logger = logging.getLogger(f"benchmarks.logging.{name}")
+        logger.propagate = False
+        logger.setLevel(level)
+        logger.addHandler(handler)
+        listener = QueueListener(log_queue, _devnull_output(devnull))
+        listener.start()
+        try:
+            yield logger
+        finally:
+            listener.stop()
+            logger.removeHandler(handler)
+
+
+@benchmark("logging.print_line_buffered")
+def bench_print(size: int):
+    """The previous behaviour: an f-string printed per cache hit, unbuffered."""
+    with open(os.devnull, "w", buffering=1) as sink:
+        yield lambda: print(
+            f"ORCHESTRATOR CACHE HIT (Redis): Using cached price for {SYMBOL}",
+            file=sink,
+        )
+
+
+@benchmark("logging.queued_info")
+def bench_queued_info(size: int):
+    """A kept record: built, stamped and queued; formatting is off-thread."""
+    with _queued_logger("info", logging.INFO) as logger:
+        yield lambda: logger.info("Cache hit for current price of %s", SYMBOL)
+
+
+@benchmark("logging.sampled_out")
+def bench_sampled_out(size: int):
+    """A line from a family sampled at 0: skipped before a record is built."""
+    with patch.object(settings, "LOG_SAMPLE_RATES", {"cache": 0.0}), _queued_logger(
+        "sampled", logging.INFO
+    ) as logger:
+
+        def log_line():
+            if logs.sampled("cache"):
+                logger.info(
+                    "Cache hit for current price of %s",
+                    SYMBOL,
+                    extra={"family": "cache"},
+                )
+
+        yield log_line
+
+
+@benchmark("logging.below_level")
+def bench_below_level(size: int):
+    """The default for per-hit messages: DEBUG under LOG_LEVEL=INFO."""
+    with _queued_logger("debug", logging.INFO) as logger:
+        yield lambda: logger.debug("Cache hit for current price of %s", SYMBOL)
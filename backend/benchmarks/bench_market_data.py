@@ -0,0 +1,123 @@
+# backend/benchmarks/bench_market_data.py
+import json
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from app.cache import shared_cache
+from app.services import financial_data_orchestrator
+from app.services.data_providers import alpha_vantage_provider, yahoo_finance_provider
+from .harness import benchmark
+
+HISTORY_SIZES = (100, 1000, 5000)
+
+
+def _ohlcv(size: int, seed: int = 0) -> np.ndarray:
+    """(close, open, high, low, volume) rows of a seeded random walk."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, size)))
+    open_ = close * np.exp(rng.normal(0, 0.005, size))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.005, size)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.005, size)))
+    volume = rng.integers(100_000, 50_000_000, size)
+    return np.column_stack([close, open_, high, low, volume])
+
+
+def history_points(size: int):
+    """Orchestrator-shaped history (dates as date objects), oldest first."""
+    start = date(2000, 1, 3)
+    points = []
+    for offset, (close, open_, high, low, volume) in enumerate(_ohlcv(size)):
+        points.append(
+            {
+                "date": start + timedelta(days=offset),
+                "open": float(open_),
+                "high": float(high),
+                "low": float(low),
+                "close": float(close),
+                "volume": int(volume),
+                "sma20": None,
+                "sma50": None,
+            }
+        )
+    return points
+
+
+@benchmark("orchestrator.deserialize_history_from_cache", sizes=HISTORY_SIZES)
+def bench_deserialize_history(size: int):
+    cached = json.loads(
+        json.dumps(history_points(size), default=shared_cache._datetime_converter)
+    )
+    return lambda: financial_data_orchestrator._deserialize_history_from_cache(cached)
+
+
+@benchmark("yfinance.historical_postprocess", sizes=HISTORY_SIZES)
+def bench_yf_historical_postprocess(size: int):
+    """fetch_yf_historical_data with the network call replaced by a ready frame."""
+    rows = _ohlcv(size)
+    index = pd.date_range(
+        "2000-01-03", periods=size, freq="B", tz="America/New_York", name="Date"
+    )
+    frame = pd.DataFrame(
+        {
+            "Open": rows[:, 1],
+            "High": rows[:, 2],
+            "Low": rows[:, 3],
+            "Close": rows[:, 0],
+            "Volume": rows[:, 4].astype("int64"),
+        },
+        index=index,
+    )
+    with patch.object(
+        yahoo_finance_provider, "_yf_history", side_effect=lambda *a, **k: frame.copy()
+    ):
+        yield lambda: yahoo_finance_provider.fetch_yf_historical_data(
+            "AAPL", "stock", period="max"
+        )
+
+
+def _av_daily_payload(size: int, crypto: bool):
+    start = date(2000, 1, 3)
+    series = {}
+    for offset, (close, open_, high, low, volume) in enumerate(_ohlcv(size)):
+        day = (start + timedelta(days=offset)).isoformat()
+        if crypto:
+            series[day] = {
+                "1a. open (USD)": f"{open_:.4f}",
+                "2a. high (USD)": f"{high:.4f}",
+                "3a. low (USD)": f"{low:.4f}",
+                "4a. close (USD)": f"{close:.4f}",
+                "5. volume": f"{volume:.2f}",
+            }
+        else:
+            series[day] = {
+                "1. open": f"{open_:.4f}",
+                "2. high": f"{high:.4f}",
+                "3. low": f"{low:.4f}",
+                "4. close": f"{close:.4f}",
+                "5. volume": str(int(volume)),
+            }
+    # Alpha Vantage lists the newest day first.
+    series = dict(reversed(list(series.items())))
+    key = "Time Series (Digital Currency Daily)" if crypto else "Time Series (Daily)"
+    return {"Meta Data": {}, key: series}
+
+
+@benchmark("alpha_vantage.parse_stock_history", sizes=HISTORY_SIZES)
+def bench_av_stock_history(size: int):
+    payload = _av_daily_payload(size, crypto=False)
+    with patch.object(alpha_vantage_provider, "_make_av_request", return_value=payload):
+        yield lambda: alpha_vantage_provider.fetch_av_stock_historical_data(
+            "IBM", outputsize="full"
+        )
+
+
+@benchmark("alpha_vantage.parse_crypto_history", sizes=HISTORY_SIZES)
+def bench_av_crypto_history(size: int):
+    payload = _av_daily_payload(size, crypto=True)
+    with patch.object(alpha_vantage_provider, "_make_av_request", return_value=payload):
+        yield lambda: alpha_vantage_provider.fetch_av_crypto_historical_data(
+            "BTC", outputsize="full"
+        )
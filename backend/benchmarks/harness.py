@@ -0,0 +1,183 @@
+# backend/benchmarks/harness.py
+import contextlib
+import gc
+import inspect
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+BASELINE_SCHEMA_VERSION = 1
+
+# A benchmark factory takes an input size, does all setup, and returns the
+# zero-argument callable that is timed. Factories that need teardown (e.g. a
+# patch active while timing) yield the callable instead, like a fixture.
+BenchmarkFactory = Callable[[int], Any]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    sizes: Sequence[int]
+    factory: BenchmarkFactory
+
+    def case_names(self) -> List[str]:
+        return [case_name(self.name, size) for size in self.sizes]
+
+
+_registry: Dict[str, Benchmark] = {}
+
+
+def case_name(name: str, size: int) -> str:
+    return f"{name}[{size}]"
+
+
+def benchmark(name: str, sizes: Sequence[int] = (1,)):
+    """Registers a benchmark factory to run once per input size."""
+
+    def decorator(factory: BenchmarkFactory) -> BenchmarkFactory:
+        if name in _registry:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        _registry[name] = Benchmark(name, tuple(sizes), factory)
+        return factory
+
+    return decorator
+
+
+def get_benchmarks(name_filter: Optional[str] = None) -> List[Benchmark]:
+    return [
+        bench
+        for name, bench in sorted(_registry.items())
+        if not name_filter or name_filter in name
+    ]
+
+
+@contextlib.contextmanager
+def silenced() -> Iterator[None]:
+    """Keeps any console output from the code under test off the terminal."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def time_callable(
+    func: Callable[[], Any], repeats: int = 5, min_time: float = 0.2
+) -> Dict[str, Any]:
+    """
+    Calibrates a loop count so one repeat takes at least `min_time`, then
+    times `repeats` repeats with GC disabled. Returns per-call seconds.
+    """
+    loops = 1
+    while True:
+        elapsed = _time_loops(func, loops)
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    per_call = [_time_loops(func, loops) / loops for _ in range(repeats)]
+    return {
+        "loops": loops,
+        "repeats": repeats,
+        "min_s": min(per_call),
+        "median_s": statistics.median(per_call),
+        "stdev_s": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+    }
+
+
+def _time_loops(func: Callable[[], Any], loops: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+@contextlib.contextmanager
+def _prepared(prepared: Any) -> Iterator[Callable[[], Any]]:
+    if not inspect.isgenerator(prepared):
+        yield prepared
+        return
+    try:
+        yield next(prepared)
+    finally:
+        prepared.close()
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark], repeats: int = 5, min_time: float = 0.2
+) -> Dict[str, Dict[str, Any]]:
+    results: Dict[str, Dict[str, Any]] = {}
+    for bench in benchmarks:
+        for size in bench.sizes:
+            with silenced(), _prepared(bench.factory(size)) as func:
+                timing = time_callable(func, repeats=repeats, min_time=min_time)
+            results[case_name(bench.name, size)] = timing
+    return results
+
+
+def write_baseline(path: str, results: Dict[str, Dict[str, Any]], **meta: Any) -> None:
+    payload = {"schema_version": BASELINE_SCHEMA_VERSION, **meta, "results": results}
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(payload, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as baseline_file:
+        payload = json.load(baseline_file)
+    if payload.get("schema_version") != BASELINE_SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} has baseline schema {payload.get('schema_version')}, "
+            f"expected {BASELINE_SCHEMA_VERSION}"
+        )
+    return payload["results"]
+
+
+def compare(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    threshold: float = 0.10,
+) -> List[Dict[str, Any]]:
+    """
+    Compares median per-call times case by case. A case is a regression when
+    it is more than `threshold` (fractional) slower than its baseline, and an
+    improvement when it is that much faster.
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        old = baseline.get(name, {}).get("median_s")
+        new = current.get(name, {}).get("median_s")
+        ratio = new / old if old and new is not None else None
+        if ratio is None:
+            verdict = "new" if old is None else "missing"
+        elif ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        rows.append(
+            {
+                "case": name,
+                "baseline_s": old,
+                "current_s": new,
+                "ratio": ratio,
+                "verdict": verdict,
+            }
+        )
+    return rows
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
@@ -0,0 +1,162 @@
+# backend/benchmarks/import_profile.py
+"""
+Import-time profile of a module in a fresh interpreter: what it costs to
+import, which imports are slowest, and the process's peak memory after.
+
+Run from backend/:
+    python -m benchmarks.import_profile                   # main, the API app
+    python -m benchmarks.import_profile --module app.core.celery_app --top 30
+    python -m benchmarks.import_profile --absent yfinance pandas numpy
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+# `python -X importtime` writes one line per module to stderr:
+#   import time:  self [us] | cumulative | imported package
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)\s*$")
+# Printed by the child after the import, so stderr stays importtime-only.
+_CHILD_CODE = (
+    "import importlib, json, resource, sys; importlib.import_module({module!r}); "
+    "sys.stdout.write(json.dumps(["
+    "resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, sorted(sys.modules)]))"
+)
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Rows of {"module", "self_us", "cumulative_us", "depth"} in output order."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        rows.append(
+            {
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": len(indent) // 2,
+            }
+        )
+    return rows
+
+
+def top_level_packages(rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """Self time summed per top-level package (e.g. all of sqlalchemy.*), in µs."""
+    totals: Dict[str, int] = {}
+    for row in rows:
+        package = row["module"].split(".", 1)[0]
+        totals[package] = totals.get(package, 0) + row["self_us"]
+    return totals
+
+
+def profile_import(module: str) -> Dict[str, Any]:
+    """Imports `module` in a new interpreter and collects its profile."""
+    env = dict(os.environ)
+    # Settings need these at import; importing never touches the DB itself.
+    env.setdefault("DATABASE_URL", "sqlite://")
+    env.setdefault("SECRET_KEY", "import-profile-secret-key-not-for-production")
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_CODE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if completed.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+    max_rss_kib, loaded = json.loads(completed.stdout)
+    rows = parse_importtime(completed.stderr)
+    return {
+        "module": module,
+        "total_us": sum(row["cumulative_us"] for row in rows if row["depth"] == 0),
+        "max_rss_mib": round(max_rss_kib / 1024, 1),
+        "imports": rows,
+        "loaded_modules": loaded,
+    }
+
+
+def _ms(us: float) -> str:
+    return f"{us / 1000:8.1f} ms"
+
+
+def render(
+    profiles: List[Dict[str, Any]], top: int, absent: Optional[List[str]]
+) -> str:
+    """Text report; timings are medians over `profiles`, rows from the first."""
+    first = profiles[0]
+    lines = [
+        f"{first['module']}: {_ms(statistics.median(p['total_us'] for p in profiles))}"
+        f" to import (median of {len(profiles)}),"
+        f" peak RSS {statistics.median(p['max_rss_mib'] for p in profiles)} MiB,"
+        f" {len(first['loaded_modules'])} modules loaded",
+        "",
+        f"Slowest imports (cumulative, top {top}):",
+    ]
+    for row in sorted(first["imports"], key=lambda r: -r["cumulative_us"])[:top]:
+        lines.append(
+            f"  {_ms(row['cumulative_us'])}  self {_ms(row['self_us'])}  {row['module']}"
+        )
+    lines += ["", f"Heaviest packages (self time, top {top}):"]
+    packages = top_level_packages(first["imports"])
+    for package, self_us in sorted(packages.items(), key=lambda kv: -kv[1])[:top]:
+        lines.append(f"  {_ms(self_us)}  {package}")
+    if absent:
+        lines.append("")
+        for module in absent:
+            state = "LOADED" if module in first["loaded_modules"] else "not loaded"
+            lines.append(f"  {module}: {state}")
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_profile",
+        description=__doc__.split("\n\n")[0],
+    )
+    parser.add_argument("--module", default="main", help="Module to import.")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument(
+        "--repeats", type=int, default=3, help="Fresh interpreters to time."
+    )
+    parser.add_argument(
+        "--absent",
+        nargs="*",
+        default=None,
+        help="Modules the import should not load; exits 1 if any is loaded.",
+    )
+    parser.add_argument("--json", default=None, help="Also write results here.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    profiles = [profile_import(args.module) for _ in range(max(1, args.repeats))]
+    print(render(profiles, args.top, args.absent))
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(
+                {
+                    "module": args.module,
+                    "total_us": statistics.median(p["total_us"] for p in profiles),
+                    "max_rss_mib": statistics.median(
+                        p["max_rss_mib"] for p in profiles
+                    ),
+                    "slowest": sorted(
+                        profiles[0]["imports"], key=lambda r: -r["cumulative_us"]
+                    )[: args.top],
+                },
+                fh,
+                indent=2,
+            )
+    loaded = set(profiles[0]["loaded_modules"])
+    return 1 if any(module in loaded for module in args.absent or ()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
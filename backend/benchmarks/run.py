@@ -0,0 +1,144 @@
+# backend/benchmarks/run.py
+"""
+Microbenchmarks for backend hot paths, on synthetic inputs at several sizes.
+
+Run from backend/:
+    python -m benchmarks.run                          # run and print
+    python -m benchmarks.run --save benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --fail-on-regression
+    python -m benchmarks.run --filter alpha_vantage --quick
+"""
+import argparse
+import importlib
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from .harness import (
+    compare,
+    format_duration,
+    get_benchmarks,
+    load_baseline,
+    run_benchmarks,
+    write_baseline,
+)
+
+BENCHMARK_MODULES = (
+    "benchmarks.bench_market_data",
+    "benchmarks.bench_cache",
+    "benchmarks.bench_api",
+    "benchmarks.bench_logging",
+)
+
+
+def load_benchmark_modules() -> None:
+    # Settings need these at import; benchmarks never touch the DB itself.
+    os.environ.setdefault("DATABASE_URL", "sqlite://")
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-not-for-production")
+    for module in BENCHMARK_MODULES:
+        importlib.import_module(module)
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--filter", default=None, help="Only names containing this.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="Minimum seconds per repeat; loops are calibrated to reach it.",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="3 repeats of 0.05s, for a fast look."
+    )
+    parser.add_argument("--save", default=None, help="Write results as a baseline.")
+    parser.add_argument("--compare", default=None, help="Baseline file to diff.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Fractional slowdown that counts as a regression (default 0.10).",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 if any case regressed beyond the threshold.",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.quick:
+        args.repeats, args.min_time = 3, 0.05
+
+    load_benchmark_modules()
+    benchmarks = get_benchmarks(args.filter)
+    if not benchmarks:
+        print(f"BENCHMARKS: Nothing matches filter '{args.filter}'.")
+        return 1
+
+    results = {}
+    for bench in benchmarks:
+        bench_results = run_benchmarks(
+            [bench], repeats=args.repeats, min_time=args.min_time
+        )
+        for name, timing in bench_results.items():
+            print(
+                f"{name:<56} median {format_duration(timing['median_s']):>10}"
+                f"  min {format_duration(timing['min_s']):>10}"
+                f"  ({timing['loops']} loops x {timing['repeats']})"
+            )
+        results.update(bench_results)
+
+    if args.save:
+        write_baseline(
+            args.save,
+            results,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            git_revision=_git_revision(),
+            python=platform.python_version(),
+            platform=platform.platform(),
+        )
+        print(f"BENCHMARKS: Baseline written to {args.save}.")
+
+    if not args.compare:
+        return 0
+    baseline = load_baseline(args.compare)
+    selected = {name for bench in benchmarks for name in bench.case_names()}
+    baseline = {name: timing for name, timing in baseline.items() if name in selected}
+    rows = compare(baseline, results, threshold=args.threshold)
+    print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+    for row in rows:
+        ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+        print(
+            f"{row['case']:<56} {format_duration(row['baseline_s']):>10} -> "
+            f"{format_duration(row['current_s']):>10}  {ratio:>7}  {row['verdict']}"
+        )
+    regressions = [row for row in rows if row["verdict"] == "regression"]
+    if regressions:
+        print(f"BENCHMARKS: {len(regressions)} case(s) regressed.")
+        return 1 if args.fail_on_regression else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
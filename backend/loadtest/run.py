@@ -0,0 +1,319 @@
+# backend/loadtest/run.py
+"""
+End-to-end load test of the FastAPI app.
+
+Boots `main:app` in-process against a database (local Postgres from
+docker-compose, or SQLite) and Redis (local server or in-process fakeredis),
+with the synthetic market-data provider standing in for upstream APIs. Seeds
+users, assets, holdings and watchlists, drives a weighted mix of endpoints
+from concurrent clients, and writes throughput, latency percentiles and
+DB/Redis calls per endpoint to a JSON results file.
+
+Run from backend/:
+    python -m loadtest.run --users 200 --assets 500 --concurrency 32 --duration 60
+    python -m loadtest.run --database-url postgresql://... --redis real
+    python -m loadtest.run --output after.json --compare before.json
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from . import stand_ins
+from .scenarios import ScenarioPicker, Universe, VirtualUser, parse_mix
+from .stats import (
+    RESULTS_SCHEMA_VERSION,
+    CallCounters,
+    LatencyRecorder,
+    compare_results,
+    current_endpoint,
+    format_comparison,
+    format_summary,
+    load_results,
+    write_results,
+)
+
+DEFAULT_DATABASE_URL = "sqlite:///./loadtest.db"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest.run", description=__doc__.split("\n\n")[0]
+    )
+    stand_in_group = parser.add_argument_group("stand-ins")
+    stand_in_group.add_argument(
+        "--database-url",
+        default=os.environ.get("LOADTEST_DATABASE_URL", DEFAULT_DATABASE_URL),
+        help="Database to seed and serve from (default: %(default)s).",
+    )
+    stand_in_group.add_argument(
+        "--redis",
+        choices=["fake", "real"],
+        default="fake",
+        help="In-process fakeredis, or the configured Redis (flushed per run).",
+    )
+
+    scale = parser.add_argument_group("seed scale")
+    scale.add_argument("--users", type=int, default=50)
+    scale.add_argument("--assets", type=int, default=200)
+    scale.add_argument("--holdings-per-user", type=int, default=10)
+    scale.add_argument("--watchlist-per-user", type=int, default=10)
+    scale.add_argument(
+        "--skew",
+        type=float,
+        default=1.0,
+        help="Zipf exponent of symbol popularity (0 = uniform).",
+    )
+
+    load = parser.add_argument_group("load")
+    load.add_argument("--concurrency", type=int, default=16)
+    load.add_argument("--duration", type=float, default=30.0, help="Seconds to run.")
+    load.add_argument(
+        "--requests", type=int, default=None, help="Stop after this many requests."
+    )
+    load.add_argument(
+        "--warmup", type=float, default=0.0, help="Seconds of unrecorded warm-up."
+    )
+    load.add_argument(
+        "--mix",
+        default=None,
+        help="Scenario weights, e.g. holdings=40,price=40,history=5,watchlist=15,token=0",
+    )
+    load.add_argument("--seed", type=int, default=42)
+
+    provider = parser.add_argument_group("synthetic provider")
+    provider.add_argument("--provider-latency-ms", type=float, default=50.0)
+    provider.add_argument("--provider-latency-jitter-ms", type=float, default=15.0)
+    provider.add_argument("--provider-error-rate", type=float, default=0.0)
+    provider.add_argument("--provider-rate-limit", type=int, default=None)
+
+    output = parser.add_argument_group("output")
+    output.add_argument("--output", default="loadtest-results.json")
+    output.add_argument(
+        "--compare", default=None, help="Earlier results file to diff against."
+    )
+    output.add_argument(
+        "--app-output",
+        action="store_true",
+        help="Show the app's log output during the run.",
+    )
+    return parser
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextlib.contextmanager
+def _silenced(enabled: bool = True):
+    """Discards app log records and console output while driving load."""
+    if not enabled:
+        yield
+        return
+    logging.disable(logging.CRITICAL)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def _issue_tokens(users: List[VirtualUser]) -> None:
+    """Mints bearer tokens directly; password checks are exercised by the token scenario."""
+    from app.auth.security import create_access_token
+
+    with _silenced():
+        for user in users:
+            user.token = create_access_token(data={"sub": user.email})
+
+
+async def _drive(
+    app,
+    users: List[VirtualUser],
+    universe: Universe,
+    mix: Dict[str, float],
+    args: argparse.Namespace,
+    recorder: LatencyRecorder,
+    seconds: float,
+    max_requests: Optional[int],
+) -> float:
+    """Runs `args.concurrency` clients against the app; returns elapsed seconds."""
+    import httpx
+
+    from app.core.config import settings
+
+    stop_at = time.perf_counter() + seconds
+    issued = 0
+
+    async def client_loop(client: httpx.AsyncClient, worker: int) -> None:
+        nonlocal issued
+        rng = random.Random(args.seed * 1000 + worker)
+        picker = ScenarioPicker(mix, rng)
+        while time.perf_counter() < stop_at:
+            if max_requests is not None:
+                if issued >= max_requests:
+                    return
+                issued += 1
+            scenario = picker.pick()
+            user = rng.choice(users)
+            method, path, request_kwargs = scenario.build(user, universe, rng)
+            headers = {}
+            if scenario.authenticated:
+                headers["Authorization"] = f"Bearer {user.token}"
+            label_token = current_endpoint.set(scenario.label)
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    method,
+                    f"{settings.API_V1_STR}{path}",
+                    headers=headers,
+                    **request_kwargs,
+                )
+                status_code = response.status_code
+            except Exception as e:
+                print(f"LOADTEST_ERROR: {scenario.label} raised {e!r}", file=sys.stderr)
+                status_code = 0
+            finally:
+                current_endpoint.reset(label_token)
+            recorder.record(scenario.label, time.perf_counter() - started, status_code)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://loadtest", timeout=None
+    ) as client:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(client_loop(client, worker) for worker in range(args.concurrency))
+        )
+        return time.perf_counter() - started
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    mix = parse_mix(args.mix)
+    stand_ins.configure_environment(
+        args.database_url,
+        {
+            "SYNTHETIC_PROVIDER_SEED": args.seed,
+            "SYNTHETIC_PROVIDER_LATENCY_MS": args.provider_latency_ms,
+            "SYNTHETIC_PROVIDER_LATENCY_JITTER_MS": args.provider_latency_jitter_ms,
+            "SYNTHETIC_PROVIDER_ERROR_RATE": args.provider_error_rate,
+            "SYNTHETIC_PROVIDER_RATE_LIMIT_PER_MINUTE": args.provider_rate_limit,
+        },
+    )
+    # Imported only now: settings are read from the environment at import.
+    from main import app
+    from app.core.logs import configure_logging
+
+    if args.app_output:
+        configure_logging()
+
+    engine = stand_ins.install_database(args.database_url)
+    stand_ins.install_redis(args.redis)
+    users, universe = stand_ins.seed(
+        users=args.users,
+        assets=args.assets,
+        holdings_per_user=args.holdings_per_user,
+        watchlist_per_user=args.watchlist_per_user,
+        rng_seed=args.seed,
+        skew=args.skew,
+    )
+    _issue_tokens(users)
+
+    counters = CallCounters()
+    stand_ins.instrument(engine, counters)
+    with _silenced(not args.app_output):
+        if args.warmup > 0:
+            asyncio.run(
+                _drive(
+                    app,
+                    users,
+                    universe,
+                    mix,
+                    args,
+                    LatencyRecorder(),
+                    args.warmup,
+                    None,
+                )
+            )
+            counters.reset()
+        recorder = LatencyRecorder()
+        elapsed = asyncio.run(
+            _drive(
+                app,
+                users,
+                universe,
+                mix,
+                args,
+                recorder,
+                args.duration,
+                args.requests,
+            )
+        )
+
+    summary = recorder.summarize(elapsed, counters)
+    return {
+        "schema_version": RESULTS_SCHEMA_VERSION,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": stand_ins.describe_database(args.database_url),
+            "redis": args.redis,
+        },
+        "config": {
+            "users": args.users,
+            "assets": args.assets,
+            "holdings_per_user": args.holdings_per_user,
+            "watchlist_per_user": args.watchlist_per_user,
+            "skew": args.skew,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "max_requests": args.requests,
+            "warmup_seconds": args.warmup,
+            "mix": mix,
+            "seed": args.seed,
+            "provider_latency_ms": args.provider_latency_ms,
+            "provider_latency_jitter_ms": args.provider_latency_jitter_ms,
+            "provider_error_rate": args.provider_error_rate,
+            "provider_rate_limit_per_minute": args.provider_rate_limit,
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        **summary,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        build_parser().error(str(e))
+    results = run(args)
+    write_results(args.output, results)
+    print(format_summary(results))
+    print(f"LOADTEST: Results written to {args.output}.")
+    if args.compare:
+        print(f"\nCompared with {args.compare}:")
+        print(format_comparison(compare_results(load_results(args.compare), results)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
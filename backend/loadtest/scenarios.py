@@ -0,0 +1,123 @@
+# backend/loadtest/scenarios.py
+import itertools
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Relative weight of each request type in the default traffic mix.
+DEFAULT_MIX: Dict[str, float] = {
+    "holdings": 30,
+    "price": 30,
+    "history": 10,
+    "watchlist": 20,
+    "token": 10,
+}
+
+
+@dataclass
+class VirtualUser:
+    """One seeded account driving traffic: its credentials and bearer token."""
+
+    email: str
+    password: str
+    token: Optional[str] = None
+
+
+@dataclass
+class Universe:
+    """Seeded symbols, most popular first, with Zipf-like request weights."""
+
+    symbols: List[str]
+    skew: float = 1.0
+    _cumulative: List[float] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        weights = [1 / (rank + 1) ** self.skew for rank in range(len(self.symbols))]
+        self._cumulative = list(itertools.accumulate(weights))
+
+    def pick(self, rng: random.Random) -> str:
+        return rng.choices(self.symbols, cum_weights=self._cumulative)[0]
+
+
+# (method, path relative to the API prefix, extra httpx request kwargs)
+RequestSpec = Tuple[str, str, Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    label: str
+    authenticated: bool
+    build: Callable[[VirtualUser, Universe, random.Random], RequestSpec]
+
+
+def _holdings(user: VirtualUser, universe: Universe, rng: random.Random):
+    return "GET", "/portfolio/holdings/", {}
+
+
+def _price(user: VirtualUser, universe: Universe, rng: random.Random):
+    return "GET", f"/market-data/{universe.pick(rng)}/price", {}
+
+
+def _history(user: VirtualUser, universe: Universe, rng: random.Random):
+    return "GET", f"/market-data/{universe.pick(rng)}/history", {}
+
+
+def _watchlist(user: VirtualUser, universe: Universe, rng: random.Random):
+    return "GET", "/watchlist/items/", {}
+
+
+def _token(user: VirtualUser, universe: Universe, rng: random.Random):
+    form = {"username": user.email, "password": user.password}
+    return "POST", "/auth/token", {"data": form}
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("holdings", "GET /portfolio/holdings/", True, _holdings),
+        Scenario("price", "GET /market-data/{symbol}/price", False, _price),
+        Scenario("history", "GET /market-data/{symbol}/history", False, _history),
+        Scenario("watchlist", "GET /watchlist/items/", True, _watchlist),
+        Scenario("token", "POST /auth/token", False, _token),
+    )
+}
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, float]:
+    """
+    Parses "holdings=40,price=40,token=0" into scenario weights. Scenarios
+    not mentioned keep their default weight; a weight of 0 disables one.
+    """
+    mix = dict(DEFAULT_MIX)
+    if not text:
+        return mix
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, sep, weight = part.partition("=")
+        name = name.strip()
+        if not sep or name not in SCENARIOS:
+            raise ValueError(
+                f"Invalid mix entry '{part}'; expected name=weight with name in "
+                f"{', '.join(SCENARIOS)}"
+            )
+        value = float(weight)
+        if value < 0:
+            raise ValueError(f"Mix weight for {name} must not be negative")
+        mix[name] = value
+    if not any(mix.values()):
+        raise ValueError("Mix must give at least one scenario a positive weight")
+    return mix
+
+
+class ScenarioPicker:
+    """Weighted random choice of scenarios, reproducible from a seed."""
+
+    def __init__(self, mix: Dict[str, float], rng: random.Random):
+        self._scenarios = [SCENARIOS[name] for name, weight in mix.items() if weight]
+        self._weights = [weight for weight in mix.values() if weight]
+        self._rng = rng
+
+    def pick(self) -> Scenario:
+        return self._rng.choices(self._scenarios, weights=self._weights)[0]
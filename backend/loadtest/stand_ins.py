@@ -0,0 +1,248 @@
+# backend/loadtest/stand_ins.py
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .scenarios import Universe, VirtualUser
+from .stats import CallCounters
+
+# Seeded rows are recognisable so re-seeding only ever removes its own data.
+SEED_EMAIL_DOMAIN = "loadtest.alpha-dash.invalid"
+SEED_ASSET_NAME_PREFIX = "Load Test "
+SEED_PASSWORD = "loadtest-password"
+SEED_CRYPTO_SHARE = 0.2
+SEED_CHUNK_SIZE = 1000
+
+
+def configure_environment(
+    database_url: str, provider_overrides: Dict[str, Any]
+) -> None:
+    """
+    Points the app at the stand-ins and the synthetic provider. Must run
+    before anything under `app` is imported, since settings load at import.
+    """
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "loadtest-secret-key-not-for-production")
+    os.environ["MARKET_DATA_PROVIDERS"] = "synthetic"
+    for name, value in provider_overrides.items():
+        if value is not None:
+            os.environ[name] = str(value)
+
+
+def install_database(database_url: str):
+    """
+    Rebinds the app's session factory to an engine suited to concurrent use
+    of `database_url` (SQLite needs cross-thread connections) and creates any
+    missing tables. Returns the engine.
+    """
+    from sqlalchemy import create_engine
+
+    from app.db import session as db_session
+    from app.db.base import Base
+
+    engine_kwargs: Dict[str, Any] = {"pool_pre_ping": True}
+    if database_url.startswith("sqlite"):
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        engine_kwargs.update(pool_size=20, max_overflow=20)
+    engine = create_engine(database_url, **engine_kwargs)
+    db_session.engine = engine
+    db_session.SessionLocal.configure(bind=engine)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def install_redis(redis_mode: str):
+    """
+    "fake" installs an in-process fakeredis server (needs the fakeredis
+    package); "real" uses the configured SHARED_CACHE_REDIS_URL. Returns the
+    client, flushed so every run starts cold.
+    """
+    from app.cache import shared_cache
+
+    if redis_mode == "fake":
+        try:
+            import fakeredis
+        except ImportError as e:
+            raise SystemExit(
+                "--redis fake needs the fakeredis package (pip install fakeredis), "
+                "or use --redis real with a local Redis."
+            ) from e
+        client = fakeredis.FakeRedis(decode_responses=True)
+        shared_cache.use_redis_client(client)
+    else:
+        client = shared_cache.get_redis_client()
+        try:
+            client.ping()
+        except Exception as e:
+            raise SystemExit(
+                "Could not connect to Redis at SHARED_CACHE_REDIS_URL for --redis real."
+            ) from e
+    client.flushdb()
+    return client
+
+
+def instrument(engine, counters: CallCounters) -> None:
+    """
+    Counts DB statements (per cursor execution) and Redis round trips (one per
+    command, one per pipeline) against the endpoint being served.
+    """
+    import redis
+    from sqlalchemy import event
+
+    def count_query(*_: Any) -> None:
+        counters.increment("db_queries")
+
+    event.listen(engine, "before_cursor_execute", count_query)
+
+    original_execute_command = redis.Redis.execute_command
+    original_pipeline_execute = redis.client.Pipeline.execute
+
+    def execute_command(self, *args, **kwargs):
+        counters.increment("redis_calls")
+        return original_execute_command(self, *args, **kwargs)
+
+    def pipeline_execute(self, *args, **kwargs):
+        if self.command_stack:
+            counters.increment("redis_calls")
+        return original_pipeline_execute(self, *args, **kwargs)
+
+    redis.Redis.execute_command = execute_command
+    redis.client.Pipeline.execute = pipeline_execute
+
+
+def _remove_previous_seed(db) -> None:
+    from app import models
+
+    user_ids = db.query(models.User.id).filter(
+        models.User.email.like(f"%@{SEED_EMAIL_DOMAIN}")
+    )
+    asset_ids = db.query(models.Asset.id).filter(
+        models.Asset.name.like(f"{SEED_ASSET_NAME_PREFIX}%")
+    )
+    for model in (models.PriceAlert, models.WatchlistItem, models.PortfolioHolding):
+        db.query(model).filter(
+            model.user_id.in_(user_ids.scalar_subquery())
+            | model.asset_id.in_(asset_ids.scalar_subquery())
+        ).delete(synchronize_session=False)
+    db.query(models.User).filter(
+        models.User.email.like(f"%@{SEED_EMAIL_DOMAIN}")
+    ).delete(synchronize_session=False)
+    db.query(models.Asset).filter(
+        models.Asset.name.like(f"{SEED_ASSET_NAME_PREFIX}%")
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+def _insert_chunked(db, model, rows: List[Dict[str, Any]]) -> None:
+    from sqlalchemy import insert
+
+    for start in range(0, len(rows), SEED_CHUNK_SIZE):
+        db.execute(insert(model), rows[start : start + SEED_CHUNK_SIZE])
+
+
+def seed(
+    users: int,
+    assets: int,
+    holdings_per_user: int,
+    watchlist_per_user: int,
+    rng_seed: int,
+    skew: float = 1.0,
+) -> Tuple[List[VirtualUser], Universe]:
+    """
+    Replaces any previous load-test data with `users` accounts (sharing one
+    password), `assets` symbols (a fifth of them crypto) and, per user,
+    holdings and watchlist items drawn with the same popularity skew as the
+    market-data traffic.
+    """
+    from app import models
+    from app.auth.security import get_password_hash
+    from app.db.session import SessionLocal
+
+    rng = random.Random(rng_seed)
+    symbols: List[str] = []
+    asset_rows = []
+    for index in range(assets):
+        is_crypto = rng.random() < SEED_CRYPTO_SHARE
+        symbol = f"LC{index:05d}-USD" if is_crypto else f"LT{index:05d}"
+        symbols.append(symbol)
+        asset_rows.append(
+            {
+                "symbol": symbol,
+                "name": f"{SEED_ASSET_NAME_PREFIX}{index}",
+                "asset_type": (
+                    models.AssetType.CRYPTO if is_crypto else models.AssetType.STOCK
+                ),
+            }
+        )
+    universe = Universe(symbols, skew=skew)
+
+    hashed_password = get_password_hash(SEED_PASSWORD)
+    emails = [f"user{index}@{SEED_EMAIL_DOMAIN}" for index in range(users)]
+
+    db = SessionLocal()
+    try:
+        _remove_previous_seed(db)
+        _insert_chunked(db, models.Asset, asset_rows)
+        _insert_chunked(
+            db,
+            models.User,
+            [
+                {"email": email, "hashed_password": hashed_password, "is_active": True}
+                for email in emails
+            ],
+        )
+        db.flush()
+        asset_ids = dict(
+            db.query(models.Asset.symbol, models.Asset.id).filter(
+                models.Asset.symbol.in_(symbols)
+            )
+        )
+        user_ids = [
+            user_id
+            for (user_id,) in db.query(models.User.id)
+            .filter(models.User.email.in_(emails))
+            .order_by(models.User.id)
+        ]
+
+        now = datetime.now(timezone.utc)
+        holding_rows, watchlist_rows = [], []
+        for user_id in user_ids:
+            for _ in range(holdings_per_user):
+                holding_rows.append(
+                    {
+                        "user_id": user_id,
+                        "asset_id": asset_ids[universe.pick(rng)],
+                        "quantity": round(rng.uniform(1, 100), 4),
+                        "purchase_price": round(rng.uniform(5, 500), 4),
+                        "purchase_date": now - timedelta(days=rng.randint(1, 1000)),
+                    }
+                )
+            watched = set()
+            for _ in range(watchlist_per_user * 4):
+                if len(watched) >= min(watchlist_per_user, len(symbols)):
+                    break
+                watched.add(universe.pick(rng))
+            watchlist_rows.extend(
+                {"user_id": user_id, "asset_id": asset_ids[symbol]}
+                for symbol in watched
+            )
+        _insert_chunked(db, models.PortfolioHolding, holding_rows)
+        _insert_chunked(db, models.WatchlistItem, watchlist_rows)
+        db.commit()
+    finally:
+        db.close()
+
+    print(
+        f"LOADTEST: Seeded {users} users, {assets} assets, "
+        f"{len(holding_rows)} holdings and {len(watchlist_rows)} watchlist items."
+    )
+    return [VirtualUser(email, SEED_PASSWORD) for email in emails], universe
+
+
+def describe_database(database_url: str) -> Optional[str]:
+    """The database URL with any password masked, for the results file."""
+    from sqlalchemy.engine import make_url
+
+    return make_url(database_url).render_as_string(hide_password=True)
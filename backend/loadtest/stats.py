@@ -0,0 +1,227 @@
+# backend/loadtest/stats.py
+import json
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+RESULTS_SCHEMA_VERSION = 1
+
+# Endpoint label of the request being driven; DB and Redis calls made while
+# serving it are attributed to that label.
+current_endpoint: ContextVar[Optional[str]] = ContextVar(
+    "loadtest_current_endpoint", default=None
+)
+UNATTRIBUTED = "(unattributed)"
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[rank]
+
+
+class CallCounters:
+    """Thread-safe per-endpoint counts of backend calls (DB queries, Redis round trips)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def increment(self, kind: str, amount: int = 1) -> None:
+        label = current_endpoint.get() or UNATTRIBUTED
+        with self._lock:
+            self._counts[label][kind] += amount
+
+    def get(self, label: str, kind: str) -> int:
+        with self._lock:
+            return self._counts.get(label, {}).get(kind, 0)
+
+    def labels(self) -> List[str]:
+        with self._lock:
+            return list(self._counts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+class LatencyRecorder:
+    """Collects per-endpoint request latencies (seconds) and error counts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._statuses: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+
+    def record(self, label: str, latency: float, status_code: int) -> None:
+        with self._lock:
+            self._latencies[label].append(latency)
+            self._statuses[label][str(status_code)] += 1
+            if status_code >= 500 or status_code == 0:
+                self._errors[label] += 1
+
+    def summarize(
+        self, elapsed_seconds: float, counters: Optional[CallCounters] = None
+    ) -> Dict[str, Any]:
+        """
+        Per-endpoint throughput, latency percentiles (milliseconds), error
+        counts and backend calls per request, plus the same for all requests.
+        """
+        with self._lock:
+            latencies = {
+                label: list(values) for label, values in self._latencies.items()
+            }
+            errors = dict(self._errors)
+            statuses = {label: dict(codes) for label, codes in self._statuses.items()}
+
+        endpoints: Dict[str, Any] = {}
+        for label in sorted(latencies):
+            values = latencies[label]
+            endpoints[label] = _summarize_latencies(values, elapsed_seconds)
+            endpoints[label]["errors"] = errors.get(label, 0)
+            endpoints[label]["status_codes"] = statuses.get(label, {})
+            if counters is not None:
+                for kind in ("db_queries", "redis_calls"):
+                    total = counters.get(label, kind)
+                    endpoints[label][kind] = total
+                    endpoints[label][f"{kind}_per_request"] = (
+                        round(total / len(values), 3) if values else None
+                    )
+
+        every_latency = [value for values in latencies.values() for value in values]
+        totals = _summarize_latencies(every_latency, elapsed_seconds)
+        totals["errors"] = sum(errors.values())
+        if counters is not None:
+            for kind in ("db_queries", "redis_calls"):
+                totals[kind] = sum(
+                    counters.get(label, kind) for label in counters.labels()
+                )
+                totals[f"{kind}_per_request"] = (
+                    round(totals[kind] / len(every_latency), 3)
+                    if every_latency
+                    else None
+                )
+                totals[f"unattributed_{kind}"] = counters.get(UNATTRIBUTED, kind)
+        return {"endpoints": endpoints, "totals": totals}
+
+
+def _summarize_latencies(values: List[float], elapsed_seconds: float) -> Dict[str, Any]:
+    ordered = sorted(values)
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "requests": len(ordered),
+        "throughput_rps": (
+            round(len(ordered) / elapsed_seconds, 2) if elapsed_seconds > 0 else None
+        ),
+        "mean_ms": ms(sum(ordered) / len(ordered)) if ordered else None,
+        "p50_ms": ms(percentile(ordered, 50)),
+        "p95_ms": ms(percentile(ordered, 95)),
+        "p99_ms": ms(percentile(ordered, 99)),
+        "max_ms": ms(ordered[-1]) if ordered else None,
+    }
+
+
+def write_results(path: str, results: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2, sort_keys=True)
+        results_file.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as results_file:
+        results = json.load(results_file)
+    if results.get("schema_version") != RESULTS_SCHEMA_VERSION:
+        raise ValueError(
+            f"{path} has results schema {results.get('schema_version')}, "
+            f"expected {RESULTS_SCHEMA_VERSION}"
+        )
+    return results
+
+
+COMPARED_METRICS = (
+    "throughput_rps",
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "db_queries_per_request",
+    "redis_calls_per_request",
+)
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Per-endpoint relative change of each compared metric between two results
+    files: {endpoint: {metric: {"baseline", "current", "change_pct"}}}.
+    """
+    comparison: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    sections = {"(total)": ("totals", None)}
+    for label in sorted(set(baseline["endpoints"]) | set(current["endpoints"])):
+        sections[label] = ("endpoints", label)
+
+    for label, (section, key) in sections.items():
+        before = baseline[section] if key is None else baseline[section].get(key, {})
+        after = current[section] if key is None else current[section].get(key, {})
+        metrics = {}
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), after.get(metric)
+            if old is None and new is None:
+                continue
+            change = None
+            if old and new is not None:
+                change = round((new - old) / old * 100, 1)
+            metrics[metric] = {"baseline": old, "current": new, "change_pct": change}
+        comparison[label] = metrics
+    return comparison
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    columns = {
+        "requests": "requests",
+        "errors": "errors",
+        "throughput_rps": "req/s",
+        "p50_ms": "p50 ms",
+        "p95_ms": "p95 ms",
+        "p99_ms": "p99 ms",
+        "db_queries_per_request": "db/req",
+        "redis_calls_per_request": "redis/req",
+    }
+    rows = list(summary["endpoints"].items()) + [("(total)", summary["totals"])]
+    width = max(len(label) for label, _ in rows) + 2
+    header = f"{'endpoint':<{width}}" + "".join(
+        f"{title:>11}" for title in columns.values()
+    )
+    lines = [header, "-" * len(header)]
+    for label, stats in rows:
+        cells = []
+        for name in columns:
+            value = stats.get(name)
+            cells.append(f"{'-' if value is None else value:>11}")
+        lines.append(f"{label:<{width}}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def format_comparison(comparison: Dict[str, Dict[str, Dict[str, Any]]]) -> str:
+    lines = []
+    for label, metrics in comparison.items():
+        parts = []
+        for metric, values in metrics.items():
+            change = values["change_pct"]
+            change_text = "n/a" if change is None else f"{change:+.1f}%"
+            parts.append(
+                f"{metric} {values['baseline']} -> {values['current']} ({change_text})"
+            )
+        lines.append(f"{label}: " + "; ".join(parts))
+    return "\n".join(lines)
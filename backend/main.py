@@ -1,9 +1,12 @@
 # backend/main.py
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 
+from app.core import logs, metrics, tracing
 from app.core.config import settings
 from app.api.v1.api import api_router as api_v1_router
+from app.services import cache_warmup
 
 app = FastAPI(
     title=settings.PROJECT_NAME, openapi_url=f"{settings.API_V1_STR}/openapi.json"
@@ -20,6 +23,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(metrics.MetricsMiddleware)
+app.add_middleware(tracing.TracingMiddleware)
+app.add_event_handler("startup", logs.configure_logging)
+app.add_event_handler("startup", cache_warmup.warm_on_startup)
+app.add_event_handler("shutdown", metrics.mark_process_dead)
+app.add_event_handler("shutdown", logs.shutdown_logging)
 
 
 @app.get("/")
@@ -32,4 +41,10 @@ async def health_check():
     return {"status": "ok", "project_name": settings.PROJECT_NAME}
 
 
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    """Prometheus scrape endpoint (aggregated across workers in multiprocess mode)."""
+    return Response(metrics.render_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 app.include_router(api_v1_router, prefix=settings.API_V1_STR)
@@ -0,0 +1,79 @@
+# backend/tests/api/test_market_data_endpoints.py
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from main import app
+from app.core.config import settings
+
+client = TestClient(app)
+PRICE_URL = f"{settings.API_V1_STR}/market-data/AAPL/price"
+
+
+@patch("app.api.endpoints.market_data.get_current_price_quote")
+@patch("app.api.endpoints.market_data.symbol_filter")
+def test_known_invalid_symbol_is_rejected_without_a_lookup(
+    mock_symbol_filter: MagicMock, mock_get_quote: MagicMock
+):
+    mock_symbol_filter.is_plausible_symbol.return_value = True
+    mock_symbol_filter.is_known_invalid.return_value = True
+    mock_symbol_filter.claim_invalid_symbol_probe.return_value = False
+
+    response = client.get(PRICE_URL)
+
+    assert response.status_code == 404
+    mock_get_quote.assert_not_called()
+
+
+@patch("app.api.endpoints.market_data.get_current_price_quote")
+@patch("app.api.endpoints.market_data.symbol_filter")
+def test_known_invalid_symbol_is_still_probed_now_and_then(
+    mock_symbol_filter: MagicMock, mock_get_quote: MagicMock
+):
+    # E.g. AAPL, listed after lookups failed during a provider outage.
+    mock_symbol_filter.is_plausible_symbol.return_value = True
+    mock_symbol_filter.is_known_invalid.return_value = True
+    mock_symbol_filter.claim_invalid_symbol_probe.return_value = True
+    mock_get_quote.return_value = {
+        "price": 190.0,
+        "is_stale": False,
+        "last_updated": datetime(2024, 3, 1, tzinfo=timezone.utc),
+    }
+
+    response = client.get(PRICE_URL)
+
+    assert response.status_code == 200
+    assert response.json()["price"] == 190.0
+    mock_symbol_filter.claim_invalid_symbol_probe.assert_called_once_with("AAPL")
+
+
+@patch("app.api.endpoints.market_data.get_current_price_quote")
+@patch("app.api.endpoints.market_data.symbol_filter")
+def test_price_lookup_runs_off_the_event_loop(
+    mock_symbol_filter: MagicMock, mock_get_quote: MagicMock
+):
+    # A blocking provider call on the loop would stall every open price stream.
+    mock_symbol_filter.is_plausible_symbol.return_value = True
+    mock_symbol_filter.is_known_invalid.return_value = False
+    on_loop = []
+
+    def quote(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            on_loop.append(True)
+        except RuntimeError:
+            on_loop.append(False)
+        return {
+            "price": 190.0,
+            "is_stale": False,
+            "last_updated": datetime(2024, 3, 1, tzinfo=timezone.utc),
+        }
+
+    mock_get_quote.side_effect = quote
+
+    response = client.get(PRICE_URL)
+
+    assert response.status_code == 200
+    assert on_loop == [False]
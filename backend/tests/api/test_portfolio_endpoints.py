@@ -8,7 +8,9 @@ from datetime import datetime, timezone
 from main import app
 from app import models
 from app.core.config import settings
+from app.core.deadline import DEADLINE_HEADER, current_deadline
 from app.models.asset import AssetType
+from app.services import portfolio_valuation
 from app.auth.dependencies import (
     get_current_active_user,
     get_db,
@@ -325,3 +327,56 @@ def test_view_user_portfolio_summary_price_fetch_fails(
             limit=100,
         )
         mock_fetch_price.assert_called_once_with("AAPL")
+
+
+def test_view_user_portfolio_summary_in_a_base_currency(
+    client_with_auth_override: TestClient,
+):
+    client = client_with_auth_override
+    with patch(
+        "app.api.endpoints.portfolio.crud.get_portfolio_holdings_by_user",
+        return_value=[],
+    ), patch(
+        "app.api.endpoints.portfolio.portfolio_valuation.value_holdings",
+        wraps=portfolio_valuation.value_holdings,
+    ) as mock_value_holdings:
+        response = client.get(
+            f"{settings.API_V1_STR}/portfolio/holdings/",
+            params={"base_currency": "eur"},
+        )
+        rejected = client.get(
+            f"{settings.API_V1_STR}/portfolio/holdings/",
+            params={"base_currency": "euro"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["base_currency"] == "EUR"
+    mock_value_holdings.assert_called_once_with([], [], "eur")
+    assert rejected.status_code == 422
+
+
+def test_view_user_portfolio_summary_values_holdings_within_the_deadline(
+    client_with_auth_override: TestClient,
+):
+    client = client_with_auth_override
+    seen = {}
+    value_holdings_unpatched = portfolio_valuation.value_holdings
+
+    def value_holdings(db_holdings, prices, base_currency):
+        seen["deadline"] = current_deadline()
+        return value_holdings_unpatched(db_holdings, prices, base_currency)
+
+    with patch(
+        "app.api.endpoints.portfolio.crud.get_portfolio_holdings_by_user",
+        return_value=[],
+    ), patch(
+        "app.api.endpoints.portfolio.portfolio_valuation.value_holdings",
+        side_effect=value_holdings,
+    ):
+        response = client.get(
+            f"{settings.API_V1_STR}/portfolio/holdings/",
+            headers={DEADLINE_HEADER: "0.5"},
+        )
+
+    assert response.status_code == 200
+    assert seen["deadline"].budget == 0.5
@@ -0,0 +1,71 @@
+# backend/tests/benchmarks/test_benchmark_harness.py
+import pytest
+
+from app.cache import shared_cache
+from benchmarks import harness
+from benchmarks.run import load_benchmark_modules
+
+
+def test_compare_classifies_cases():
+    baseline = {
+        "a[1]": {"median_s": 1.0},
+        "b[1]": {"median_s": 1.0},
+        "c[1]": {"median_s": 1.0},
+        "gone[1]": {"median_s": 1.0},
+    }
+    current = {
+        "a[1]": {"median_s": 1.25},
+        "b[1]": {"median_s": 0.5},
+        "c[1]": {"median_s": 1.05},
+        "added[1]": {"median_s": 1.0},
+    }
+
+    verdicts = {
+        row["case"]: row["verdict"]
+        for row in harness.compare(baseline, current, threshold=0.10)
+    }
+
+    assert verdicts == {
+        "a[1]": "regression",
+        "b[1]": "improvement",
+        "c[1]": "unchanged",
+        "gone[1]": "missing",
+        "added[1]": "new",
+    }
+
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    harness.write_baseline(path, {"a[1]": {"median_s": 0.5}}, git_revision="abc")
+    assert harness.load_baseline(path) == {"a[1]": {"median_s": 0.5}}
+
+
+def test_time_callable_calibrates_loops():
+    calls = []
+    timing = harness.time_callable(lambda: calls.append(1), repeats=2, min_time=0.001)
+    assert timing["loops"] >= 1
+    assert len(calls) >= timing["loops"] * 2
+    assert timing["min_s"] <= timing["median_s"]
+
+
+@pytest.fixture(scope="module")
+def registered_benchmarks():
+    load_benchmark_modules()
+    return harness.get_benchmarks()
+
+
+def test_every_benchmark_runs_once_at_its_smallest_size(registered_benchmarks):
+    original_client = shared_cache.get_redis_client()
+    for bench in registered_benchmarks:
+        with harness._prepared(bench.factory(min(bench.sizes))) as func:
+            func()
+    # Benchmarks that swap in a stand-in client must put the real one back.
+    assert shared_cache.get_redis_client() is original_client
+    assert {bench.name for bench in registered_benchmarks} >= {
+        "orchestrator.deserialize_history_from_cache",
+        "yfinance.historical_postprocess",
+        "alpha_vantage.parse_stock_history",
+        "shared_cache.set_history",
+        "portfolio.summary_assembly",
+        "auth.jwt_decode",
+    }
@@ -0,0 +1,50 @@
+# backend/tests/benchmarks/test_import_profile.py
+from benchmarks import import_profile
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   pandas.core
+import time:      1000 |       1420 | pandas
+import time:        80 |         80 | json
+some unrelated stderr line
+"""
+
+
+def test_parse_importtime_reads_rows_and_depth():
+    rows = import_profile.parse_importtime(IMPORTTIME)
+
+    assert [(r["module"], r["depth"]) for r in rows] == [
+        ("_io", 2),
+        ("pandas.core", 1),
+        ("pandas", 0),
+        ("json", 0),
+    ]
+    assert rows[2]["self_us"] == 1000
+    assert rows[2]["cumulative_us"] == 1420
+
+
+def test_top_level_packages_sum_self_time():
+    rows = import_profile.parse_importtime(IMPORTTIME)
+
+    assert import_profile.top_level_packages(rows) == {
+        "_io": 120,
+        "pandas": 1300,
+        "json": 80,
+    }
+
+
+def test_render_flags_modules_that_should_be_absent():
+    profile = {
+        "module": "main",
+        "total_us": 1500,
+        "max_rss_mib": 50.0,
+        "imports": import_profile.parse_importtime(IMPORTTIME),
+        "loaded_modules": ["json", "pandas", "pandas.core"],
+    }
+
+    report = import_profile.render([profile], top=2, absent=["pandas", "yfinance"])
+
+    assert report.startswith("main:      1.5 ms to import")
+    assert "pandas: LOADED" in report
+    assert "yfinance: not loaded" in report
@@ -0,0 +1,127 @@
+# backend/tests/cache/test_bar_buffer.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.cache import bar_buffer
+from app.core.config import settings
+
+START = datetime(2024, 3, 1, 14, 30, tzinfo=timezone.utc)
+
+
+def _bar(minute: int, close: float = 100.0) -> dict:
+    return {
+        "timestamp": START + timedelta(minutes=minute),
+        "open": close,
+        "high": close + 0.5,
+        "low": close - 0.5,
+        "close": close,
+        "volume": 1200,
+    }
+
+
+class _ListRedis:
+    """The handful of list commands the buffer uses, kept in a dict."""
+
+    def __init__(self):
+        self.lists = {}
+        self.expiries = {}
+        self.strings = {}
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def lindex(self, key, index):
+        values = self.lists.get(key, [])
+        return values[index] if values else None
+
+    def lset(self, key, index, value):
+        self.lists[key][index] = value
+
+    def rpush(self, key, *values):
+        self.lists.setdefault(key, []).extend(values)
+
+    def ltrim(self, key, start, end):
+        self.lists[key] = self.lists.get(key, [])[start:]
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+    def expire(self, key, seconds):
+        self.expiries[key] = seconds
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+
+class _Pipeline:
+    def __init__(self, client):
+        self.client, self.calls = client, []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, n)(*a, **k) for n, a, k in self.calls]
+
+
+@pytest.fixture
+def client():
+    fake = _ListRedis()
+    with patch.object(bar_buffer, "get_redis_client", return_value=fake):
+        yield fake
+
+
+def test_bars_round_trip_in_under_a_hundred_bytes():
+    bar = _bar(0, close=43210.123456789)
+    encoded = bar_buffer.encode_bar(dict(bar, volume=123456789012))
+
+    assert len(encoded) < 100
+    assert bar_buffer.decode_bar(bar_buffer.encode_bar(bar)) == bar
+
+
+def test_buffer_keeps_only_the_newest_bars(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTRADAY_BUFFER_BARS", 3)
+    key = bar_buffer.buffer_key("AAPL_stock", "1m")
+
+    bar_buffer.replace_bars(key, [_bar(m) for m in range(5)])
+    assert [b["timestamp"] for b in bar_buffer.read_bars(key)] == [
+        _bar(m)["timestamp"] for m in (2, 3, 4)
+    ]
+
+    bar_buffer.append_bars(key, [_bar(5), _bar(6)])
+    assert len(client.lists[key]) == 3
+    assert bar_buffer.read_bars(key)[-1]["timestamp"] == _bar(6)["timestamp"]
+    assert client.expiries[key] == settings.INTRADAY_BUFFER_TTL_SECONDS
+
+
+def test_append_replaces_the_forming_bar_and_skips_older_ones(client):
+    key = bar_buffer.buffer_key("AAPL_stock", "1m")
+    bar_buffer.replace_bars(key, [_bar(0), _bar(1, close=100.0)])
+
+    bar_buffer.append_bars(key, [_bar(0, close=1.0), _bar(1, close=101.0), _bar(2)])
+
+    stored = bar_buffer.read_bars(key)
+    assert [b["close"] for b in stored] == [100.0, 101.0, 100.0]
+    assert stored == bar_buffer.merge_bars(
+        [_bar(0), _bar(1)], [_bar(0, close=1.0), _bar(1, close=101.0), _bar(2)]
+    )
+
+
+def test_refresh_is_claimed_once_per_window(client):
+    key = bar_buffer.buffer_key("AAPL_stock", "5m")
+
+    assert bar_buffer.claim_refresh(key, 60) is True
+    assert bar_buffer.claim_refresh(key, 60) is False
+
+
+def test_without_redis_there_is_no_buffer():
+    assert bar_buffer.read_bars("intraday:AAPL_stock:1m") is None
+    assert bar_buffer.claim_refresh("intraday:AAPL_stock:1m", 60) is True
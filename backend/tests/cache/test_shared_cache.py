@@ -0,0 +1,122 @@
+# backend/tests/cache/test_shared_cache.py
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from prometheus_client import REGISTRY
+
+from app.cache import shared_cache
+from app.core.config import settings
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+@pytest.fixture
+def lazy_client(monkeypatch):
+    """Drops the test-wide "no Redis" override and starts from no client."""
+    previous = shared_cache.use_redis_client(shared_cache._NO_OVERRIDE)
+    monkeypatch.setattr(shared_cache, "_client", None)
+    monkeypatch.setattr(
+        shared_cache, "_availability", {"failures": 0, "down_until": 0.0}
+    )
+    monkeypatch.setattr(shared_cache, "_read_timeouts", {"consecutive": 0})
+    yield
+    shared_cache.use_redis_client(previous)
+
+
+def test_client_is_created_once_on_first_use(lazy_client):
+    client = MagicMock()
+    with patch.object(shared_cache, "_create_client", return_value=client) as create:
+        assert shared_cache.get_redis_client() is client
+        assert shared_cache.get_redis_client() is client
+    create.assert_called_once()
+
+
+def test_unreachable_redis_fails_fast_then_backs_off(lazy_client, monkeypatch):
+    # Nothing listens on port 1: the connect is refused immediately.
+    monkeypatch.setattr(settings, "REDIS_PORT", 1)
+    failures = _sample("alphadash_redis_connection_failures_total")
+
+    assert shared_cache.get_shared_cache("price:AAPL_stock") is None
+
+    assert _sample("alphadash_redis_connection_failures_total") == failures + 1
+    assert _sample("alphadash_redis_available") == 0
+    assert shared_cache.get_redis_client() is None
+    first_backoff = shared_cache._availability["down_until"]
+
+    # Once the backoff ends the next call tries again, and waits twice as long.
+    shared_cache._availability["down_until"] = 0.0
+    assert shared_cache.get_redis_client() is not None
+    shared_cache.get_shared_cache("price:AAPL_stock")
+    assert shared_cache._availability["failures"] == 2
+    assert shared_cache._availability["down_until"] > first_backoff
+
+
+def test_backoff_is_capped(lazy_client, monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_RECONNECT_BACKOFF_MAX_SECONDS", 2.0)
+    with patch("app.cache.shared_cache.time.monotonic", return_value=100.0):
+        for _ in range(10):
+            shared_cache._availability["down_until"] = 0.0
+            shared_cache._mark_down(redis.exceptions.ConnectionError("refused"))
+    assert shared_cache._availability["down_until"] == 102.0
+
+
+def test_successful_connect_ends_the_backoff(lazy_client):
+    shared_cache._mark_down(redis.exceptions.ConnectionError("refused"))
+
+    shared_cache._mark_up()
+
+    assert shared_cache._availability == {"failures": 0, "down_until": 0.0}
+    assert _sample("alphadash_redis_available") == 1
+
+
+def test_a_slow_command_is_a_miss_not_an_outage(lazy_client):
+    connection = shared_cache._TrackedConnection()
+    timeout = redis.exceptions.TimeoutError("Timeout reading from socket")
+    with patch.object(
+        redis.Connection, "read_response", side_effect=[timeout, "OK", timeout]
+    ):
+        for _ in range(3):
+            try:
+                connection.read_response()
+            except redis.exceptions.TimeoutError:
+                pass
+    assert shared_cache._availability["failures"] == 0
+
+    with patch.object(redis.Connection, "read_response", side_effect=timeout):
+        for _ in range(shared_cache.READ_TIMEOUTS_BEFORE_DOWN):
+            with pytest.raises(redis.exceptions.TimeoutError):
+                connection.read_response()
+    assert shared_cache._availability["failures"] == 1
+    assert shared_cache.get_redis_client() is None
+
+
+class _StubConnection:
+    def __init__(self, **_):
+        self.pid = None
+
+    def connect(self):
+        pass
+
+    def can_read(self):
+        return False
+
+    def disconnect(self):
+        pass
+
+
+def test_pool_reports_connections_in_use():
+    pool = shared_cache._InstrumentedPool(
+        connection_class=_StubConnection, max_connections=3
+    )
+    in_use = _sample("alphadash_redis_pool_connections_in_use")
+
+    first, second = pool.get_connection(), pool.get_connection()
+    assert _sample("alphadash_redis_pool_connections_in_use") == in_use + 2
+    assert _sample("alphadash_redis_pool_max_connections") == 3
+
+    pool.release(first)
+    pool.release(second)
+    assert _sample("alphadash_redis_pool_connections_in_use") == in_use
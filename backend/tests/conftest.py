@@ -1,6 +1,11 @@
 # backend/tests/conftest.py
+from unittest.mock import MagicMock
+
 import pytest
 
+from app.cache import shared_cache
+from app.services import corporate_actions, instruments
+
 
 @pytest.fixture(autouse=True)  # autouse=True makes it apply to all tests in the session
 def override_settings(monkeypatch):
@@ -19,6 +24,8 @@ def override_settings(monkeypatch):
     )
     monkeypatch.setattr("app.core.config.settings.ALGORITHM", "HS256")  # Clean value
     monkeypatch.setattr("app.core.config.settings.ACCESS_TOKEN_EXPIRE_MINUTES", 30)
+    # Keep every sampled log line, so tests can assert on them.
+    monkeypatch.setattr("app.core.config.settings.LOG_SAMPLE_RATES", {})
 
     # If settings are used in other modules imported by tests, you might need to patch them there too,
     # or ensure this conftest.py is loaded before those modules try to access settings.
@@ -27,3 +34,32 @@ def override_settings(monkeypatch):
 
     # It's generally best to patch where the setting is *used* or its source.
     # Patching app.core.config.settings should be effective if other modules import it.
+
+
+@pytest.fixture(autouse=True)
+def isolated_instruments(monkeypatch):
+    """
+    Starts each test with no resolved instruments and an assets table that
+    knows no symbols, so resolution never reaches a real database.
+    """
+    instruments.forget()
+    monkeypatch.setattr(instruments, "SessionLocal", MagicMock())
+    yield
+    instruments.forget()
+
+
+@pytest.fixture(autouse=True)
+def isolated_corporate_actions(monkeypatch):
+    """Starts each test with an empty corporate_actions table."""
+    corporate_actions.forget()
+    monkeypatch.setattr(corporate_actions, "SessionLocal", MagicMock())
+    yield
+    corporate_actions.forget()
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Tests run without Redis unless they patch get_redis_client themselves."""
+    previous = shared_cache.use_redis_client(None)
+    yield
+    shared_cache.use_redis_client(previous)
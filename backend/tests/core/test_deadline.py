@@ -0,0 +1,62 @@
+# backend/tests/core/test_deadline.py
+import time
+from unittest.mock import MagicMock
+
+from app.core import deadline as deadline_module
+from app.core.config import settings
+from app.core.deadline import (
+    Deadline,
+    current_deadline,
+    deadline_scope,
+    provider_timeout,
+    request_deadline,
+)
+
+
+def test_deadline_counts_down():
+    deadline = Deadline(0.05)
+    assert 0 < deadline.remaining() <= 0.05
+    assert deadline.timeout(cap=0.01) == 0.01
+    time.sleep(0.06)
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+
+
+def test_deadline_scope_keeps_the_earlier_deadline():
+    outer = Deadline(1.0)
+    with deadline_scope(outer):
+        with deadline_scope(Deadline(10.0)) as inner:
+            assert inner is outer
+        tighter = Deadline(0.5)
+        with deadline_scope(tighter) as inner:
+            assert inner is tighter
+        with deadline_scope(None) as inner:
+            assert inner is outer
+    assert current_deadline() is None
+
+
+def test_provider_timeout_uses_remaining_budget():
+    assert provider_timeout() == settings.MARKET_DATA_PROVIDER_TIMEOUT_SECONDS
+    with deadline_scope(Deadline(0.5)):
+        assert provider_timeout() <= 0.5
+
+
+def test_request_deadline_honours_client_header_up_to_endpoint_default():
+    dependency = request_deadline(3.0)
+
+    def request_with(headers):
+        request = MagicMock()
+        request.headers = headers
+        return request
+
+    assert dependency(request_with({})).budget == 3.0
+    assert (
+        dependency(request_with({deadline_module.DEADLINE_HEADER: "1.5"})).budget == 1.5
+    )
+    assert (
+        dependency(request_with({deadline_module.DEADLINE_HEADER: "60"})).budget == 3.0
+    )
+    assert (
+        dependency(request_with({deadline_module.DEADLINE_HEADER: "soon"})).budget
+        == 3.0
+    )
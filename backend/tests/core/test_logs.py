@@ -0,0 +1,109 @@
+# backend/tests/core/test_logs.py
+import io
+import json
+import logging
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from app.core import logs, tracing
+from app.core.config import settings
+
+
+def _record(level=logging.INFO, msg="Price for %s is %s", args=("AAPL", 1.5), **extra):
+    record = logging.makeLogRecord(
+        {"name": "app.test", "levelno": level, "msg": msg, "args": args}
+    )
+    record.levelname = logging.getLevelName(level)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampled_keeps_unrated_families_and_full_rates():
+    with patch.object(
+        settings, "LOG_SAMPLE_RATES", {"cache": 0.0, "price_refresh": 1.0}
+    ):
+        assert logs.sampled("cache") is False
+        assert logs.sampled("price_refresh") is True
+        assert logs.sampled("unrated") is True
+
+
+def test_sampled_keeps_roughly_the_configured_fraction():
+    with patch.object(settings, "LOG_SAMPLE_RATES", {"cache": 0.25}), patch(
+        "app.core.logs.random.random", side_effect=[0.1, 0.3, 0.2, 0.9]
+    ):
+        kept = [logs.sampled("cache") for _ in range(4)]
+    assert kept == [True, False, True, False]
+
+
+def test_json_formatter_includes_extra_fields():
+    line = logs.JsonFormatter().format(_record(family="cache", trace_id="ab" * 16))
+
+    entry = json.loads(line)
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "app.test"
+    assert entry["message"] == "Price for AAPL is 1.5"
+    assert entry["family"] == "cache"
+    assert entry["trace_id"] == "ab" * 16
+
+
+def test_queue_handler_resolves_message_and_drops_when_full():
+    log_queue = queue.SimpleQueue()
+    handler = logs.NonBlockingQueueHandler(log_queue, max_size=1)
+    args = ["AAPL"]
+
+    handler.handle(_record(msg="Refreshing %s", args=(args,)))
+    args.append("MSFT")  # later mutation must not change the logged text
+    handler.handle(_record())
+
+    assert log_queue.qsize() == 1
+    assert handler.dropped == 1
+    assert log_queue.get_nowait().getMessage() == "Refreshing ['AAPL']"
+
+
+def test_queue_handler_stamps_the_current_trace():
+    log_queue = queue.SimpleQueue()
+    handler = logs.NonBlockingQueueHandler(log_queue, max_size=10)
+    with patch.object(settings, "TRACING_EXPORTER", "console"), patch.object(
+        settings, "TRACING_SAMPLE_RATE", 1.0
+    ), patch.object(tracing, "_export"):
+        with tracing.span("request") as request_span:
+            handler.handle(_record())
+
+    record = log_queue.get_nowait()
+    assert record.trace_id == request_span.trace_id
+    assert record.span_id == request_span.span_id
+
+
+@pytest.fixture
+def restored_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield root
+    logs.shutdown_logging()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def test_configure_logging_writes_through_the_listener(restored_root_logger):
+    stdout = io.StringIO()
+    with patch.object(settings, "LOG_FORMAT", "json"), patch.object(
+        settings, "LOG_SAMPLE_RATES", {"cache": 0.0}
+    ), patch("sys.stdout", stdout):
+        logs.configure_logging()
+        logs.configure_logging()  # idempotent
+
+        logger = logging.getLogger("app.tests.logs")
+        logger.info("Kept %s", "record")
+        if logs.sampled("cache"):
+            logger.info("Sampled out", extra={"family": "cache"})
+        logger.debug("Below LOG_LEVEL")
+        logs.shutdown_logging()
+
+    lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["Kept record"]
+    assert len(restored_root_logger.handlers) == 1
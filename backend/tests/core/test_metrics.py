@@ -0,0 +1,108 @@
+# backend/tests/core/test_metrics.py
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from app.cache import shared_cache
+from app.core import metrics
+from app.services.data_providers import registry
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_cache_key_family():
+    assert metrics.cache_key_family("price:AAPL") == "price"
+    assert metrics.cache_key_family("history:AAPL:compact") == "history"
+    assert metrics.cache_key_family("no_prefix") == "other"
+
+
+def test_middleware_labels_requests_by_route_template():
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        return {"id": item_id}
+
+    client = TestClient(app)
+    name = "alphadash_http_request_duration_seconds_count"
+    before = _sample(name, method="GET", route="/items/{item_id}", status="200")
+    unmatched_before = _sample(name, method="GET", route="unmatched", status="404")
+
+    assert client.get("/items/1").status_code == 200
+    assert client.get("/items/2").status_code == 200
+    assert client.get("/nowhere").status_code == 404
+
+    assert _sample(name, method="GET", route="/items/{item_id}", status="200") == (
+        before + 2
+    )
+    assert _sample(name, method="GET", route="unmatched", status="404") == (
+        unmatched_before + 1
+    )
+
+
+def test_metrics_endpoint_exposes_prometheus_text():
+    from main import app
+
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "alphadash_cache_requests_total" in response.text
+
+
+@pytest.fixture
+def mock_redis_client():
+    client = MagicMock()
+    with patch.object(shared_cache, "get_redis_client", return_value=client):
+        yield client
+
+
+def test_cache_lookups_are_counted_by_family(mock_redis_client: MagicMock):
+    name = "alphadash_cache_requests_total"
+    hits = _sample(name, family="price", result="hit")
+    misses = _sample(name, family="price", result="miss")
+    mock_redis_client.get.side_effect = ["187.5", None]
+    mock_redis_client.mget.return_value = ["1.0", None]
+
+    shared_cache.get_shared_cache("price:AAPL")
+    shared_cache.get_shared_cache("price:MSFT")
+    shared_cache.get_many_shared_cache(["price:AAPL", "price:MSFT"])
+
+    assert _sample(name, family="price", result="hit") == hits + 2
+    assert _sample(name, family="price", result="miss") == misses + 2
+
+
+@patch("app.services.data_providers.registry.note_provider_call")
+def test_counted_call_records_provider_outcomes(mock_note_call: MagicMock):
+    provider = MagicMock()
+    provider.name = "metrics_stub"
+
+    def fetch_current_price(symbol, asset_type):
+        return {"AAPL": 1.0}.get(symbol)
+
+    def fetch_historical_data(symbol, asset_type, outputsize):
+        raise RuntimeError("boom")
+
+    name = "alphadash_provider_request_duration_seconds_count"
+    registry.counted_call(provider, fetch_current_price, "AAPL", "stock")()
+    registry.counted_call(provider, fetch_current_price, "NOPE", "stock")()
+    with pytest.raises(RuntimeError):
+        registry.counted_call(
+            provider, fetch_historical_data, "AAPL", "stock", "compact"
+        )()
+
+    labels = {"provider": "metrics_stub", "operation": "current_price"}
+    assert _sample(name, outcome="success", **labels) == 1
+    assert _sample(name, outcome="empty", **labels) == 1
+    assert (
+        _sample(
+            name, provider="metrics_stub", operation="historical_data", outcome="error"
+        )
+        == 1
+    )
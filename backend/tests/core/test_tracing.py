@@ -0,0 +1,142 @@
+# backend/tests/core/test_tracing.py
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import celery_app, tracing
+from app.core.config import settings
+
+REMOTE_TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+@pytest.fixture
+def exported():
+    """Turns tracing on at full sampling and collects exported spans."""
+    spans = []
+    with patch.object(settings, "TRACING_EXPORTER", "console"), patch.object(
+        settings, "TRACING_SAMPLE_RATE", 1.0
+    ), patch.object(tracing, "_export", spans.append):
+        yield spans
+
+
+def test_parse_traceparent():
+    parent = tracing.parse_traceparent(REMOTE_TRACEPARENT)
+    assert parent.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert parent.span_id == "00f067aa0ba902b7"
+    assert parent.sampled is True
+    assert parent.traceparent == REMOTE_TRACEPARENT
+    assert tracing.parse_traceparent("not-a-traceparent") is None
+    assert tracing.parse_traceparent(None) is None
+
+
+def test_tracing_is_off_without_an_exporter():
+    with patch.object(settings, "TRACING_EXPORTER", None):
+        assert tracing.start_span("anything") is None
+        with tracing.span("anything") as active:
+            assert active is None
+
+
+def test_nested_spans_share_the_trace(exported):
+    with tracing.span("parent") as parent:
+        with tracing.span("child") as child:
+            headers = {}
+            tracing.inject(headers)
+
+    assert child.trace_id == parent.trace_id
+    assert child.parent_id == parent.span_id
+    assert headers == {"traceparent": child.traceparent}
+    assert [s.name for s in exported] == ["child", "parent"]
+    assert tracing.current_span() is None
+
+
+def test_unsampled_traces_export_nothing(exported):
+    with patch.object(settings, "TRACING_SAMPLE_RATE", 0.000001), patch(
+        "app.core.tracing.random.random", return_value=0.5
+    ):
+        with tracing.span("root") as root:
+            with tracing.span("child") as child:
+                pass
+
+    assert root.sampled is False
+    assert child is root
+    assert exported == []
+
+
+def test_span_records_exceptions(exported):
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError("bad input")
+    assert exported[0].error == "ValueError: bad input"
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    finished = tracing.Span("op", "a" * 32, None, sampled=True)
+    finished.end_ns = finished.start_ns + 5000
+
+    with patch.object(settings, "TRACING_EXPORTER", "file"), patch.object(
+        settings, "TRACING_FILE_PATH", str(path)
+    ):
+        tracing._SpanExporter().export([finished])
+
+    record = json.loads(path.read_text().strip())
+    assert record["name"] == "op"
+    assert record["trace_id"] == "a" * 32
+    assert record["duration_us"] == 5
+
+
+def test_to_zipkin_maps_fields():
+    finished = tracing.Span("GET", "b" * 32, "c" * 16, True, kind="server")
+    finished.set_attribute("http.status_code", 200)
+    finished.end()
+
+    record = tracing.to_zipkin(finished)
+
+    assert record["traceId"] == "b" * 32
+    assert record["parentId"] == "c" * 16
+    assert record["kind"] == "SERVER"
+    assert record["tags"] == {"http.status_code": "200"}
+
+
+def test_middleware_continues_the_callers_trace(exported):
+    app = FastAPI()
+    app.add_middleware(tracing.TracingMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        return {"trace_id": tracing.current_span().trace_id}
+
+    response = TestClient(app).get(
+        "/items/1", headers={"traceparent": REMOTE_TRACEPARENT}
+    )
+
+    assert response.json()["trace_id"] == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert response.headers["traceparent"].startswith(
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-"
+    )
+    server_span = exported[-1]
+    assert server_span.name == "HTTP GET /items/{item_id}"
+    assert server_span.parent_id == "00f067aa0ba902b7"
+    assert server_span.attributes["http.status_code"] == 200
+
+
+def test_celery_task_continues_the_publishers_trace(exported):
+    headers = {}
+    with tracing.span("request") as request_span:
+        celery_app._propagate_trace(headers=headers)
+
+    task = MagicMock()
+    task.name = "app.tasks.example"
+    task.request.traceparent = headers["traceparent"]
+    celery_app._start_task_timer(task_id="t-1", task=task)
+    assert tracing.current_span().trace_id == request_span.trace_id
+    celery_app._observe_task_duration(task_id="t-1", task=task, state="SUCCESS")
+
+    task_span = exported[-1]
+    assert task_span.name == "celery.task app.tasks.example"
+    assert task_span.parent_id == request_span.span_id
+    assert task_span.attributes["celery.state"] == "SUCCESS"
+    assert tracing.current_span() is None
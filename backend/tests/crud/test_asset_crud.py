@@ -204,3 +204,35 @@ def test_update_asset_last_price_timestamp(mock_db_session: Session):
     mock_db_session.add.assert_called_once_with(mock_asset)
     mock_db_session.commit.assert_called_once()
     mock_db_session.refresh.assert_called_once_with(mock_asset)
+
+
+def test_bulk_create_assets_uses_on_conflict_do_nothing(mock_db_session: Session):
+    mock_db_session.execute.return_value.scalars.return_value.all.return_value = [
+        "AAPL"
+    ]
+    assets_in = [
+        schemas.AssetCreate(symbol="aapl", asset_type=AssetType.STOCK),
+        schemas.AssetCreate(symbol="MSFT", asset_type=AssetType.STOCK),
+    ]
+
+    created = crud.bulk_create_assets(db=mock_db_session, assets_in=assets_in)
+
+    assert created == ["AAPL"]
+    mock_db_session.execute.assert_called_once()
+    compiled = str(mock_db_session.execute.call_args[0][0].compile())
+    assert "ON CONFLICT (symbol) DO NOTHING" in compiled
+    assert "RETURNING assets.symbol" in compiled
+    mock_db_session.commit.assert_called_once()
+
+
+def test_bulk_create_assets_chunks_statements(mock_db_session: Session):
+    mock_db_session.execute.return_value.scalars.return_value.all.return_value = []
+    assets_in = [
+        schemas.AssetCreate(symbol=f"SYM{i}", asset_type=AssetType.STOCK)
+        for i in range(5)
+    ]
+
+    crud.bulk_create_assets(db=mock_db_session, assets_in=assets_in, chunk_size=2)
+
+    assert mock_db_session.execute.call_count == 3
+    mock_db_session.commit.assert_called_once()
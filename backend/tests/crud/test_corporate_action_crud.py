@@ -0,0 +1,56 @@
+# backend/tests/crud/test_corporate_action_crud.py
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from app import crud, schemas
+from app.models.corporate_action import CorporateActionType
+
+
+def test_get_corporate_action_map_groups_actions_by_symbol():
+    db = MagicMock(spec=Session)
+    db.query.return_value.join.return_value.order_by.return_value.all.return_value = [
+        ("aapl", CorporateActionType.DIVIDEND, date(2020, 8, 7), 0.82),
+        ("AAPL", CorporateActionType.SPLIT, date(2020, 8, 31), 4.0),
+        ("NVDA", CorporateActionType.SPLIT, date(2024, 6, 10), 10.0),
+    ]
+
+    mapping = crud.get_corporate_action_map(db)
+
+    assert mapping == {
+        "AAPL": [
+            ("dividend", date(2020, 8, 7), 0.82),
+            ("split", date(2020, 8, 31), 4.0),
+        ],
+        "NVDA": [("split", date(2024, 6, 10), 10.0)],
+    }
+
+
+def test_add_corporate_actions_skips_known_ones_and_returns_new_rows():
+    db = MagicMock(spec=Session)
+    inserted = [MagicMock(asset_id=3)]
+    db.execute.return_value.scalars.return_value.all.return_value = inserted
+
+    result = crud.add_corporate_actions(
+        db,
+        asset_id=3,
+        actions=[
+            schemas.CorporateActionCreate(
+                action_type="split", ex_date=date(2020, 8, 31), value=4.0
+            )
+        ],
+        source="yfinance",
+    )
+
+    assert result == inserted
+    statement = str(db.execute.call_args.args[0])
+    assert "ON CONFLICT ON CONSTRAINT _asset_action_ex_date_uc DO NOTHING" in statement
+    db.commit.assert_called_once()
+
+
+def test_add_corporate_actions_without_actions_is_noop():
+    db = MagicMock(spec=Session)
+
+    assert crud.add_corporate_actions(db, asset_id=3, actions=[]) == []
+    db.execute.assert_not_called()
@@ -391,3 +391,39 @@ def test_get_user_aggregated_asset_summary_multiple_distinct_assets(
     mock_db_session.query.return_value.join.return_value.filter.assert_called()
     mock_db_session.query.return_value.join.return_value.filter.return_value.group_by.assert_called()
     mock_db_session.query.return_value.join.return_value.filter.return_value.group_by.return_value.order_by.assert_called()
+
+
+def test_bulk_create_portfolio_holdings(mock_db_session: Session):
+    purchase_dt = datetime.now(timezone.utc)
+    holdings_in = [
+        {
+            "asset_id": 1,
+            "quantity": 2.0,
+            "purchase_price": 10.0,
+            "purchase_date": purchase_dt,
+        },
+        {
+            "asset_id": 2,
+            "quantity": 3.0,
+            "purchase_price": 20.0,
+            "purchase_date": purchase_dt,
+        },
+    ]
+
+    inserted = crud.bulk_create_portfolio_holdings(
+        db=mock_db_session, holdings_in=holdings_in, user_id=7
+    )
+
+    assert inserted == 2
+    mock_db_session.execute.assert_called_once()
+    rows = mock_db_session.execute.call_args[0][1]
+    assert [r["user_id"] for r in rows] == [7, 7]
+    mock_db_session.commit.assert_called_once()
+
+
+def test_bulk_create_portfolio_holdings_empty(mock_db_session: Session):
+    assert (
+        crud.bulk_create_portfolio_holdings(mock_db_session, holdings_in=[], user_id=1)
+        == 0
+    )
+    mock_db_session.execute.assert_not_called()
@@ -0,0 +1,55 @@
+# backend/tests/crud/test_price_alert_crud.py
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.models.price_alert import AlertCondition
+
+
+def test_create_price_alert_sets_owner_and_reference_price():
+    db = MagicMock(spec=Session)
+    alert_in = schemas.PriceAlertCreate(
+        asset_id=3, condition=AlertCondition.PERCENT_MOVE, threshold=5.0
+    )
+
+    alert = crud.create_price_alert(
+        db, alert_in=alert_in, user_id=9, reference_price=120.0
+    )
+
+    assert isinstance(alert, models.PriceAlert)
+    assert alert.user_id == 9
+    assert alert.reference_price == 120.0
+    assert alert.is_active is True
+    db.add.assert_called_once_with(alert)
+    db.commit.assert_called_once()
+
+
+def test_mark_price_alerts_triggered_returns_rows_actually_updated():
+    db = MagicMock(spec=Session)
+    row = MagicMock(id=4, user_id=2)
+    db.execute.return_value.all.return_value = [row]
+
+    triggered = crud.mark_price_alerts_triggered(
+        db,
+        alert_ids=[4, 5],
+        price=101.0,
+        triggered_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+    )
+
+    assert triggered == [(4, 2)]
+    db.execute.assert_called_once()
+    db.commit.assert_called_once()
+
+
+def test_mark_price_alerts_triggered_empty_is_noop():
+    db = MagicMock(spec=Session)
+
+    assert (
+        crud.mark_price_alerts_triggered(
+            db, alert_ids=[], price=1.0, triggered_at=datetime.now(timezone.utc)
+        )
+        == []
+    )
+    db.execute.assert_not_called()
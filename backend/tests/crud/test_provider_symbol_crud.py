@@ -0,0 +1,47 @@
+# backend/tests/crud/test_provider_symbol_crud.py
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from app import crud
+
+
+def test_get_provider_symbol_map_groups_tickers_by_symbol():
+    db = MagicMock(spec=Session)
+    db.query.return_value.join.return_value.all.return_value = [
+        ("matic", "yfinance", "POL-USD"),
+        ("MATIC", "alpha_vantage", "POL"),
+        ("BRK.B", "yfinance", "BRK-B"),
+    ]
+
+    mapping = crud.get_provider_symbol_map(db)
+
+    assert mapping == {
+        "MATIC": {"yfinance": "POL-USD", "alpha_vantage": "POL"},
+        "BRK.B": {"yfinance": "BRK-B"},
+    }
+    db.query.assert_called_once()
+
+
+def test_set_provider_symbol_upserts_and_commits():
+    db = MagicMock(spec=Session)
+    stored = MagicMock(asset_id=3, provider="yfinance", ticker="POL-USD")
+    db.execute.return_value.scalars.return_value.one.return_value = stored
+
+    result = crud.set_provider_symbol(
+        db, asset_id=3, provider="yfinance", ticker="POL-USD"
+    )
+
+    assert result is stored
+    statement = str(db.execute.call_args.args[0])
+    assert "ON CONFLICT ON CONSTRAINT _asset_provider_uc DO UPDATE" in statement
+    db.commit.assert_called_once()
+
+
+def test_remove_provider_symbol_missing_is_noop():
+    db = MagicMock(spec=Session)
+    db.query.return_value.filter.return_value.first.return_value = None
+
+    assert crud.remove_provider_symbol(db, asset_id=3, provider="yfinance") is None
+    db.delete.assert_not_called()
+    db.commit.assert_not_called()
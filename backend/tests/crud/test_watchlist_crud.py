@@ -210,3 +210,30 @@ def test_remove_asset_from_watchlist_item_not_found(mock_db_session: Session):
         )
         mock_db_session.delete.assert_not_called()
         mock_db_session.commit.assert_not_called()
+
+
+def test_get_user_tracked_assets(mock_db_session: Session):
+    mock_db_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = [
+        MagicMock(symbol="AAPL", asset_type=AssetType.STOCK),
+        MagicMock(symbol="BTC", asset_type=AssetType.CRYPTO),
+    ]
+
+    tracked = crud.get_user_tracked_assets(db=mock_db_session, user_id=1)
+
+    assert tracked == [("AAPL", "stock"), ("BTC", "crypto")]
+    mock_db_session.query.assert_called_once_with(
+        models.Asset.symbol, models.Asset.asset_type
+    )
+
+
+def test_get_tracked_assets_by_popularity(mock_db_session: Session):
+    query = mock_db_session.query.return_value.join.return_value.group_by.return_value
+    query.order_by.return_value.limit.return_value.all.return_value = [
+        MagicMock(symbol="AAPL", asset_type=AssetType.STOCK),
+        MagicMock(symbol="BTC", asset_type=AssetType.CRYPTO),
+    ]
+
+    popular = crud.get_tracked_assets_by_popularity(db=mock_db_session, limit=2)
+
+    assert popular == [("AAPL", "stock"), ("BTC", "crypto")]
+    query.order_by.return_value.limit.assert_called_once_with(2)
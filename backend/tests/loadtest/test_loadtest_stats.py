@@ -0,0 +1,75 @@
+# backend/tests/loadtest/test_loadtest_stats.py
+import random
+
+import pytest
+
+from loadtest import scenarios, stats
+
+
+def test_percentile_nearest_rank():
+    values = sorted(float(v) for v in range(1, 101))
+    assert stats.percentile(values, 50) == 50.0
+    assert stats.percentile(values, 99) == 99.0
+    assert stats.percentile([], 95) is None
+
+
+def test_summarize_attributes_backend_calls_per_endpoint():
+    counters = stats.CallCounters()
+    recorder = stats.LatencyRecorder()
+
+    token = stats.current_endpoint.set("GET /watchlist/items/")
+    counters.increment("db_queries", 2)
+    counters.increment("redis_calls")
+    stats.current_endpoint.reset(token)
+    counters.increment("redis_calls")  # outside any request
+    recorder.record("GET /watchlist/items/", 0.010, 200)
+    recorder.record("GET /watchlist/items/", 0.030, 500)
+
+    summary = recorder.summarize(elapsed_seconds=2.0, counters=counters)
+
+    watchlist = summary["endpoints"]["GET /watchlist/items/"]
+    assert watchlist["requests"] == 2
+    assert watchlist["errors"] == 1
+    assert watchlist["throughput_rps"] == 1.0
+    assert watchlist["p50_ms"] == 10.0
+    assert watchlist["db_queries_per_request"] == 1.0
+    assert watchlist["redis_calls_per_request"] == 0.5
+    assert watchlist["status_codes"] == {"200": 1, "500": 1}
+    assert summary["totals"]["redis_calls"] == 2
+    assert summary["totals"]["unattributed_redis_calls"] == 1
+
+
+def test_compare_results_reports_relative_change():
+    baseline = {
+        "endpoints": {"GET /x": {"p95_ms": 100.0, "throughput_rps": 50.0}},
+        "totals": {"p95_ms": 100.0},
+    }
+    current = {
+        "endpoints": {"GET /x": {"p95_ms": 80.0, "throughput_rps": 60.0}},
+        "totals": {"p95_ms": 120.0},
+    }
+
+    comparison = stats.compare_results(baseline, current)
+
+    assert comparison["GET /x"]["p95_ms"]["change_pct"] == -20.0
+    assert comparison["GET /x"]["throughput_rps"]["change_pct"] == 20.0
+    assert comparison["(total)"]["p95_ms"]["change_pct"] == 20.0
+
+
+def test_parse_mix_overrides_defaults_and_validates():
+    mix = scenarios.parse_mix("price=50, token=0")
+    assert mix["price"] == 50
+    assert mix["token"] == 0
+    assert mix["holdings"] == scenarios.DEFAULT_MIX["holdings"]
+
+    with pytest.raises(ValueError):
+        scenarios.parse_mix("nonsense=1")
+    with pytest.raises(ValueError):
+        scenarios.parse_mix(",".join(f"{name}=0" for name in scenarios.SCENARIOS))
+
+
+def test_universe_pick_favours_popular_symbols():
+    universe = scenarios.Universe([f"S{i}" for i in range(50)], skew=1.0)
+    rng = random.Random(1)
+    picks = [universe.pick(rng) for _ in range(2000)]
+    assert picks.count("S0") > picks.count("S49") * 5
@@ -94,18 +94,17 @@ def test_fetch_av_stock_current_price_success(requests_mock):
     assert price == expected_price
 
 
-def test_fetch_av_stock_current_price_api_note(requests_mock, capsys):
+def test_fetch_av_stock_current_price_api_note(requests_mock, caplog):
     symbol = "IBM"
     url = f"{MOCK_AV_BASE_URL}?apikey={settings.ALPHA_VANTAGE_API_KEY}&function=GLOBAL_QUOTE&symbol={symbol.upper()}"
     requests_mock.get(url, json=MOCK_AV_API_NOTE_RESPONSE)
 
     price = av_provider.fetch_av_stock_current_price(symbol)
     assert price is None
-    captured = capsys.readouterr()
-    assert "AV_PROVIDER API Note/Info" in captured.out
+    assert "API Note/Info" in caplog.text
 
 
-def test_fetch_av_stock_current_price_parsing_error(requests_mock, capsys):
+def test_fetch_av_stock_current_price_parsing_error(requests_mock, caplog):
     symbol = "BADPARSE"
     url = f"{MOCK_AV_BASE_URL}?apikey={settings.ALPHA_VANTAGE_API_KEY}&function=GLOBAL_QUOTE&symbol={symbol.upper()}"
     requests_mock.get(
@@ -114,8 +113,7 @@ def test_fetch_av_stock_current_price_parsing_error(requests_mock, capsys):
 
     price = av_provider.fetch_av_stock_current_price(symbol)
     assert price is None
-    captured = capsys.readouterr()
-    assert f"AV_PROVIDER Could not parse stock price for {symbol}" in captured.out
+    assert f"Could not parse stock price for {symbol}" in caplog.text
 
 
 # --- Tests for fetch_av_crypto_current_price ---
@@ -133,7 +131,7 @@ def test_fetch_av_crypto_current_price_success(requests_mock):
 
 
 def test_fetch_av_crypto_current_price_api_information(
-    requests_mock, capsys
+    requests_mock, caplog
 ):  # Test with "Information" key
     crypto_symbol = "ETH"
     market = "USD"
@@ -144,8 +142,7 @@ def test_fetch_av_crypto_current_price_api_information(
         crypto_symbol, market_currency=market
     )
     assert price is None
-    captured = capsys.readouterr()
-    assert "AV_PROVIDER API Note/Info" in captured.out
+    assert "API Note/Info" in caplog.text
 
 
 # --- Tests for fetch_av_stock_historical_data ---
@@ -162,7 +159,7 @@ def test_fetch_av_stock_historical_data_success(requests_mock):
     assert history[1]["close"] == 136.99
 
 
-def test_fetch_av_stock_historical_data_empty_series(requests_mock, capsys):
+def test_fetch_av_stock_historical_data_empty_series(requests_mock, caplog):
     symbol = "EMPTY"
     outputsize = "compact"
     url = f"{MOCK_AV_BASE_URL}?apikey={settings.ALPHA_VANTAGE_API_KEY}&function=TIME_SERIES_DAILY&symbol={symbol.upper()}&outputsize={outputsize}"
@@ -174,10 +171,9 @@ def test_fetch_av_stock_historical_data_empty_series(requests_mock, capsys):
     assert (
         history is None
     )  # Or [] depending on provider logic for truly empty series after parsing
-    captured = capsys.readouterr()
     # This depends on whether your provider returns None or [] for an empty but valid series object
     # If it returns None:
-    assert f"AV_PROVIDER Could not parse stock historical for {symbol}" in captured.out
+    assert f"Could not parse stock historical for {symbol}" in caplog.text
     # If it returns []:
     # assert history == []
 
@@ -201,23 +197,41 @@ def test_fetch_av_crypto_historical_data_success(requests_mock):
     assert history[1]["close"] == 1830.00
 
 
+# --- Tests for fetch_av_fx_history ---
+def test_fetch_av_fx_history_success(requests_mock):
+    url = f"{MOCK_AV_BASE_URL}?apikey={settings.ALPHA_VANTAGE_API_KEY}&function=FX_DAILY&from_symbol=EUR&to_symbol=USD&outputsize=full"
+    requests_mock.get(
+        url,
+        json={
+            "Time Series FX (Daily)": {
+                "2023-10-27": {"4. close": "1.0565"},
+                "2023-10-26": {"4. close": "1.0563"},
+                "2023-10-25": {"1. open": "1.0590"},  # malformed: no close
+            }
+        },
+    )
+
+    history = av_provider.fetch_av_fx_history("eur", "usd")
+    assert history == [
+        {"date": date(2023, 10, 26), "rate": 1.0563},
+        {"date": date(2023, 10, 27), "rate": 1.0565},
+    ]
+
+
 # --- General Provider Tests ---
-def test_av_provider_no_api_key(monkeypatch, capsys):
+def test_av_provider_no_api_key(monkeypatch, caplog):
     monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", None)  # Simulate no API key
 
     assert av_provider.fetch_av_stock_current_price("ANY") is None
     assert av_provider.fetch_av_crypto_current_price("ANY") is None
     assert av_provider.fetch_av_stock_historical_data("ANY") is None
     assert av_provider.fetch_av_crypto_historical_data("ANY") is None
-
-    captured = capsys.readouterr()
     assert (
-        captured.out.count("AV_PROVIDER Warning: ALPHA_VANTAGE_API_KEY not configured.")
-        >= 4
+        caplog.text.count("ALPHA_VANTAGE_API_KEY not configured.") >= 4
     )  # Check for multiple calls
 
 
-def test_av_provider_network_error(requests_mock, capsys):
+def test_av_provider_network_error(requests_mock, caplog):
     symbol = "NETERROR"
     # Any AV endpoint will do for this test
     url = f"{MOCK_AV_BASE_URL}?apikey={settings.ALPHA_VANTAGE_API_KEY}&function=GLOBAL_QUOTE&symbol={symbol.upper()}"
@@ -227,6 +241,5 @@ def test_av_provider_network_error(requests_mock, capsys):
 
     price = av_provider.fetch_av_stock_current_price(symbol)
     assert price is None
-    captured = capsys.readouterr()
-    assert "AV_PROVIDER Error fetching data" in captured.out
-    assert "Simulated network failure" in captured.out
+    assert "Error fetching data" in caplog.text
+    assert "Simulated network failure" in caplog.text
@@ -0,0 +1,98 @@
+# backend/tests/services/data_providers/test_cassette.py
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+import requests
+
+from app.core.config import settings
+from app.services.data_providers import cassette
+from app.services.data_providers.alpha_vantage_provider import _make_av_request
+from app.services.data_providers.yahoo_finance_provider import fetch_yf_current_price
+
+
+@pytest.fixture
+def cassette_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "cassette.jsonl.gz")
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_PATH", path)
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_REPLAY_SPEED", 0.0)
+    monkeypatch.setattr(cassette, "_recorder", None)
+    monkeypatch.setattr(cassette, "_player", None)
+    yield path
+    if cassette._recorder is not None:
+        cassette._recorder.close()
+
+
+def _record_then_replay(monkeypatch):
+    cassette.get_recorder().close()
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_MODE", cassette.MODE_REPLAY)
+
+
+def test_frame_round_trip_keeps_timezone():
+    index = pd.date_range("2024-01-02", periods=3, freq="D", tz="America/New_York")
+    frame = pd.DataFrame({"Close": [1.5, 2.5, float("nan")]}, index=index)
+
+    restored = cassette.decode_frame(cassette.encode_frame(frame))
+
+    assert str(restored.index.tz) == "America/New_York"
+    assert list(restored.index) == list(index)
+    assert restored["Close"].iloc[1] == 2.5
+    assert pd.isna(restored["Close"].iloc[2])
+
+
+def test_intercept_without_mode_calls_live(monkeypatch):
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_MODE", None)
+    live = MagicMock(return_value={"ok": True})
+
+    assert cassette.intercept("av_request", "k", live) == {"ok": True}
+    live.assert_called_once()
+
+
+def test_record_then_replay_serves_responses_in_order(cassette_path, monkeypatch):
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_MODE", cassette.MODE_RECORD)
+    cassette.intercept("av_request", "k", lambda: {"n": 1})
+    cassette.intercept("av_request", "k", lambda: {"n": 2})
+    with pytest.raises(ValueError):
+        cassette.intercept("av_request", "bad", MagicMock(side_effect=ValueError("x")))
+
+    _record_then_replay(monkeypatch)
+    live = MagicMock()
+    assert cassette.intercept("av_request", "k", live) == {"n": 1}
+    assert cassette.intercept("av_request", "k", live) == {"n": 2}
+    assert cassette.intercept("av_request", "k", live) == {"n": 2}
+    with pytest.raises(KeyError, match="ValueError: x"):
+        cassette.intercept("av_request", "bad", live, error_type=KeyError)
+    with pytest.raises(KeyError, match="No recording"):
+        cassette.intercept("av_request", "unknown", live, error_type=KeyError)
+    live.assert_not_called()
+    assert cassette.get_player().misses == 1
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.yf.Ticker")
+def test_yfinance_provider_replays_recorded_history(
+    mock_ticker, cassette_path, monkeypatch
+):
+    index = pd.date_range("2024-01-02", periods=2, freq="D", tz="UTC")
+    mock_ticker.return_value.history.return_value = pd.DataFrame(
+        {"Close": [101.0, 102.5]}, index=index
+    )
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_MODE", cassette.MODE_RECORD)
+    assert fetch_yf_current_price("AAPL", "stock") == 102.5
+
+    _record_then_replay(monkeypatch)
+    mock_ticker.return_value.history.reset_mock()
+    assert fetch_yf_current_price("AAPL", "stock") == 102.5
+    mock_ticker.return_value.history.assert_not_called()
+
+
+@patch("app.services.data_providers.alpha_vantage_provider.requests.get")
+def test_alpha_vantage_replays_recorded_error(mock_get, cassette_path, monkeypatch):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", "demo")
+    mock_get.side_effect = requests.exceptions.ConnectionError("boom")
+    monkeypatch.setattr(settings, "MARKET_DATA_CASSETTE_MODE", cassette.MODE_RECORD)
+    assert _make_av_request({"function": "GLOBAL_QUOTE", "symbol": "IBM"}) is None
+
+    _record_then_replay(monkeypatch)
+    mock_get.reset_mock()
+    assert _make_av_request({"function": "GLOBAL_QUOTE", "symbol": "IBM"}) is None
+    mock_get.assert_not_called()
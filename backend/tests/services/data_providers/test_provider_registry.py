@@ -0,0 +1,145 @@
+# backend/tests/services/data_providers/test_provider_registry.py
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.services.data_providers import registry
+from app.services.data_providers.alpha_vantage_provider import AlphaVantageProvider
+from app.services.data_providers.base import (
+    OPERATION_CURRENT_PRICE,
+    OPERATION_HISTORICAL_DATA,
+    MarketDataProvider,
+    ProviderCapabilities,
+)
+
+
+class _StubProvider(MarketDataProvider):
+    def __init__(self, name, priority=100, cost=0.0, per_minute=None, **caps):
+        self.name = name
+        self.priority = priority
+        self.cost_per_call = cost
+        self.rate_limit_per_minute = per_minute
+        self.capabilities = ProviderCapabilities(**caps)
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_providers", {})
+    monkeypatch.setattr(registry, "_lazy_providers", {})
+    monkeypatch.setattr(
+        settings,
+        "MARKET_DATA_PROVIDERS",
+        "pricey,cheap,stocks_only,quotes_only,limited,unlimited",
+    )
+    return registry
+
+
+def test_default_providers_are_registered():
+    assert {p.name for p in registry.get_providers()} >= {"yfinance", "alpha_vantage"}
+
+
+def test_plan_filters_by_capability_and_orders_by_priority_then_cost(
+    isolated_registry,
+):
+    isolated_registry.register_provider(_StubProvider("pricey", priority=10, cost=5))
+    isolated_registry.register_provider(_StubProvider("cheap", priority=10, cost=1))
+    isolated_registry.register_provider(
+        _StubProvider("stocks_only", priority=1, asset_types=frozenset({"stock"}))
+    )
+    isolated_registry.register_provider(
+        _StubProvider(
+            "quotes_only",
+            priority=1,
+            operations=frozenset({OPERATION_CURRENT_PRICE}),
+        )
+    )
+
+    crypto_history = isolated_registry.plan(OPERATION_HISTORICAL_DATA, "crypto")
+    stock_quotes = isolated_registry.plan(OPERATION_CURRENT_PRICE, "stock")
+
+    assert [p.name for p in crypto_history] == ["cheap", "pricey"]
+    assert [p.name for p in stock_quotes] == [
+        "stocks_only",
+        "quotes_only",
+        "cheap",
+        "pricey",
+    ]
+
+
+@patch("app.services.data_providers.registry.shared_cache")
+def test_plan_leaves_out_providers_over_rate_limit(
+    mock_shared_cache: MagicMock, isolated_registry
+):
+    isolated_registry.register_provider(_StubProvider("limited", per_minute=5))
+    isolated_registry.register_provider(_StubProvider("unlimited"))
+    mock_shared_cache.get_many_shared_cache.return_value = [5, 7]
+
+    plan = isolated_registry.plan(OPERATION_CURRENT_PRICE, "stock")
+
+    assert [p.name for p in plan] == ["unlimited"]
+
+
+def test_plan_only_uses_selected_providers(monkeypatch):
+    monkeypatch.setattr(settings, "MARKET_DATA_PROVIDERS", "synthetic")
+
+    plan = registry.plan(OPERATION_HISTORICAL_DATA, "crypto")
+
+    assert [p.name for p in plan] == ["synthetic"]
+
+
+def test_plan_skips_disabled_providers(monkeypatch):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", None)
+
+    names = [p.name for p in registry.plan(OPERATION_CURRENT_PRICE, "stock")]
+
+    assert "alpha_vantage" not in names
+
+
+@patch(
+    "app.services.data_providers.alpha_vantage_provider.fetch_av_crypto_current_price"
+)
+def test_alpha_vantage_adapter_maps_crypto_pairs_only_in_provider_symbol(
+    mock_fetch_crypto: MagicMock,
+):
+    mock_fetch_crypto.return_value = 42.0
+    provider = AlphaVantageProvider()
+
+    assert provider.provider_symbol("btcusdt", "crypto") == "BTC"
+    # Fetches take the ticker they are given, default or stored.
+    assert provider.fetch_current_price("POLUSD", "crypto") == 42.0
+    mock_fetch_crypto.assert_called_once_with("POLUSD")
+
+
+@patch("app.services.data_providers.registry.note_provider_call")
+def test_counted_call_counts_then_calls(mock_note_call: MagicMock):
+    provider = _StubProvider("stub")
+    method = MagicMock(return_value=1.5)
+
+    fetcher = registry.counted_call(provider, method, "AAPL", "stock")
+    mock_note_call.assert_not_called()
+
+    assert fetcher() == 1.5
+    mock_note_call.assert_called_once_with(provider)
+    method.assert_called_once_with("AAPL", "stock")
+
+
+def test_lazy_providers_are_imported_on_first_use(isolated_registry):
+    module = MagicMock()
+    module.Lazy.side_effect = lambda: _StubProvider("lazy")
+    isolated_registry.register_lazy_provider("lazy", "some.provider_module:Lazy")
+    isolated_registry.register_lazy_provider("other", "other.provider_module:Other")
+
+    with patch.object(
+        isolated_registry.importlib, "import_module", return_value=module
+    ) as import_module:
+        isolated_registry.enabled_provider_names()
+        import_module.assert_not_called()
+
+        assert isolated_registry.get_provider("lazy").name == "lazy"
+        assert isolated_registry.get_provider("lazy").name == "lazy"
+        import_module.assert_called_once_with("some.provider_module")
+        # Only configured providers are loaded when planning.
+        with patch.object(settings, "MARKET_DATA_PROVIDERS", "lazy"):
+            isolated_registry.plan(OPERATION_CURRENT_PRICE, "stock")
+        assert import_module.call_count == 1
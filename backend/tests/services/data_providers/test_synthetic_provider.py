@@ -0,0 +1,65 @@
+# backend/tests/services/data_providers/test_synthetic_provider.py
+from datetime import date
+
+from app.core.config import settings
+from app.services.data_providers import synthetic_provider
+from app.services.data_providers.synthetic_provider import SyntheticProvider
+
+
+def test_generate_history_is_deterministic_and_window_independent():
+    end = date(2024, 3, 1)
+    long_window = synthetic_provider.generate_history("AAPL", "stock", 100, end=end)
+    short_window = synthetic_provider.generate_history("aapl", "stock", 10, end=end)
+
+    assert long_window[-10:][0]["close"] == short_window[0]["close"]
+    assert [p["date"] for p in long_window[-10:]] == [p["date"] for p in short_window]
+    assert all(p["date"].weekday() < 5 for p in long_window)
+    for point in long_window:
+        assert point["low"] <= min(point["open"], point["close"])
+        assert point["high"] >= max(point["open"], point["close"])
+    assert long_window[18]["sma20"] is None and long_window[19]["sma20"] is not None
+
+
+def test_generate_history_differs_by_symbol_and_seed(monkeypatch):
+    end = date(2024, 3, 1)
+    aapl = synthetic_provider.generate_history("AAPL", "stock", 5, end=end)
+    msft = synthetic_provider.generate_history("MSFT", "stock", 5, end=end)
+    assert aapl != msft
+
+    monkeypatch.setattr(settings, "SYNTHETIC_PROVIDER_SEED", 7)
+    assert synthetic_provider.generate_history("AAPL", "stock", 5, end=end) != aapl
+
+
+def test_crypto_history_includes_weekends():
+    history = synthetic_provider.generate_history(
+        "BTC", "crypto", 7, end=date(2024, 3, 3)
+    )
+    assert len({p["date"].weekday() for p in history}) == 7
+
+
+def test_generate_quote_changes_per_bucket():
+    at = 1_700_000_000.0
+    assert synthetic_provider.generate_quote("AAPL", "stock", at=at) == (
+        synthetic_provider.generate_quote("AAPL", "stock", at=at + 1)
+    )
+    assert synthetic_provider.generate_quote("AAPL", "stock", at=at) != (
+        synthetic_provider.generate_quote("AAPL", "stock", at=at + 120)
+    )
+
+
+def test_provider_injects_errors_and_rate_limits(monkeypatch):
+    monkeypatch.setattr(settings, "SYNTHETIC_PROVIDER_ERROR_RATE", 1.0)
+    assert SyntheticProvider().fetch_current_price("AAPL", "stock") is None
+
+    monkeypatch.setattr(settings, "SYNTHETIC_PROVIDER_ERROR_RATE", 0.0)
+    monkeypatch.setattr(settings, "SYNTHETIC_PROVIDER_RATE_LIMIT_PER_MINUTE", 2)
+    provider = SyntheticProvider()
+    answers = [provider.fetch_current_price("AAPL", "stock") for _ in range(3)]
+    assert answers[0] is not None and answers[1] is not None
+    assert answers[2] is None
+
+
+def test_provider_batch_quotes():
+    quotes = SyntheticProvider().fetch_current_prices(["aapl", "msft"], "stock")
+    assert set(quotes) == {"AAPL", "MSFT"}
+    assert all(price > 0 for price in quotes.values())
@@ -2,7 +2,9 @@
 import pytest
 from unittest.mock import patch, MagicMock
 import pandas as pd
-from datetime import date
+from datetime import date, datetime, timezone
+
+from app.core.config import settings
 
 from app.services.data_providers import yahoo_finance_provider as yf_provider
 
@@ -27,7 +29,8 @@ def test_map_symbol_for_yfinance_stock():
 def test_map_symbol_for_yfinance_crypto():
     assert yf_provider._map_symbol_for_yfinance("BTC", "crypto") == "BTC-USD"
     assert yf_provider._map_symbol_for_yfinance("eth", "crypto") == "ETH-USD"
-    assert yf_provider._map_symbol_for_yfinance("XYZ", "crypto") == "XYZ"
+    assert yf_provider._map_symbol_for_yfinance("XYZ", "crypto") == "XYZ-USD"
+    assert yf_provider._map_symbol_for_yfinance("pepeusdt", "crypto") == "PEPE-USD"
 
 
 def test_map_symbol_for_yfinance_no_type():
@@ -50,7 +53,11 @@ def test_fetch_yf_current_price_from_history(mock_yf_ticker):
 
     price = yf_provider.fetch_yf_current_price("AAPL", asset_type="stock")
     assert price == 151.25
-    mock_ticker_instance.history.assert_called_once_with(period="5d", interval="1d")
+    mock_ticker_instance.history.assert_called_once_with(
+        period="5d",
+        interval="1d",
+        timeout=settings.MARKET_DATA_PROVIDER_TIMEOUT_SECONDS,
+    )
 
 
 def test_fetch_yf_current_price_from_info(mock_yf_ticker):
@@ -62,25 +69,23 @@ def test_fetch_yf_current_price_from_info(mock_yf_ticker):
     assert price == 175.50
 
 
-def test_fetch_yf_current_price_not_found(mock_yf_ticker, capsys):
+def test_fetch_yf_current_price_not_found(mock_yf_ticker, caplog):
     mock_ticker_instance, _ = mock_yf_ticker
     mock_ticker_instance.history.return_value = pd.DataFrame()
     mock_ticker_instance.info = {}
 
     price = yf_provider.fetch_yf_current_price("NONEXIST", asset_type="stock")
     assert price is None
-    captured = capsys.readouterr()
-    assert "YF_PROVIDER: Could not determine current price" in captured.out
+    assert "Could not determine current price" in caplog.text
 
 
-def test_fetch_yf_current_price_yfinance_exception(mock_yf_ticker, capsys):
+def test_fetch_yf_current_price_yfinance_exception(mock_yf_ticker, caplog):
     mock_ticker_instance, _ = mock_yf_ticker
     mock_ticker_instance.history.side_effect = Exception("yfinance API error")
 
     price = yf_provider.fetch_yf_current_price("ERROR", asset_type="stock")
     assert price is None
-    captured = capsys.readouterr()
-    assert "YF_PROVIDER: Error fetching current price" in captured.out
+    assert "Error fetching current price" in caplog.text
 
 
 def test_fetch_yf_historical_data_success(mock_yf_ticker):
@@ -106,17 +111,43 @@ def test_fetch_yf_historical_data_success(mock_yf_ticker):
     assert history[0]["close"] == 151.25
     assert history[1]["date"] == date(2023, 10, 27)
     assert history[1]["close"] == 152.50
-    mock_ticker_instance.history.assert_called_once_with(period="1mo", interval="1d")
+    mock_ticker_instance.history.assert_called_once_with(
+        period="1mo",
+        interval="1d",
+        timeout=settings.MARKET_DATA_PROVIDER_TIMEOUT_SECONDS,
+    )
+
+
+def test_fetch_yf_historical_data_reports_corporate_actions(mock_yf_ticker):
+    mock_ticker_instance, _ = mock_yf_ticker
+    mock_ticker_instance.history.return_value = pd.DataFrame(
+        {
+            "Open": [150.0, 151.0],
+            "High": [152.0, 153.0],
+            "Low": [149.0, 150.0],
+            "Close": [151.25, 152.50],
+            "Volume": [100000, 120000],
+            "Dividends": [0.24, 0.0],
+            "Stock Splits": [0.0, 4.0],
+        },
+        index=[pd.Timestamp("2023-10-26"), pd.Timestamp("2023-10-27")],
+    )
+
+    history = yf_provider.fetch_yf_historical_data("AAPL", asset_type="stock")
 
+    assert history[0]["dividend"] == 0.24
+    assert "split" not in history[0]
+    assert history[1]["split"] == 4.0
+    assert "dividend" not in history[1]
 
-def test_fetch_yf_historical_data_empty(mock_yf_ticker, capsys):
+
+def test_fetch_yf_historical_data_empty(mock_yf_ticker, caplog):
     mock_ticker_instance, _ = mock_yf_ticker
     mock_ticker_instance.history.return_value = pd.DataFrame()
 
     history = yf_provider.fetch_yf_historical_data("EMPTY", asset_type="stock")
     assert history is None
-    captured = capsys.readouterr()
-    assert "YF_PROVIDER: No historical data found" in captured.out
+    assert "No historical data found" in caplog.text
 
 
 def test_fetch_yf_historical_data_calculates_sma(mock_yf_ticker):
@@ -201,3 +232,50 @@ def test_fetch_yf_historical_data_sma_with_insufficient_data(mock_yf_ticker):
     for item in history:
         assert item["sma20"] is None
         assert item["sma50"] is None
+
+
+def test_fetch_yf_intraday_bars_returns_utc_timestamps(mock_yf_ticker):
+    mock_ticker_instance, _ = mock_yf_ticker
+    mock_ticker_instance.history.return_value = pd.DataFrame(
+        {
+            "Open": [150.0, 151.0],
+            "High": [152.0, 153.0],
+            "Low": [149.0, 150.0],
+            "Close": [151.25, None],
+            "Volume": [1000, 1200],
+        },
+        index=pd.DatetimeIndex(
+            ["2024-03-01 09:30", "2024-03-01 09:35"], tz="America/New_York"
+        ),
+    )
+    since = datetime(2024, 3, 1, 14, 30, tzinfo=timezone.utc)
+
+    bars = yf_provider.fetch_yf_intraday_bars("AAPL", "stock", "5m", since=since)
+
+    # The still-forming bar with no close yet is skipped.
+    assert bars == [
+        {
+            "timestamp": datetime(2024, 3, 1, 14, 30, tzinfo=timezone.utc),
+            "open": 150.0,
+            "high": 152.0,
+            "low": 149.0,
+            "close": 151.25,
+            "volume": 1000,
+        }
+    ]
+    mock_ticker_instance.history.assert_called_once_with(
+        start=since,
+        interval="5m",
+        timeout=settings.MARKET_DATA_PROVIDER_TIMEOUT_SECONDS,
+    )
+
+
+def test_fetch_yf_intraday_bars_backfills_without_since(mock_yf_ticker):
+    mock_ticker_instance, _ = mock_yf_ticker
+
+    assert yf_provider.fetch_yf_intraday_bars("AAPL", "stock", "1m") is None
+    mock_ticker_instance.history.assert_called_once_with(
+        period=yf_provider.INTRADAY_BACKFILL_PERIODS["1m"],
+        interval="1m",
+        timeout=settings.MARKET_DATA_PROVIDER_TIMEOUT_SECONDS,
+    )
@@ -0,0 +1,170 @@
+# backend/tests/services/test_alert_engine.py
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from app import models, schemas
+from app.models.asset import AssetType
+from app.models.price_alert import AlertCondition
+from app.services import alert_engine, price_events
+
+
+def _alert(alert_id: int, condition: AlertCondition, **kwargs) -> models.PriceAlert:
+    return models.PriceAlert(
+        id=alert_id,
+        user_id=1,
+        asset_id=1,
+        condition=condition,
+        is_active=True,
+        **kwargs
+    )
+
+
+def test_handler_is_registered():
+    assert alert_engine.evaluate_price_change in price_events._handlers
+
+
+def test_compute_trigger_levels():
+    assert alert_engine.compute_trigger_levels(
+        _alert(1, AlertCondition.ABOVE, threshold=200.0)
+    ) == (200.0, None)
+    assert alert_engine.compute_trigger_levels(
+        _alert(2, AlertCondition.BELOW, threshold=100.0)
+    ) == (None, 100.0)
+    assert alert_engine.compute_trigger_levels(
+        _alert(3, AlertCondition.PERCENT_MOVE, threshold=10.0, reference_price=50.0)
+    ) == (55.0, 45.0)
+    sma_alert = _alert(4, AlertCondition.SMA_CROSS, sma_window=20)
+    assert alert_engine.compute_trigger_levels(sma_alert, 90.0, 100.0) == (100.0, None)
+    assert alert_engine.compute_trigger_levels(sma_alert, 110.0, 100.0) == (None, 100.0)
+    assert alert_engine.compute_trigger_levels(sma_alert, None, 100.0) == (None, None)
+
+
+@patch("app.services.alert_engine.shared_cache")
+def test_index_alert_adds_to_sorted_sets(mock_shared_cache: MagicMock):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+
+    indexed = alert_engine.index_alert(
+        _alert(7, AlertCondition.PERCENT_MOVE, threshold=10.0, reference_price=50.0),
+        "aapl",
+        "stock",
+    )
+
+    assert indexed is True
+    pipe.zadd.assert_any_call("alerts:above:AAPL", {"7": 55.0})
+    pipe.zadd.assert_any_call("alerts:below:AAPL", {"7": 45.0})
+    pipe.execute.assert_called_once()
+
+
+@patch("app.services.alert_engine.shared_cache")
+def test_index_alert_returns_false_on_redis_error(mock_shared_cache: MagicMock):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.pipeline.return_value.execute.side_effect = ConnectionError("down")
+
+    indexed = alert_engine.index_alert(
+        _alert(7, AlertCondition.ABOVE, threshold=200.0), "aapl", "stock"
+    )
+
+    assert indexed is False
+
+
+@patch("app.services.alert_engine._trigger_executor")
+@patch("app.services.alert_engine.SessionLocal")
+@patch("app.services.alert_engine.shared_cache")
+def test_evaluate_price_change_hands_crossed_alerts_to_a_worker(
+    mock_shared_cache: MagicMock,
+    mock_session_local: MagicMock,
+    mock_executor: MagicMock,
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.pipeline.return_value.execute.return_value = [["3"], ["5", "3"]]
+    event = schemas.PriceChangeEvent(
+        symbol="AAPL",
+        price=150.0,
+        timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        source="yfinance",
+    )
+
+    assert alert_engine.evaluate_price_change(event) == [3, 5]
+
+    mock_executor.submit.assert_called_once_with(
+        alert_engine.trigger_alerts, event, [3, 5]
+    )
+    mock_session_local.assert_not_called()
+
+
+@patch("app.services.alert_engine.crud.mark_price_alerts_triggered")
+@patch("app.services.alert_engine.SessionLocal")
+@patch("app.services.alert_engine.shared_cache")
+def test_trigger_alerts_marks_and_notifies(
+    mock_shared_cache: MagicMock,
+    mock_session_local: MagicMock,
+    mock_mark_triggered: MagicMock,
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    mock_mark_triggered.return_value = [(3, 10), (5, 11)]
+    event = schemas.PriceChangeEvent(
+        symbol="AAPL",
+        price=150.0,
+        timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        source="yfinance",
+    )
+
+    triggered = alert_engine.trigger_alerts(event, [3, 5])
+
+    assert triggered == [3, 5]
+    assert mock_mark_triggered.call_args.kwargs["alert_ids"] == [3, 5]
+    mock_session_local.return_value.close.assert_called_once()
+    client.pipeline.return_value.zrem.assert_any_call("alerts:above:AAPL", "3", "5")
+    channels = [
+        c.args[0] for c in mock_shared_cache.publish_shared_event.call_args_list
+    ]
+    assert channels == ["alert_notifications:10", "alert_notifications:11"]
+
+
+@patch("app.services.alert_engine.SessionLocal")
+@patch("app.services.alert_engine.shared_cache")
+def test_evaluate_price_change_no_candidates_skips_db(
+    mock_shared_cache: MagicMock, mock_session_local: MagicMock
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.pipeline.return_value.execute.return_value = [[], []]
+    event = schemas.PriceChangeEvent(
+        symbol="AAPL",
+        price=150.0,
+        timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        source="yfinance",
+    )
+
+    assert alert_engine.evaluate_price_change(event) == []
+    mock_session_local.assert_not_called()
+
+
+@patch("app.services.alert_engine.crud.get_active_price_alerts")
+@patch("app.services.alert_engine.shared_cache")
+def test_rebuild_alert_index_swaps_staged_sets_in(
+    mock_shared_cache: MagicMock, mock_get_active_alerts: MagicMock
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.scan_iter.side_effect = [["alerts:above:AAPL", "alerts:above:GONE"], []]
+    staging, swap = MagicMock(), MagicMock()
+    client.pipeline.side_effect = [staging, swap]
+    alert = _alert(7, AlertCondition.ABOVE, threshold=200.0)
+    alert.asset = models.Asset(symbol="AAPL", asset_type=AssetType.STOCK)
+    mock_get_active_alerts.return_value = [alert]
+
+    assert alert_engine.rebuild_alert_index(MagicMock()) == 1
+
+    staged_key = staging.zadd.call_args.args[0]
+    assert staged_key.startswith("alerts_rebuild:")
+    assert staging.zadd.call_args.args[1] == {"7": 200.0}
+    assert client.pipeline.call_args_list[1].kwargs == {"transaction": True}
+    swap.rename.assert_called_once_with(staged_key, "alerts:above:AAPL")
+    swap.delete.assert_called_once_with("alerts:above:GONE")
+    client.delete.assert_not_called()
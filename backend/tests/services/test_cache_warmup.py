@@ -0,0 +1,129 @@
+# backend/tests/services/test_cache_warmup.py
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.services import cache_warmup
+from app.services.data_providers.base import ProviderCapabilities
+
+
+def _batch_provider(prices):
+    provider = MagicMock()
+    provider.name = "batcher"
+    provider.capabilities = ProviderCapabilities(batch_quotes=True)
+    provider.provider_symbol.side_effect = lambda symbol, asset_type: symbol
+    provider.fetch_current_prices.return_value = prices
+    return provider
+
+
+@pytest.fixture
+def warm_env():
+    """Patches the cache and orchestrator calls a warm-up makes."""
+    with patch(
+        "app.services.cache_warmup.shared_cache.get_many_shared_cache",
+        side_effect=lambda keys: [None] * len(keys),
+    ) as get_many, patch(
+        "app.services.cache_warmup.orchestrator.get_current_prices",
+        side_effect=lambda items, max_workers: {s: 1.0 for s, _ in items},
+    ) as get_prices, patch(
+        "app.services.cache_warmup.orchestrator.get_historical_data",
+        return_value=[{"date": "2024-01-02", "close": 1.0}],
+    ) as get_history, patch(
+        "app.services.cache_warmup.orchestrator.cache_current_price"
+    ) as cache_price, patch(
+        "app.services.cache_warmup.registry.plan", return_value=[]
+    ) as plan:
+        yield MagicMock(
+            get_many=get_many,
+            get_prices=get_prices,
+            get_history=get_history,
+            cache_price=cache_price,
+            plan=plan,
+        )
+
+
+def test_warm_cache_skips_cached_prices_and_reports_progress(warm_env):
+    # AAPL's price and history are already cached.
+    warm_env.get_many.side_effect = lambda keys: [
+        1.0 if "AAPL" in key else None for key in keys
+    ]
+    reports = []
+
+    progress = cache_warmup.warm_cache(
+        [("AAPL", "stock"), ("MSFT", "stock"), ("BTC", "crypto")],
+        chunk_size=2,
+        on_progress=lambda p: reports.append(p.processed),
+    )
+
+    assert reports == [2, 3]
+    assert progress.prices_cached == 1 and progress.histories_cached == 1
+    assert progress.prices_warmed == 2 and progress.histories_warmed == 2
+    fetched = [c.args[0] for c in warm_env.get_prices.call_args_list]
+    assert fetched == [[("MSFT", "stock")], [("BTC", "crypto")]]
+    assert warm_env.get_prices.call_args.kwargs["max_workers"] == (
+        settings.CACHE_WARMUP_MAX_WORKERS
+    )
+
+
+def test_warm_cache_prices_with_one_batch_call_per_asset_type(warm_env):
+    provider = _batch_provider({"AAPL": 190.0, "MSFT": None})
+    warm_env.plan.return_value = [provider]
+
+    progress = cache_warmup.warm_cache([("AAPL", "stock"), ("MSFT", "stock")])
+
+    provider.fetch_current_prices.assert_called_once_with(["AAPL", "MSFT"], "stock")
+    cached = warm_env.cache_price.call_args.args
+    assert (cached[0].symbol, cached[1], cached[2]) == ("AAPL", 190.0, "batcher")
+    # Only the symbol the batch missed goes through a single lookup.
+    warm_env.get_prices.assert_called_once_with([("MSFT", "stock")], max_workers=4)
+    assert progress.prices_warmed == 2
+
+
+def test_warm_cache_stops_when_the_deadline_runs_out(warm_env):
+    progress = cache_warmup.warm_cache([("AAPL", "stock")], deadline=Deadline(0))
+
+    assert progress.processed == 0
+    warm_env.get_prices.assert_not_called()
+
+
+@patch("app.services.cache_warmup.warm_tracked_assets")
+def test_warm_on_startup_skips_a_warm_cache(mock_warm: MagicMock):
+    client = MagicMock()
+    client.exists.return_value = 1
+    with patch.object(
+        cache_warmup.shared_cache, "get_redis_client", return_value=client
+    ):
+        cache_warmup.warm_on_startup()
+    mock_warm.assert_not_called()
+
+
+@patch("app.services.cache_warmup.warm_tracked_assets")
+def test_warm_on_startup_warms_under_the_lock(mock_warm: MagicMock):
+    client = MagicMock()
+    client.exists.return_value = 0
+    client.set.return_value = True
+    with patch.object(
+        cache_warmup.shared_cache, "get_redis_client", return_value=client
+    ):
+        cache_warmup.warm_on_startup()
+
+    mock_warm.assert_called_once()
+    client.delete.assert_called_once_with(cache_warmup.LOCK_KEY)
+
+
+@patch("app.services.cache_warmup._mark_warm")
+@patch("app.services.cache_warmup.warm_cache")
+@patch("app.services.cache_warmup.crud.get_tracked_assets_by_popularity")
+def test_warm_tracked_assets_marks_the_cache_warm_when_done(
+    mock_popular: MagicMock, mock_warm_cache: MagicMock, mock_mark_warm: MagicMock
+):
+    mock_popular.return_value = [("AAPL", "stock")]
+    mock_warm_cache.return_value = cache_warmup.WarmupProgress(total=1, processed=1)
+
+    cache_warmup.warm_tracked_assets()
+
+    assert mock_popular.call_args.kwargs["limit"] == settings.CACHE_WARMUP_MAX_SYMBOLS
+    assert mock_warm_cache.call_args.args[0] == [("AAPL", "stock")]
+    mock_mark_warm.assert_called_once()
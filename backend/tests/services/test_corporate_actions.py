@@ -0,0 +1,130 @@
+# backend/tests/services/test_corporate_actions.py
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services import corporate_actions, instruments
+from app.services.data_providers.base import ACTION_TYPES
+
+NONE_APPLIED = frozenset()
+SPLITS_APPLIED = frozenset({"split"})
+START = date(2024, 1, 1)
+
+
+def _points(closes, volume=1000):
+    return [
+        {
+            "date": START + timedelta(days=i),
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": volume,
+        }
+        for i, close in enumerate(closes)
+    ]
+
+
+def test_adjust_history_applies_cumulative_factors_before_each_ex_date():
+    points = _points([400.0, 400.0, 100.0, 100.0, 98.0])
+    actions = [
+        ("split", START + timedelta(days=2), 4.0),
+        ("dividend", START + timedelta(days=4), 2.0),
+    ]
+
+    adjusted = corporate_actions.adjust_history(points, actions, NONE_APPLIED)
+
+    dividend_factor = 1 - 2.0 / 100.0
+    assert [p["close"] for p in adjusted] == pytest.approx(
+        [100.0 * dividend_factor] * 4 + [98.0]
+    )
+    assert [p["volume"] for p in adjusted] == [4000, 4000, 1000, 1000, 1000]
+    assert points[0]["close"] == 400.0  # the raw series is left alone
+
+
+def test_adjust_history_scales_dividends_by_later_splits_in_adjusted_series():
+    # Split-adjusted prices: the 2.0 dividend was paid on a 200.0 close.
+    points = _points([50.0, 49.5, 49.5])
+    actions = [
+        ("dividend", START + timedelta(days=1), 2.0),
+        ("split", START + timedelta(days=2), 4.0),
+    ]
+
+    adjusted = corporate_actions.adjust_history(points, actions, SPLITS_APPLIED)
+
+    assert adjusted[0]["close"] == pytest.approx(50.0 * (1 - 2.0 / 200.0))
+    assert [p["close"] for p in adjusted[1:]] == [49.5, 49.5]
+    assert [p["volume"] for p in adjusted] == [1000, 1000, 1000]
+
+
+def test_adjust_history_recomputes_moving_averages():
+    points = _points([200.0] * 10 + [100.0] * 15)
+    actions = [("split", START + timedelta(days=10), 2.0)]
+
+    adjusted = corporate_actions.adjust_history(points, actions, NONE_APPLIED)
+
+    assert adjusted[18]["sma20"] is None
+    assert adjusted[19]["sma20"] == pytest.approx(100.0)
+    assert adjusted[24]["sma20"] == pytest.approx(100.0)
+    assert adjusted[24]["sma50"] is None
+
+
+def test_adjust_history_returns_series_unchanged_without_pending_actions():
+    points = _points([10.0, 11.0])
+    actions = [("split", START + timedelta(days=1), 2.0)]
+
+    assert corporate_actions.adjust_history(points, actions, ACTION_TYPES) is points
+    assert corporate_actions.adjust_history(points, [], NONE_APPLIED) is points
+
+
+def test_actions_from_history_restates_split_adjusted_dividends():
+    points = _points([50.0, 50.0, 50.0])
+    points[0]["dividend"] = 0.5
+    points[2]["split"] = 4.0
+
+    assert corporate_actions.actions_from_history(points, ACTION_TYPES) == [
+        ("dividend", START, 2.0),
+        ("split", START + timedelta(days=2), 4.0),
+    ]
+    assert corporate_actions.actions_from_history(points, NONE_APPLIED)[0] == (
+        "dividend",
+        START,
+        0.5,
+    )
+
+
+@patch("app.services.corporate_actions.crud.add_corporate_actions")
+@patch("app.services.corporate_actions.crud.get_corporate_action_map")
+def test_record_from_history_stores_only_new_actions(
+    mock_get_map: MagicMock, mock_add: MagicMock
+):
+    mock_get_map.return_value = {"AAPL": [("split", START, 4.0)]}
+    mock_add.return_value = [MagicMock()]
+    points = _points([50.0, 50.0])
+    points[0]["split"] = 4.0
+    points[1]["dividend"] = 0.25
+    instrument = instruments.Instrument(symbol="AAPL", asset_type="stock", asset_id=7)
+
+    corporate_actions.record_from_history(instrument, points, "yfinance", ACTION_TYPES)
+
+    actions = mock_add.call_args.kwargs["actions"]
+    assert mock_add.call_args.kwargs["asset_id"] == 7
+    assert [(a.action_type.value, a.ex_date, a.value) for a in actions] == [
+        ("dividend", START + timedelta(days=1), 0.25)
+    ]
+    # The write reloads the table on the next lookup.
+    mock_get_map.return_value = {"AAPL": [("split", START, 4.0)] * 2}
+    assert len(corporate_actions.actions_for("aapl")) == 2
+
+
+@patch("app.services.corporate_actions.crud.add_corporate_actions")
+def test_record_from_history_skips_instruments_without_an_asset(mock_add: MagicMock):
+    points = _points([50.0])
+    points[0]["split"] = 2.0
+
+    corporate_actions.record_from_history(
+        instruments.Instrument(symbol="XYZ"), points, "yfinance", ACTION_TYPES
+    )
+
+    mock_add.assert_not_called()
@@ -1,10 +1,15 @@
 # backend/tests/services/test_financial_data_orchestrator.py
+import json
+import pandas as pd
 import pytest
 import time
-from unittest.mock import patch, MagicMock
-from datetime import date
+from unittest.mock import ANY, patch, MagicMock
+from datetime import date, datetime, timedelta, timezone
+from app import schemas
 from app.core.config import settings
+from app.core.deadline import Deadline
 
+from app.services import corporate_actions
 from app.services import financial_data_orchestrator as orchestrator
 
 
@@ -103,7 +108,8 @@ def test_get_current_price_crypto_cache_miss_then_hit(
 
     assert price1 == expected_yf_price
     mock_get_shared_cache.assert_called_once_with(cache_key)
-    mock_fetch_yf_crypto_price.assert_called_once_with(symbol, asset_type)
+    # Providers receive their own ticker for the instrument.
+    mock_fetch_yf_crypto_price.assert_called_once_with(f"{symbol}-USD", asset_type)
     mock_fetch_av_crypto_price.assert_not_called()
     mock_set_shared_cache.assert_called_once_with(cache_key, expected_yf_price)
 
@@ -350,7 +356,10 @@ def test_get_historical_data_stock_cache_miss_then_hit(
         symbol, asset_type, period=yf_period_expected
     )
     mock_fetch_av_stock_hist.assert_not_called()
-    mock_set_shared_cache.assert_called_once_with(cache_key, mock_hist_data_from_yf)
+    mock_set_shared_cache.assert_called_once_with(
+        cache_key,
+        {"source": "yfinance", "fetched_at": ANY, "points": mock_hist_data_from_yf},
+    )
 
     mock_get_shared_cache.reset_mock()
     mock_set_shared_cache.reset_mock()
@@ -439,10 +448,13 @@ def test_get_historical_data_crypto_cache_miss_then_hit(
     assert hist1 == mock_hist_data_from_yf
     mock_get_shared_cache.assert_called_once_with(cache_key)
     mock_fetch_yf_crypto_hist.assert_called_once_with(
-        symbol, asset_type, period=yf_period_expected
+        f"{symbol}-USD", asset_type, period=yf_period_expected
     )
     mock_fetch_av_crypto_hist.assert_not_called()
-    mock_set_shared_cache.assert_called_once_with(cache_key, mock_hist_data_from_yf)
+    mock_set_shared_cache.assert_called_once_with(
+        cache_key,
+        {"source": "yfinance", "fetched_at": ANY, "points": mock_hist_data_from_yf},
+    )
 
     mock_get_shared_cache.reset_mock()
     mock_set_shared_cache.reset_mock()
@@ -557,4 +569,502 @@ def test_get_historical_data_provider_returns_empty_list(
         symbol.upper(), outputsize=outputsize
     )
 
-    mock_set_shared_cache.assert_called_once_with(cache_key, [])
+    mock_set_shared_cache.assert_called_once_with(
+        cache_key, {"source": "alpha_vantage", "fetched_at": ANY, "points": []}
+    )
+
+
+@patch("app.services.corporate_actions.crud.get_corporate_action_map")
+@patch("app.services.financial_data_orchestrator.shared_cache.set_shared_cache")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+@patch(
+    "app.services.data_providers.alpha_vantage_provider.fetch_av_stock_historical_data"
+)
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_historical_data")
+def test_unadjusted_history_is_adjusted_and_cached_per_set_of_actions(
+    mock_fetch_yf_hist: MagicMock,
+    mock_fetch_av_hist: MagicMock,
+    mock_get_shared_cache: MagicMock,
+    mock_set_shared_cache: MagicMock,
+    mock_get_action_map: MagicMock,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", "DUMMY_KEY_FOR_TEST_AV")
+    cache = {}
+    mock_get_shared_cache.side_effect = cache.get
+    mock_set_shared_cache.side_effect = lambda key, value, **kwargs: cache.update(
+        {key: json.loads(json.dumps(value, default=str))}
+    )
+    mock_fetch_yf_hist.return_value = None
+    mock_fetch_av_hist.return_value = [
+        {"date": date(2024, 6, 6), "close": 1200.0, "volume": 10},
+        {"date": date(2024, 6, 7), "close": 1210.0, "volume": 10},
+        {"date": date(2024, 6, 10), "close": 121.0, "volume": 100},
+    ]
+    mock_get_action_map.return_value = {"NVDA": [("split", date(2024, 6, 10), 10.0)]}
+
+    history = orchestrator.get_historical_data("NVDA", "stock")
+
+    assert [p["close"] for p in history] == pytest.approx([120.0, 121.0, 121.0])
+    assert [p["volume"] for p in history] == [100, 100, 100]
+    assert cache["history:NVDA_stock_3mo"]["points"][0]["close"] == 1200.0
+    adjusted_keys = [k for k in cache if k.startswith("history_adjusted:NVDA_stock")]
+    assert len(adjusted_keys) == 1
+
+    assert orchestrator.get_historical_data("NVDA", "stock") == history
+    assert len(cache) == 2
+
+    # A new action recomputes the adjusted series from the cached raw one.
+    mock_get_action_map.return_value = {
+        "NVDA": [
+            ("dividend", date(2024, 6, 7), 12.0),
+            ("split", date(2024, 6, 10), 10.0),
+        ]
+    }
+    corporate_actions.actions_changed()
+
+    history = orchestrator.get_historical_data("NVDA", "stock")
+
+    assert [p["close"] for p in history] == pytest.approx([118.8, 121.0, 121.0])
+    assert len([k for k in cache if k.startswith("history_adjusted:")]) == 2
+    mock_fetch_av_hist.assert_called_once()
+
+
+@patch("app.services.instruments.crud.get_provider_symbol_map")
+@patch("app.services.data_providers.yahoo_finance_provider.yf.Ticker")
+def test_stored_provider_ticker_reaches_the_provider_unchanged(
+    mock_ticker: MagicMock, mock_get_symbol_map: MagicMock
+):
+    mock_get_symbol_map.return_value = {"BTC": {"yfinance": "BTC-EUR"}}
+    mock_ticker.return_value.history.return_value = pd.DataFrame(
+        {"Close": [61000.0]}, index=[pd.Timestamp("2024-03-01")]
+    )
+
+    assert orchestrator.get_current_price("btc", "crypto") == 61000.0
+    mock_ticker.assert_called_once_with("BTC-EUR")
+
+
+@patch("app.services.financial_data_orchestrator.get_current_price")
+def test_get_current_prices_fetches_each_pair(mock_get_current_price: MagicMock):
+    mock_get_current_price.side_effect = lambda symbol, asset_type: (
+        None if symbol == "BAD" else 10.0
+    )
+
+    prices = orchestrator.get_current_prices(
+        [("aapl", "stock"), ("BTC", "crypto"), ("BAD", "stock")], max_workers=2
+    )
+
+    assert prices == {"AAPL": 10.0, "BTC": 10.0, "BAD": None}
+    assert mock_get_current_price.call_count == 3
+    mock_get_current_price.assert_any_call("BTC", "crypto")
+
+
+def test_get_current_prices_empty():
+    assert orchestrator.get_current_prices([]) == {}
+
+
+@patch("app.services.financial_data_orchestrator.symbol_filter.record_lookup_failure")
+@patch("app.services.financial_data_orchestrator.symbol_filter.is_negatively_cached")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_current_price")
+def test_get_current_price_negative_cache_skips_providers(
+    mock_fetch_yf_price: MagicMock,
+    mock_get_shared_cache: MagicMock,
+    mock_is_negatively_cached: MagicMock,
+    mock_record_failure: MagicMock,
+):
+    mock_get_shared_cache.return_value = None
+    mock_is_negatively_cached.return_value = True
+
+    assert orchestrator.get_current_price("nope", "stock") is None
+
+    mock_is_negatively_cached.assert_called_once_with("price:NOPE_stock")
+    mock_fetch_yf_price.assert_not_called()
+    mock_record_failure.assert_not_called()
+
+
+@patch("app.services.financial_data_orchestrator.symbol_filter.record_lookup_failure")
+@patch("app.services.financial_data_orchestrator.symbol_filter.is_negatively_cached")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_historical_data")
+def test_get_historical_data_records_failure_when_all_providers_fail(
+    mock_fetch_yf_history: MagicMock,
+    mock_get_shared_cache: MagicMock,
+    mock_is_negatively_cached: MagicMock,
+    mock_record_failure: MagicMock,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", None)
+    mock_get_shared_cache.return_value = None
+    mock_is_negatively_cached.return_value = False
+    mock_fetch_yf_history.return_value = None
+
+    assert orchestrator.get_historical_data("nope", "stock") is None
+
+    mock_record_failure.assert_called_once_with("history:NOPE_stock_3mo")
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.record_attempts")
+@patch("app.services.financial_data_orchestrator.provider_health.allow_request")
+@patch("app.services.financial_data_orchestrator.shared_cache.set_shared_cache")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+@patch(
+    "app.services.data_providers.alpha_vantage_provider.fetch_av_stock_current_price"
+)
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_current_price")
+def test_get_current_price_skips_provider_with_open_circuit(
+    mock_fetch_yf_price: MagicMock,
+    mock_fetch_av_price: MagicMock,
+    mock_get_shared_cache: MagicMock,
+    mock_set_shared_cache: MagicMock,
+    mock_allow_request: MagicMock,
+    mock_record_attempts: MagicMock,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", "DUMMY_KEY_FOR_TEST_AV")
+    mock_get_shared_cache.return_value = None
+    mock_allow_request.side_effect = lambda name, asset_type: name != "yfinance"
+    mock_fetch_av_price.return_value = 123.0
+
+    assert orchestrator.get_current_price("MSFT", "stock") == 123.0
+
+    mock_fetch_yf_price.assert_not_called()
+    attempts = mock_record_attempts.call_args[0][0]
+    assert [(name, ok) for name, _, ok in attempts] == [("alpha_vantage", True)]
+
+
+def _slow(value, seconds):
+    def fetch():
+        time.sleep(seconds)
+        return value
+
+    return fetch
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.record_attempts")
+def test_fetch_from_providers_moves_on_when_a_provider_raises(
+    mock_record_attempts: MagicMock,
+):
+    failing = MagicMock(side_effect=ValueError("bad payload"))
+    fetchers = [("yfinance", failing), ("alpha_vantage", MagicMock(return_value=2.0))]
+
+    result, source, attempted = orchestrator._fetch_from_providers(
+        fetchers, "stock", "test"
+    )
+
+    assert (result, source, attempted) == (2.0, "alpha_vantage", True)
+    attempts, asset_type, errors = mock_record_attempts.call_args[0]
+    assert [(name, ok) for name, _, ok in attempts] == [
+        ("yfinance", False),
+        ("alpha_vantage", True),
+    ]
+    assert (asset_type, errors) == ("stock", ["yfinance"])
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.record_attempts")
+@patch(
+    "app.services.financial_data_orchestrator.provider_health.try_acquire_hedge_slot"
+)
+@patch("app.services.financial_data_orchestrator.provider_health.hedge_delay")
+def test_fetch_hedged_secondary_wins_when_primary_is_slow(
+    mock_hedge_delay: MagicMock,
+    mock_try_acquire: MagicMock,
+    mock_record_attempts: MagicMock,
+):
+    mock_hedge_delay.return_value = 0.05
+    mock_try_acquire.return_value = True
+    fetchers = [("yfinance", _slow(1.0, 0.5)), ("alpha_vantage", _slow(2.0, 0.01))]
+
+    started = time.perf_counter()
+    result, source, attempted = orchestrator._fetch_hedged(fetchers, "stock", "test")
+
+    assert (result, source, attempted) == (2.0, "alpha_vantage", True)
+    assert time.perf_counter() - started < 0.4
+    mock_hedge_delay.assert_called_once_with("yfinance", "stock")
+
+    # Both outcomes are recorded once the slow primary also finishes.
+    time.sleep(0.6)
+    attempts = mock_record_attempts.call_args[0][0]
+    assert sorted((name, ok) for name, _, ok in attempts) == [
+        ("alpha_vantage", True),
+        ("yfinance", True),
+    ]
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.record_attempts")
+@patch(
+    "app.services.financial_data_orchestrator.provider_health.try_acquire_hedge_slot"
+)
+@patch("app.services.financial_data_orchestrator.provider_health.hedge_delay")
+def test_fetch_hedged_without_budget_waits_for_primary(
+    mock_hedge_delay: MagicMock,
+    mock_try_acquire: MagicMock,
+    mock_record_attempts: MagicMock,
+):
+    mock_hedge_delay.return_value = 0.01
+    mock_try_acquire.return_value = False
+    secondary = MagicMock(return_value=2.0)
+    fetchers = [("yfinance", _slow(1.0, 0.1)), ("alpha_vantage", secondary)]
+
+    result, source, _ = orchestrator._fetch_hedged(fetchers, "stock", "test")
+
+    assert (result, source) == (1.0, "yfinance")
+    secondary.assert_not_called()
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.record_attempts")
+@patch(
+    "app.services.financial_data_orchestrator.provider_health.try_acquire_hedge_slot"
+)
+@patch("app.services.financial_data_orchestrator.provider_health.hedge_delay")
+def test_fetch_hedged_falls_back_when_primary_fails(
+    mock_hedge_delay: MagicMock,
+    mock_try_acquire: MagicMock,
+    mock_record_attempts: MagicMock,
+):
+    mock_hedge_delay.return_value = 5.0
+    fetchers = [("yfinance", _slow(None, 0.0)), ("alpha_vantage", _slow(3.0, 0.0))]
+
+    result, source, _ = orchestrator._fetch_hedged(fetchers, "stock", "test")
+
+    assert (result, source) == (3.0, "alpha_vantage")
+    mock_try_acquire.assert_not_called()
+
+
+@patch("app.services.financial_data_orchestrator.symbol_filter.record_lookup_failure")
+@patch("app.services.financial_data_orchestrator.price_events.get_last_price_events")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_current_price")
+def test_get_current_price_quote_serves_stale_price_when_deadline_spent(
+    mock_fetch_yf_price: MagicMock,
+    mock_get_shared_cache: MagicMock,
+    mock_get_last_price_events: MagicMock,
+    mock_record_failure: MagicMock,
+):
+    mock_get_shared_cache.return_value = None
+    last_seen = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    mock_get_last_price_events.return_value = [
+        schemas.PriceChangeEvent(
+            symbol="AAPL", price=170.0, timestamp=last_seen, source="yfinance"
+        )
+    ]
+
+    quote = orchestrator.get_current_price_quote("aapl", "stock", deadline=Deadline(0))
+
+    assert quote == {"price": 170.0, "is_stale": True, "last_updated": last_seen}
+    mock_fetch_yf_price.assert_not_called()
+    mock_record_failure.assert_not_called()
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.record_attempts")
+@patch("app.services.financial_data_orchestrator.provider_health.hedge_delay")
+@patch("app.services.financial_data_orchestrator.price_events.get_last_price_events")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+def test_get_current_price_quote_hedged_is_bounded_by_deadline(
+    mock_get_shared_cache: MagicMock,
+    mock_get_last_price_events: MagicMock,
+    mock_hedge_delay: MagicMock,
+    mock_record_attempts: MagicMock,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", None)
+    monkeypatch.setattr(
+        "app.services.data_providers.yahoo_finance_provider.fetch_yf_current_price",
+        lambda symbol, asset_type: time.sleep(0.5) or 1.0,
+    )
+    mock_get_shared_cache.return_value = None
+    mock_get_last_price_events.return_value = []
+    mock_hedge_delay.return_value = 5.0
+
+    started = time.perf_counter()
+    quote = orchestrator.get_current_price_quote(
+        "AAPL", "stock", hedge=True, deadline=Deadline(0.1)
+    )
+
+    assert quote is None
+    assert time.perf_counter() - started < 0.4
+
+
+def _intraday_bar(minute: int, close: float = 100.0) -> dict:
+    timestamp = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    return {
+        "timestamp": timestamp.replace(minute=0) + (minute * timedelta(minutes=1)),
+        "open": close,
+        "high": close,
+        "low": close,
+        "close": close,
+        "volume": 10,
+    }
+
+
+@pytest.fixture
+def buffer():
+    """Patches the Redis bar buffer; set read_bars/claim_refresh return values."""
+    mocks = {
+        "read_bars": MagicMock(return_value=[]),
+        "claim_refresh": MagicMock(return_value=True),
+        "append_bars": MagicMock(),
+        "replace_bars": MagicMock(),
+    }
+    with patch.multiple("app.services.financial_data_orchestrator.bar_buffer", **mocks):
+        yield mocks
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_intraday_bars")
+def test_intraday_bars_backfill_an_empty_buffer(mock_fetch_yf_bars, buffer):
+    bars = [_intraday_bar(m, close=float(m)) for m in range(25)]
+    mock_fetch_yf_bars.return_value = bars
+
+    points = orchestrator.get_intraday_bars("aapl", "stock", "1m")
+
+    mock_fetch_yf_bars.assert_called_once_with("AAPL", "stock", "1m", None)
+    buffer["replace_bars"].assert_called_once_with("intraday:AAPL_stock:1m", bars)
+    assert [p["timestamp"] for p in points] == [b["timestamp"] for b in bars]
+    assert points[0]["date"] == bars[0]["timestamp"].date()
+    assert points[18]["sma20"] is None
+    assert points[19]["sma20"] == sum(range(20)) / 20
+    assert points[24]["sma50"] is None
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_intraday_bars")
+def test_intraday_bars_fetch_only_since_the_last_buffered_bar(
+    mock_fetch_yf_bars, buffer
+):
+    buffer["read_bars"].return_value = [_intraday_bar(0), _intraday_bar(1)]
+    fresh = [_intraday_bar(1, close=101.0), _intraday_bar(2)]
+    mock_fetch_yf_bars.return_value = fresh
+
+    points = orchestrator.get_intraday_bars("AAPL", "stock", "1m")
+
+    mock_fetch_yf_bars.assert_called_once_with(
+        "AAPL", "stock", "1m", _intraday_bar(1)["timestamp"]
+    )
+    buffer["append_bars"].assert_called_once_with("intraday:AAPL_stock:1m", fresh)
+    buffer["replace_bars"].assert_not_called()
+    assert [p["close"] for p in points] == [100.0, 101.0, 100.0]
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_intraday_bars")
+def test_fresh_intraday_buffer_is_served_without_providers(mock_fetch_yf_bars, buffer):
+    buffer["read_bars"].return_value = [_intraday_bar(0)]
+    buffer["claim_refresh"].return_value = False
+
+    points = orchestrator.get_intraday_bars("AAPL", "stock", "1h")
+
+    assert len(points) == 1
+    mock_fetch_yf_bars.assert_not_called()
+    buffer["claim_refresh"].assert_called_once_with(
+        "intraday:AAPL_stock:1h", settings.INTRADAY_REFRESH_SECONDS
+    )
+
+
+def test_intraday_bars_reject_unknown_intervals():
+    with pytest.raises(ValueError):
+        orchestrator.get_intraday_bars("AAPL", "stock", "2m")
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_fx_rate")
+@patch("app.services.financial_data_orchestrator.shared_cache.set_shared_cache")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_many_shared_cache")
+def test_get_fx_rates_reads_cache_then_providers(
+    mock_get_many: MagicMock,
+    mock_set_shared_cache: MagicMock,
+    mock_fetch_yf_fx_rate: MagicMock,
+):
+    # GBP cached, JPY not; provider rate-limit counters read as unset.
+    cached = {"fx:GBPUSD": 0.79}
+    mock_get_many.side_effect = lambda keys: [cached.get(key) for key in keys]
+    mock_fetch_yf_fx_rate.return_value = 0.0067
+
+    quotes = orchestrator.get_fx_rates(["usd", "GBP", "JPY", "GBP"], "usd")
+
+    fx_reads = [
+        call.args[0]
+        for call in mock_get_many.call_args_list
+        if call.args[0][0].startswith("fx:")
+    ]
+    assert fx_reads == [["fx:GBPUSD", "fx:JPYUSD"]]
+    mock_fetch_yf_fx_rate.assert_called_once_with("JPY", "USD")
+    assert quotes["USD"]["rate"] == 1.0
+    assert quotes["GBP"]["rate"] == 0.79
+    assert quotes["JPY"] == {
+        "rate": 0.0067,
+        "is_stale": False,
+        "last_updated": quotes["JPY"]["last_updated"],
+    }
+    assert mock_set_shared_cache.call_args_list[0].args == ("fx:JPYUSD", 0.0067)
+
+
+@patch("app.services.financial_data_orchestrator.provider_health.allow_request")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_many_shared_cache")
+def test_get_fx_rates_serves_the_last_known_rate_when_no_provider_may_answer(
+    mock_get_many: MagicMock,
+    mock_get_shared_cache: MagicMock,
+    mock_allow_request: MagicMock,
+):
+    mock_get_many.side_effect = lambda keys: [None] * len(keys)
+    mock_get_shared_cache.return_value = {
+        "rate": 1.07,
+        "timestamp": "2024-03-01T12:00:00+00:00",
+    }
+    mock_allow_request.return_value = False  # every circuit open
+
+    quotes = orchestrator.get_fx_rates(["EUR"], "USD")
+
+    assert quotes["EUR"] == {
+        "rate": 1.07,
+        "is_stale": True,
+        "last_updated": datetime(2024, 3, 1, 12, tzinfo=timezone.utc),
+    }
+    mock_get_shared_cache.assert_called_once_with("fx_last:EURUSD")
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_fx_history")
+@patch("app.services.financial_data_orchestrator.shared_cache.set_shared_cache")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+def test_fx_history_is_cached_as_columns_and_read_as_of_a_date(
+    mock_get_shared_cache: MagicMock,
+    mock_set_shared_cache: MagicMock,
+    mock_fetch_yf_fx_history: MagicMock,
+):
+    mock_get_shared_cache.return_value = None
+    mock_fetch_yf_fx_history.return_value = [
+        {"date": date(2024, 3, 1), "rate": 1.08},
+        {"date": date(2024, 3, 4), "rate": 1.09},
+    ]
+
+    history = orchestrator.get_fx_history("eur", "usd")
+
+    assert history == {"dates": ["2024-03-01", "2024-03-04"], "rates": [1.08, 1.09]}
+    mock_set_shared_cache.assert_called_once_with(
+        "fx_history:EURUSD", history, ex=orchestrator.FX_HISTORY_CACHE_SECONDS
+    )
+    assert orchestrator.fx_rate_on(history, date(2024, 2, 29)) is None
+    assert orchestrator.fx_rate_on(history, date(2024, 3, 1)) == 1.08
+    assert orchestrator.fx_rate_on(history, date(2024, 3, 3)) == 1.08  # weekend
+    assert orchestrator.fx_rate_on(history, date(2024, 3, 10)) == 1.09
+
+
+@patch("app.services.financial_data_orchestrator.symbol_filter.record_lookup_failure")
+@patch("app.services.financial_data_orchestrator.symbol_filter.is_negatively_cached")
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_fx_history")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+def test_fx_history_failures_are_negatively_cached(
+    mock_get_shared_cache: MagicMock,
+    mock_fetch_yf_fx_history: MagicMock,
+    mock_is_negatively_cached: MagicMock,
+    mock_record_failure: MagicMock,
+    monkeypatch,
+):
+    monkeypatch.setattr(settings, "ALPHA_VANTAGE_API_KEY", None)
+    mock_get_shared_cache.return_value = None
+    mock_is_negatively_cached.return_value = False
+    mock_fetch_yf_fx_history.return_value = None
+
+    assert orchestrator.get_fx_history("eur", "usd") is None
+    mock_record_failure.assert_called_once_with("fx_history:EURUSD")
+
+    mock_is_negatively_cached.return_value = True
+    assert orchestrator.get_fx_history("eur", "usd") is None
+    mock_fetch_yf_fx_history.assert_called_once()
@@ -0,0 +1,147 @@
+# backend/tests/services/test_instruments.py
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import models
+from app.services import financial_data_orchestrator as orchestrator
+from app.services import instruments
+
+
+def _asset(symbol: str, asset_type: models.AssetType, asset_id: int = 1):
+    return models.Asset(id=asset_id, symbol=symbol, asset_type=asset_type)
+
+
+@pytest.fixture
+def assets_table():
+    """Patches the assets lookup; set `.return_value` to the rows it finds."""
+    with patch(
+        "app.services.instruments.crud.get_assets_by_symbols", return_value=[]
+    ) as lookup:
+        yield lookup
+
+
+def test_bare_symbol_takes_its_type_from_the_assets_table(assets_table):
+    assets_table.return_value = [_asset("BTC", models.AssetType.CRYPTO, 7)]
+
+    instrument = instruments.resolve(" btc ")
+
+    assert instrument.symbol == "BTC"
+    assert instrument.asset_type == "crypto"
+    assert instrument.asset_id == 7
+    assert instrument.cache_id == "BTC_crypto"
+    assert instrument.provider_symbol("yfinance") == "BTC-USD"
+    assert instrument.provider_symbol("alpha_vantage") == "BTC"
+
+
+def test_type_hint_is_kept_for_unknown_symbols(assets_table):
+    assert instruments.resolve("ETH", "Crypto").cache_id == "ETH_crypto"
+    assert instruments.resolve("NOPE").cache_id == "NOPE_unknown"
+    # A type hint alone names the instrument; only the bare symbol was looked up.
+    assets_table.assert_called_once()
+    assert assets_table.call_args.kwargs["symbols"] == ["NOPE"]
+
+
+def test_resolutions_are_memoized_until_forgotten(assets_table):
+    assets_table.return_value = [_asset("AAPL", models.AssetType.STOCK)]
+
+    first = instruments.resolve("AAPL")
+    assert instruments.resolve("aapl") is first
+    assert assets_table.call_count == 1
+
+    instruments.forget("aapl")
+    instruments.resolve("AAPL")
+    assert assets_table.call_count == 2
+
+
+def test_resolve_many_loads_unknown_symbols_in_one_query(assets_table):
+    assets_table.return_value = [
+        _asset("AAPL", models.AssetType.STOCK, 1),
+        _asset("BTC", models.AssetType.CRYPTO, 2),
+    ]
+
+    resolved = instruments.resolve_many([("AAPL", None), ("btc", None), ("X", None)])
+
+    assert assets_table.call_count == 1
+    assert sorted(assets_table.call_args.kwargs["symbols"]) == ["AAPL", "BTC", "X"]
+    assert resolved[("AAPL", None)].asset_type == "stock"
+    assert resolved[("BTC", None)].asset_type == "crypto"
+    assert resolved[("X", None)].asset_type is None
+
+
+def test_lookup_errors_fall_back_to_the_hint(assets_table):
+    assets_table.side_effect = RuntimeError("database unavailable")
+
+    assert instruments.resolve("AAPL").asset_type is None
+    assert instruments.resolve("AAPL", "stock").asset_type == "stock"
+
+
+@patch("app.services.data_providers.yahoo_finance_provider.fetch_yf_current_price")
+@patch("app.services.financial_data_orchestrator.shared_cache.set_shared_cache")
+@patch("app.services.financial_data_orchestrator.shared_cache.get_shared_cache")
+def test_typed_and_untyped_lookups_share_a_cache_entry(
+    mock_get_shared_cache: MagicMock,
+    mock_set_shared_cache: MagicMock,
+    mock_fetch_yf_price: MagicMock,
+    assets_table,
+):
+    assets_table.return_value = [_asset("AAPL", models.AssetType.STOCK)]
+    mock_get_shared_cache.return_value = 190.5
+
+    assert orchestrator.get_current_price("aapl") == 190.5
+    assert orchestrator.get_current_price("AAPL", "stock") == 190.5
+
+    assert [c.args[0] for c in mock_get_shared_cache.call_args_list] == [
+        "price:AAPL_stock",
+        "price:AAPL_stock",
+    ]
+    mock_fetch_yf_price.assert_not_called()
+
+
+@pytest.fixture
+def stored_tickers():
+    """Patches the provider_symbols table; set `.return_value` to its map."""
+    with patch(
+        "app.services.instruments.crud.get_provider_symbol_map", return_value={}
+    ) as lookup:
+        yield lookup
+
+
+def test_stored_provider_tickers_override_the_default_mapping(
+    assets_table, stored_tickers
+):
+    stored_tickers.return_value = {"MATIC": {"yfinance": "POL-USD"}}
+
+    instrument = instruments.resolve("MATIC", "crypto")
+
+    assert instrument.provider_symbol("yfinance") == "POL-USD"
+    assert instrument.provider_symbol("alpha_vantage") == "MATIC"
+    assert instruments.resolve("SOL", "crypto").provider_symbol("yfinance") == (
+        "SOL-USD"
+    )
+    # The table is read once, not per resolution.
+    assert stored_tickers.call_count == 1
+
+
+def test_provider_symbols_reload_when_the_version_moves(assets_table, stored_tickers):
+    client = MagicMock()
+    client.get.return_value = "1"
+    with patch.object(
+        instruments.shared_cache, "get_redis_client", return_value=client
+    ), patch("app.services.instruments.VERSION_CHECK_SECONDS", 0):
+        assert instruments.resolve("MATIC", "crypto").provider_symbol("yfinance") == (
+            "MATIC-USD"
+        )
+        instruments.resolve("MATIC", "crypto")
+        assert stored_tickers.call_count == 1
+
+        # Another process stored a ticker and bumped the version.
+        stored_tickers.return_value = {"MATIC": {"yfinance": "POL-USD"}}
+        client.get.return_value = "2"
+        assert instruments.resolve("MATIC", "crypto").provider_symbol("yfinance") == (
+            "POL-USD"
+        )
+        assert stored_tickers.call_count == 2
+
+        instruments.provider_symbols_changed()
+        client.incr.assert_called_once_with(instruments.PROVIDER_SYMBOLS_VERSION_KEY)
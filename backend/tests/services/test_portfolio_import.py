@@ -0,0 +1,159 @@
+# backend/tests/services/test_portfolio_import.py
+import csv
+import io
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app import models
+from app.models.asset import AssetType
+from app.services import portfolio_import
+
+
+def _asset(asset_id: int, symbol: str) -> models.Asset:
+    return models.Asset(
+        id=asset_id,
+        symbol=symbol,
+        asset_type=AssetType.STOCK,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_detect_import_format():
+    assert portfolio_import.detect_import_format("lots.csv", "text/csv") == "csv"
+    assert portfolio_import.detect_import_format("lots.jsonl", None) == "jsonl"
+    assert (
+        portfolio_import.detect_import_format(None, "application/x-ndjson") == "jsonl"
+    )
+    assert portfolio_import.detect_import_format(None, None) == "csv"
+
+
+def test_iter_import_records_csv_normalizes_headers():
+    upload = io.BytesIO(
+        b"Symbol, Quantity ,purchase_price,purchase_date\n"
+        b"aapl,10,150.5,2024-01-02\n"
+        b"msft,,300,2024-01-03\n"
+    )
+
+    records = list(portfolio_import.iter_import_records(upload, "csv"))
+
+    assert records[0] == (
+        2,
+        {
+            "symbol": "aapl",
+            "quantity": "10",
+            "purchase_price": "150.5",
+            "purchase_date": "2024-01-02",
+        },
+        None,
+    )
+    assert records[1][1]["quantity"] is None
+
+
+def test_iter_import_records_jsonl_reports_bad_lines():
+    upload = io.BytesIO(
+        b'{"symbol": "AAPL", "quantity": 1, "purchase_price": 1, "purchase_date": "2024-01-02"}\n'
+        b"\n"
+        b"not json\n"
+        b"[1, 2]\n"
+    )
+
+    records = list(portfolio_import.iter_import_records(upload, "jsonl"))
+
+    assert len(records) == 3
+    assert records[0][2] is None
+    assert records[1][0] == 3 and records[1][2].startswith("Invalid JSON")
+    assert records[2][2] == "Expected a JSON object per line."
+
+
+def test_iter_import_records_csv_reports_unreadable_rows():
+    upload = io.BytesIO(
+        b"symbol,quantity,purchase_price,purchase_date\n"
+        b"aapl,10,150.5,2024-01-02\n"
+        b"msft,1,300," + b"x" * 200 + b"\n"
+    )
+
+    previous_limit = csv.field_size_limit(100)
+    try:
+        records = list(portfolio_import.iter_import_records(upload, "csv"))
+    finally:
+        csv.field_size_limit(previous_limit)
+
+    assert records[0][2] is None
+    assert records[1][0] == 3 and records[1][1] is None
+    assert records[1][2].startswith("Invalid CSV")
+
+
+@patch("app.services.portfolio_import.crud.bulk_create_portfolio_holdings")
+@patch("app.services.portfolio_import.crud.get_assets_by_symbols")
+def test_import_holdings_chunks_and_reports_errors(
+    mock_get_assets_by_symbols: MagicMock,
+    mock_bulk_create: MagicMock,
+):
+    db = MagicMock(spec=Session)
+    mock_get_assets_by_symbols.return_value = [_asset(1, "AAPL"), _asset(2, "MSFT")]
+    mock_bulk_create.side_effect = lambda db, holdings_in, user_id: len(holdings_in)
+
+    row = {"quantity": "1", "purchase_price": "10", "purchase_date": "2024-01-02"}
+    records = [
+        (2, {"symbol": "aapl", **row}, None),
+        (3, {"symbol": "MSFT", **row}, None),
+        (4, {"symbol": "NOPE", **row}, None),
+        (5, {"symbol": "AAPL", **row, "quantity": "-5"}, None),
+        (6, None, "Invalid JSON: boom"),
+        (7, {"symbol": "AAPL", **row}, None),
+    ]
+
+    result = portfolio_import.import_holdings(
+        db, user_id=42, records=records, chunk_size=2
+    )
+
+    assert result.total_rows == 6
+    assert result.imported_count == 3
+    assert result.failed_count == 3
+    assert {e.row for e in result.errors} == {4, 5, 6}
+    assert result.rows_per_second > 0
+
+    # Symbols already resolved in an earlier chunk are not looked up again.
+    looked_up = [
+        set(call.kwargs["symbols"])
+        for call in mock_get_assets_by_symbols.call_args_list
+    ]
+    assert looked_up == [{"AAPL", "MSFT"}, {"NOPE"}]
+    assert mock_bulk_create.call_count == 2
+    assert all(call.kwargs["user_id"] == 42 for call in mock_bulk_create.call_args_list)
+
+
+def test_import_holdings_reports_non_string_symbols_as_row_errors():
+    db = MagicMock(spec=Session)
+    row = {"quantity": 1, "purchase_price": 10, "purchase_date": "2024-01-02"}
+    records = [(2, {"symbol": 123, **row}, None)]
+
+    result = portfolio_import.import_holdings(db, user_id=42, records=records)
+
+    assert result.failed_count == 1
+    assert result.errors[0].row == 2
+    assert result.errors[0].symbol == "123"
+
+
+@patch("app.services.portfolio_import.crud.bulk_create_portfolio_holdings")
+@patch("app.services.portfolio_import.crud.get_assets_by_symbols")
+def test_import_holdings_rolls_back_failed_chunk(
+    mock_get_assets_by_symbols: MagicMock,
+    mock_bulk_create: MagicMock,
+):
+    db = MagicMock(spec=Session)
+    mock_get_assets_by_symbols.return_value = [_asset(1, "AAPL")]
+    mock_bulk_create.side_effect = SQLAlchemyError("insert failed")
+
+    row = {"quantity": "1", "purchase_price": "10", "purchase_date": "2024-01-02"}
+    records = [(2, {"symbol": "AAPL", **row}, None)]
+
+    result = portfolio_import.import_holdings(db, user_id=1, records=records)
+
+    assert result.imported_count == 0
+    assert result.failed_count == 1
+    assert result.errors[0].error == "Database error while inserting."
+    db.rollback.assert_called_once()
@@ -0,0 +1,118 @@
+# backend/tests/services/test_portfolio_valuation.py
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app import models
+from app.services import portfolio_valuation
+
+NOW = datetime(2024, 3, 4, 15, 0, tzinfo=timezone.utc)
+
+
+def _holding(holding_id: int, symbol: str, currency, quantity, purchase_price):
+    asset = models.Asset(
+        id=holding_id,
+        symbol=symbol,
+        asset_type=models.AssetType.STOCK,
+        currency=currency,
+        created_at=NOW,
+    )
+    return models.PortfolioHolding(
+        id=holding_id,
+        user_id=1,
+        asset_id=holding_id,
+        quantity=quantity,
+        purchase_price=purchase_price,
+        purchase_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        asset_info=asset,
+        created_at=NOW,
+    )
+
+
+@pytest.fixture
+def fx():
+    """EUR->USD at 1.10 now and 1.05 on the purchase date; no GBP rate."""
+    with patch.object(
+        portfolio_valuation.orchestrator,
+        "get_fx_rates",
+        return_value={
+            "EUR": {"rate": 1.10, "is_stale": True, "last_updated": NOW},
+            "GBP": None,
+        },
+    ) as get_fx_rates, patch.object(
+        portfolio_valuation.orchestrator,
+        "get_fx_history",
+        side_effect=lambda currency, base: (
+            {"dates": ["2024-01-02"], "rates": [1.05]} if currency == "EUR" else None
+        ),
+    ) as get_fx_history:
+        yield get_fx_rates, get_fx_history
+
+
+def test_holdings_convert_into_the_base_currency(fx):
+    get_fx_rates, get_fx_history = fx
+    holdings = [
+        _holding(1, "AAPL", None, 10, 150.0),  # USD by default
+        _holding(2, "SAP.DE", "eur", 10, 100.0),
+        _holding(3, "VOD.L", "GBP", 10, 1.0),
+    ]
+
+    summary = portfolio_valuation.value_holdings(holdings, [170.0, 120.0, 0.7], "usd")
+
+    get_fx_rates.assert_called_once_with(["EUR", "GBP"], "USD")
+    assert get_fx_history.call_count == 2  # once per currency, not per holding
+    aapl, sap, vod = summary.holdings
+    assert (aapl.current_value, aapl.gain_loss, aapl.fx_rate) == (1700.0, 200.0, 1.0)
+    # Bought at 1.05 USD/EUR, valued at 1.10 today.
+    assert sap.currency == "USD"
+    assert sap.purchase_value == pytest.approx(1050.0)
+    assert sap.current_price == pytest.approx(132.0)
+    assert sap.gain_loss == pytest.approx(270.0)
+    # No GBP rate: the holding is returned unvalued and left out of totals.
+    assert vod.current_value is None and vod.purchase_value is None
+    assert summary.base_currency == "USD"
+    assert summary.fx_is_stale is True
+    assert summary.total_purchase_value == pytest.approx(2550.0)
+    assert summary.total_current_value == pytest.approx(3020.0)
+
+
+def test_single_currency_portfolios_need_no_fx(fx):
+    get_fx_rates, get_fx_history = fx
+
+    holding = portfolio_valuation.value_holding(
+        _holding(1, "SAP.DE", "EUR", 2, 100.0), 110.0, "EUR"
+    )
+
+    assert (holding.currency, holding.current_value, holding.gain_loss) == (
+        "EUR",
+        220.0,
+        20.0,
+    )
+    get_fx_rates.assert_not_called()
+    get_fx_history.assert_not_called()
+
+
+def test_history_is_only_fetched_for_past_purchases(fx):
+    get_fx_rates, get_fx_history = fx
+    holding = _holding(2, "SAP.DE", "EUR", 10, 100.0)
+    holding.purchase_date = datetime.now(timezone.utc)
+
+    valued = portfolio_valuation.value_holding(holding, 120.0, "USD")
+
+    get_fx_history.assert_not_called()
+    assert valued.purchase_value == pytest.approx(1100.0)  # today's rate
+
+
+def test_a_zero_historical_rate_is_not_treated_as_missing(fx):
+    get_fx_rates, get_fx_history = fx
+    get_fx_history.side_effect = lambda currency, base: {
+        "dates": ["2024-01-02"],
+        "rates": [0.0],
+    }
+
+    valued = portfolio_valuation.value_holding(
+        _holding(2, "SAP.DE", "EUR", 10, 100.0), 120.0, "USD"
+    )
+
+    assert valued.purchase_value == 0.0
@@ -0,0 +1,86 @@
+# backend/tests/services/test_price_events.py
+import pytest
+from unittest.mock import patch, MagicMock
+
+from app.services import price_events
+
+
+@pytest.fixture(autouse=True)
+def clear_handlers():
+    price_events._handlers.clear()
+    yield
+    price_events._handlers.clear()
+
+
+@patch("app.services.price_events.shared_cache.publish_shared_event")
+@patch("app.services.price_events.shared_cache.swap_shared_cache")
+def test_publish_price_change_publishes_delta(
+    mock_swap: MagicMock, mock_publish: MagicMock
+):
+    mock_swap.return_value = {"symbol": "AAPL", "price": 170.0}
+    received = []
+    price_events.register_price_change_handler(received.append)
+
+    event = price_events.publish_price_change("aapl", "stock", 171.5, "yfinance")
+
+    assert event is not None
+    assert event.symbol == "AAPL"
+    assert event.previous_price == 170.0
+    assert event.source == "yfinance"
+    assert mock_swap.call_args[0][0] == "last_price:AAPL"
+    channels, payload = mock_publish.call_args[0]
+    assert channels == ["price_events", "price_events:AAPL"]
+    assert payload["price"] == 171.5
+    assert payload["previous_price"] == 170.0
+    assert received == [event]
+
+
+@patch("app.services.price_events.shared_cache.publish_shared_event")
+@patch("app.services.price_events.shared_cache.swap_shared_cache")
+def test_publish_price_change_skips_unchanged_price(
+    mock_swap: MagicMock, mock_publish: MagicMock
+):
+    mock_swap.return_value = {"symbol": "AAPL", "price": 170.0}
+    handler = MagicMock()
+    price_events.register_price_change_handler(handler)
+
+    event = price_events.publish_price_change("AAPL", "stock", 170.0, "yfinance")
+
+    assert event is None
+    mock_publish.assert_not_called()
+    handler.assert_not_called()
+
+
+@patch("app.services.price_events.shared_cache.publish_shared_event")
+@patch("app.services.price_events.shared_cache.swap_shared_cache", return_value=None)
+def test_publish_price_change_isolates_handler_errors(
+    mock_swap: MagicMock, mock_publish: MagicMock
+):
+    failing = MagicMock(side_effect=RuntimeError("boom"), __name__="failing")
+    received = []
+    price_events.register_price_change_handler(failing)
+    price_events.register_price_change_handler(received.append)
+
+    event = price_events.publish_price_change("BTC", "crypto", 100.0, "alpha_vantage")
+
+    assert event.previous_price is None
+    mock_publish.assert_called_once()
+    assert received == [event]
+
+
+@patch("app.services.price_events.shared_cache.get_many_shared_cache")
+def test_get_last_price_events(mock_get_many: MagicMock):
+    mock_get_many.return_value = [
+        {
+            "symbol": "AAPL",
+            "price": 1.0,
+            "timestamp": "2024-01-02T00:00:00Z",
+            "source": "yfinance",
+        },
+        None,
+    ]
+
+    events = price_events.get_last_price_events(["aapl", "msft"])
+
+    mock_get_many.assert_called_once_with(["last_price:AAPL", "last_price:MSFT"])
+    assert [e.symbol for e in events] == ["AAPL"]
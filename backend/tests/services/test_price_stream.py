@@ -0,0 +1,75 @@
+# backend/tests/services/test_price_stream.py
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import patch, MagicMock
+
+from app import schemas
+from app.services import price_stream
+
+
+def _collect(agen):
+    async def run():
+        return [frame async for frame in agen]
+
+    return asyncio.run(run())
+
+
+def test_format_sse():
+    frame = price_stream.format_sse({"symbol": "AAPL", "price": 1.5}, event="price")
+    assert frame == 'event: price\ndata: {"symbol": "AAPL", "price": 1.5}\n\n'
+
+
+@patch("app.services.price_stream.price_events.get_last_price_events")
+def test_get_cached_price_snapshot(mock_get_last: MagicMock):
+    mock_get_last.return_value = [
+        schemas.PriceChangeEvent(
+            symbol="AAPL",
+            price=170.0,
+            timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            source="yfinance",
+        )
+    ]
+
+    snapshot = price_stream.get_cached_price_snapshot(["AAPL", "BTC"])
+
+    mock_get_last.assert_called_once_with(["AAPL", "BTC"])
+    assert snapshot[0]["symbol"] == "AAPL"
+    assert snapshot[0]["price"] == 170.0
+
+
+@patch("app.services.price_stream.price_events.aiter_price_changes")
+def test_stream_price_updates_sends_snapshot_then_updates(mock_aiter: MagicMock):
+    event = schemas.PriceChangeEvent(
+        symbol="AAPL",
+        price=171.0,
+        previous_price=170.0,
+        timestamp=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        source="yfinance",
+    )
+    closed = []
+
+    async def fake_changes():
+        try:
+            for item in [None, event, None]:
+                yield item
+        finally:
+            closed.append(True)
+
+    mock_aiter.return_value = fake_changes()
+    checks = iter([False, False, True])
+
+    async def is_disconnected():
+        return next(checks)
+
+    frames = _collect(
+        price_stream.stream_price_updates(
+            ["aapl"], [{"symbol": "AAPL", "price": 170.0}], is_disconnected
+        )
+    )
+
+    assert frames == [
+        price_stream.format_sse({"symbol": "AAPL", "price": 170.0}, event="price"),
+        price_stream.format_sse(event.model_dump(mode="json"), event="price"),
+    ]
+    assert mock_aiter.call_args[0][0] == ["AAPL"]
+    assert closed == [True]
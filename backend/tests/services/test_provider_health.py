@@ -0,0 +1,170 @@
+# backend/tests/services/test_provider_health.py
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.core.config import settings
+from app.services import provider_health
+
+
+@pytest.fixture(autouse=True)
+def clear_local_stats():
+    provider_health._local_stats.clear()
+    yield
+    provider_health._local_stats.clear()
+
+
+def test_summarize_outcomes():
+    raw = ["1:0.1000", "1:0.3000", "0:2.0000", "1:0.2000"]
+
+    stats = provider_health._summarize(raw)
+
+    assert stats["samples"] == 4
+    assert stats["error_rate"] == 0.25
+    assert stats["p50"] == 0.2
+    assert stats["p95"] == 0.3
+
+
+@patch("app.services.provider_health.shared_cache")
+def test_allow_request_circuit_states(mock_shared_cache: MagicMock):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+
+    pipe.execute.return_value = [0, 0]
+    assert provider_health.allow_request("yfinance", "stock") is True
+
+    pipe.execute.return_value = [1, 1]
+    assert provider_health.allow_request("yfinance", "stock") is False
+
+    # Half-open: only the caller that wins the probe lock gets through.
+    pipe.execute.return_value = [0, 1]
+    client.set.return_value = True
+    assert provider_health.allow_request("yfinance", "stock") is True
+    client.set.assert_called_with(
+        "provider_probe:yfinance:stock",
+        1,
+        nx=True,
+        ex=provider_health.PROBE_LOCK_SECONDS,
+    )
+    client.set.return_value = None
+    assert provider_health.allow_request("yfinance", "stock") is False
+
+
+@patch("app.services.provider_health._open_circuit")
+@patch("app.services.provider_health.shared_cache")
+def test_record_attempts_trips_breaker_on_error_rate(
+    mock_shared_cache: MagicMock, mock_open_circuit: MagicMock
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+    pipe.execute.return_value = [1, True, True, 0, 1, True, True, 0]
+    client.lrange.return_value = ["0:3.0"] * 8 + ["1:0.2"] * 2
+
+    provider_health.record_attempts(
+        [("yfinance", 3.0, False), ("alpha_vantage", 0.2, True)], "stock"
+    )
+
+    assert pipe.lpush.call_count == 2
+    mock_open_circuit.assert_called_once_with("yfinance", "stock")
+
+
+@patch("app.services.provider_health._open_circuit")
+@patch("app.services.provider_health.shared_cache")
+def test_record_attempts_ignores_fast_misses_when_nobody_answered(
+    mock_shared_cache: MagicMock, mock_open_circuit: MagicMock
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+    pipe.execute.return_value = [1, 1]
+
+    provider_health.record_attempts(
+        [("yfinance", 0.3, False), ("alpha_vantage", 0.2, False)], "stock"
+    )
+
+    pipe.lpush.assert_not_called()
+    assert pipe.delete.call_count == 2
+    mock_open_circuit.assert_not_called()
+
+
+@patch("app.services.provider_health.shared_cache")
+def test_record_attempts_counts_errors_even_when_nobody_answered(
+    mock_shared_cache: MagicMock,
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+    pipe.execute.return_value = [1, True, True, 0, 1]
+    client.lrange.return_value = ["0:0.3"]
+
+    provider_health.record_attempts(
+        [("yfinance", 0.3, False), ("alpha_vantage", 0.2, False)],
+        "stock",
+        errors=["yfinance"],
+    )
+
+    pipe.lpush.assert_called_once()
+    assert "yfinance" in pipe.lpush.call_args[0][0]
+    pipe.delete.assert_called_once()
+
+
+@patch("app.services.provider_health.shared_cache")
+def test_order_providers_by_observed_latency(mock_shared_cache: MagicMock):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.lrange.side_effect = lambda key, *_: (
+        ["1:0.9"] * 10 if "yfinance" in key else ["1:0.2"] * 10
+    )
+
+    assert provider_health.order_providers(["yfinance", "alpha_vantage"], "stock") == [
+        "alpha_vantage",
+        "yfinance",
+    ]
+
+
+@patch("app.services.provider_health.shared_cache")
+def test_order_providers_keeps_default_without_enough_samples(
+    mock_shared_cache: MagicMock,
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.lrange.side_effect = lambda key, *_: (
+        ["1:0.9"] * 10 if "yfinance" in key else ["1:0.2"] * 3
+    )
+
+    assert provider_health.order_providers(["yfinance", "alpha_vantage"], "stock") == [
+        "yfinance",
+        "alpha_vantage",
+    ]
+
+
+@patch("app.services.provider_health.shared_cache")
+def test_hedge_budget_is_capped_per_minute(mock_shared_cache: MagicMock, monkeypatch):
+    mock_shared_cache.get_redis_client.return_value = None
+    monkeypatch.setattr(settings, "MARKET_DATA_HEDGE_MAX_PER_MINUTE", 2)
+    provider_health._local_hedge_budget.clear()
+
+    granted = [provider_health.try_acquire_hedge_slot() for _ in range(3)]
+
+    assert granted == [True, True, False]
+
+
+@patch("app.services.provider_health.shared_cache")
+def test_hedge_delay_uses_configured_percentile(
+    mock_shared_cache: MagicMock, monkeypatch
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.lrange.return_value = [f"1:{i / 100}" for i in range(1, 21)]
+    monkeypatch.setattr(settings, "MARKET_DATA_HEDGE_PERCENTILE", 90.0)
+
+    assert provider_health.hedge_delay("yfinance", "stock") == 0.18
+
+    client.lrange.return_value = ["1:0.5"]
+    provider_health._local_stats.clear()
+    assert (
+        provider_health.hedge_delay("yfinance", "stock")
+        == settings.MARKET_DATA_HEDGE_DEFAULT_DELAY_SECONDS
+    )
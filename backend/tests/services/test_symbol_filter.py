@@ -0,0 +1,117 @@
+# backend/tests/services/test_symbol_filter.py
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from app.cache.bloom_filter import BloomFilter
+from app.services import symbol_filter
+
+
+@pytest.fixture(autouse=True)
+def reset_bloom(monkeypatch):
+    monkeypatch.setattr(symbol_filter, "_bloom", None)
+    monkeypatch.setattr(symbol_filter, "_bloom_built_at", 0.0)
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000)
+    symbols = [f"BAD{i}" for i in range(1000)]
+    bloom.update(symbols)
+
+    assert all(bloom.might_contain(s) for s in symbols)
+    false_positives = sum(bloom.might_contain(f"OK{i}") for i in range(10000))
+    assert false_positives < 300
+
+
+def test_is_plausible_symbol():
+    for symbol in ["AAPL", "brk.b", "BTC-USD", "EURUSD=X", "^GSPC"]:
+        assert symbol_filter.is_plausible_symbol(symbol)
+    for symbol in ["", "A B", "<script>", "X" * 30, "../etc"]:
+        assert not symbol_filter.is_plausible_symbol(symbol)
+
+
+def test_negative_cache_ttl_backs_off_exponentially():
+    assert symbol_filter.negative_cache_ttl(1) == 60
+    assert symbol_filter.negative_cache_ttl(2) == 120
+    assert symbol_filter.negative_cache_ttl(4) == 480
+    assert (
+        symbol_filter.negative_cache_ttl(100)
+        == symbol_filter.NEGATIVE_CACHE_MAX_SECONDS
+    )
+
+
+@patch("app.services.symbol_filter.shared_cache")
+def test_record_lookup_failure_promotes_repeat_offenders(mock_shared_cache: MagicMock):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+    pipe.execute.side_effect = [[3, True], [True, 1]]
+    symbol_filter._bloom = BloomFilter(capacity=10)
+
+    symbol_filter.record_lookup_failure("price:NOPE_stock", "nope")
+
+    pipe.set.assert_called_once_with("negative:price:NOPE_stock", 3, ex=240)
+    pipe.zadd.assert_called_once()
+    assert pipe.zadd.call_args[0][0] == "invalid_symbols"
+    assert symbol_filter._bloom.might_contain("NOPE")
+
+
+@patch("app.services.symbol_filter.shared_cache")
+def test_record_lookup_failure_without_symbol_only_backs_off_its_key(
+    mock_shared_cache: MagicMock,
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    pipe = client.pipeline.return_value
+    pipe.execute.side_effect = [[5, True], [True]]
+    symbol_filter._bloom = BloomFilter(capacity=10)
+
+    symbol_filter.record_lookup_failure("intraday:NOPE_stock_5m")
+
+    pipe.incr.assert_called_once_with("negative_failures:intraday:NOPE_stock_5m")
+    pipe.set.assert_called_once_with("negative:intraday:NOPE_stock_5m", 5, ex=960)
+    pipe.zadd.assert_not_called()
+    assert not symbol_filter._bloom.might_contain("NOPE")
+
+
+@patch("app.services.symbol_filter.shared_cache")
+def test_is_known_invalid_only_hits_redis_for_bloom_positives(
+    mock_shared_cache: MagicMock,
+):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.pipeline.return_value.execute.return_value = [0, 0, ["NOPE"]]
+    client.zscore.return_value = 1700000000.0
+
+    assert symbol_filter.is_known_invalid("AAPL") is False
+    client.zscore.assert_not_called()
+
+    assert symbol_filter.is_known_invalid("nope") is True
+    client.zscore.assert_called_once_with("invalid_symbols", "NOPE")
+    # The filter is built once and reused until it goes stale.
+    assert client.pipeline.call_count == 1
+
+
+@patch("app.services.symbol_filter.shared_cache")
+def test_invalid_symbol_probe_is_granted_once_per_window(mock_shared_cache: MagicMock):
+    client = MagicMock()
+    mock_shared_cache.get_redis_client.return_value = client
+    client.set.side_effect = [True, None]
+
+    assert symbol_filter.claim_invalid_symbol_probe("aapl") is True
+    assert symbol_filter.claim_invalid_symbol_probe("aapl") is False
+    client.set.assert_called_with(
+        "invalid_probe:AAPL",
+        "1",
+        nx=True,
+        ex=symbol_filter.INVALID_SYMBOL_PROBE_SECONDS,
+    )
+
+
+def test_symbol_filter_is_noop_without_redis():
+    with patch("app.services.symbol_filter.shared_cache") as mock_shared_cache:
+        mock_shared_cache.get_redis_client.return_value = None
+        assert symbol_filter.is_known_invalid("NOPE") is False
+        assert symbol_filter.claim_invalid_symbol_probe("NOPE") is False
+        assert symbol_filter.is_negatively_cached("price:NOPE_stock") is False
+        symbol_filter.record_lookup_failure("price:NOPE_stock", "NOPE")
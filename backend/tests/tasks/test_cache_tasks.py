@@ -0,0 +1,57 @@
+# backend/tests/tasks/test_cache_tasks.py
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.cache_warmup import WarmupProgress
+from app.tasks.cache_tasks import warm_cache_task
+
+
+@pytest.fixture
+def redis_available():
+    with patch(
+        "app.tasks.cache_tasks.shared_cache.get_redis_client", return_value=MagicMock()
+    ):
+        yield
+
+
+@patch("app.tasks.cache_tasks.cache_warmup.warm_tracked_assets")
+@patch("app.tasks.cache_tasks.cache_warmup.is_cache_warm", return_value=True)
+def test_warm_cache_task_skips_a_warm_cache(
+    mock_is_warm: MagicMock, mock_warm: MagicMock, redis_available
+):
+    assert warm_cache_task.run() == "Cache already warm."
+    mock_warm.assert_not_called()
+
+
+@patch("app.tasks.cache_tasks.cache_warmup.warm_tracked_assets")
+@patch("app.tasks.cache_tasks.cache_warmup.is_cache_warm", return_value=True)
+def test_warm_cache_task_reports_progress(
+    mock_is_warm: MagicMock, mock_warm: MagicMock, redis_available
+):
+    progress = WarmupProgress(total=2, processed=2, prices_warmed=2)
+
+    def warm(on_progress):
+        on_progress(progress)
+        return progress
+
+    mock_warm.side_effect = warm
+    with patch.object(warm_cache_task, "update_state") as mock_update_state:
+        result = warm_cache_task.run(force=True)
+
+    mock_update_state.assert_called_once_with(
+        state="PROGRESS", meta=progress.model_dump()
+    )
+    assert "Symbols: 2/2" in result
+    assert not result.startswith("CELERY_TASK")
+
+
+@patch("app.tasks.cache_tasks.cache_warmup.warm_tracked_assets")
+@patch("app.tasks.cache_tasks.cache_warmup.is_cache_warm", return_value=False)
+def test_warm_cache_task_does_not_fetch_without_redis(
+    mock_is_warm: MagicMock, mock_warm: MagicMock
+):
+    # No Redis (see conftest): is_cache_warm() would say cold on every run.
+    assert warm_cache_task.run() == "Cache unavailable; warm-up skipped."
+    assert warm_cache_task.run(force=True) == "Cache unavailable; warm-up skipped."
+    mock_warm.assert_not_called()
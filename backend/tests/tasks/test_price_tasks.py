@@ -1,4 +1,5 @@
 # backend/tests/tasks/test_price_tasks.py
+import logging
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta, timezone
@@ -77,8 +78,9 @@ def test_refresh_task_mixed_scenarios(
     mock_session_local: MagicMock,
     mock_db_session_for_task: Session,
     mock_asset_list: List[models.Asset],
-    capsys,
+    caplog,
 ):
+    caplog.set_level(logging.INFO)
     mock_session_local.return_value = mock_db_session_for_task
     mock_get_assets_crud.return_value = mock_asset_list
 
@@ -131,13 +133,11 @@ def test_refresh_task_mixed_scenarios(
     assert "STALE_STOCK" in symbols_updated
     assert "NEVER_UPDATED" in symbols_updated
     assert "FAIL_DB_UPDATE" in symbols_updated
-
-    captured = capsys.readouterr()
-    assert "CELERY_TASK: Asset FRESH_CRYPTO - Skipping (fresh:" in captured.out
-    assert "CELERY_TASK: Failed to get price for FAIL_FETCH" in captured.out
+    assert "Asset FRESH_CRYPTO - Skipping (fresh:" in caplog.text
+    assert "Failed to get price for FAIL_FETCH" in caplog.text
     assert (
-        "CELERY_TASK: ERROR processing asset FAIL_DB_UPDATE: Simulated DB update error"
-        in captured.out
+        "Error processing asset FAIL_DB_UPDATE: Simulated DB update error"
+        in caplog.text
     )
     assert "Refreshed: 2" in result
     assert "Skipped (fresh): 1" in result
@@ -150,16 +150,16 @@ def test_refresh_task_no_assets_in_db(
     mock_get_assets_crud: MagicMock,
     mock_session_local: MagicMock,
     mock_db_session_for_task: Session,
-    capsys,
+    caplog,
 ):
+    caplog.set_level(logging.INFO)
     mock_session_local.return_value = mock_db_session_for_task
     mock_get_assets_crud.return_value = []
 
     result = refresh_all_asset_prices_task.s().apply().get()
 
     assert result == "No assets to refresh."
-    captured = capsys.readouterr()
-    assert "CELERY_TASK: No assets found in DB to refresh." in captured.out
+    assert "No assets found in DB to refresh." in caplog.text
     mock_get_assets_crud.assert_called_once()
 
 
@@ -172,15 +172,14 @@ def test_refresh_task_get_assets_raises_exception(
     mock_get_assets_crud: MagicMock,
     mock_session_local: MagicMock,
     mock_db_session_for_task: Session,
-    capsys,
+    caplog,
 ):
     mock_session_local.return_value = mock_db_session_for_task
 
     result = refresh_all_asset_prices_task.s().apply().get()
 
     assert "Task failed with critical error: DB connection error" in result
-    captured = capsys.readouterr()
     assert (
-        "CRITICAL ERROR in refresh_all_asset_prices_task: DB connection error"
-        in captured.out
+        "Critical error in refresh_all_asset_prices_task: DB connection error"
+        in caplog.text
     )